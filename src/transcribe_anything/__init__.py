@@ -1,4 +1,6 @@
+from .api import TranscribeResult
 from .api import transcribe
 from .api import transcribe as transcribe_anything
+from .api import transcribe_many
 
-__all__ = ["transcribe", "transcribe_anything"]
+__all__ = ["transcribe", "transcribe_anything", "transcribe_many", "TranscribeResult"]
@@ -59,6 +59,16 @@ WHISPERX_FLAG_ARGS = [
 INSANE_DEVICES = {"insane", "insane-flash"}
 
 
+def _wants_cli_progress(args: argparse.Namespace) -> bool:
+    """Whether a local run should print progress lines to stderr."""
+    # Progress needs the backend's stdout piped through us, so only when
+    # asked for or when someone is watching. The insane backends only ever
+    # report 0% and 100%.
+    if args.device in INSANE_DEVICES:
+        return False
+    return bool(args.progress) or sys.stderr.isatty()
+
+
 def route_whisperx_args(args: argparse.Namespace, unknown: list[str]) -> None:
     """Append WhisperX-only CLI args to unknown when the WhisperX backend is selected."""
     use_whisperx = args.device == "whisperx"
@@ -240,6 +250,23 @@ def parse_arguments() -> argparse.Namespace:
         help="whether to embed the translation file into the output file",
         action="store_true",
     )
+    parser.add_argument(
+        "--multi-gpu",
+        help="Split long recordings at silence across every visible GPU and stitch the results. Only works for --device insane / insane-flash.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        help="With --device cpu, transcribe the recording as N silence-split windows in N parallel whisper processes. Default: one process.",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--cache",
+        help=("Reuse a previous transcript of the same audio + settings from the local transcript cache, " "and store this run's result in it. Also reads TRANSCRIBE_ANYTHING_CACHE."),
+        action="store_true",
+        default=None,
+    )
     parser.add_argument(
         "--initial_prompt",
         help="Initial prompt to provide context for transcription. Useful for custom vocabulary, names, or domain-specific terms. Example: 'The speaker discusses AI, machine learning, and neural networks.'",
@@ -262,6 +289,15 @@ def parse_arguments() -> argparse.Namespace:
         help=("Auth token for the remote daemon (Authorization: Bearer). " "Also reads TRANSCRIBE_ANYTHING_TOKEN."),
         default=None,
     )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help=(
+            "Print 'progress: 42%% (50s / 120s)' lines to stderr while a local run decodes. "
+            "On by default when stderr is a terminal. Whisper (cpu/cuda) and WhisperX only; "
+            "the insane backends decode in one call and have no progress to report."
+        ),
+    )
     parser.add_argument(
         "--stream-in",
         action="store_true",
@@ -456,6 +492,7 @@ def main() -> int:
 
     try:
         from transcribe_anything.api import transcribe
+        from transcribe_anything.progress import cli_progress
 
         transcribe(
             url_or_file=args.url_or_file,
@@ -469,6 +506,10 @@ def main() -> int:
             other_args=unknown,
             align=align,
             align_model=align_model if align else None,
+            use_cache=args.cache,
+            multi_gpu=args.multi_gpu,
+            cpu_workers=args.cpu_workers,
+            progress_callback=cli_progress() if _wants_cli_progress(args) else None,
         )
     except KeyboardInterrupt:
         print("KeyboardInterrupt")
@@ -14,18 +14,34 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import static_ffmpeg  # type: ignore
 import static_ffmpeg.run as static_ffmpeg_run  # type: ignore
 from appdirs import user_config_dir  # type: ignore
 
 from transcribe_anything.audio import fetch_audio
-from transcribe_anything.insanely_fast_whisper import run_insanely_fast_whisper
+from transcribe_anything.insane_sharded import run_insanely_fast_whisper_sharded
+from transcribe_anything.insanely_fast_whisper import (
+    get_wave_duration,
+    run_insanely_fast_whisper,
+)
 from transcribe_anything.logger import log_error
+from transcribe_anything.progress import ProgressCallback, StageCallback, timed_stage
+from transcribe_anything.transcript_cache import (
+    TranscriptCache,
+    cache_enabled_from_env,
+    hash_file,
+    make_cache_key,
+)
 from transcribe_anything.util import (
     chop_double_extension,
     get_static_ffmpeg_runtime_dir,
@@ -33,6 +49,7 @@ from transcribe_anything.util import (
 )
 from transcribe_anything.whisper import get_computing_device, run_whisper
 from transcribe_anything.whisper_mac import run_whisper_mac_mlx
+from transcribe_anything.ytldp_download import get_video_info
 
 run_whisperx: Any = None
 run_sensevoice: Any = None
@@ -114,6 +131,27 @@ class Device(Enum):
         raise ValueError(f"Unknown device {device}")
 
 
+# Temp wavs not yet removed. One atexit hook sweeps them, rather than one
+# hook per file, which piles up over a long transcribe_many batch.
+_TEMP_WAVS: set[str] = set()
+_TEMP_WAVS_LOCK = threading.Lock()
+
+
+def _cleanup_temp_wavs() -> None:
+    with _TEMP_WAVS_LOCK:
+        leftovers = list(_TEMP_WAVS)
+        _TEMP_WAVS.clear()
+    for path in leftovers:
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except Exception as exc:
+                warnings.warn(f"Failed to remove {path}: {exc}")
+
+
+atexit.register(_cleanup_temp_wavs)
+
+
 def make_temp_wav() -> str:
     """
     Makes a temporary mp3 file and returns the path to it.
@@ -121,15 +159,8 @@ def make_temp_wav() -> str:
     tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)  # pylint: disable=consider-using-with
 
     tmp.close()
-
-    def cleanup() -> None:
-        if os.path.exists(tmp.name):
-            try:
-                os.remove(tmp.name)
-            except Exception as exc:
-                warnings.warn(f"Failed to remove {tmp.name}: {exc}")
-
-    atexit.register(cleanup)
+    with _TEMP_WAVS_LOCK:
+        _TEMP_WAVS.add(tmp.name)
     return tmp.name
 
 
@@ -157,94 +188,91 @@ def get_video_name_from_url(url: str) -> str:
     """
     assert url.startswith("http"), f"Invalid url {url}"
 
-    # Try and the title of the video using yt-dlp
-    # If that fails, use the basename of the url
-    cmd_list: list[str] = []
-    cmd_list.extend(["yt-dlp", "--get-title", f"{url}"])
-
+    # Use the title from the (cached) yt-dlp metadata pass, which the
+    # download reuses. If that fails, use the basename of the url.
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cmd_str = subprocess.list2cmdline(cmd_list)
-            print(f"Running:\n  {cmd_str}")
-            env = os.environ.copy()
-            # env["set PYTHONIOENCODING=utf-8"]
-            env["PYTHONIOENCODING"] = "utf-8"
-            cp = subprocess.run(
-                cmd_str,
-                check=True,
-                capture_output=True,
-                universal_newlines=True,
-                cwd=temp_dir,
-                env=env,
-                shell=True,
-            )
-            stdout = cp.stdout
-            lines = stdout.split("\n")
-            lines = [line.strip() for line in lines]
-            for line in lines:
-                if "OSError" in line:
-                    continue
-                line = line[:80]
-                return sanitize_filename(line)
-            log_error("yt-dlp failed to get title, using basename instead.")
-            return os.path.basename(url)
+        info = get_video_info(url)
     except subprocess.CalledProcessError as exc:
         log_error(f"yt-dlp failed with {exc}, using basename instead\n{exc.stdout}\n{exc.stderr}")
         return os.path.basename(url)
     except Exception as exc:
         log_error(f"yt-dlp failed with {exc}, using basename instead.")
         return os.path.basename(url)
+    title = (info.title or "").strip()
+    if not title:
+        log_error("yt-dlp failed to get title, using basename instead.")
+        return os.path.basename(url)
+    return sanitize_filename(title[:80])
+
+
+def _embed_subtitles(url_or_file: str, srt_file: str, output_dir: str) -> None:
+    """Burn ``srt_file`` into ``url_or_file`` and write ``out.mp4`` to ``output_dir``."""
+    assert os.path.isfile(url_or_file), f"Path {url_or_file} doesn't exist."
+    out_mp4 = os.path.join(output_dir, "out.mp4")
+    static_ffmpeg_path = shutil.which("static_ffmpeg")
+    if static_ffmpeg_path is None:
+        raise FileNotFoundError("static_ffmpeg not found")
+    embed_ffmpeg_cmd_list = [
+        "static_ffmpeg",
+        "-y",
+        "-i",
+        url_or_file,
+        "-i",
+        srt_file,
+        "-vf",
+        f"subtitles={fix_subtitles_path(srt_file)}",
+        out_mp4,
+    ]
+    embed_ffmpeg_cmd = subprocess.list2cmdline(embed_ffmpeg_cmd_list)
+    print(f"Running:\n  {embed_ffmpeg_cmd}")
+    try:
+        _ = subprocess.run(
+            embed_ffmpeg_cmd,
+            universal_newlines=True,
+            check=True,
+            capture_output=True,
+            shell=True,
+        )
+    except subprocess.CalledProcessError as exc:
+        stdout = exc.stdout
+        stderr = exc.stderr
+        warnings.warn(f"ffmpeg failed with return code {exc.returncode}\n{stdout}\n{stderr}")
+        raise
 
 
-def transcribe(
+def _remove_temp_wav(tmp_wav: str) -> None:
+    with _TEMP_WAVS_LOCK:
+        _TEMP_WAVS.discard(tmp_wav)
+    try:
+        os.remove(tmp_wav)
+    except Exception as exc:
+        warnings.warn(f"Failed to remove {tmp_wav}: {exc}")
+
+
+def _union_seconds(intervals: list[tuple[float, float]]) -> float:
+    """Total length of the union of ``(start, end)`` intervals."""
+    total = 0.0
+    covered_to = float("-inf")
+    for start, end in sorted(intervals):
+        start = max(start, covered_to)
+        if end > start:
+            total += end - start
+            covered_to = end
+    return total
+
+
+def _resolve_output_dir(
     url_or_file: str,
-    output_dir: Optional[str] = None,
-    model: Optional[str] = None,
-    task: Optional[str] = None,
-    language: Optional[str] = None,
-    device: Optional[str] = None,
-    embed: bool = False,
-    hugging_face_token: Optional[str] = None,
-    other_args: Optional[list[str]] = None,
-    initial_prompt: Optional[str] = None,
-    align: bool = False,
-    align_model: Optional[str] = None,
+    output_dir: Optional[str],
+    language: Optional[str],
+    parent: Optional[str] = None,
+    index: Optional[int] = None,
 ) -> str:
-    """
-    Runs the transcription program.
-
-    Args:
-        url_or_file: Path to local file or URL (YouTube, etc.)
-        output_dir: Directory to save output files
-        model: Whisper model to use (tiny, small, medium, large, etc.)
-        task: Task to perform (transcribe or translate)
-        language: Language of the audio (auto-detected if None)
-        device: Device to use (cuda, xpu, cpu, insane, insane-flash, whisperx, mlx)
-        embed: Whether to embed subtitles into video file
-        hugging_face_token: Token for speaker diarization
-        other_args: Additional arguments to pass to Whisper backend
-        initial_prompt: Initial prompt to provide context for transcription.
-                       Useful for custom vocabulary, names, or domain-specific terms.
-                       Example: "The speaker discusses AI, machine learning, and neural networks."
-        align: Run WhisperX wav2vec2 forced-alignment post-pass on the
-               transcript to replace HF Whisper's coarse segment timestamps
-               with phoneme-precise word-level timing. Only applies to
-               ``--device insane`` and ``--device insane-flash``; ignored
-               otherwise. Best-effort: unsupported language or env build
-               failure leaves the original output untouched.
-        align_model: Override the wav2vec2 model id used by alignment.
-                     Defaults to WhisperX's per-language defaults; pass a
-                     HuggingFace wav2vec2 model id to use a language that
-                     isn't in those defaults.
+    """Returns (and creates) the output dir, deriving a name (under ``parent``) from the input if none is given.
 
-    Returns:
-        Path to the output directory containing transcription files
+    ``index`` prefixes the derived name so inputs that share a basename
+    (``a/clip.mp4`` and ``b/clip.mp4``) get separate directories.
     """
-    # add the paths for any dependent tools that may rely on ffmpeg
-    _add_static_ffmpeg_paths()
-    if not os.path.isfile(url_or_file) and embed:
-        raise NotImplementedError("Embedding is only supported for local files. " + "Please download the file first.")
-    # cache = DiskLRUCache(CACHE_FILE, 16)
     basename = os.path.basename(url_or_file)
     if not basename or basename == ".":  # if url_or_file is a directory
         # Defense against paths with a trailing /, for example:
@@ -255,73 +283,162 @@ def transcribe(
     if output_dir is None:
         output_dir_was_generated = True
         if url_or_file.startswith("http"):
-            outname = get_video_name_from_url(url_or_file)
-            output_dir = "text_" + sanitize_filename(outname)
+            outname = sanitize_filename(get_video_name_from_url(url_or_file))
         else:
-            output_dir = "text_" + os.path.splitext(basename)[0]
+            outname = os.path.splitext(basename)[0]
+        output_dir = f"text_{index:04d}_{outname}" if index is not None else f"text_{outname}"
+        if parent is not None:
+            output_dir = os.path.join(parent, output_dir)
     if output_dir_was_generated and language is not None:
         output_dir = os.path.join(output_dir, language)
     print(f"making dir {output_dir}")
     os.makedirs(output_dir, exist_ok=True)
-    tmp_wav = make_temp_wav()
-    try:
-        assert os.path.isdir(output_dir), f"Path {output_dir} is not found or not a directory."
-        # tmp_mp3 = os.path.join(output_dir, "out.mp3")
-        fetch_audio(url_or_file, tmp_wav)
-        assert os.path.exists(tmp_wav), f"Path {tmp_wav} doesn't exist."
-        # filemd5 = md5(file.encode("utf-8")).hexdigest()
-        # key = f"{file}-{filemd5}-{model}"
-        # cached_data = cache.get_json(key)
-        # print(f"Todo: cached data: {cached_data}")
-        device = device or get_computing_device()
-        device_enum = Device.from_str(device)
-        if device_enum == Device.CUDA:
-            print("#####################################")
-            print("######### GPU ACCELERATED! ##########")
-            print("#####################################")
-        elif device_enum == Device.XPU:
-            print("#####################################")
-            print("####### INTEL XPU MODE! #############")
-            print("#####################################")
-        elif device_enum == Device.INSANE:
-            print("#####################################")
-            print("####### INSANE GPU MODE! ############")
-            print("#####################################")
-        elif device_enum == Device.INSANE_FLASH:
-            print("#####################################")
-            print("#### INSANE FLASH GPU MODE! #########")
-            print("#####################################")
-        elif device_enum == Device.WHISPERX:
-            print("#####################################")
-            print("######### WHISPERX MODE! ############")
-            print("#####################################")
-        elif device_enum == Device.SENSEVOICE:
-            print("#####################################")
-            print("######## SENSEVOICE MODE! ###########")
-            print("#####################################")
-        elif device_enum == Device.CPU:
-            print("WARNING: NOT using GPU acceleration, using 10x slower CPU instead.")
-        elif device_enum == Device.MLX:
-            print("#####################################")
-            print("####### MAC MLX GPU MODE! ###########")
-            print("#####################################")
-        else:
-            raise ValueError(f"Unknown device {device}")
-        print(f"Using device {device}")
-        model_str = f"{model}" if model else ("small" if device_enum == Device.WHISPERX else "")
-        task_str = f"{task}" if task else "transcribe"
-        language_str = f"{language}" if language else ""
-
-        # Handle initial_prompt parameter
-        if initial_prompt:
-            if other_args is None:
-                other_args = []
-            other_args.extend(["--initial_prompt", initial_prompt])
-            print(f"Using initial prompt: {initial_prompt[:100]}{'...' if len(initial_prompt) > 100 else ''}")
+    return output_dir
+
 
+def _transcribe_wav(
+    url_or_file: str,
+    tmp_wav: str,
+    output_dir: str,
+    model: Optional[str] = None,
+    task: Optional[str] = None,
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    embed: bool = False,
+    hugging_face_token: Optional[str] = None,
+    other_args: Optional[list[str]] = None,
+    initial_prompt: Optional[str] = None,
+    align: bool = False,
+    align_model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    multi_gpu: bool = False,
+    cpu_workers: int = 0,
+    device_id: Optional[str] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    stage_callback: Optional[StageCallback] = None,
+) -> str:
+    """Runs the backend on an already-normalized wav and moves the results into output_dir.
+
+    This is the inference stage of :func:`transcribe`; fetching the audio is
+    left to the caller so :func:`transcribe_many` can overlap it with the
+    previous item's inference.
+    """
+    assert os.path.isdir(output_dir), f"Path {output_dir} is not found or not a directory."
+    device = device or get_computing_device()
+    device_enum = Device.from_str(device)
+    if device_enum == Device.CUDA:
+        print("#####################################")
+        print("######### GPU ACCELERATED! ##########")
+        print("#####################################")
+    elif device_enum == Device.XPU:
+        print("#####################################")
+        print("####### INTEL XPU MODE! #############")
+        print("#####################################")
+    elif device_enum == Device.INSANE:
+        print("#####################################")
+        print("####### INSANE GPU MODE! ############")
+        print("#####################################")
+    elif device_enum == Device.INSANE_FLASH:
+        print("#####################################")
+        print("#### INSANE FLASH GPU MODE! #########")
+        print("#####################################")
+    elif device_enum == Device.WHISPERX:
+        print("#####################################")
+        print("######### WHISPERX MODE! ############")
+        print("#####################################")
+    elif device_enum == Device.SENSEVOICE:
+        print("#####################################")
+        print("######## SENSEVOICE MODE! ###########")
+        print("#####################################")
+    elif device_enum == Device.CPU:
+        print("WARNING: NOT using GPU acceleration, using 10x slower CPU instead.")
+    elif device_enum == Device.MLX:
+        print("#####################################")
+        print("####### MAC MLX GPU MODE! ###########")
+        print("#####################################")
+    else:
+        raise ValueError(f"Unknown device {device}")
+    print(f"Using device {device}")
+    model_str = f"{model}" if model else ("small" if device_enum == Device.WHISPERX else "")
+    task_str = f"{task}" if task else "transcribe"
+    language_str = f"{language}" if language else ""
+
+    # Handle initial_prompt parameter
+    if initial_prompt:
+        if other_args is None:
+            other_args = []
+        other_args.extend(["--initial_prompt", initial_prompt])
+        print(f"Using initial prompt: {initial_prompt[:100]}{'...' if len(initial_prompt) > 100 else ''}")
+
+    cache: Optional[TranscriptCache] = None
+    cache_key: Optional[str] = None
+    cache_settings: dict[str, Any] = {}
+    cached_files: Optional[list[str]] = None
+    if use_cache if use_cache is not None else cache_enabled_from_env():
+        cache = TranscriptCache()
+        cache_settings = {
+            "device": str(device_enum),
+            "model": model_str,
+            "task": task_str,
+            "language": language_str,
+            "initial_prompt": initial_prompt,
+            "align": align,
+            "align_model": align_model,
+            "other_args": list(other_args or []),
+            "diarization": bool(hugging_face_token),
+            "multi_gpu": multi_gpu,
+            "cpu_workers": cpu_workers,
+        }
+        cache_key = make_cache_key(hash_file(tmp_wav), cache_settings)
+        cached_files = cache.get(cache_key, output_dir)
+        if cached_files is not None:
+            print(f"Transcript cache hit ({cache_key[:12]}), skipping {device} backend.")
+
+    srt_file: Optional[str] = None
+    postprocess_started = time.monotonic()
+    if cached_files is not None:
+        if "out.srt" in cached_files:
+            srt_file = os.path.join(output_dir, "out.srt")
+    else:
         print(f"Running whisper on {tmp_wav} (will install models on first run)")
+        # Only passed when set, so backends are called exactly as before otherwise.
+        progress: dict[str, Any] = {"progress_callback": progress_callback} if progress_callback is not None else {}
+        # The insane runners also time their alignment pass. With
+        # --multi-gpu the shards align concurrently, so keep the wall-clock
+        # intervals and report their union as "alignment", taken back out
+        # of "inference" below; summing the durations would count overlap
+        # twice.
+        aligned: list[tuple[float, float]] = []
+        aligned_lock = threading.Lock()
+        insane_hooks = dict(progress)
+        if stage_callback is not None:
+
+            def _insane_stage(stage: str, seconds: float) -> None:
+                if stage != "alignment":
+                    stage_callback(stage, seconds)
+                    return
+                finished = time.monotonic()
+                with aligned_lock:
+                    aligned.append((finished - seconds, finished))
+
+            insane_hooks["stage_callback"] = _insane_stage
+        backend_started = time.monotonic()
         with tempfile.TemporaryDirectory() as tmpdir:
-            if device_enum in (Device.INSANE, Device.INSANE_FLASH, Device.XPU):
+            if device_enum in (Device.INSANE, Device.INSANE_FLASH) and multi_gpu:
+                run_insanely_fast_whisper_sharded(
+                    input_wav=Path(tmp_wav),
+                    model=model_str,
+                    output_dir=Path(tmpdir),
+                    task=task_str,
+                    language=language_str,
+                    hugging_face_token=hugging_face_token,
+                    other_args=other_args,
+                    flash=device_enum == Device.INSANE_FLASH,
+                    align=align,
+                    align_model=align_model,
+                    **insane_hooks,
+                )
+            elif device_enum in (Device.INSANE, Device.INSANE_FLASH, Device.XPU):
                 run_insanely_fast_whisper(
                     input_wav=Path(tmp_wav),
                     model=model_str,
@@ -334,6 +451,8 @@ def transcribe(
                     align=align,
                     align_model=align_model,
                     use_xpu=device_enum == Device.XPU,
+                    device_id=device_id,
+                    **insane_hooks,
                 )
             elif device_enum == Device.WHISPERX:
                 global run_whisperx
@@ -354,6 +473,7 @@ def transcribe(
                     hugging_face_token=hugging_face_token,
                     other_args=other_args,
                     use_xpu=device_enum == Device.XPU,
+                    **progress,
                 )
             elif device_enum == Device.SENSEVOICE:
                 global run_sensevoice
@@ -379,15 +499,23 @@ def transcribe(
             else:
                 run_whisper(
                     input_wav=Path(tmp_wav),
-                    device=str(device),
+                    device=f"cuda:{device_id}" if device_id and device_enum == Device.CUDA else str(device),
                     model=model_str,
                     output_dir=Path(tmpdir),
                     task=task_str,
                     language=language_str,
                     other_args=other_args,
+                    cpu_workers=cpu_workers,
+                    **progress,
                 )
+            if stage_callback is not None:
+                alignment_seconds = _union_seconds(aligned)
+                if aligned:
+                    stage_callback("alignment", alignment_seconds)
+                stage_callback("inference", max(0.0, time.monotonic() - backend_started - alignment_seconds))
+            postprocess_started = time.monotonic()
             files = [os.path.join(tmpdir, name) for name in os.listdir(tmpdir)]
-            srt_file: Optional[str] = None
+            produced: list[str] = []
             for file in files:
                 # Change the filename to remove the double extension
                 file_name = os.path.basename(file)
@@ -403,50 +531,295 @@ def transcribe(
                 assert os.path.isfile(file), f"Path {file} doesn't exist."
                 assert not os.path.exists(outfile), f"Path {outfile} already exists."
                 shutil.move(file, outfile)
+                produced.append(outfile)
                 if ext == ".srt":
                     srt_file = outfile
-            output_dir = os.path.abspath(output_dir)
-            assert srt_file is not None, "No srt file found."
-            srt_file = os.path.abspath(srt_file)
-            if embed:
-                assert os.path.isfile(url_or_file), f"Path {url_or_file} doesn't exist."
-                out_mp4 = os.path.join(output_dir, "out.mp4")
-                static_ffmpeg_path = shutil.which("static_ffmpeg")
-                if static_ffmpeg_path is None:
-                    raise FileNotFoundError("static_ffmpeg not found")
-                embed_ffmpeg_cmd_list = [
-                    "static_ffmpeg",
-                    "-y",
-                    "-i",
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, produced, settings=cache_settings)
+    if progress_callback is not None:
+        # Cache hits and backends without incremental output finish here.
+        duration = get_wave_duration(Path(tmp_wav))
+        progress_callback(duration, duration)
+    output_dir = os.path.abspath(output_dir)
+    assert srt_file is not None, "No srt file found."
+    srt_file = os.path.abspath(srt_file)
+    if embed:
+        _embed_subtitles(url_or_file, srt_file, output_dir)
+    if stage_callback is not None:
+        stage_callback("postprocess", time.monotonic() - postprocess_started)
+    print(f"Done! Files were saved to {output_dir}")
+    return output_dir
+
+
+def transcribe(
+    url_or_file: str,
+    output_dir: Optional[str] = None,
+    model: Optional[str] = None,
+    task: Optional[str] = None,
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    embed: bool = False,
+    hugging_face_token: Optional[str] = None,
+    other_args: Optional[list[str]] = None,
+    initial_prompt: Optional[str] = None,
+    align: bool = False,
+    align_model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    multi_gpu: bool = False,
+    cpu_workers: int = 0,
+    device_id: Optional[str] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    stage_callback: Optional[StageCallback] = None,
+    fetched_wav: Optional[str] = None,
+) -> str:
+    """
+    Runs the transcription program.
+
+    Args:
+        url_or_file: Path to local file or URL (YouTube, etc.)
+        output_dir: Directory to save output files
+        model: Whisper model to use (tiny, small, medium, large, etc.)
+        task: Task to perform (transcribe or translate)
+        language: Language of the audio (auto-detected if None)
+        device: Device to use (cuda, xpu, cpu, insane, insane-flash, whisperx, mlx)
+        embed: Whether to embed subtitles into video file
+        hugging_face_token: Token for speaker diarization
+        other_args: Additional arguments to pass to Whisper backend
+        initial_prompt: Initial prompt to provide context for transcription.
+                       Useful for custom vocabulary, names, or domain-specific terms.
+                       Example: "The speaker discusses AI, machine learning, and neural networks."
+        align: Run WhisperX wav2vec2 forced-alignment post-pass on the
+               transcript to replace HF Whisper's coarse segment timestamps
+               with phoneme-precise word-level timing. Only applies to
+               ``--device insane`` and ``--device insane-flash``; ignored
+               otherwise. Best-effort: unsupported language or env build
+               failure leaves the original output untouched.
+        align_model: Override the wav2vec2 model id used by alignment.
+                     Defaults to WhisperX's per-language defaults; pass a
+                     HuggingFace wav2vec2 model id to use a language that
+                     isn't in those defaults.
+        use_cache: Look up / store the result in the content-addressed
+                   transcript cache, keyed by the normalized WAV plus every
+                   output-affecting setting. A hit skips the backend and
+                   copies the cached artifacts into ``output_dir``. ``None``
+                   defers to the ``TRANSCRIBE_ANYTHING_CACHE`` env var
+                   (off by default).
+        multi_gpu: For ``--device insane`` / ``insane-flash``: split long
+                   recordings at silence into one piece per visible GPU,
+                   transcribe the pieces concurrently and stitch the
+                   results. Recordings under 10 minutes, single-GPU boxes
+                   and diarization runs use one GPU as before.
+        cpu_workers: For ``--device cpu``: split the recording at silence
+                     into windows and transcribe them with this many
+                     whisper processes side by side, each capped at
+                     ``cpu_count // cpu_workers`` torch threads. ``0`` / ``1``
+                     runs a single process as before.
+        device_id: Pin the run to one CUDA device (e.g. ``"1"``). Honoured
+                   by ``--device cuda`` / ``insane`` / ``insane-flash``;
+                   the daemon uses it to give each worker slot its own
+                   card. ``None`` uses the default device.
+        progress_callback: Called as ``progress_callback(processed_seconds,
+                   total_seconds)`` while the backend runs. Whisper and
+                   WhisperX report per decoded segment; the other
+                   backends report at start and end (and per piece for
+                   ``multi_gpu`` / ``cpu_workers``).
+        stage_callback: Called as ``stage_callback(stage, seconds)`` with
+                   the wall time of each stage: ``fetch`` (download +
+                   ffmpeg normalize), ``inference`` (environment, model
+                   load and decoding), ``alignment`` (``align`` on the
+                   insane backends) and ``postprocess``.
+        fetched_wav: ``url_or_file`` already run through :func:`fetch_input`
+                   (the daemon's ``--fetch-ahead`` stage). The fetch stage
+                   is skipped and the file is left for the caller to remove.
+
+    Returns:
+        Path to the output directory containing transcription files
+    """
+    # add the paths for any dependent tools that may rely on ffmpeg
+    _add_static_ffmpeg_paths()
+    if not os.path.isfile(url_or_file) and embed:
+        raise NotImplementedError("Embedding is only supported for local files. " + "Please download the file first.")
+    output_dir = _resolve_output_dir(url_or_file, output_dir, language)
+    tmp_wav = fetched_wav or make_temp_wav()
+    try:
+        if fetched_wav is None:
+            with timed_stage(stage_callback, "fetch"):
+                fetch_audio(url_or_file, tmp_wav)
+        assert os.path.exists(tmp_wav), f"Path {tmp_wav} doesn't exist."
+        return _transcribe_wav(
+            url_or_file,
+            tmp_wav,
+            output_dir,
+            model=model,
+            task=task,
+            language=language,
+            device=device,
+            embed=embed,
+            hugging_face_token=hugging_face_token,
+            other_args=other_args,
+            initial_prompt=initial_prompt,
+            align=align,
+            align_model=align_model,
+            use_cache=use_cache,
+            multi_gpu=multi_gpu,
+            cpu_workers=cpu_workers,
+            device_id=device_id,
+            progress_callback=progress_callback,
+            stage_callback=stage_callback,
+        )
+    finally:
+        if fetched_wav is None:
+            _remove_temp_wav(tmp_wav)
+
+
+def fetch_input(url_or_file: str, wav_path: str) -> None:
+    """The fetch stage of :func:`transcribe` on its own: download and normalize to a 16 kHz wav."""
+    _add_static_ffmpeg_paths()
+    fetch_audio(url_or_file, wav_path)
+
+
+@dataclass
+class TranscribeResult:
+    """Outcome of one input of :func:`transcribe_many`."""
+
+    index: int
+    url_or_file: str
+    output_dir: Optional[str] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _fetch_stage(index: int, url_or_file: str, output_root: Optional[str], language: Optional[str]) -> tuple[str, str]:
+    """Producer stage of :func:`transcribe_many`: name the output dir and normalize the audio."""
+    output_dir = _resolve_output_dir(url_or_file, None, language, parent=output_root, index=index)
+    tmp_wav = make_temp_wav()
+    try:
+        fetch_audio(url_or_file, tmp_wav)
+        assert os.path.exists(tmp_wav), f"Path {tmp_wav} doesn't exist."
+    except BaseException:
+        _remove_temp_wav(tmp_wav)
+        raise
+    return output_dir, tmp_wav
+
+
+def transcribe_many(
+    inputs: Iterable[str],
+    output_root: Optional[str] = None,
+    model: Optional[str] = None,
+    task: Optional[str] = None,
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    embed: bool = False,
+    hugging_face_token: Optional[str] = None,
+    other_args: Optional[list[str]] = None,
+    initial_prompt: Optional[str] = None,
+    align: bool = False,
+    align_model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    multi_gpu: bool = False,
+    cpu_workers: int = 0,
+    prefetch: int = 2,
+    fetch_workers: int = 2,
+) -> Iterator[TranscribeResult]:
+    """
+    Transcribes many inputs, overlapping download / decode with inference.
+
+    A thread pool runs the fetch stage (yt-dlp + ffmpeg to a 16 kHz wav) for
+    up to ``prefetch`` upcoming inputs while the backend runs on the current
+    one, so the GPU isn't idle during downloads. Inference itself stays
+    serialized in the calling thread. ffmpeg paths and the computing device
+    are resolved once for the whole batch.
+
+    Results are yielded in input order as each item finishes. A failing item
+    yields a :class:`TranscribeResult` with ``error`` set; the batch carries
+    on with the next input. ``inputs`` is consumed lazily, so it may be a
+    generator over a very large batch.
+
+    Args:
+        inputs: Local files and/or URLs.
+        output_root: Parent directory for the per-input output dirs, which
+                     are named the way :func:`transcribe` names them with
+                     the input's index in front (``text_0003_clip``), so
+                     inputs sharing a basename don't overwrite each other.
+                     Defaults to the current directory.
+        prefetch: How many inputs to fetch ahead of the one being transcribed.
+                  Bounds the number of temporary wav files on disk.
+        fetch_workers: Threads running the fetch stage.
+        (remaining args): As for :func:`transcribe`, applied to every input.
+
+    Yields:
+        One :class:`TranscribeResult` per input.
+    """
+    _add_static_ffmpeg_paths()
+    device = device or get_computing_device()
+    prefetch = max(1, prefetch)
+    pending: deque[tuple[int, str, Future]] = deque()
+    items = enumerate(inputs)
+    executor = ThreadPoolExecutor(max_workers=max(1, fetch_workers), thread_name_prefix="transcribe-fetch")
+
+    def fill() -> None:
+        while len(pending) < prefetch:
+            try:
+                index, url_or_file = next(items)
+            except StopIteration:
+                return
+            if embed and not os.path.isfile(url_or_file):
+                future: Future = Future()
+                future.set_exception(NotImplementedError("Embedding is only supported for local files. " + "Please download the file first."))
+            else:
+                future = executor.submit(_fetch_stage, index, url_or_file, output_root, language)
+            pending.append((index, url_or_file, future))
+
+    try:
+        fill()
+        while pending:
+            index, url_or_file, future = pending.popleft()
+            try:
+                output_dir, tmp_wav = future.result()
+            except Exception as exc:
+                fill()
+                yield TranscribeResult(index=index, url_or_file=url_or_file, error=exc)
+                continue
+            # Queue the next download before occupying the backend.
+            fill()
+            result = TranscribeResult(index=index, url_or_file=url_or_file, output_dir=output_dir)
+            try:
+                result.output_dir = _transcribe_wav(
                     url_or_file,
-                    "-i",
-                    srt_file,
-                    "-vf",
-                    f"subtitles={fix_subtitles_path(srt_file)}",
-                    out_mp4,
-                ]
-                embed_ffmpeg_cmd = subprocess.list2cmdline(embed_ffmpeg_cmd_list)
-                print(f"Running:\n  {embed_ffmpeg_cmd}")
-                try:
-                    _ = subprocess.run(
-                        embed_ffmpeg_cmd,
-                        universal_newlines=True,
-                        check=True,
-                        capture_output=True,
-                        shell=True,
-                    )
-                except subprocess.CalledProcessError as exc:
-                    stdout = exc.stdout
-                    stderr = exc.stderr
-                    warnings.warn(f"ffmpeg failed with return code {exc.returncode}\n{stdout}\n{stderr}")
-                    raise
-        print(f"Done! Files were saved to {output_dir}")
-        return output_dir
+                    tmp_wav,
+                    output_dir,
+                    model=model,
+                    task=task,
+                    language=language,
+                    device=device,
+                    embed=embed,
+                    hugging_face_token=hugging_face_token,
+                    # _transcribe_wav appends the prompt to other_args in place.
+                    other_args=list(other_args) if other_args is not None else None,
+                    initial_prompt=initial_prompt,
+                    align=align,
+                    align_model=align_model,
+                    use_cache=use_cache,
+                    multi_gpu=multi_gpu,
+                    cpu_workers=cpu_workers,
+                )
+            except Exception as exc:
+                result.error = exc
+            finally:
+                _remove_temp_wav(tmp_wav)
+            yield result
     finally:
-        try:
-            os.remove(tmp_wav)
-        except Exception as exc:
-            warnings.warn(f"Failed to remove {tmp_wav}: {exc}")
+        # Reached on normal exhaustion and when the caller abandons the
+        # generator: drop queued fetches and clean up finished ones.
+        for _index, _url_or_file, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for _index, _url_or_file, future in pending:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                _remove_temp_wav(future.result()[1])
 
 
 if __name__ == "__main__":
@@ -2,14 +2,30 @@
 Fetches audio and handles transcoding it for it.
 """
 
+import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
+import wave
+from dataclasses import dataclass
+from typing import Any, Optional
 
 from transcribe_anything.util import PROCESS_TIMEOUT
-from transcribe_anything.ytldp_download import ytdlp_download
+from transcribe_anything.ytldp_download import (
+    get_video_info,
+    ytdlp_download,
+    ytdlp_stream_cmd,
+)
+
+STREAM_INGEST_ENV_VAR = "TRANSCRIBE_ANYTHING_STREAM_INGEST"
+
+
+def stream_ingest_enabled() -> bool:
+    """Streaming URL ingest is on unless ``TRANSCRIBE_ANYTHING_STREAM_INGEST=0``."""
+    return os.environ.get(STREAM_INGEST_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
 
 
 def _convert_to_wav(inpath: str, outpath: str, speech_normalization: bool = False) -> None:
@@ -54,10 +70,185 @@ def _convert_to_wav(inpath: str, outpath: str, speech_normalization: bool = Fals
     assert os.path.exists(outpath), f"The expected file {outpath} doesn't exist"
 
 
-def fetch_audio(url_or_file: str, out_wav: str) -> None:
-    """Fetches from the internet or from a local file and outputs a wav file."""
+def _stream_url_to_wav(url: str, outpath: str, speech_normalization: bool = False) -> None:
+    """Pipes yt-dlp's download straight into ffmpeg, writing the 16 kHz mono wav to ``outpath``.
+
+    Decoding overlaps the download and nothing but the final wav touches the
+    disk, instead of a downloaded file, a temp wav and a copy of it.
+    """
+    static_ffmpeg_path = shutil.which("static_ffmpeg")
+    if static_ffmpeg_path is None:
+        raise FileNotFoundError("No path for static_ffmpeg")
+    ytdlp_cmd = ytdlp_stream_cmd(url)
+    ffmpeg_cmd = [static_ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error", "-i", "pipe:0", "-vn"]
+    if speech_normalization:
+        ffmpeg_cmd += [
+            "-filter:a",
+            "speechnorm=e=12.5:r=0.00001:l=1",
+        ]
+    ffmpeg_cmd += ["-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", str(outpath)]
+    print(f"Running:\n  {subprocess.list2cmdline(ytdlp_cmd)} | {subprocess.list2cmdline(ffmpeg_cmd)}")
+    with subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE) as ytdlp_proc:
+        assert ytdlp_proc.stdout is not None
+        try:
+            with subprocess.Popen(ffmpeg_cmd, stdin=ytdlp_proc.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as ffmpeg_proc:
+                # Only ffmpeg holds the read end now, so yt-dlp gets EPIPE if ffmpeg dies.
+                ytdlp_proc.stdout.close()
+                _, ffmpeg_stderr = ffmpeg_proc.communicate(timeout=PROCESS_TIMEOUT)
+            ytdlp_proc.wait(timeout=PROCESS_TIMEOUT)
+        except BaseException:
+            ytdlp_proc.kill()
+            raise
+    if ytdlp_proc.returncode != 0:
+        raise subprocess.CalledProcessError(ytdlp_proc.returncode, ytdlp_cmd)
+    if ffmpeg_proc.returncode != 0:
+        stderr = ffmpeg_stderr.decode(errors="replace") if ffmpeg_stderr else ""
+        raise subprocess.CalledProcessError(ffmpeg_proc.returncode, ffmpeg_cmd, stderr=stderr)
+    assert os.path.exists(outpath), f"The expected file {outpath} doesn't exist"
+
+
+# What the backends consume: 16 kHz mono 16-bit PCM.
+TARGET_CODEC = "pcm_s16le"
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+# WAVE_FORMAT_PCM. A WAVE_FORMAT_EXTENSIBLE (0xfffe) header carries the same
+# samples, but ``wave`` can't open it before Python 3.12, so it is remuxed.
+WAVE_FORMAT_PCM_TAG = "0x0001"
+
+INGEST_ZERO_COPY = "zero-copy"
+INGEST_REMUX = "remux"
+INGEST_DECODE = "decode"
+# URL inputs: yt-dlp piped into ffmpeg, or downloaded and then converted.
+INGEST_STREAM = "stream"
+INGEST_DOWNLOAD = "download"
+
+
+@dataclass
+class IngestPlan:
+    """How a local file gets to a 16 kHz mono wav, decided from one ffprobe pass."""
+
+    mode: str  # INGEST_ZERO_COPY | INGEST_REMUX | INGEST_DECODE
+    reason: str
+
+
+@dataclass
+class IngestReport:
+    """The plan that ran and how long it took."""
+
+    mode: str
+    reason: str
+    seconds: float
+
+
+def _ffprobe(path: str) -> Optional[dict[str, Any]]:
+    """Container + stream info for ``path`` as ffprobe JSON, or None if ffprobe isn't usable."""
+    ffprobe_path = shutil.which("static_ffprobe") or shutil.which("ffprobe")
+    if ffprobe_path is None:
+        return None
+    cmd_list = [ffprobe_path, "-v", "error", "-show_format", "-show_streams", "-of", "json", str(path)]
+    try:
+        cp = subprocess.run(cmd_list, shell=False, check=True, capture_output=True, timeout=60)
+        return json.loads(cp.stdout)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as exc:
+        sys.stderr.write(f"ffprobe failed on {path}: {exc}\n")
+        return None
+
+
+def plan_ingest(probe: Optional[dict[str, Any]]) -> IngestPlan:
+    """Picks the cheapest way to turn a probed input into the backend wav."""
+    if not probe:
+        return IngestPlan(INGEST_DECODE, "no probe info")
+    streams = probe.get("streams") or []
+    audio = [stream for stream in streams if stream.get("codec_type") == "audio"]
+    if not audio:
+        return IngestPlan(INGEST_DECODE, "no audio stream found")
+    first = audio[0]
+    try:
+        sample_rate = int(first.get("sample_rate") or 0)
+    except ValueError:
+        sample_rate = 0
+    if first.get("codec_name") != TARGET_CODEC or sample_rate != TARGET_SAMPLE_RATE or first.get("channels") != TARGET_CHANNELS:
+        desc = f"{first.get('codec_name')} {sample_rate} Hz x{first.get('channels')}"
+        return IngestPlan(INGEST_DECODE, f"audio is {desc}")
+    format_names = str((probe.get("format") or {}).get("format_name", "")).split(",")
+    if "wav" in format_names and len(streams) == 1:
+        if str(first.get("codec_tag", "")).lower() == WAVE_FORMAT_PCM_TAG:
+            return IngestPlan(INGEST_ZERO_COPY, "already 16 kHz mono pcm_s16le wav")
+        return IngestPlan(INGEST_REMUX, f"pcm_s16le wav with format tag {first.get('codec_tag')}, not plain PCM")
+    return IngestPlan(INGEST_REMUX, "pcm_s16le 16 kHz mono audio in another container")
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, or a filesystem without hardlinks.
+        shutil.copyfile(src, dst)
+
+
+def ingest_local_file(path: str, out_wav: str) -> IngestReport:
+    """Writes the backend wav for a local file to ``out_wav``, skipping work the input doesn't need.
+
+    * zero-copy: the input already is a 16 kHz mono pcm_s16le wav, hardlink it.
+    * remux: the audio is already in that format, copy the stream into a wav.
+    * decode: full decode + resample of the first audio stream only; video is
+      never demuxed.
+    """
+    start = time.monotonic()
+    abspath = os.path.abspath(path)
+    out_wav_abs = os.path.abspath(out_wav)
+    plan = plan_ingest(_ffprobe(abspath))
+    if plan.mode == INGEST_ZERO_COPY:
+        _link_or_copy(abspath, out_wav_abs)
+    else:
+        static_ffmpeg_path = shutil.which("static_ffmpeg")
+        if static_ffmpeg_path is None:
+            raise FileNotFoundError("No path for static_ffmpeg")
+        cmd_list = [static_ffmpeg_path, "-y", "-i", abspath, "-map", "0:a:0", "-vn"]
+        if plan.mode == INGEST_REMUX:
+            cmd_list += ["-c:a", "copy"]
+        else:
+            cmd_list += ["-acodec", TARGET_CODEC, "-ar", str(TARGET_SAMPLE_RATE), "-ac", str(TARGET_CHANNELS)]
+        cmd_list += [out_wav_abs]
+        cmd_str = subprocess.list2cmdline(cmd_list)
+        sys.stderr.write(f"Running:\n  {cmd_str}\n")
+        try:
+            subprocess.run(
+                cmd_list,
+                shell=False,
+                check=True,
+                capture_output=True,
+                timeout=PROCESS_TIMEOUT,
+            )
+        except subprocess.CalledProcessError as exc:
+            print(f"Failed to run {cmd_str} with error {exc}")
+            print(f"stdout: {exc.stdout.decode(errors='replace')}")
+            print(f"stderr: {exc.stderr.decode(errors='replace')}")
+            raise
+    report = IngestReport(mode=plan.mode, reason=plan.reason, seconds=time.monotonic() - start)
+    sys.stderr.write(f"Ingest: {report.mode} ({report.reason}) in {report.seconds:.2f}s\n")
+    return report
+
+
+def fetch_audio(url_or_file: str, out_wav: str) -> IngestReport:
+    """Fetches from the internet or from a local file and outputs a wav file.
+
+    Returns the :class:`IngestReport` of the path that produced it.
+    """
     assert out_wav.endswith(".wav")
+    start = time.monotonic()
     if url_or_file.startswith("http") or url_or_file.startswith("ftp"):
+        if stream_ingest_enabled():
+            try:
+                _stream_url_to_wav(url_or_file, out_wav, speech_normalization=True)
+                sys.stderr.write("Downloading complete.\n")
+                return IngestReport(mode=INGEST_STREAM, reason="yt-dlp piped into ffmpeg", seconds=time.monotonic() - start)
+            except (subprocess.CalledProcessError, FileNotFoundError) as exc:
+                # Some extractors (e.g. fragmented DASH needing a merge) can't
+                # write to stdout; the download-then-convert path handles them.
+                sys.stderr.write(f"Streaming ingest failed ({exc}), falling back to a full download.\n")
         with tempfile.TemporaryDirectory() as tmpdir:
             print(f"Using temporary directory {tmpdir}")
             downloaded_file = ytdlp_download(url_or_file, os.path.abspath(tmpdir))
@@ -65,45 +256,36 @@ def fetch_audio(url_or_file: str, out_wav: str) -> None:
             _convert_to_wav(downloaded_file, out_wav, speech_normalization=True)
         sys.stderr.write("Downloading complete.\n")
         assert os.path.exists(out_wav), f"The expected file {out_wav} doesn't exist"
-    else:
-        assert os.path.isfile(url_or_file)
-        abspath = os.path.abspath(url_or_file)
-        out_wav_abs = os.path.abspath(out_wav)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            static_ffmpeg_path = shutil.which("static_ffmpeg")
-            if static_ffmpeg_path is None:
-                raise FileNotFoundError("No path for static_ffmpeg")
-            cmd_list = [
-                static_ffmpeg_path,
-                "-y",
-                "-i",
-                str(abspath),
-                "-acodec",
-                "pcm_s16le",
-                "-ar",
-                "16000",
-                "-ac",
-                "1",
-                "out.wav",
-            ]
-            cmd_str = subprocess.list2cmdline(cmd_list)
-            sys.stderr.write(f"Running:\n  {cmd_str}\n")
-            try:
-                subprocess.run(
-                    cmd_list,
-                    cwd=tmpdir,
-                    shell=False,
-                    check=False,
-                    capture_output=True,
-                    timeout=PROCESS_TIMEOUT,
-                )
-                shutil.copyfile(os.path.join(tmpdir, "out.wav"), out_wav_abs)
-            except subprocess.CalledProcessError as exc:
-                print(f"Failed to run {cmd_str} with error {exc}")
-                print(f"stdout: {exc.stdout.decode()}")
-                print(f"stderr: {exc.stderr.decode()}")
-                raise
-        assert os.path.exists(out_wav), f"The expected file {out_wav} doesn't exist"
+        reason = "streaming ingest disabled" if not stream_ingest_enabled() else "streaming ingest failed"
+        return IngestReport(mode=INGEST_DOWNLOAD, reason=reason, seconds=time.monotonic() - start)
+    assert os.path.isfile(url_or_file)
+    report = ingest_local_file(url_or_file, out_wav)
+    assert os.path.exists(out_wav), f"The expected file {out_wav} doesn't exist"
+    return report
+
+
+def probe_audio_seconds(url_or_file: str) -> Optional[float]:
+    """Duration of ``url_or_file`` in seconds without fetching the audio, or None if unknown.
+
+    Local files are read from the wav header, else ffprobe. URLs use yt-dlp's
+    ``-J`` metadata, which :func:`get_video_info` caches for the download.
+    """
+    if url_or_file.startswith("http") or url_or_file.startswith("ftp"):
+        try:
+            return get_video_info(url_or_file).duration
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, OSError) as exc:
+            sys.stderr.write(f"yt-dlp metadata pass failed for {url_or_file}: {exc}\n")
+            return None
+    try:
+        with wave.open(url_or_file, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (OSError, EOFError, wave.Error, ZeroDivisionError):
+        pass
+    probe = _ffprobe(url_or_file)
+    try:
+        return float(probe["format"]["duration"]) if probe else None
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def unit_test() -> None:
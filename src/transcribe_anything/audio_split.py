@@ -0,0 +1,171 @@
+"""
+Splits a normalized wav at silence and stitches per-piece transcripts back together.
+
+Used to transcribe one long recording on several workers at once (one
+backend process per GPU, or per CPU worker). Only the 16-bit mono wavs
+produced by :func:`transcribe_anything.audio.fetch_audio` are supported.
+
+Cut points are searched only in a window around each evenly spaced target,
+so even a multi-hour file is analysed in a fraction of a second without
+numpy: the cut lands on the quietest short frame near the target.
+"""
+
+import sys
+import wave
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_SEARCH_SECONDS = 30.0
+DEFAULT_FRAME_SECONDS = 0.05
+
+
+@dataclass
+class AudioPiece:
+    """One piece of a split wav; ``start``/``end`` are seconds into the original."""
+
+    index: int
+    start: float
+    end: float
+    path: Path
+
+
+def _read_samples(wav: wave.Wave_read, start_frame: int, num_frames: int) -> array:
+    wav.setpos(start_frame)
+    samples = array("h")
+    samples.frombytes(wav.readframes(num_frames))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+def _quietest_frame(samples: array, frame_len: int) -> int:
+    """Offset (in samples) of the centre of the lowest-energy ``frame_len`` frame."""
+    best_offset = 0
+    best_energy: Optional[int] = None
+    for offset in range(0, max(1, len(samples) - frame_len + 1), frame_len):
+        energy = sum(x * x for x in samples[offset : offset + frame_len])
+        if best_energy is None or energy < best_energy:
+            best_energy = energy
+            best_offset = offset
+    return best_offset + frame_len // 2
+
+
+def _check_format(wav: wave.Wave_read) -> None:
+    if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+        raise ValueError(f"expected a 16-bit mono wav, got {wav.getsampwidth() * 8}-bit x{wav.getnchannels()}")
+
+
+def find_split_points(
+    wav_path: Path,
+    num_pieces: int,
+    search_seconds: float = DEFAULT_SEARCH_SECONDS,
+    frame_seconds: float = DEFAULT_FRAME_SECONDS,
+) -> list[float]:
+    """Returns ``num_pieces - 1`` increasing cut times (seconds) at quiet points near even splits."""
+    with wave.open(str(wav_path), "rb") as wav:
+        _check_format(wav)
+        rate = wav.getframerate()
+        total = wav.getnframes()
+        frame_len = max(1, int(frame_seconds * rate))
+        search = int(search_seconds * rate)
+        cuts: list[int] = []
+        for i in range(1, num_pieces):
+            target = total * i // num_pieces
+            lo = max(cuts[-1] + frame_len if cuts else 0, target - search)
+            hi = min(total, target + search)
+            if hi - lo < frame_len:
+                cut = target
+            else:
+                cut = lo + _quietest_frame(_read_samples(wav, lo, hi - lo), frame_len)
+            if (cuts and cut <= cuts[-1]) or cut <= 0 or cut >= total:
+                continue
+            cuts.append(cut)
+    return [cut / rate for cut in cuts]
+
+
+def split_wav(wav_path: Path, out_dir: Path, cut_points: list[float]) -> list[AudioPiece]:
+    """Writes one wav per piece between consecutive ``cut_points`` into ``out_dir``."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    pieces: list[AudioPiece] = []
+    with wave.open(str(wav_path), "rb") as wav:
+        _check_format(wav)
+        rate = wav.getframerate()
+        total = wav.getnframes()
+        bounds = [0] + [int(round(t * rate)) for t in cut_points] + [total]
+        for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            piece_path = out_dir / f"piece_{index:03d}.wav"
+            wav.setpos(start)
+            with wave.open(str(piece_path), "wb") as out:
+                out.setnchannels(1)
+                out.setsampwidth(2)
+                out.setframerate(rate)
+                remaining = end - start
+                while remaining > 0:
+                    block = min(remaining, rate * 60)
+                    out.writeframes(wav.readframes(block))
+                    remaining -= block
+            pieces.append(AudioPiece(index=index, start=start / rate, end=end / rate, path=piece_path))
+    return pieces
+
+
+def _shift(value: Any, offset: float) -> Any:
+    return value + offset if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+
+
+def _offset_timestamps(node: Any, offset: float) -> Any:
+    """Shifts every ``timestamp`` pair and ``start``/``end`` value found in ``node`` by ``offset``."""
+    if isinstance(node, dict):
+        out: dict[str, Any] = {}
+        for key, value in node.items():
+            if key == "timestamp" and isinstance(value, (list, tuple)):
+                out[key] = [_shift(v, offset) for v in value]
+            elif key in ("start", "end"):
+                out[key] = _shift(value, offset)
+            else:
+                out[key] = _offset_timestamps(value, offset)
+        return out
+    if isinstance(node, list):
+        return [_offset_timestamps(item, offset) for item in node]
+    return node
+
+
+def _close_open_chunks(chunks: list[Any], length: float) -> list[Any]:
+    """Whisper leaves the last chunk's end as None; within a piece that's the piece's end."""
+    out = []
+    for chunk in chunks:
+        if isinstance(chunk, dict) and isinstance(chunk.get("timestamp"), (list, tuple)):
+            pair = list(chunk["timestamp"])
+            if len(pair) == 2 and pair[0] is not None and pair[1] is None:
+                chunk = dict(chunk, timestamp=[pair[0], length])
+        out.append(chunk)
+    return out
+
+
+def stitch_transcripts(parts: list[tuple[AudioPiece, dict[str, Any]]]) -> dict[str, Any]:
+    """Merges per-piece transcripts into one, offsetting every timestamp by its piece start.
+
+    Handles both the insanely-fast-whisper shape (``chunks`` with
+    ``timestamp`` pairs) and the openai-whisper shape (``segments`` with
+    ``start``/``end``, renumbered). Top-level keys other than ``text``,
+    ``chunks`` and ``segments`` are taken from the first piece.
+    """
+    merged: dict[str, Any] = {}
+    texts: list[str] = []
+    for piece, data in parts:
+        for key, value in data.items():
+            if key == "text":
+                if str(value).strip():
+                    texts.append(str(value).strip())
+            elif key in ("chunks", "segments"):
+                if key == "chunks":
+                    value = _close_open_chunks(value, piece.end - piece.start)
+                merged.setdefault(key, []).extend(_offset_timestamps(value, piece.start))
+            else:
+                merged.setdefault(key, value)
+    merged["text"] = " ".join(texts)
+    for index, segment in enumerate(merged.get("segments", [])):
+        if isinstance(segment, dict) and "id" in segment:
+            segment["id"] = index
+    return merged
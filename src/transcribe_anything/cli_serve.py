@@ -97,6 +97,12 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=200,
         help="cadence at which the streaming backend emits partial events (ms). Default 200.",
     )
+    parser.add_argument(
+        "--max-streams",
+        type=int,
+        default=1,
+        help="concurrent /v1/stream sessions. Above 1 they share one decoder per model and batch their decodes. Default 1.",
+    )
     parser.add_argument("--hf-token", default=None, help="HuggingFace token (never echoed to clients)")
     parser.add_argument(
         "--prefetch",
@@ -110,14 +116,62 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     )
     parser.add_argument("--max-batch-size", type=int, default=None, help="clamp client-supplied batch_size to this")
     parser.add_argument("--max-queue", type=int, default=8, help="max queued jobs (default: 8)")
+    parser.add_argument(
+        "--max-queue-wait",
+        type=float,
+        default=None,
+        help="reject jobs predicted to wait longer than this many seconds, from queued audio length x each model's measured speed (default: off)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="concurrent job slots, spread over the visible CUDA devices (default: 1). 0 = one slot per CUDA device.",
+    )
+    parser.add_argument(
+        "--fetch-ahead",
+        type=int,
+        default=0,
+        help="download and normalize the inputs of up to N queued jobs while the current one transcribes (default: 0, off)",
+    )
+    parser.add_argument(
+        "--fetch-scratch-bytes",
+        type=int,
+        default=2 * 1024 * 1024 * 1024,
+        help="cap on disk used by --fetch-ahead wav files (default: 2 GB)",
+    )
     parser.add_argument(
         "--max-upload-size",
         default=2 * 1024 * 1024 * 1024,
         type=int,
         help="max upload size in bytes (default: 2 GB)",
     )
-    parser.add_argument("--artifact-ttl", default=3600, type=int, help="artifact retention in seconds (default: 3600)")
+    parser.add_argument("--max-upload-sessions", default=32, type=int, help="max open resumable upload sessions; more get 429 (default: 32)")
+    parser.add_argument(
+        "--max-upload-reserved-bytes",
+        default=8 * 1024 * 1024 * 1024,
+        type=int,
+        help="max disk preallocated by open resumable upload sessions; more get 507 (default: 8 GB)",
+    )
+    parser.add_argument("--artifact-ttl", default=3600, type=int, help="artifact retention in seconds after a job finishes; 0 keeps them until DELETE (default: 3600)")
+    parser.add_argument(
+        "--max-job-root-bytes",
+        default=None,
+        type=int,
+        help="cap on disk used by job artifact dirs; the oldest finished jobs are evicted first (default: no cap)",
+    )
     parser.add_argument("--job-root", default=None, type=Path, help="directory for per-job scratch dirs")
+    parser.add_argument(
+        "--job-db",
+        default=None,
+        type=Path,
+        help="SQLite file that persists the job index across restarts (requires --job-root). Queued jobs are re-enqueued on startup.",
+    )
+    parser.add_argument(
+        "--requeue-interrupted",
+        action="store_true",
+        help="with --job-db, re-run jobs that were mid-transcription when the daemon died instead of marking them failed",
+    )
     parser.add_argument(
         "--shutdown-grace",
         default=60,
@@ -169,15 +223,25 @@ def _config_from_args(args: argparse.Namespace) -> "ServerConfig":  # type: igno
         prefetch=args.prefetch,
         max_batch_size=args.max_batch_size,
         max_queue=args.max_queue,
+        max_queue_wait_seconds=args.max_queue_wait,
+        workers=args.workers,
+        fetch_ahead=args.fetch_ahead,
+        fetch_scratch_bytes=args.fetch_scratch_bytes,
         max_upload_size_bytes=args.max_upload_size,
+        max_upload_sessions=args.max_upload_sessions,
+        max_upload_reserved_bytes=args.max_upload_reserved_bytes,
         artifact_ttl_seconds=args.artifact_ttl,
+        max_job_root_bytes=args.max_job_root_bytes,
         job_root=str(args.job_root) if args.job_root else None,
+        job_db=str(args.job_db) if args.job_db else None,
+        requeue_interrupted=bool(args.requeue_interrupted),
         shutdown_grace_seconds=args.shutdown_grace,
         allow_webhooks=bool(args.allow_webhooks),
         webhook_timeout_seconds=args.webhook_timeout,
         allow_stream=bool(args.allow_stream),
         max_stream_duration_seconds=args.max_stream_duration,
         stream_decode_interval_ms=args.stream_decode_interval_ms,
+        max_streams=args.max_streams,
     )
 
 
@@ -17,11 +17,27 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
 
+from transcribe_anything.util import sanitize_filename
+
+# Files at least this big go through the resumable upload protocol when the
+# daemon supports it (``resumable=None``).
+RESUMABLE_THRESHOLD_BYTES = 64 * 1024 * 1024
+DEFAULT_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_UPLOAD_PARALLELISM = 4
+# Rounds of "query what's missing, re-send it" before giving up.
+UPLOAD_MAX_ATTEMPTS = 8
+# While a job runs, long-polls return at least this often so the progress
+# line keeps moving.
+PROGRESS_REFRESH_SECONDS = 5.0
+# How long a submission answered with 429 keeps being retried.
+DEFAULT_BUSY_TIMEOUT_SECONDS = 15 * 60.0
+
 
 class RemoteTranscriberError(Exception):
     """Raised when a remote daemon rejects or fails a transcription request."""
@@ -68,6 +84,244 @@ def _collect_options(
     return options
 
 
+def _split_ranges(missing: list, chunk_bytes: int) -> list:
+    """Cuts the daemon's half-open ``[start, end)`` gaps into ``chunk_bytes`` ranges."""
+    ranges = []
+    for start, end in missing:
+        for offset in range(start, end, chunk_bytes):
+            ranges.append((offset, min(end, offset + chunk_bytes)))
+    return ranges
+
+
+def _read_range(path: Path, start: int, end: int) -> bytes:
+    with path.open("rb") as fh:
+        fh.seek(start)
+        return fh.read(end - start)
+
+
+def _range_headers(start: int, end: int, size: int) -> dict:
+    return {"Content-Range": f"bytes {start}-{end - 1}/{size}", "Content-Type": "application/octet-stream"}
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return min(30.0, 0.5 * (2**attempt))
+
+
+def _busy_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait after a 429: the daemon's ``Retry-After``, backed off on repeats."""
+    try:
+        retry_after = float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        retry_after = 0.0
+    return max(retry_after, _backoff_seconds(attempt))
+
+
+def _is_finalize(resp: httpx.Response) -> bool:
+    # A resumable upload keeps its bytes on a 429; only the finalize is retried.
+    return resp.request.url.path.endswith("/finalize")
+
+
+def _submit_until_admitted(client: httpx.Client, base_url: str, submit: Any, busy_timeout_seconds: float) -> httpx.Response:
+    """Calls ``submit()`` and, while the daemon answers 429, waits as told and resubmits."""
+    resp = submit()
+    deadline = time.time() + busy_timeout_seconds
+    attempt = 0
+    while resp.status_code == 429 and time.time() < deadline:
+        delay = min(_busy_delay(resp, attempt), max(0.0, deadline - time.time()))
+        sys.stderr.write(f"daemon at {base_url} is busy; retrying in {delay:.0f}s\n")
+        time.sleep(delay)
+        attempt += 1
+        resp = client.post(str(resp.request.url)) if _is_finalize(resp) else submit()
+    return resp
+
+
+async def _submit_until_admitted_async(client: httpx.AsyncClient, base_url: str, submit: Any, busy_timeout_seconds: float) -> httpx.Response:
+    """Async mirror of :func:`_submit_until_admitted`."""
+    resp = await submit()
+    deadline = time.time() + busy_timeout_seconds
+    attempt = 0
+    while resp.status_code == 429 and time.time() < deadline:
+        delay = min(_busy_delay(resp, attempt), max(0.0, deadline - time.time()))
+        sys.stderr.write(f"daemon at {base_url} is busy; retrying in {delay:.0f}s\n")
+        await asyncio.sleep(delay)
+        attempt += 1
+        resp = await client.post(str(resp.request.url)) if _is_finalize(resp) else await submit()
+    return resp
+
+
+def _use_resumable(resumable: Optional[bool], size: int, capabilities: Optional[dict], retry: bool = False) -> bool:
+    """Whether to upload resumably; ``retry`` (the daemon answered 429) routes any size that way.
+
+    A busy daemon is retried, and a resumable upload only re-sends its
+    finalize request, not the whole body.
+    """
+    if resumable is not None:
+        return resumable
+    return (retry or size >= RESUMABLE_THRESHOLD_BYTES) and bool((capabilities or {}).get("resumable_uploads"))
+
+
+def _long_poll_seconds(capabilities: Optional[dict]) -> float:
+    """How long one ``GET /v1/jobs/{id}?wait=`` may be held, or 0 if the daemon can't long-poll."""
+    if not (capabilities or {}).get("job_events"):
+        return 0.0
+    return float(capabilities.get("max_job_wait_seconds") or 0.0)
+
+
+def _job_poll_request(last_status: Optional[str], long_poll: float, remaining: float, request_timeout: float) -> tuple:
+    """``(params, timeout)`` for the next job-status request.
+
+    The first request returns at once so the client sees the initial
+    status; after that, with a long-polling daemon, each request is held
+    until the job leaves ``last_status``.
+    """
+    if not long_poll or last_status is None:
+        return {}, request_timeout
+    if last_status == "running":
+        long_poll = min(long_poll, PROGRESS_REFRESH_SECONDS)
+    wait = max(0.0, min(long_poll, remaining))
+    return {"wait": wait, "since": last_status}, request_timeout + wait
+
+
+def _describe_job(job: dict) -> str:
+    """``running 42% (eta 30s)`` from a job status dict."""
+    status = str(job.get("status"))
+    progress = job.get("progress")
+    if status != "running" or progress is None:
+        return status
+    eta = job.get("eta_seconds")
+    suffix = f" (eta {eta:.0f}s)" if eta is not None else ""
+    return f"{status} {100 * progress:.0f}%{suffix}"
+
+
+def _get_capabilities(client: httpx.Client, base_url: str) -> Optional[dict]:
+    try:
+        resp = client.get(f"{base_url}/v1/capabilities")
+    except httpx.HTTPError:
+        return None
+    return resp.json() if resp.status_code < 400 else None
+
+
+def _download_artifacts(client: httpx.Client, base_url: str, job_id: str, artifacts: list, out_path: Path) -> None:
+    if not artifacts:
+        raise RemoteTranscriberError(f"daemon job {job_id} reported no artifacts")
+    for name in artifacts:
+        dest = out_path / name
+        with client.stream("GET", f"{base_url}/v1/jobs/{job_id}/artifacts/{name}") as r:
+            if r.status_code >= 400:
+                raise RemoteTranscriberError(f"failed to download artifact {name}: {r.status_code} {r.text}")
+            with dest.open("wb") as fh:
+                for chunk in r.iter_bytes():
+                    fh.write(chunk)
+
+
+def _upload_resumable(
+    client: httpx.Client,
+    base_url: str,
+    local: Path,
+    options: dict,
+    chunk_bytes: int,
+    parallelism: int,
+) -> httpx.Response:
+    """Uploads ``local`` via ``/v1/uploads`` and returns the finalize response.
+
+    Ranges go up ``parallelism`` at a time. A range that fails (dropped
+    connection, 5xx) is not retried on its own: after each round the
+    client asks the daemon which bytes it actually has and re-sends only
+    those gaps, backing off between rounds.
+    """
+    size = local.stat().st_size
+    resp = client.post(f"{base_url}/v1/uploads", json={"filename": local.name, "size": size, "options": options})
+    if resp.status_code >= 400:
+        raise RemoteTranscriberError(f"daemon at {base_url} rejected upload: {resp.status_code} {resp.text}")
+    session = resp.json()
+    upload_url = f"{base_url}{session['upload_url']}"
+
+    def put_range(byte_range: tuple) -> Optional[str]:
+        start, end = byte_range
+        try:
+            r = client.put(upload_url, content=_read_range(local, start, end), headers=_range_headers(start, end, size))
+        except httpx.HTTPError as exc:
+            return str(exc)
+        if r.status_code >= 500:
+            return f"{r.status_code} {r.text}"
+        if r.status_code >= 400:
+            raise RemoteTranscriberError(f"daemon rejected range {start}-{end - 1}: {r.status_code} {r.text}")
+        return None
+
+    for attempt in range(UPLOAD_MAX_ATTEMPTS):
+        missing = session.get("missing") or []
+        if not missing:
+            break
+        with ThreadPoolExecutor(max_workers=max(1, parallelism), thread_name_prefix="ta-upload") as pool:
+            errors = [e for e in pool.map(put_range, _split_ranges(missing, chunk_bytes)) if e]
+        if errors:
+            sys.stderr.write(f"upload {session['upload_id']}: {len(errors)} range(s) failed ({errors[0]}); resuming\n")
+            time.sleep(_backoff_seconds(attempt))
+        try:
+            status = client.get(upload_url)
+        except httpx.HTTPError:
+            time.sleep(_backoff_seconds(attempt))
+            continue
+        if status.status_code >= 400:
+            raise RemoteTranscriberError(f"daemon lost upload {session['upload_id']}: {status.status_code} {status.text}")
+        session = status.json()
+    if session.get("missing"):
+        raise RemoteTranscriberError(f"upload {session['upload_id']} still incomplete after {UPLOAD_MAX_ATTEMPTS} attempts")
+    return client.post(f"{upload_url}/finalize")
+
+
+async def _upload_resumable_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    local: Path,
+    options: dict,
+    chunk_bytes: int,
+    parallelism: int,
+) -> httpx.Response:
+    """Async mirror of :func:`_upload_resumable`."""
+    size = local.stat().st_size
+    resp = await client.post(f"{base_url}/v1/uploads", json={"filename": local.name, "size": size, "options": options})
+    if resp.status_code >= 400:
+        raise RemoteTranscriberError(f"daemon at {base_url} rejected upload: {resp.status_code} {resp.text}")
+    session = resp.json()
+    upload_url = f"{base_url}{session['upload_url']}"
+    slots = asyncio.Semaphore(max(1, parallelism))
+
+    async def put_range(byte_range: tuple) -> Optional[str]:
+        start, end = byte_range
+        async with slots:
+            data = await asyncio.to_thread(_read_range, local, start, end)
+            try:
+                r = await client.put(upload_url, content=data, headers=_range_headers(start, end, size))
+            except httpx.HTTPError as exc:
+                return str(exc)
+        if r.status_code >= 500:
+            return f"{r.status_code} {r.text}"
+        if r.status_code >= 400:
+            raise RemoteTranscriberError(f"daemon rejected range {start}-{end - 1}: {r.status_code} {r.text}")
+        return None
+
+    for attempt in range(UPLOAD_MAX_ATTEMPTS):
+        missing = session.get("missing") or []
+        if not missing:
+            break
+        errors = [e for e in await asyncio.gather(*(put_range(r) for r in _split_ranges(missing, chunk_bytes))) if e]
+        if errors:
+            sys.stderr.write(f"upload {session['upload_id']}: {len(errors)} range(s) failed ({errors[0]}); resuming\n")
+            await asyncio.sleep(_backoff_seconds(attempt))
+        try:
+            status = await client.get(upload_url)
+        except httpx.HTTPError:
+            await asyncio.sleep(_backoff_seconds(attempt))
+            continue
+        if status.status_code >= 400:
+            raise RemoteTranscriberError(f"daemon lost upload {session['upload_id']}: {status.status_code} {status.text}")
+        session = status.json()
+    if session.get("missing"):
+        raise RemoteTranscriberError(f"upload {session['upload_id']} still incomplete after {UPLOAD_MAX_ATTEMPTS} attempts")
+    return await client.post(f"{upload_url}/finalize")
+
+
 def transcribe_remote(
     url_or_file: str,
     *,
@@ -85,11 +339,30 @@ def transcribe_remote(
     poll_interval_seconds: float = 1.0,
     request_timeout_seconds: float = 30.0,
     job_timeout_seconds: float = 60 * 60 * 4,
+    resumable: Optional[bool] = None,
+    upload_chunk_bytes: int = DEFAULT_UPLOAD_CHUNK_BYTES,
+    upload_parallelism: int = DEFAULT_UPLOAD_PARALLELISM,
+    busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
 ) -> str:
     """Submit a transcription job to a remote daemon and download artifacts locally.
 
     Returns the absolute path to the output directory, matching the shape
     of :func:`transcribe_anything.api.transcribe`.
+
+    Local files of ``RESUMABLE_THRESHOLD_BYTES`` or more are sent through
+    the daemon's resumable upload protocol when it advertises one:
+    ``upload_chunk_bytes`` ranges, ``upload_parallelism`` at a time, with
+    dropped ranges re-sent automatically. ``resumable=True`` / ``False``
+    forces the choice.
+
+    Job status is long-polled (``GET /v1/jobs/{id}?wait=``) when the
+    daemon advertises ``job_events``, so completion is seen as soon as it
+    happens; older daemons are polled every ``poll_interval_seconds``.
+
+    A busy daemon (429) is retried after its ``Retry-After``, backing off
+    on repeats, for up to ``busy_timeout_seconds``; 0 fails at once. A
+    rejected file is re-sent resumably (when the daemon supports it), so
+    further retries repeat only the finalize, not the upload.
     """
     base_url = _normalize_base_url(remote)
     headers = _build_headers(token)
@@ -109,41 +382,57 @@ def transcribe_remote(
 
     client = httpx.Client(timeout=request_timeout_seconds, headers=headers)
     try:
-        if is_url:
-            payload = {"url": url_or_file, **options}
-            resp = client.post(f"{base_url}/v1/transcribe", json=payload)
-        else:
+        capabilities = _get_capabilities(client, base_url)
+        # Local files sent so far; after a 429 the upload goes resumable.
+        attempts: list = []
+
+        def submit() -> httpx.Response:
+            if is_url:
+                payload = {"url": url_or_file, **options}
+                return client.post(f"{base_url}/v1/transcribe", json=payload)
             local = Path(url_or_file)
             if not local.is_file():
                 raise RemoteTranscriberError(f"local file not found: {url_or_file}")
+            attempts.append(local)
+            if _use_resumable(resumable, local.stat().st_size, capabilities, retry=len(attempts) > 1):
+                return _upload_resumable(client, base_url, local, options, upload_chunk_bytes, upload_parallelism)
             with local.open("rb") as fh:
                 files = {"file": (local.name, fh, "application/octet-stream")}
                 data = {"options": json.dumps(options)} if options else {}
-                resp = client.post(f"{base_url}/v1/transcribe", files=files, data=data)
+                return client.post(f"{base_url}/v1/transcribe", files=files, data=data)
+
+        resp = _submit_until_admitted(client, base_url, submit, busy_timeout_seconds)
         if resp.status_code >= 400:
             raise RemoteTranscriberError(f"daemon at {base_url} rejected submission: {resp.status_code} {resp.text}")
         body = resp.json()
         job_id = body["job_id"]
 
-        # Poll until terminal.
+        # Poll until terminal; a daemon that advertises job_events holds
+        # each request until the status changes instead.
         deadline = time.time() + job_timeout_seconds
+        long_poll = _long_poll_seconds(capabilities)
         last_status = None
+        last_line = None
         while True:
             if time.time() > deadline:
                 raise RemoteTranscriberError(f"job {job_id} timed out after {job_timeout_seconds}s")
-            jr = client.get(f"{base_url}/v1/jobs/{job_id}")
+            params, timeout = _job_poll_request(last_status, long_poll, deadline - time.time(), request_timeout_seconds)
+            jr = client.get(f"{base_url}/v1/jobs/{job_id}", params=params, timeout=timeout)
             if jr.status_code >= 400:
                 raise RemoteTranscriberError(f"daemon returned {jr.status_code} fetching job status: {jr.text}")
             job = jr.json()
             status = job.get("status")
-            if status != last_status:
-                sys.stderr.write(f"remote job {job_id}: {status}\n")
-                last_status = status
+            line = _describe_job(job)
+            if line != last_line:
+                sys.stderr.write(f"remote job {job_id}: {line}\n")
+                last_line = line
+            last_status = status
             if status == "completed":
                 break
             if status == "failed":
                 raise RemoteTranscriberError(f"daemon job {job_id} failed: {job.get('error')}")
-            time.sleep(poll_interval_seconds)
+            if not long_poll:
+                time.sleep(poll_interval_seconds)
 
         # Resolve output_dir similarly to api.transcribe's logic.
         if output_dir is None:
@@ -153,22 +442,124 @@ def transcribe_remote(
         out_path = Path(output_dir).resolve()
         out_path.mkdir(parents=True, exist_ok=True)
 
-        artifacts = job.get("artifacts") or []
-        if not artifacts:
-            raise RemoteTranscriberError(f"daemon job {job_id} reported no artifacts")
-        for name in artifacts:
-            dest = out_path / name
-            with client.stream("GET", f"{base_url}/v1/jobs/{job_id}/artifacts/{name}") as r:
-                if r.status_code >= 400:
-                    raise RemoteTranscriberError(f"failed to download artifact {name}: {r.status_code} {r.text}")
-                with dest.open("wb") as fh:
-                    for chunk in r.iter_bytes():
-                        fh.write(chunk)
+        _download_artifacts(client, base_url, job_id, job.get("artifacts") or [], out_path)
         return str(out_path)
     finally:
         client.close()
 
 
+def transcribe_remote_batch(
+    inputs: list[str],
+    *,
+    remote: str,
+    output_root: Optional[str] = None,
+    token: Optional[str] = None,
+    policy: str = "partial",
+    model: Optional[str] = None,
+    task: Optional[str] = None,
+    language: Optional[str] = None,
+    initial_prompt: Optional[str] = None,
+    align: bool = False,
+    align_model: Optional[str] = None,
+    other_args: Optional[list[str]] = None,
+    embed: bool = False,
+    poll_interval_seconds: float = 1.0,
+    request_timeout_seconds: float = 30.0,
+    job_timeout_seconds: float = 60 * 60 * 4,
+    busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+) -> list[dict]:
+    """Submit ``inputs`` (URLs) as one ``POST /v1/batches`` and download every result.
+
+    All inputs share the same options. With ``policy="atomic"`` the daemon
+    admits the whole batch or none of it (raising
+    :class:`RemoteTranscriberError` on a full queue); with ``"partial"`` it
+    admits what fits and the rest come back with status ``rejected``.
+
+    Artifacts of input ``i`` land in ``output_root/{i:04d}_{stem}``, with
+    the stem made filesystem-safe (``output_root`` defaults to
+    ``text_batch``). Returns one dict per input, in order:
+    ``{"input", "job_id", "status", "output_dir", "error"}``. A failed job,
+    one whose artifacts fail to download, or one deleted or reaped before
+    it finished does not stop the others from being collected. An atomic
+    batch the daemon is too busy for is retried as in :func:`transcribe_remote`.
+    """
+    base_url = _normalize_base_url(remote)
+    options = _collect_options(
+        model=model,
+        task=task,
+        language=language,
+        initial_prompt=initial_prompt,
+        align=align,
+        align_model=align_model,
+        other_args=other_args,
+        embed=embed,
+    )
+    root = Path(output_root or "text_batch").resolve()
+    results = [{"input": url, "job_id": None, "status": "rejected", "output_dir": None, "error": None} for url in inputs]
+
+    client = httpx.Client(timeout=request_timeout_seconds, headers=_build_headers(token))
+    try:
+        payload = {"inputs": list(inputs), "options": options, "policy": policy}
+        resp = _submit_until_admitted(client, base_url, lambda: client.post(f"{base_url}/v1/batches", json=payload), busy_timeout_seconds)
+        if resp.status_code >= 400:
+            raise RemoteTranscriberError(f"daemon at {base_url} rejected batch: {resp.status_code} {resp.text}")
+        body = resp.json()
+        batch_id = body["batch_id"]
+        by_job = {}
+        for entry in body.get("admitted") or []:
+            results[entry["index"]].update(job_id=entry["job_id"], status="queued")
+            by_job[entry["job_id"]] = entry["index"]
+        for entry in body.get("rejected") or []:
+            results[entry["index"]]["error"] = entry.get("error")
+
+        deadline = time.time() + job_timeout_seconds
+        last_line = None
+        while by_job:
+            if time.time() > deadline:
+                raise RemoteTranscriberError(f"batch {batch_id} timed out after {job_timeout_seconds}s")
+            br = client.get(f"{base_url}/v1/batches/{batch_id}")
+            if br.status_code == 404:
+                # The daemon drops a batch once none of its jobs are left.
+                for job_id, index in by_job.items():
+                    results[index].update(status="failed", error=f"job {job_id} is no longer part of batch {batch_id}")
+                break
+            if br.status_code >= 400:
+                raise RemoteTranscriberError(f"daemon returned {br.status_code} fetching batch status: {br.text}")
+            batch = br.json()
+            counts = batch.get("counts") or {}
+            line = ", ".join(f"{n} {status}" for status, n in counts.items() if n)
+            if line != last_line:
+                sys.stderr.write(f"remote batch {batch_id}: {line}\n")
+                last_line = line
+            listed = {job["job_id"] for job in batch.get("jobs") or []}
+            for job_id in [j for j in by_job if j not in listed]:
+                # Deleted or reaped before we saw it finish; it won't come back.
+                results[by_job.pop(job_id)].update(status="failed", error=f"job {job_id} is no longer part of batch {batch_id}")
+            for job in batch.get("jobs") or []:
+                index = by_job.get(job["job_id"])
+                if index is None or job["status"] not in ("completed", "failed"):
+                    continue
+                del by_job[job["job_id"]]
+                result = results[index]
+                result.update(status=job["status"], error=job.get("error"))
+                if job["status"] == "completed":
+                    stem = sanitize_filename(Path(Path(result["input"]).name).stem) or job["job_id"]
+                    out_path = root / f"{index:04d}_{stem}"
+                    out_path.mkdir(parents=True, exist_ok=True)
+                    try:
+                        _download_artifacts(client, base_url, job["job_id"], [a["name"] for a in job.get("artifacts") or []], out_path)
+                    except RemoteTranscriberError as exc:
+                        # e.g. the artifacts were reaped before we got to them.
+                        result.update(status="failed", error=str(exc))
+                        continue
+                    result["output_dir"] = str(out_path)
+            if by_job:
+                time.sleep(poll_interval_seconds)
+        return results
+    finally:
+        client.close()
+
+
 async def transcribe_remote_async(
     url_or_file: str,
     *,
@@ -186,6 +577,10 @@ async def transcribe_remote_async(
     poll_interval_seconds: float = 1.0,
     request_timeout_seconds: float = 30.0,
     job_timeout_seconds: float = 60 * 60 * 4,
+    resumable: Optional[bool] = None,
+    upload_chunk_bytes: int = DEFAULT_UPLOAD_CHUNK_BYTES,
+    upload_parallelism: int = DEFAULT_UPLOAD_PARALLELISM,
+    busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
 ) -> str:
     """Async mirror of :func:`transcribe_remote`.
 
@@ -211,40 +606,59 @@ async def transcribe_remote_async(
     is_url = url_or_file.startswith("http://") or url_or_file.startswith("https://") or url_or_file.startswith("ftp://")
 
     async with httpx.AsyncClient(timeout=request_timeout_seconds, headers=headers) as client:
-        if is_url:
-            payload = {"url": url_or_file, **options}
-            resp = await client.post(f"{base_url}/v1/transcribe", json=payload)
-        else:
+        try:
+            caps = await client.get(f"{base_url}/v1/capabilities")
+            capabilities = caps.json() if caps.status_code < 400 else None
+        except httpx.HTTPError:
+            capabilities = None
+        # Local files sent so far; after a 429 the upload goes resumable.
+        attempts: list = []
+
+        async def submit() -> httpx.Response:
+            if is_url:
+                payload = {"url": url_or_file, **options}
+                return await client.post(f"{base_url}/v1/transcribe", json=payload)
             local = Path(url_or_file)
             if not local.is_file():
                 raise RemoteTranscriberError(f"local file not found: {url_or_file}")
+            attempts.append(local)
+            if _use_resumable(resumable, local.stat().st_size, capabilities, retry=len(attempts) > 1):
+                return await _upload_resumable_async(client, base_url, local, options, upload_chunk_bytes, upload_parallelism)
             with local.open("rb") as fh:
                 files = {"file": (local.name, fh, "application/octet-stream")}
                 data = {"options": json.dumps(options)} if options else {}
-                resp = await client.post(f"{base_url}/v1/transcribe", files=files, data=data)
+                return await client.post(f"{base_url}/v1/transcribe", files=files, data=data)
+
+        resp = await _submit_until_admitted_async(client, base_url, submit, busy_timeout_seconds)
         if resp.status_code >= 400:
             raise RemoteTranscriberError(f"daemon at {base_url} rejected submission: {resp.status_code} {resp.text}")
         body = resp.json()
         job_id = body["job_id"]
 
         deadline = time.time() + job_timeout_seconds
+        long_poll = _long_poll_seconds(capabilities)
         last_status = None
+        last_line = None
         while True:
             if time.time() > deadline:
                 raise RemoteTranscriberError(f"job {job_id} timed out after {job_timeout_seconds}s")
-            jr = await client.get(f"{base_url}/v1/jobs/{job_id}")
+            params, timeout = _job_poll_request(last_status, long_poll, deadline - time.time(), request_timeout_seconds)
+            jr = await client.get(f"{base_url}/v1/jobs/{job_id}", params=params, timeout=timeout)
             if jr.status_code >= 400:
                 raise RemoteTranscriberError(f"daemon returned {jr.status_code} fetching job status: {jr.text}")
             job = jr.json()
             status = job.get("status")
-            if status != last_status:
-                sys.stderr.write(f"remote job {job_id}: {status}\n")
-                last_status = status
+            line = _describe_job(job)
+            if line != last_line:
+                sys.stderr.write(f"remote job {job_id}: {line}\n")
+                last_line = line
+            last_status = status
             if status == "completed":
                 break
             if status == "failed":
                 raise RemoteTranscriberError(f"daemon job {job_id} failed: {job.get('error')}")
-            await asyncio.sleep(poll_interval_seconds)
+            if not long_poll:
+                await asyncio.sleep(poll_interval_seconds)
 
         if output_dir is None:
             base = Path(url_or_file).name
@@ -0,0 +1,117 @@
+"""
+Multi-GPU sharding of one long recording for the insane backends.
+
+The wav is cut at quiet points into one piece per visible device, every
+piece runs through :func:`run_insanely_fast_whisper` pinned to its own
+device (each gets its own process / resident worker), and the per-piece
+``out.json`` files are stitched back into a single out.json / srt / vtt /
+txt with the timestamps offset to the original recording.
+
+Diarization is not sharded: speaker labels from independent pieces don't
+line up, so runs with a HF token use a single device.
+"""
+
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from transcribe_anything.audio_split import (
+    find_split_points,
+    split_wav,
+    stitch_transcripts,
+)
+from transcribe_anything.insanely_fast_whisper import (
+    convert_json_to_srt,
+    convert_json_to_text,
+    convert_to_webvtt,
+    get_device_ids,
+    get_wave_duration,
+    run_insanely_fast_whisper,
+)
+from transcribe_anything.progress import (
+    ProgressCallback,
+    ProgressTracker,
+    StageCallback,
+)
+
+# Below this, model load + split overhead outweighs the parallel speed-up.
+MIN_SHARD_SECONDS = 10 * 60
+
+
+def write_transcript_outputs(json_data: dict[str, Any], output_dir: Path, duration: float) -> None:
+    """Writes out.json / out.srt / out.txt / out.vtt for an insane-style transcript."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "out.json").write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+    srt_file = output_dir / "out.srt"
+    srt_file.write_text(convert_json_to_srt(json_data, duration), encoding="utf-8")
+    (output_dir / "out.txt").write_text(convert_json_to_text(json_data), encoding="utf-8")
+    convert_to_webvtt(srt_file, output_dir / "out.vtt")
+
+
+def run_insanely_fast_whisper_sharded(
+    input_wav: Path,
+    model: str,
+    output_dir: Path,
+    task: str,
+    language: str,
+    hugging_face_token: Optional[str] = None,
+    other_args: Optional[list[str]] = None,
+    flash: bool = False,
+    align: bool = False,
+    align_model: Optional[str] = None,
+    device_ids: Optional[list[str]] = None,
+    min_shard_seconds: float = MIN_SHARD_SECONDS,
+    backend_fn: Callable[..., None] = run_insanely_fast_whisper,
+    progress_callback: Optional[ProgressCallback] = None,
+    stage_callback: Optional[StageCallback] = None,
+) -> None:
+    """Transcribes ``input_wav`` split across ``device_ids`` (default: every visible card).
+
+    Falls back to a single ``backend_fn`` run when there is only one device,
+    the recording is shorter than ``min_shard_seconds``, or diarization is on.
+    """
+    common: dict[str, Any] = dict(
+        model=model,
+        task=task,
+        language=language,
+        hugging_face_token=hugging_face_token,
+        other_args=other_args,
+        flash=flash,
+        align=align,
+        align_model=align_model,
+    )
+    if stage_callback is not None:
+        common["stage_callback"] = stage_callback
+    if device_ids is None:
+        device_ids = get_device_ids()
+    duration = get_wave_duration(input_wav)
+    if len(device_ids) < 2 or duration < min_shard_seconds or hugging_face_token:
+        single: dict[str, Any] = {"progress_callback": progress_callback} if progress_callback is not None else {}
+        backend_fn(input_wav=input_wav, output_dir=output_dir, device_id=device_ids[0] if device_ids else None, **common, **single)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="ta-shards-") as tmpdir:
+        tmp = Path(tmpdir)
+        pieces = split_wav(input_wav, tmp / "audio", find_split_points(input_wav, len(device_ids)))
+        print(f"Sharding {duration:.0f}s of audio into {len(pieces)} pieces across devices {', '.join(device_ids[: len(pieces)])}")
+
+        # Each piece decodes in one pipeline call; progress moves as pieces finish.
+        tracker = ProgressTracker(progress_callback, duration)
+        tracker.update(0.0)
+        piece_done = [0.0] * len(pieces)
+
+        def run_piece(index: int) -> dict[str, Any]:
+            piece_dir = tmp / f"out_{index:03d}"
+            piece_args = dict(common, other_args=list(other_args) if other_args is not None else None)
+            backend_fn(input_wav=pieces[index].path, output_dir=piece_dir, device_id=device_ids[index], **piece_args)
+            piece_done[index] = pieces[index].end - pieces[index].start
+            tracker.update(sum(piece_done))
+            return json.loads((piece_dir / "out.json").read_text(encoding="utf-8"))
+
+        with ThreadPoolExecutor(max_workers=len(pieces), thread_name_prefix="insane-shard") as executor:
+            results = list(executor.map(run_piece, range(len(pieces))))
+
+    stitched = stitch_transcripts(list(zip(pieces, results)))
+    write_transcript_outputs(stitched, output_dir, duration)
@@ -0,0 +1,275 @@
+"""
+Host-side manager for the resident insane / insane-flash model worker.
+
+``run_insanely_fast_whisper`` used to spawn the ``insanely-fast-whisper``
+CLI for every file, paying the Python + torch import and a full model
+load before the first second of audio was decoded. For batches of short
+clips that load dominated wall-clock time.
+
+This module keeps one long-lived ``insane_worker_runner.py`` process per
+(model, device, flash) inside the insane iso-env and hands it jobs over a
+JSON-lines protocol. Workers live until the host process exits (or
+:func:`shutdown_workers` is called), so a daemon or a bulk run reuses the
+loaded pipeline across every job.
+
+Only the plain transcription path is served by the worker. Jobs that need
+diarization (``--hf-token``) or backend args the worker doesn't understand
+fall back to the one-shot CLI. Set ``TRANSCRIBE_ANYTHING_INSANE_WORKER=0``
+to disable the worker entirely.
+
+Every read from the worker has a deadline. A worker that stops answering
+(a wedged CUDA context, a deadlock) is killed and the job raises
+:class:`InsaneWorkerError`, so the caller can fall back to the CLI instead
+of holding its slot forever.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+HERE = Path(__file__).parent
+RUNNER = HERE / "insane_worker_runner.py"
+WORKER_ENV_VAR = "TRANSCRIBE_ANYTHING_INSANE_WORKER"
+
+_FALSE_VALUES = {"0", "false", "f", "no", "n", "off"}
+
+# Startup includes the first model download, which can be several GB.
+START_TIMEOUT_SECONDS = 60 * 60
+# A job may take this long plus its audio length (real time); the GPU
+# pipeline runs tens of times faster, so only a hung worker hits it.
+JOB_TIMEOUT_BASE_SECONDS = 10 * 60
+JOB_TIMEOUT_PER_AUDIO_SECOND = 1.0
+
+
+def job_timeout_seconds(audio_seconds: float) -> float:
+    """Deadline for one worker job on ``audio_seconds`` of audio."""
+    return JOB_TIMEOUT_BASE_SECONDS + JOB_TIMEOUT_PER_AUDIO_SECOND * max(0.0, audio_seconds)
+
+
+class InsaneWorkerError(OSError):
+    """Raised when the resident worker fails to start or to run a job."""
+
+
+@dataclass(frozen=True)
+class WorkerKey:
+    """Identity of a loaded pipeline. One worker process per distinct key."""
+
+    model: str
+    device_id: str
+    flash: bool
+
+
+def worker_enabled() -> bool:
+    """Return False when the user opted out via ``TRANSCRIBE_ANYTHING_INSANE_WORKER``."""
+    value = os.environ.get(WORKER_ENV_VAR, "").strip().lower()
+    return value not in _FALSE_VALUES
+
+
+def parse_worker_args(backend_args: list[str]) -> Optional[dict[str, Any]]:
+    """Map residual backend args onto worker job options.
+
+    Returns ``None`` if any arg isn't something the worker can honour, in
+    which case the caller must use the one-shot CLI instead. ``--flash`` is
+    accepted because it is part of the :class:`WorkerKey`, not the job.
+    """
+    options: dict[str, Any] = {"timestamp": "chunk"}
+    index = 0
+    while index < len(backend_args):
+        arg = backend_args[index]
+        flag, _, inline_value = arg.partition("=")
+        if flag not in ("--timestamp", "--flash"):
+            return None
+        if inline_value:
+            value: Optional[str] = inline_value
+            index += 1
+        elif index + 1 < len(backend_args) and not backend_args[index + 1].startswith("-"):
+            value = backend_args[index + 1]
+            index += 2
+        else:
+            value = None
+            index += 1
+        if flag == "--timestamp":
+            if value not in ("chunk", "word"):
+                return None
+            options["timestamp"] = value
+    return options
+
+
+class InsaneWorker:
+    """One resident ``insane_worker_runner.py`` process.
+
+    Jobs are serialized with a lock: the pipeline is single-tenant on its
+    device, and the protocol is strictly request/response.
+    """
+
+    def __init__(self, iso_env: Any, key: WorkerKey, env: Optional[dict[str, str]] = None) -> None:
+        self.iso_env = iso_env
+        self.key = key
+        self.env = env
+        self._proc: Optional[subprocess.Popen] = None
+        # Lines from the worker's stdout, fed by a reader thread so reads can
+        # time out; None marks EOF.
+        self._lines: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, timeout: float = START_TIMEOUT_SECONDS) -> None:
+        """Spawn the worker and block until it reports the model is loaded."""
+        cmd_list = [
+            "python",
+            str(RUNNER),
+            "--model-name",
+            self.key.model,
+            "--device-id",
+            self.key.device_id,
+            "--flash",
+            str(self.key.flash),
+        ]
+        sys.stderr.write(f"Starting resident insane worker:\n  {subprocess.list2cmdline(cmd_list)}\n")
+        self._proc = self.iso_env.open_proc(  # pylint: disable=consider-using-with
+            cmd_list,
+            shell=False,
+            universal_newlines=True,
+            encoding="utf-8",
+            env=self.env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump_stdout, args=(self._proc, self._lines), name="insane-worker-stdout", daemon=True).start()
+        message = self._read_message(timeout)
+        if message.get("type") != "ready":
+            self.close()
+            raise InsaneWorkerError(f"insane worker failed to load {self.key.model}:\n{message.get('error')}")
+
+    def transcribe(
+        self,
+        input_wav: Path,
+        transcript_path: Path,
+        task: str,
+        language: str,
+        batch_size: Optional[int],
+        timestamp: str = "chunk",
+        timeout: float = JOB_TIMEOUT_BASE_SECONDS,
+    ) -> None:
+        """Run one job on the resident pipeline, writing ``transcript_path``.
+
+        Raises :class:`InsaneWorkerError` (after killing the worker) if no
+        answer arrives within ``timeout`` seconds.
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            "type": "job",
+            "id": job_id,
+            "file_name": str(input_wav),
+            "transcript_path": str(transcript_path),
+            "task": task,
+            "language": language or None,
+            "batch_size": batch_size,
+            "timestamp": timestamp,
+        }
+        with self._lock:
+            if not self.is_alive:
+                raise InsaneWorkerError("insane worker is not running")
+            proc = self._proc
+            assert proc is not None and proc.stdin is not None
+            try:
+                proc.stdin.write(json.dumps(job) + "\n")
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError) as exc:
+                raise InsaneWorkerError(f"insane worker went away: {exc}") from exc
+            message = self._read_message(timeout)
+        if message.get("type") != "done" or message.get("id") != job_id:
+            raise InsaneWorkerError(f"insane worker failed on {input_wav}:\n{message.get('error')}")
+
+    def close(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None and proc.stdin is not None:
+                proc.stdin.write(json.dumps({"type": "shutdown"}) + "\n")
+                proc.stdin.flush()
+                proc.stdin.close()
+            proc.wait(timeout=10)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    @staticmethod
+    def _pump_stdout(proc: subprocess.Popen, lines: queue.Queue) -> None:
+        assert proc.stdout is not None
+        try:
+            for line in iter(proc.stdout.readline, ""):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
+
+    def _read_message(self, timeout: float) -> dict[str, Any]:
+        proc = self._proc
+        assert proc is not None
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            self._proc = None
+            proc.kill()
+            proc.wait()
+            raise InsaneWorkerError(f"insane worker gave no answer within {timeout:.0f}s; killed it") from None
+        if line is None:
+            returncode = proc.wait()
+            raise InsaneWorkerError(f"insane worker exited unexpectedly (exit {returncode})")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise InsaneWorkerError(f"insane worker sent an invalid response: {line!r}") from exc
+
+
+_WORKERS: dict[WorkerKey, InsaneWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_worker(iso_env: Any, key: WorkerKey, env: Optional[dict[str, str]] = None) -> InsaneWorker:
+    """Return the live worker for ``key``, starting one if needed."""
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is not None and worker.is_alive:
+            return worker
+        worker = InsaneWorker(iso_env, key, env=env)
+        worker.start()
+        _WORKERS[key] = worker
+        return worker
+
+
+def discard_worker(key: WorkerKey) -> None:
+    """Drop (and stop) the worker for ``key`` so the next job starts fresh."""
+    with _WORKERS_LOCK:
+        worker = _WORKERS.pop(key, None)
+    if worker is not None:
+        worker.close()
+
+
+def shutdown_workers() -> None:
+    """Stop every resident worker. Registered with ``atexit``."""
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_workers)
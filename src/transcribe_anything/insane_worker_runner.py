@@ -0,0 +1,127 @@
+# pylint: skip-file
+"""
+Resident model worker for the insane / insane-flash backends.
+
+Runs inside the insane iso-env. Loads the HF ``automatic-speech-recognition``
+pipeline ONCE, then serves transcription jobs over a JSON-lines protocol
+on stdin/stdout so the host pays the Python + torch import and model load
+a single time instead of once per file.
+
+Protocol (one JSON object per line):
+
+* worker → host, after the model is loaded: ``{"type": "ready", ...}``
+* host → worker: ``{"type": "job", "id": ..., "file_name": ...,
+  "transcript_path": ..., "task": ..., "language": ..., "batch_size": ...,
+  "timestamp": "chunk" | "word"}``
+* worker → host: ``{"type": "done", "id": ...}`` or
+  ``{"type": "error", "id": ..., "error": "..."}``
+* host → worker: ``{"type": "shutdown"}`` (or EOF on stdin) to exit.
+
+The transcript written to ``transcript_path`` has the same shape the
+``insanely-fast-whisper`` CLI writes (``speakers`` / ``chunks`` / ``text``),
+so the host-side post-processing doesn't care which path produced it.
+
+Everything the pipeline prints goes to stderr; stdout is reserved for the
+protocol.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import traceback
+from typing import Any, TextIO
+
+DEFAULT_BATCH_SIZE = 24
+
+
+def _str_to_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _send(proto: TextIO, message: dict[str, Any]) -> None:
+    proto.write(json.dumps(message) + "\n")
+    proto.flush()
+
+
+def _torch_device(device_id: str) -> str:
+    if device_id == "mps":
+        return "mps"
+    if device_id.isdigit():
+        return f"cuda:{device_id}"
+    return device_id
+
+
+def _run_job(pipe: Any, model_name: str, job: dict[str, Any]) -> None:
+    language = job.get("language") or None
+    generate_kwargs: dict[str, Any] = {"task": job.get("task") or "transcribe", "language": language}
+    if model_name.split(".")[-1] == "en":
+        generate_kwargs.pop("task")
+    ts: Any = "word" if job.get("timestamp") == "word" else True
+    outputs = pipe(
+        job["file_name"],
+        chunk_length_s=30,
+        batch_size=int(job.get("batch_size") or DEFAULT_BATCH_SIZE),
+        generate_kwargs=generate_kwargs,
+        return_timestamps=ts,
+    )
+    result = {"speakers": [], "chunks": outputs["chunks"], "text": outputs["text"]}
+    with open(job["transcript_path"], "w", encoding="utf8") as fp:
+        json.dump(result, fp, ensure_ascii=False)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Resident insanely-fast-whisper model worker.")
+    parser.add_argument("--model-name", required=True)
+    parser.add_argument("--device-id", required=True)
+    parser.add_argument("--flash", default="False", type=_str_to_bool)
+    args = parser.parse_args()
+
+    # Reserve the real stdout for the protocol; anything transformers or
+    # torch prints lands on stderr instead of corrupting a response line.
+    proto = sys.stdout
+    sys.stdout = sys.stderr
+
+    try:
+        import torch  # type: ignore
+        from transformers import pipeline  # type: ignore
+
+        pipe = pipeline(
+            "automatic-speech-recognition",
+            model=args.model_name,
+            torch_dtype=torch.float16,
+            device=_torch_device(args.device_id),
+            model_kwargs={"attn_implementation": "flash_attention_2"} if args.flash else {"attn_implementation": "sdpa"},
+        )
+        if args.device_id == "mps":
+            torch.mps.empty_cache()
+    except Exception:
+        _send(proto, {"type": "error", "id": None, "error": traceback.format_exc()})
+        return 1
+
+    _send(proto, {"type": "ready", "model": args.model_name, "device_id": args.device_id, "flash": args.flash})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as exc:
+            _send(proto, {"type": "error", "id": None, "error": f"invalid job line: {exc}"})
+            continue
+        if job.get("type") == "shutdown":
+            break
+        job_id = job.get("id")
+        try:
+            _run_job(pipe, args.model_name, job)
+        except Exception:
+            _send(proto, {"type": "error", "id": job_id, "error": traceback.format_exc()})
+            continue
+        _send(proto, {"type": "done", "id": job_id})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,7 +24,22 @@ import webvtt  # type: ignore
 
 from transcribe_anything.cuda_available import CudaInfo
 from transcribe_anything.generate_speaker_json import generate_speaker_json
+from transcribe_anything.insane_worker import (
+    InsaneWorkerError,
+    WorkerKey,
+    discard_worker,
+    get_worker,
+    job_timeout_seconds,
+    parse_worker_args,
+    worker_enabled,
+)
 from transcribe_anything.insanley_fast_whisper_reqs import get_environment
+from transcribe_anything.progress import (
+    ProgressCallback,
+    ProgressTracker,
+    StageCallback,
+    timed_stage,
+)
 from transcribe_anything.util import (
     get_static_ffmpeg_runtime_dir,
     print_cuda_diagnostics,
@@ -269,6 +284,16 @@ def get_device_id() -> str:
     return f"{device_id}"
 
 
+def get_device_ids() -> list[str]:
+    """All usable device ids, largest card first."""
+    if sys.platform == "darwin":
+        return ["mps"]
+    cuda_info = get_cuda_info()
+    if not cuda_info.cuda_available:
+        return []
+    return [f"{device.device_id}" for device in cuda_info.cuda_devices]
+
+
 def get_batch_size() -> int | None:
     """Returns the batch size."""
     if sys.platform == "darwin":
@@ -382,6 +407,40 @@ def trim_text_chunks(json_data: dict[str, Any]) -> None:
     visit(json_data)
 
 
+def _run_in_worker(
+    iso_env: Any,
+    key: WorkerKey,
+    env: dict[str, str],
+    input_wav: Path,
+    outfile: Path,
+    task: str,
+    language: str,
+    batch_size: int | None,
+    timestamp: str,
+    audio_seconds: float,
+) -> bool:
+    """Transcribe on the resident worker. Returns False if the caller should fall back to the CLI."""
+    try:
+        worker = get_worker(iso_env, key, env=env)
+        sys.stderr.write(f"Transcribing {input_wav} on resident worker ({key.model} on device {key.device_id})\n")
+        worker.transcribe(
+            input_wav=input_wav,
+            transcript_path=outfile,
+            task=task,
+            language=language,
+            batch_size=batch_size,
+            timestamp=timestamp,
+            timeout=job_timeout_seconds(audio_seconds),
+        )
+        return True
+    except InsaneWorkerError as exc:
+        warnings.warn(f"Resident insane worker failed, falling back to the CLI: {exc}")
+        # The worker still holds the model on the GPU; the CLI fallback loads
+        # its own copy, so free the device before handing off.
+        discard_worker(key)
+        return False
+
+
 def run_insanely_fast_whisper(
     input_wav: Path,
     model: str,
@@ -394,9 +453,21 @@ def run_insanely_fast_whisper(
     align: bool = False,
     align_model: str | None = None,
     use_xpu: bool = False,
+    device_id: str | None = None,
+    progress_callback: ProgressCallback | None = None,
+    stage_callback: StageCallback | None = None,
 ) -> None:
     """Runs insanely fast whisper.
 
+    ``device_id`` pins the run to one CUDA device; by default the first
+    (largest) visible card is used.
+
+    The backend decodes the whole file in one pipeline call and prints no
+    per-segment output, so ``progress_callback`` only sees 0 at the start
+    and the full duration at the end (enough for the daemon's job status;
+    the CLI doesn't wire it up for this backend). ``stage_callback``
+    receives the time spent in the ``align`` pass as ``"alignment"``.
+
     When ``align`` is true, runs WhisperX's wav2vec2 forced-alignment pass
     on the transcript to replace HF Whisper's segment-level timestamps
     with phoneme-precise word-level timestamps. Reuses the WhisperX
@@ -425,11 +496,14 @@ def run_insanely_fast_whisper(
         # Assume it's not a namespace model, so add the namespace.
         model = f"openai/whisper-{model}"
     wave_duration = get_wave_duration(input_wav)
+    tracker = ProgressTracker(progress_callback, wave_duration)
+    tracker.update(0.0)
     # if sys.platform == "win32":
     # Set the text mode to UTF-8 on Windows.
     # cmd_list.extend(["cmd.exe", "/c"])
     # cmd_list.extend(["chcp", "65001", "&&"])
     if use_xpu:
+        device_id = "xpu"
         xpu_script = HERE / "_xpu_whisper.py"
         cmd_list += [
             "python",
@@ -438,7 +512,7 @@ def run_insanely_fast_whisper(
             "xpu",
         ]
     else:
-        device_id = get_device_id()
+        device_id = device_id or get_device_id()
         cmd_list += [
             "insanely-fast-whisper",
             "--device-id",
@@ -490,21 +564,43 @@ def run_insanely_fast_whisper(
     # Mask --hf-token's value before any logging/error so the token doesn't
     # leak into stdout, error responses, or downstream observability tools.
     cmd_safe = re.sub(r"(--hf[-_]token)\s+\S+", r"\1 <REDACTED>", cmd)
-    sys.stderr.write(f"Running:\n  {cmd_safe}\n")
-    proc = iso_env.open_proc(  # pylint: disable=consider-using-with
-        cmd_list,
-        shell=False,
-        universal_newlines=True,
-        encoding="utf-8",
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    stdout, stderr = proc.communicate()
-    if proc.returncode != 0:
-        msg = f"Failed to execute {cmd_safe}\n--- stderr ---\n{stderr}\n--- stdout ---\n{stdout}\n"
-        raise OSError(msg)
+    # The resident worker keeps the pipeline loaded between files. It only
+    # serves plain transcription; diarization and unknown backend args go
+    # through the one-shot CLI below.
+    ran_in_worker = False
+    worker_options = None
+    if not use_xpu and not hugging_face_token and worker_enabled():
+        worker_options = parse_worker_args(backend_args)
+    if worker_options is not None:
+        ran_in_worker = _run_in_worker(
+            iso_env=iso_env,
+            key=WorkerKey(model=model, device_id=device_id, flash=flash),
+            env=env,
+            input_wav=input_wav,
+            outfile=outfile,
+            task=task,
+            language=language,
+            batch_size=batch_size,
+            timestamp=worker_options["timestamp"],
+            audio_seconds=wave_duration,
+        )
+    if not ran_in_worker:
+        sys.stderr.write(f"Running:\n  {cmd_safe}\n")
+        proc = iso_env.open_proc(  # pylint: disable=consider-using-with
+            cmd_list,
+            shell=False,
+            universal_newlines=True,
+            encoding="utf-8",
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = proc.communicate()
+        if proc.returncode != 0:
+            msg = f"Failed to execute {cmd_safe}\n--- stderr ---\n{stderr}\n--- stdout ---\n{stdout}\n"
+            raise OSError(msg)
     assert outfile.exists(), f"Expected {outfile} to exist."
+    tracker.done()
     json_text = outfile.read_text(encoding="utf-8")
     json_data = json.loads(json_text)
     trim_text_chunks(json_data)
@@ -512,12 +608,13 @@ def run_insanely_fast_whisper(
     if align:
         from transcribe_anything.insane_align import apply_forced_alignment
 
-        json_data = apply_forced_alignment(
-            json_data,
-            input_wav=input_wav,
-            language=language,
-            align_model=align_model,
-        )
+        with timed_stage(stage_callback, "alignment"):
+            json_data = apply_forced_alignment(
+                json_data,
+                input_wav=input_wav,
+                language=language,
+                align_model=align_model,
+            )
         trim_text_chunks(json_data)
 
     json_data_str = json.dumps(json_data, indent=2)
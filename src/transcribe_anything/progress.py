@@ -0,0 +1,120 @@
+"""
+Progress reporting from the backend runners.
+
+Every runner that takes a ``progress_callback`` calls it as
+``callback(processed_seconds, total_seconds)``: how much of the input
+audio has been transcribed so far, against its duration from
+:func:`~transcribe_anything.insanely_fast_whisper.get_wave_duration`.
+
+The whisper and whisperx CLIs print each segment as it is decoded
+(``[00:12.000 --> 00:15.480]  text`` / ``Transcript: [12.0 --> 15.48] text``);
+the end timestamp of the latest segment is the processed position.
+Backends that print nothing incremental (insanely-fast-whisper's single
+pipeline call) report 0 at start and the full duration when done; the
+sharded / windowed runners report per piece.
+
+A ``stage_callback(stage, seconds)`` likewise receives the wall time of
+each pipeline stage (``fetch``, ``inference``, ``alignment``,
+``postprocess``); the daemon turns these into ``/metrics`` histograms.
+"""
+
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TextIO
+
+# (processed_seconds, total_seconds)
+ProgressCallback = Callable[[float, float], None]
+# (stage, seconds)
+StageCallback = Callable[[str, float], None]
+
+# "--> 00:15.480]" (whisper), "--> 01:02:03.5]" and "--> 15.48]" (whisperx).
+_SEGMENT_END = re.compile(r"-->\s*(\d+(?::\d+){0,2}(?:\.\d+)?)\s*\]")
+
+
+@contextmanager
+def timed_stage(stage_callback: Optional[StageCallback], stage: str) -> Iterator[None]:
+    """Reports the wall time of the ``with`` body as ``stage``, if it completes."""
+    start = time.monotonic()
+    yield
+    if stage_callback is not None:
+        stage_callback(stage, time.monotonic() - start)
+
+
+def parse_segment_end(line: str) -> Optional[float]:
+    """End time in seconds of the segment printed on ``line``, or None."""
+    match = _SEGMENT_END.search(line)
+    if match is None:
+        return None
+    seconds = 0.0
+    for part in match.group(1).split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+class ProgressTracker:
+    """Forwards monotonically increasing, clamped progress to ``callback``."""
+
+    def __init__(self, callback: Optional[ProgressCallback], total_seconds: float) -> None:
+        self.callback = callback
+        self.total_seconds = max(0.0, float(total_seconds))
+        self.processed_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, processed_seconds: float) -> None:
+        with self._lock:
+            processed = min(max(processed_seconds, self.processed_seconds), self.total_seconds)
+            if processed == self.processed_seconds and processed > 0:
+                return
+            self.processed_seconds = processed
+        if self.callback is not None:
+            self.callback(processed, self.total_seconds)
+
+    def feed_line(self, line: str) -> None:
+        end = parse_segment_end(line)
+        if end is not None:
+            self.update(end)
+
+    def done(self) -> None:
+        self.update(self.total_seconds)
+
+
+def pump_lines(stream: TextIO, tracker: ProgressTracker, echo: Optional[TextIO] = None, sink: Optional[list] = None) -> threading.Thread:
+    """Reads ``stream`` line by line on a daemon thread, feeding ``tracker``.
+
+    Lines are echoed to ``echo`` (so the user still sees the backend's
+    output) and/or appended to ``sink`` (for error messages). Join the
+    returned thread after the process exits.
+    """
+
+    def run() -> None:
+        for line in iter(stream.readline, ""):
+            tracker.feed_line(line)
+            if echo is not None:
+                echo.write(line)
+                echo.flush()
+            if sink is not None:
+                sink.append(line)
+
+    thread = threading.Thread(target=run, name="backend-output", daemon=True)
+    thread.start()
+    return thread
+
+
+def cli_progress(stream: TextIO = sys.stderr, step_percent: float = 5.0) -> ProgressCallback:
+    """Callback for the CLI: prints ``progress: 42% (50s / 120s)`` every ``step_percent``."""
+    last = [-step_percent]
+
+    def report(processed_seconds: float, total_seconds: float) -> None:
+        pct = 100.0 * processed_seconds / total_seconds if total_seconds > 0 else 100.0
+        if pct - last[0] < step_percent and pct < 100.0:
+            return
+        if pct >= 100.0 and last[0] >= 100.0:
+            return
+        last[0] = pct
+        stream.write(f"progress: {pct:.0f}% ({processed_seconds:.0f}s / {total_seconds:.0f}s)\n")
+        stream.flush()
+
+    return report
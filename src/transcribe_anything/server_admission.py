@@ -0,0 +1,103 @@
+"""
+Cost model behind the daemon's admission control and start/finish predictions.
+
+A queue of eight one-minute clips and a queue of eight four-hour files
+are very different backlogs. :class:`CostModel` prices a job as its
+audio seconds times a moving-average real-time factor (RTF, processing
+seconds per audio second) for its model, learned from completed jobs.
+:func:`forecast` lays the running and queued jobs out over the worker
+slots with those prices to predict when each one starts and finishes;
+:class:`JobStore` uses the predicted wait of a new job to admit or reject
+it (``--max-queue-wait``) and to compute an honest ``Retry-After``.
+
+Stdlib only, like :mod:`server_config`.
+"""
+
+import heapq
+import threading
+from typing import Optional
+
+# Assumed until the first job of a model completes: real time.
+DEFAULT_RTF = 1.0
+# Assumed length of a job whose audio hasn't been measured yet, until the
+# first job completes; after that, the moving average of completed jobs.
+DEFAULT_AUDIO_SECONDS = 300.0
+# Weight of the newest observation in the moving averages.
+SMOOTHING = 0.2
+
+
+class CostModel:
+    """Exponential moving averages of RTF per model and of audio length. Thread-safe."""
+
+    def __init__(self, smoothing: float = SMOOTHING) -> None:
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._rtf: dict = {}
+        self._audio_seconds: Optional[float] = None
+
+    def _blend(self, old: Optional[float], new: float) -> float:
+        return new if old is None else old + self.smoothing * (new - old)
+
+    def observe(self, model: str, audio_seconds: float, run_seconds: float) -> None:
+        if audio_seconds <= 0:
+            return
+        with self._lock:
+            self._rtf[model] = self._blend(self._rtf.get(model), run_seconds / audio_seconds)
+            self._audio_seconds = self._blend(self._audio_seconds, audio_seconds)
+
+    def rtf(self, model: str) -> float:
+        with self._lock:
+            return self._rtf.get(model, DEFAULT_RTF)
+
+    def job_seconds(self, model: str, audio_seconds: Optional[float]) -> float:
+        """Predicted run time of a job on one slot."""
+        with self._lock:
+            rtf = self._rtf.get(model, DEFAULT_RTF)
+            if not audio_seconds:
+                audio_seconds = self._audio_seconds or DEFAULT_AUDIO_SECONDS
+        return audio_seconds * rtf
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"rtf": dict(self._rtf), "audio_seconds": self._audio_seconds}
+
+
+def forecast(now: float, slots: int, running: list, queued: list) -> tuple:
+    """Predicts ``{job_id: (start_at, finish_at)}`` and the slot free times after them.
+
+    ``running`` is ``[(job_id, start_at, expected_finish_at)]``; ``queued``
+    is ``[(job_id, run_seconds)]`` in queue order. Each queued job starts
+    on whichever slot frees up first, like the workers taking from the
+    queue. Running jobs already past their predicted finish are assumed to
+    finish now. The returned heap is what a job queued next would see.
+    """
+    schedule: dict = {}
+    free = [now] * max(0, slots - len(running))
+    for job_id, start_at, finish_at in running:
+        finish_at = max(now, finish_at)
+        schedule[job_id] = (start_at, finish_at)
+        free.append(finish_at)
+    heapq.heapify(free)
+    for job_id, run_seconds in queued:
+        start_at = heapq.heappop(free) if free else now
+        schedule[job_id] = (start_at, start_at + run_seconds)
+        heapq.heappush(free, start_at + run_seconds)
+    return schedule, free
+
+
+def admit(free: list, now: float, run_seconds: list, max_wait: Optional[float]) -> tuple:
+    """How many new jobs (in order) start within ``max_wait`` seconds, and a Retry-After.
+
+    ``free`` is the slot heap from :func:`forecast`; it is consumed. The
+    Retry-After is how long until the first job that doesn't fit would
+    start within the limit, as the backlog drains in real time.
+    """
+    fits = 0
+    for seconds in run_seconds:
+        start_at = heapq.heappop(free) if free else now
+        wait = start_at - now
+        if max_wait is not None and wait > max_wait:
+            return fits, wait - max_wait
+        heapq.heappush(free, start_at + seconds)
+        fits += 1
+    return fits, 0.0
@@ -19,16 +19,22 @@ Design constraints (issue #107):
   unless ``--allow-client-model`` was set.
 * HF tokens supplied to the daemon must never leak into client responses
   (extends the redaction landed in #93 to the HTTP layer).
-* Jobs run on a single background worker (the GPU is single-tenant per
-  backend). Queue is bounded; overflow returns 429.
+* Jobs run on a pool of worker slots, one by default (the GPU is
+  single-tenant per backend). ``--workers`` adds slots, each pinned to its
+  own CUDA device. Queue is bounded (by count and, with ``--max-queue-wait``,
+  by predicted wait); overflow returns 429 with a predicted Retry-After.
 """
 
 import asyncio
-import io
+import concurrent.futures
+import functools
+import hashlib
 import json
+import math
+import re
 import shutil
 import tempfile
-import zipfile
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Callable, Iterable, Optional
@@ -43,10 +49,20 @@ from fastapi import (  # noqa: F401
     WebSocketDisconnect,
 )
 from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+try:  # python-multipart >= 0.0.13 renamed its import package
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # pragma: no cover - older python-multipart
+    from multipart.multipart import (  # type: ignore
+        MultipartParser,
+        parse_options_header,
+    )
 
 # Re-export pure-logic surface so test modules and external callers keep
 # importing from ``server_app`` after the file split.
 from transcribe_anything.server_config import (
+    BATCH_POLICIES,
     DEFAULT_HOST,
     DEFAULT_PORT,
     WS_CLOSE_BUSY,
@@ -54,6 +70,7 @@ from transcribe_anything.server_config import (
     WS_CLOSE_INTERNAL,
     WS_CLOSE_NOT_ALLOWED,
     WS_CLOSE_UNAUTHORIZED,
+    AudioBridge,
     Job,
     JobStatus,
     JobStore,
@@ -61,7 +78,7 @@ from transcribe_anything.server_config import (
     ServerConfig,
     SettingsViolation,
     StreamCancelled,
-    StreamSession,
+    StreamSessionPool,
     WarmupRunner,
     _canned_streaming_fn,
     _default_transcribe_fn,
@@ -72,8 +89,15 @@ from transcribe_anything.server_config import (
     config_from_env,
     config_to_env,
     is_model_cached,
+    iter_artifacts_zip,
     validate_request_options,
 )
+from transcribe_anything.server_uploads import (
+    DEFAULT_UPLOAD_CHUNK_BYTES,
+    MAX_UPLOAD_CHUNK_BYTES,
+    UploadError,
+    UploadStore,
+)
 
 
 def create_app(
@@ -82,6 +106,7 @@ def create_app(
     transcribe_fn: Optional[Callable[..., str]] = None,
     job_root: Optional[Path] = None,
     streaming_fn: Optional[Callable[..., Iterable[dict]]] = None,
+    duration_fn: Optional[Callable[[str], Optional[float]]] = None,
 ) -> FastAPI:
     """Build the FastAPI app. Pure factory — easy to unit-test."""
     config.validate()
@@ -90,9 +115,23 @@ def create_app(
         job_root = Path(config.job_root) if config.job_root else Path(tempfile.mkdtemp(prefix="ta-jobs-"))
     job_root.mkdir(parents=True, exist_ok=True)
 
-    store = JobStore(config, transcribe_fn=transcribe_fn)
+    db = None
+    if config.job_db:
+        from transcribe_anything.server_jobdb import JobDatabase
+
+        db = JobDatabase(config.job_db)
+    store = JobStore(config, transcribe_fn=transcribe_fn, db=db, duration_fn=duration_fn)
+    store.recover(job_root)
     store.start()
-    stream_session = StreamSession()
+    uploads = UploadStore(job_root / "_uploads", config.max_upload_size_bytes, max_sessions=config.max_upload_sessions, max_reserved_bytes=config.max_upload_reserved_bytes)
+    if config.artifact_ttl_seconds > 0:
+        # Abandoned sessions hold their preallocated bytes; expire them on
+        # the reaper's schedule, not only when another upload is created.
+        store.add_reap_hook(lambda: uploads.expire(config.artifact_ttl_seconds))
+    waiters = _JobWaiters()
+    store.add_listener(waiters.notify)
+    stream_sessions = StreamSessionPool(config.max_streams)
+    shared_decoders = None
     # Streaming backend resolution:
     #   1. explicit streaming_fn= wins (tests, custom backends)
     #   2. when allow_stream is on, try the real faster-whisper backend
@@ -114,6 +153,13 @@ def create_app(
 
             _lazy_imports()
             active_streaming_fn = faster_whisper_streaming_fn
+            if config.max_streams > 1:
+                # Concurrent sessions share one decoder per model and
+                # batch their decodes instead of each loading a model.
+                from transcribe_anything.stream_backend import SharedDecoders
+
+                shared_decoders = SharedDecoders()
+                active_streaming_fn = functools.partial(faster_whisper_streaming_fn, decoders=shared_decoders)
         except ImportError as exc:
             import logging as _logging
 
@@ -138,6 +184,8 @@ def create_app(
             yield
         finally:
             store.stop()
+            if shared_decoders is not None:
+                shared_decoders.close()
 
     app = FastAPI(
         title="transcribe-anything daemon",
@@ -151,6 +199,7 @@ def create_app(
     app.state.store = store
     app.state.warmup = warmup
     app.state.job_root = job_root
+    app.state.uploads = uploads
 
     def _auth_dep(
         authorization: Optional[str] = Header(default=None),
@@ -202,8 +251,34 @@ def create_app(
                 "# HELP transcribe_anything_queue_capacity Configured --max-queue.",
                 "# TYPE transcribe_anything_queue_capacity gauge",
                 f"transcribe_anything_queue_capacity {snap['queue_capacity']}",
+                "# HELP transcribe_anything_workers Job worker slots.",
+                "# TYPE transcribe_anything_workers gauge",
+                f"transcribe_anything_workers {snap['workers']}",
+                "# HELP transcribe_anything_jobs_reaped_total Finished jobs removed by the artifact reaper.",
+                "# TYPE transcribe_anything_jobs_reaped_total counter",
+            ]
+        )
+        for reason, n in snap["reaped_lifetime"].items():
+            lines.append(f'transcribe_anything_jobs_reaped_total{{reason="{reason}"}} {n}')
+        lines.extend(
+            [
+                "# HELP transcribe_anything_predicted_queue_wait_seconds Predicted wait of a job submitted now.",
+                "# TYPE transcribe_anything_predicted_queue_wait_seconds gauge",
+                f"transcribe_anything_predicted_queue_wait_seconds {store.predicted_wait()}",
+                "# HELP transcribe_anything_model_rtf Moving-average real-time factor per model used for admission.",
+                "# TYPE transcribe_anything_model_rtf gauge",
             ]
         )
+        for model, rtf in sorted(store.cost.snapshot()["rtf"].items()):
+            lines.append(f'transcribe_anything_model_rtf{{model="{model}"}} {rtf}')
+        lines.extend(
+            [
+                "# HELP transcribe_anything_stream_sessions Live /v1/stream sessions.",
+                "# TYPE transcribe_anything_stream_sessions gauge",
+                f"transcribe_anything_stream_sessions {len(stream_sessions.live())}",
+            ]
+        )
+        lines.extend(store.metrics.render())
         body = "\n".join(lines) + "\n"
         return Response(content=body, media_type="text/plain; version=0.0.4")
 
@@ -220,7 +295,18 @@ def create_app(
             "prefetch": config.prefetch,
             "max_batch_size": config.max_batch_size,
             "max_queue": config.max_queue,
+            "max_queue_wait_seconds": config.max_queue_wait_seconds,
+            "workers": len(store.worker_devices),
+            "fetch_ahead": config.fetch_ahead,
             "max_upload_size_bytes": config.max_upload_size_bytes,
+            "resumable_uploads": True,
+            "upload_chunk_bytes": DEFAULT_UPLOAD_CHUNK_BYTES,
+            "max_upload_chunk_bytes": MAX_UPLOAD_CHUNK_BYTES,
+            "job_events": True,
+            "max_job_wait_seconds": MAX_JOB_WAIT_SECONDS,
+            "batches": True,
+            "max_batch_inputs": MAX_BATCH_INPUTS,
+            "max_streams": config.max_streams,
             "warmup": warmup_state,
             "hf_token_configured": bool(config.hf_token),
         }
@@ -241,21 +327,13 @@ def create_app(
 
         try:
             if "multipart/form-data" in content_type:
-                form = await request.form()
-                upload = form.get("file")
-                # Duck-type: starlette's UploadFile is a different class than
-                # fastapi.UploadFile across versions; rely on the attributes
-                # we actually use (.file, .filename) instead of isinstance.
-                if upload is None or not hasattr(upload, "file") or not hasattr(upload, "filename"):
-                    raise HTTPException(status_code=400, detail="multipart submission requires a 'file' field")
-                opts_raw = form.get("options")
+                input_path, input_sha256, opts_raw = await _receive_multipart(request, artifact_dir, config.max_upload_size_bytes)
                 options: dict = {}
-                if isinstance(opts_raw, str) and opts_raw.strip():
+                if opts_raw and opts_raw.strip():
                     try:
                         options = json.loads(opts_raw)
                     except json.JSONDecodeError as exc:
                         raise HTTPException(status_code=400, detail=f"options JSON invalid: {exc}") from exc
-                input_path = _save_upload(upload, artifact_dir, config.max_upload_size_bytes)
             else:
                 try:
                     body = await request.json()
@@ -268,6 +346,7 @@ def create_app(
                     raise HTTPException(status_code=400, detail="JSON submission requires a 'url' field")
                 options = {k: v for k, v in body.items() if k != "url"}
                 input_path = url
+                input_sha256 = None
 
             try:
                 normalized = validate_request_options(options, config)
@@ -275,10 +354,11 @@ def create_app(
                 raise HTTPException(status_code=400, detail=str(exc)) from exc
 
             job_request = {"input": input_path, **normalized}
+            audio_seconds = await run_in_threadpool(store.probe_audio_seconds, input_path)
             try:
-                job = store.submit(job_request, str(artifact_dir))
+                job = store.submit(job_request, str(artifact_dir), input_sha256=input_sha256, audio_seconds=audio_seconds)
             except QueueFull as exc:
-                raise HTTPException(status_code=429, detail=str(exc)) from exc
+                raise _busy(exc) from exc
         except HTTPException:
             shutil.rmtree(artifact_dir, ignore_errors=True)
             raise
@@ -292,14 +372,270 @@ def create_app(
             "status_url": f"/v1/jobs/{job.job_id}",
         }
 
-    @app.get("/v1/jobs/{job_id}")
-    def get_job(job_id: str, _: None = Depends(_auth_dep)) -> dict:
+    # ---- resumable uploads ----
+    # POST /v1/uploads {filename, size, options} opens a session; the client
+    # PUTs byte ranges (Content-Range: bytes a-b/size) in any order, GETs the
+    # session to learn what's missing after a dropped connection, then
+    # POSTs /finalize to turn it into an ordinary job.
+    def _upload_http_error(exc: UploadError) -> HTTPException:
+        return HTTPException(status_code=exc.status_code, detail=str(exc))
+
+    @app.post("/v1/uploads", status_code=201)
+    async def create_upload(request: Request, _: None = Depends(_auth_dep)) -> dict:
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail=f"request body must be JSON: {exc}") from exc
+        if not isinstance(body, dict):
+            raise HTTPException(status_code=400, detail="request body must be a JSON object")
+        options = body.get("options") or {}
+        if not isinstance(options, dict):
+            raise HTTPException(status_code=400, detail="options must be a JSON object")
+        try:
+            validate_request_options(options, config)
+        except SettingsViolation as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if config.artifact_ttl_seconds > 0:
+            await run_in_threadpool(uploads.expire, config.artifact_ttl_seconds)
+        try:
+            session = await run_in_threadpool(uploads.create, str(body.get("filename") or "upload.bin"), body.get("size"), options)
+        except UploadError as exc:
+            raise _upload_http_error(exc) from exc
+        return {
+            **session.to_public_dict(),
+            "upload_url": f"/v1/uploads/{session.upload_id}",
+            "chunk_size": DEFAULT_UPLOAD_CHUNK_BYTES,
+            "max_chunk_size": MAX_UPLOAD_CHUNK_BYTES,
+        }
+
+    @app.get("/v1/uploads/{upload_id}")
+    def get_upload(upload_id: str, _: None = Depends(_auth_dep)) -> dict:
+        session = uploads.get(upload_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="unknown upload")
+        return session.to_public_dict()
+
+    @app.put("/v1/uploads/{upload_id}")
+    async def put_upload_range(upload_id: str, request: Request, _: None = Depends(_auth_dep)) -> dict:
+        session = uploads.get(upload_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="unknown upload")
+        match = _CONTENT_RANGE.fullmatch((request.headers.get("content-range") or "").strip())
+        if match is None:
+            raise HTTPException(status_code=400, detail="PUT needs a 'Content-Range: bytes <first>-<last>/<size>' header")
+        first, last, total = (int(g) for g in match.groups())
+        if total != session.size or last < first:
+            raise HTTPException(status_code=416, detail=f"bad range {first}-{last}/{total} for a {session.size}-byte upload")
+        if last - first + 1 > MAX_UPLOAD_CHUNK_BYTES:
+            raise HTTPException(status_code=413, detail=f"range larger than {MAX_UPLOAD_CHUNK_BYTES} bytes")
+        try:
+            writer = await run_in_threadpool(uploads.open_range, upload_id, first, last - first + 1)
+        except UploadError as exc:
+            raise _upload_http_error(exc) from exc
+        # Each chunk goes to data.part at its offset as it arrives; the range
+        # is recorded only once all of it is on disk.
+        try:
+            async for chunk in request.stream():
+                if chunk:
+                    await run_in_threadpool(writer.write, chunk)
+            session = await run_in_threadpool(writer.commit)
+        except UploadError as exc:
+            raise _upload_http_error(exc) from exc
+        finally:
+            writer.close()
+        return session.to_public_dict()
+
+    @app.delete("/v1/uploads/{upload_id}", status_code=204)
+    def delete_upload(upload_id: str, _: None = Depends(_auth_dep)) -> None:
+        if not uploads.delete(upload_id):
+            raise HTTPException(status_code=404, detail="unknown upload")
+
+    @app.post("/v1/uploads/{upload_id}/finalize", status_code=202)
+    async def finalize_upload(upload_id: str, _: None = Depends(_auth_dep)) -> dict:
+        session = uploads.get(upload_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="unknown upload")
+        if config.prefetch == "none" and not is_model_cached(config.model):
+            raise HTTPException(
+                status_code=503,
+                detail=(f"prefetch=none and model {config.model!r} is not cached locally. " "Pre-warm the HuggingFace cache or restart with --prefetch lazy/eager."),
+            )
+        try:
+            normalized = validate_request_options(session.options, config)
+        except SettingsViolation as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        artifact_dir = Path(tempfile.mkdtemp(prefix="ta-job-", dir=str(job_root)))
+        try:
+            input_path, input_sha256 = await run_in_threadpool(uploads.finalize, upload_id, artifact_dir)
+        except UploadError as exc:
+            shutil.rmtree(artifact_dir, ignore_errors=True)
+            raise _upload_http_error(exc) from exc
+        try:
+            audio_seconds = await run_in_threadpool(store.probe_audio_seconds, input_path)
+            job = store.submit({"input": input_path, **normalized}, str(artifact_dir), input_sha256=input_sha256, audio_seconds=audio_seconds)
+        except QueueFull as exc:
+            # Keep the bytes: the client can finalize again once the queue drains.
+            uploads.unfinalize(upload_id, input_path)
+            shutil.rmtree(artifact_dir, ignore_errors=True)
+            raise _busy(exc) from exc
+        uploads.commit(upload_id)
+        return {
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "status_url": f"/v1/jobs/{job.job_id}",
+        }
+
+    def _job_dict(job_id: str) -> Optional[dict]:
         job = store.get(job_id)
         if job is None:
-            raise HTTPException(status_code=404, detail="unknown job")
+            return None
         if job.status == JobStatus.COMPLETED and not job.artifacts:
             job.artifacts = store.list_artifacts(job)
-        return job.to_public_dict()
+        body = job.to_public_dict()
+        predicted = store.predictions().get(job_id) if job.status in (JobStatus.QUEUED, JobStatus.RUNNING) else None
+        # Whole seconds, so an unchanged prediction doesn't look like news to SSE / long-poll clients.
+        body["predicted_start_at"] = round(predicted[0]) if predicted else None
+        body["predicted_finish_at"] = round(predicted[1]) if predicted else None
+        return body
+
+    @app.get("/v1/jobs/{job_id}")
+    async def get_job(job_id: str, wait: float = 0.0, since: Optional[str] = None, _: None = Depends(_auth_dep)) -> dict:
+        # Long-poll: with ?wait=S the response is held until the job leaves
+        # status ``since`` (default: its status right now) or S seconds pass.
+        waiter = waiters.register(job_id) if wait > 0 else None
+        try:
+            # _job_dict lists the artifact dir; keep that disk I/O off the loop.
+            body = await run_in_threadpool(_job_dict, job_id)
+            if body is None:
+                raise HTTPException(status_code=404, detail="unknown job")
+            since = since or body["status"]
+            if waiter is None or body["status"] != since or body["status"] in _TERMINAL_STATUSES:
+                return body
+            deadline = asyncio.get_running_loop().time() + min(wait, MAX_JOB_WAIT_SECONDS)
+            while body["status"] == since:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0 or not await waiters.wait(waiter, remaining):
+                    break
+                body = await run_in_threadpool(_job_dict, job_id)
+                if body is None:
+                    raise HTTPException(status_code=404, detail="unknown job")
+            return body
+        finally:
+            if waiter is not None:
+                waiters.unregister(job_id, waiter)
+
+    @app.get("/v1/jobs/{job_id}/events")
+    async def job_events(job_id: str, _: None = Depends(_auth_dep)) -> Response:
+        if store.get(job_id) is None:
+            raise HTTPException(status_code=404, detail="unknown job")
+
+        async def _events():
+            waiter = waiters.register(job_id)
+            try:
+                last = None
+                while True:
+                    waiter[1].clear()
+                    body = await run_in_threadpool(_job_dict, job_id)
+                    if body is None:
+                        yield f"event: deleted\ndata: {json.dumps({'job_id': job_id})}\n\n"
+                        return
+                    if body != last:
+                        yield f"event: status\ndata: {json.dumps(body)}\n\n"
+                        last = body
+                    if body["status"] in _TERMINAL_STATUSES:
+                        return
+                    if not await waiters.wait(waiter, SSE_KEEPALIVE_SECONDS):
+                        yield ": keepalive\n\n"
+            finally:
+                waiters.unregister(job_id, waiter)
+
+        return StreamingResponse(_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+    # ---- batches ----
+    # POST /v1/batches {inputs: [url...], options: {...}, policy} submits one
+    # job per input with shared options. "atomic" (default) admits all of
+    # them or answers 429; "partial" admits what fits in the queue and lists
+    # the rest under "rejected". Jobs are ordinary jobs: the per-job routes
+    # work on them, and GET /v1/batches/{id} aggregates their status.
+    @app.post("/v1/batches", status_code=202)
+    async def submit_batch(request: Request, _: None = Depends(_auth_dep)) -> dict:
+        if config.prefetch == "none" and not is_model_cached(config.model):
+            raise HTTPException(
+                status_code=503,
+                detail=(f"prefetch=none and model {config.model!r} is not cached locally. " "Pre-warm the HuggingFace cache or restart with --prefetch lazy/eager."),
+            )
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail=f"request body must be JSON: {exc}") from exc
+        if not isinstance(body, dict):
+            raise HTTPException(status_code=400, detail="request body must be a JSON object")
+        inputs = body.get("inputs")
+        if not isinstance(inputs, list) or not inputs or not all(isinstance(url, str) and url for url in inputs):
+            raise HTTPException(status_code=400, detail="'inputs' must be a non-empty list of URLs")
+        if len(inputs) > MAX_BATCH_INPUTS:
+            raise HTTPException(status_code=400, detail=f"a batch may carry at most {MAX_BATCH_INPUTS} inputs, got {len(inputs)}")
+        policy = body.get("policy") or "atomic"
+        if policy not in BATCH_POLICIES:
+            raise HTTPException(status_code=400, detail=f"policy must be one of {list(BATCH_POLICIES)}, got {policy!r}")
+        options = body.get("options") or {}
+        if not isinstance(options, dict):
+            raise HTTPException(status_code=400, detail="options must be a JSON object")
+        try:
+            normalized = validate_request_options(options, config)
+        except SettingsViolation as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+        audio_seconds = await asyncio.gather(*(run_in_threadpool(store.probe_audio_seconds, url) for url in inputs))
+        dirs = [Path(tempfile.mkdtemp(prefix="ta-job-", dir=str(job_root))) for _ in inputs]
+        try:
+            batch, admitted, rejected = store.submit_batch([({"input": url, **normalized}, str(d)) for url, d in zip(inputs, dirs)], policy, audio_seconds=list(audio_seconds))
+        except QueueFull as exc:
+            for d in dirs:
+                shutil.rmtree(d, ignore_errors=True)
+            raise _busy(exc) from exc
+        for index in rejected:
+            shutil.rmtree(dirs[index], ignore_errors=True)
+        return {
+            "batch_id": batch.batch_id,
+            "status_url": f"/v1/batches/{batch.batch_id}",
+            "policy": policy,
+            "admitted": [{"index": index, "job_id": job.job_id, "status_url": f"/v1/jobs/{job.job_id}"} for index, job in enumerate(admitted)],
+            "rejected": batch.rejected,
+            "retry_after_seconds": _retry_after_header(batch.retry_after) if batch.retry_after is not None else None,
+        }
+
+    @app.get("/v1/batches/{batch_id}")
+    def get_batch(batch_id: str, _: None = Depends(_auth_dep)) -> dict:
+        found = store.get_batch(batch_id)
+        if found is None:
+            raise HTTPException(status_code=404, detail="unknown batch")
+        batch, batch_jobs = found
+        counts = {status.value: 0 for status in JobStatus}
+        jobs = []
+        for job in batch_jobs:
+            public = _job_dict(job.job_id)
+            if public is None:
+                continue
+            counts[public["status"]] += 1
+            jobs.append(
+                {
+                    "job_id": job.job_id,
+                    "input": job.request.get("input"),
+                    "status": public["status"],
+                    "progress": public["progress"],
+                    "error": public["error"],
+                    "artifacts": [{"name": name, "url": f"/v1/jobs/{job.job_id}/artifacts/{name}"} for name in public["artifacts"]],
+                }
+            )
+        return {
+            "batch_id": batch.batch_id,
+            "created_at": batch.created_at,
+            "status": _batch_status(counts),
+            "counts": counts,
+            "jobs": jobs,
+            "rejected": batch.rejected,
+        }
 
     @app.delete("/v1/jobs/{job_id}", status_code=204)
     def delete_job(job_id: str, _: None = Depends(_auth_dep)) -> None:
@@ -328,13 +664,8 @@ def create_app(
         files = sorted(p for p in artifact_dir.iterdir() if p.is_file()) if artifact_dir.is_dir() else []
         if not files:
             raise HTTPException(status_code=404, detail="no artifacts available for this job")
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for f in files:
-                zf.write(f, arcname=f.name)
-        buf.seek(0)
         return StreamingResponse(
-            buf,
+            iter_artifacts_zip(files),
             media_type="application/zip",
             headers={"Content-Disposition": f'attachment; filename="job-{job_id}.zip"'},
         )
@@ -363,8 +694,9 @@ def create_app(
                 await ws.close(code=WS_CLOSE_UNAUTHORIZED)
                 return
 
-        if not stream_session.acquire():
-            await ws.send_json({"type": "error", "code": "busy", "message": "another stream is in-flight"})
+        session = stream_sessions.acquire()
+        if session is None:
+            await ws.send_json({"type": "error", "code": "busy", "message": f"{config.max_streams} stream(s) already in-flight"})
             await ws.close(code=WS_CLOSE_BUSY)
             return
 
@@ -385,23 +717,33 @@ def create_app(
 
             await ws.send_json({"type": "ready"})
 
-            # Pull audio frames + control frames into an async queue so the
-            # backend generator (which is sync) can iterate them without
-            # blocking the event loop.
-            audio_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+            # Hand audio frames to the (sync) backend through a bridge it
+            # blocks on; control frames and disconnects close it so the
+            # backend wakes up for them too. While the bridge is full the
+            # pumper stops reading, which pushes back on the client.
+            bridge = AudioBridge()
             input_done = asyncio.Event()
 
+            def _stop(cancel: bool) -> None:
+                if cancel:
+                    session.cancel()
+                input_done.set()
+                bridge.close()
+
             async def _pump_inputs() -> None:
-                deadline = stream_session.runtime_seconds
+                loop = asyncio.get_running_loop()
                 while not input_done.is_set():
                     try:
                         msg = await ws.receive()
                     except WebSocketDisconnect:
-                        stream_session.cancel()
-                        input_done.set()
+                        _stop(cancel=True)
+                        return
+                    if msg.get("type") == "websocket.disconnect":
+                        _stop(cancel=True)
                         return
                     if "bytes" in msg and msg["bytes"] is not None:
-                        await audio_queue.put(msg["bytes"])
+                        if not bridge.try_put(msg["bytes"]):
+                            await loop.run_in_executor(None, bridge.put, msg["bytes"])
                     elif "text" in msg and msg["text"] is not None:
                         try:
                             ctrl = json.loads(msg["text"])
@@ -410,51 +752,35 @@ def create_app(
                         if not isinstance(ctrl, dict):
                             continue
                         if ctrl.get("type") == "end_of_input":
-                            input_done.set()
+                            _stop(cancel=False)
                             return
                         if ctrl.get("type") == "cancel":
-                            stream_session.cancel()
-                            input_done.set()
+                            _stop(cancel=True)
                             return
                     # Hard cap on session duration to keep a misbehaving
                     # client from pinning the GPU forever.
-                    runtime = stream_session.runtime_seconds
+                    runtime = session.runtime_seconds
                     if runtime is not None and runtime > config.max_stream_duration_seconds:
                         await ws.send_json({"type": "error", "code": "duration_exceeded"})
                         await ws.close(code=WS_CLOSE_DURATION_EXCEEDED)
-                        stream_session.cancel()
-                        input_done.set()
+                        _stop(cancel=True)
                         return
-                    _ = deadline  # currently unused; placeholder for adaptive backpressure
 
             pumper = asyncio.create_task(_pump_inputs())
 
-            def _audio_iterable():
-                """Non-blocking generator over the audio queue.
-
-                Yields whatever PCM frames are currently buffered, then
-                returns. The backend is expected to iterate this once per
-                decode cycle — looping forever inside it would block the
-                sync backend thread waiting on the async pumper.
-                """
-                while True:
-                    if stream_session.is_cancelled:
-                        return
-                    try:
-                        chunk = audio_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        return
-                    yield chunk
-
-            # Drive the (sync) streaming backend in a thread so it doesn't
-            # block the event loop. Forward each emitted event over the
-            # socket as a text frame.
+            # Drive the (sync) streaming backend on its own thread so it
+            # doesn't block the event loop. Not the default executor: the
+            # backend holds its thread for the whole session, and the pumper
+            # needs that pool for bridge.put; with enough live sessions every
+            # pool thread would be a backend waiting on a put that can't run.
+            # Forward each emitted event over the socket as a text frame.
             loop = asyncio.get_running_loop()
             queue_out: asyncio.Queue = asyncio.Queue()
+            backend_finished: concurrent.futures.Future = concurrent.futures.Future()
 
             def _run_backend() -> None:
                 try:
-                    for event in active_streaming_fn(_audio_iterable(), session=stream_session, config=config, hello=hello):
+                    for event in active_streaming_fn(bridge, session=session, config=config, hello=hello):
                         asyncio.run_coroutine_threadsafe(queue_out.put(event), loop)
                 except StreamCancelled:
                     pass
@@ -463,8 +789,9 @@ def create_app(
                     asyncio.run_coroutine_threadsafe(queue_out.put({"type": "error", "code": "backend_failure", "message": redacted}), loop)
                 finally:
                     asyncio.run_coroutine_threadsafe(queue_out.put({"type": "done"}), loop)
+                    backend_finished.set_result(None)
 
-            backend_thread = asyncio.get_event_loop().run_in_executor(None, _run_backend)
+            threading.Thread(target=_run_backend, name=f"stream-backend-{session.session_id}", daemon=True).start()
 
             try:
                 while True:
@@ -472,17 +799,17 @@ def create_app(
                     try:
                         await ws.send_json(event)
                     except (WebSocketDisconnect, RuntimeError):
-                        stream_session.cancel()
+                        _stop(cancel=True)
                         break
                     if event.get("type") == "done":
                         break
             finally:
-                input_done.set()
+                # Wake a backend still waiting for audio; it sees the
+                # cancel or the end of input and returns.
+                if not input_done.is_set():
+                    _stop(cancel=True)
                 pumper.cancel()
-                try:
-                    await backend_thread
-                except Exception:  # pylint: disable=broad-except
-                    pass
+                await asyncio.wrap_future(backend_finished)
 
             try:
                 await ws.close()
@@ -499,36 +826,241 @@ def create_app(
             except RuntimeError:
                 pass
         finally:
-            stream_session.release()
+            stream_sessions.release(session)
+
+    @app.get("/v1/streams")
+    def list_streams(_: None = Depends(_auth_dep)) -> dict:
+        """Live stream sessions with their decode latency, plus shared-decoder batching stats."""
+        return {
+            "max_streams": config.max_streams,
+            "streams": [{"session_id": live.session_id, "runtime_seconds": live.runtime_seconds, "latency": live.latency_stats()} for live in stream_sessions.live()],
+            "decoders": shared_decoders.stats() if shared_decoders is not None else {},
+        }
 
     # Stash for tests / introspection.
-    app.state.stream_session = stream_session
+    app.state.stream_sessions = stream_sessions
+    app.state.shared_decoders = shared_decoders
 
     return app
 
 
-def _save_upload(upload, dest_dir: Path, max_bytes: int) -> str:
-    """Stream an UploadFile to ``dest_dir``, enforcing ``max_bytes``."""
-    filename = getattr(upload, "filename", None) or "upload.bin"
-    safe = Path(filename).name
-    out = dest_dir / "_input" / safe
-    out.parent.mkdir(parents=True, exist_ok=True)
-    total = 0
-    with open(out, "wb") as fh:
-        while True:
-            chunk = upload.file.read(1024 * 1024)
-            if not chunk:
-                break
-            total += len(chunk)
-            if total > max_bytes:
-                fh.close()
-                try:
-                    out.unlink()
-                except OSError:
-                    pass
-                raise HTTPException(status_code=413, detail=f"upload exceeds max-upload-size {max_bytes} bytes")
-            fh.write(chunk)
-    return str(out)
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+# Longest a ``GET /v1/jobs/{id}?wait=`` long-poll is held open.
+MAX_JOB_WAIT_SECONDS = 60.0
+SSE_KEEPALIVE_SECONDS = 15.0
+_TERMINAL_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+
+
+def _retry_after_header(seconds: Optional[float]) -> int:
+    """Whole seconds for a ``Retry-After`` header; at least 1 so clients don't spin."""
+    return max(1, math.ceil(seconds or 0.0))
+
+
+def _busy(exc: QueueFull) -> HTTPException:
+    """429 for a rejected submission, with the predicted ``Retry-After``."""
+    return HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": str(_retry_after_header(exc.retry_after))})
+
+
+# Most inputs one ``POST /v1/batches`` may carry.
+MAX_BATCH_INPUTS = 1000
+
+
+def _batch_status(counts: dict) -> str:
+    """One word for a batch from its per-status job counts."""
+    total = sum(counts.values())
+    if counts.get(JobStatus.RUNNING.value):
+        return "running"
+    if counts.get(JobStatus.QUEUED.value):
+        # Some finished and some still waiting: the batch is under way.
+        return "running" if counts.get(JobStatus.COMPLETED.value) or counts.get(JobStatus.FAILED.value) else "queued"
+    if total and counts.get(JobStatus.COMPLETED.value) == total:
+        return "completed"
+    if total and counts.get(JobStatus.FAILED.value) == total:
+        return "failed"
+    return "partial"
+
+
+class _JobWaiters:
+    """Wakes long-poll and SSE handlers when a job changes state.
+
+    :meth:`notify` is a :class:`JobStore` listener and runs on worker
+    threads; each waiter is an ``asyncio.Event`` set on the loop that
+    registered it, so an idle waiter costs no thread and no polling.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict = {}
+
+    def register(self, job_id: str) -> tuple:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(job_id, set()).add(waiter)
+        return waiter
+
+    def unregister(self, job_id: str, waiter: tuple) -> None:
+        with self._lock:
+            pending = self._waiters.get(job_id)
+            if pending is not None:
+                pending.discard(waiter)
+                if not pending:
+                    del self._waiters[job_id]
+
+    def notify(self, job_id: str) -> None:
+        with self._lock:
+            pending = list(self._waiters.get(job_id, ()))
+        for loop, event in pending:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop already closed (daemon shutting down).
+                pass
+
+    @staticmethod
+    async def wait(waiter: tuple, timeout: float) -> bool:
+        """True if the job changed within ``timeout`` seconds. Re-arms the waiter."""
+        event = waiter[1]
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        event.clear()
+        return True
+
+
+# Cap on the non-file ``options`` field of a multipart submission, and the
+# slack allowed on top of max-upload-size for it plus the part headers when
+# rejecting on Content-Length.
+MAX_FORM_FIELD_BYTES = 1024 * 1024
+_MULTIPART_OVERHEAD_BYTES = MAX_FORM_FIELD_BYTES + 64 * 1024
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"upload exceeds max-upload-size {max_bytes} bytes")
+
+
+class _MultipartUpload:
+    """Streaming parser for the multipart body of ``POST /v1/transcribe``.
+
+    The ``file`` part goes straight to ``dest_dir/_input/<name>`` and is
+    hashed on the same pass, so the body is read once instead of being
+    spooled by Starlette and then copied. ``options`` is the only other
+    field kept. Blocking; feed it through a threadpool.
+    """
+
+    def __init__(self, content_type: str, dest_dir: Path, max_bytes: int) -> None:
+        _, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=400, detail="multipart submission has no boundary")
+        self.dest_dir = dest_dir
+        self.max_bytes = max_bytes
+        self.path: Optional[Path] = None
+        self.options: Optional[str] = None
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._fh = None
+        self._part: Optional[str] = None
+        self._headers: dict = {}
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._value = bytearray()
+        callbacks = {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+        self._parser = MultipartParser(boundary, callbacks)
+
+    def feed(self, chunk: bytes) -> None:
+        self._parser.write(chunk)
+
+    def finish(self) -> tuple:
+        """Returns ``(path, sha256 hex, options or None)`` once the body has been fed."""
+        self._parser.finalize()
+        self.close()
+        if self.path is None:
+            raise HTTPException(status_code=400, detail="multipart submission requires a 'file' field")
+        return str(self.path), self._digest.hexdigest(), self.options
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _on_part_begin(self) -> None:
+        self._part = None
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self) -> None:
+        _, disposition = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = disposition.get(b"name", b"")
+        if name == b"file" and b"filename" in disposition and self.path is None:
+            safe = Path(disposition[b"filename"].decode("utf-8", "replace")).name or "upload.bin"
+            self.path = self.dest_dir / "_input" / safe
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "wb")  # pylint: disable=consider-using-with
+            self._part = "file"
+        elif name == b"options":
+            self._part = "options"
+            self._value.clear()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part == "file":
+            self.size += end - start
+            if self.size > self.max_bytes:
+                raise _too_large(self.max_bytes)
+            view = memoryview(data)[start:end]
+            self._digest.update(view)
+            self._fh.write(view)
+        elif self._part == "options":
+            self._value += data[start:end]
+            if len(self._value) > MAX_FORM_FIELD_BYTES:
+                raise HTTPException(status_code=413, detail=f"options field exceeds {MAX_FORM_FIELD_BYTES} bytes")
+
+    def _on_part_end(self) -> None:
+        if self._part == "file":
+            self.close()
+        elif self._part == "options":
+            self.options = self._value.decode("utf-8", "replace")
+        self._part = None
+
+
+async def _receive_multipart(request: Request, dest_dir: Path, max_bytes: int) -> tuple:
+    """Stream a multipart submission into ``dest_dir``; returns ``(path, sha256 hex, options)``.
+
+    An honest Content-Length over the limit is refused before any of the
+    body is read. Parsing, hashing and the disk writes run off the event
+    loop so a multi-GB upload doesn't stall /healthz, /metrics or a live
+    /v1/stream session.
+    """
+    length = request.headers.get("content-length") or ""
+    if length.isdigit() and int(length) > max_bytes + _MULTIPART_OVERHEAD_BYTES:
+        raise _too_large(max_bytes)
+    upload = _MultipartUpload(request.headers.get("content-type") or "", dest_dir, max_bytes)
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await run_in_threadpool(upload.feed, chunk)
+        return await run_in_threadpool(upload.finish)
+    finally:
+        upload.close()
 
 
 def run_server(config: ServerConfig) -> None:
@@ -13,8 +13,9 @@ without spinning up the HTTP layer:
 * :class:`ServerConfig` — daemon-side configuration (locked at startup).
 * :func:`_redact_secrets` — HF token scrubber.
 * :func:`validate_request_options` — settings-ownership enforcement.
-* :class:`JobStore` — in-memory job registry + bounded queue + worker.
+* :class:`JobStore` — in-memory job registry + bounded queue + worker slots.
 * :class:`WarmupRunner` — eager-prefetch background task.
+* :func:`iter_artifacts_zip` — bounded-memory streaming ZIP of a job's artifacts.
 * :func:`config_to_env` / :func:`config_from_env` — round-trip between
   a :class:`ServerConfig` instance and env vars (used to ferry config
   into the iso-env subprocess).
@@ -22,6 +23,7 @@ without spinning up the HTTP layer:
 
 import dataclasses
 import hmac
+import inspect
 import json
 import logging
 import os
@@ -32,11 +34,18 @@ import threading
 import time
 import traceback
 import uuid
+import wave
+import zipfile
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from queue import Empty, Full, Queue
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
+
+from transcribe_anything.server_admission import CostModel, admit, forecast
+from transcribe_anything.server_metrics import JobMetrics
+from transcribe_anything.server_prefetch import InputPrefetcher
 
 LOG = logging.getLogger("transcribe_anything.server")
 
@@ -79,9 +88,38 @@ class ServerConfig:
     prefetch: str = "lazy"  # "lazy" | "eager" | "none"
     max_batch_size: Optional[int] = None
     max_queue: int = 8
+    # Reject new jobs whose predicted queue wait (queued audio seconds x
+    # the moving-average RTF of their model, spread over the worker slots)
+    # exceeds this. None admits on max_queue alone.
+    max_queue_wait_seconds: Optional[float] = None
+    # Job worker slots. 1 keeps the historical single-tenant behaviour;
+    # N > 1 runs N jobs at once, spread round-robin over the visible CUDA
+    # devices (or unpinned on CPU); 0 means one slot per CUDA device.
+    workers: int = 1
+    # Download / ffmpeg-normalize the inputs of up to this many queued jobs
+    # while the workers run inference (see server_prefetch). 0 disables it
+    # and each job fetches its own input when it starts, as before.
+    fetch_ahead: int = 0
+    # Cap on the prefetched wav bytes held at once.
+    fetch_scratch_bytes: int = 2 * 1024 * 1024 * 1024  # 2 GB
     max_upload_size_bytes: int = 2 * 1024 * 1024 * 1024  # 2 GB
+    # Resumable upload sessions preallocate their declared size on disk, so
+    # both their number and their total reservation are capped (429 / 507).
+    max_upload_sessions: int = 32
+    max_upload_reserved_bytes: int = 8 * 1024 * 1024 * 1024  # 8 GB
+    # Terminal jobs (and their artifact dirs) are reaped this long after
+    # they finish; 0 keeps them until a client DELETEs them.
     artifact_ttl_seconds: int = 3600
+    # Optional cap on the bytes held by job artifact dirs; the reaper evicts
+    # the oldest finished jobs first to get back under it.
+    max_job_root_bytes: Optional[int] = None
+    reaper_interval_seconds: float = 30.0
     job_root: Optional[str] = None
+    # SQLite file recording every job transition (see server_jobdb). On
+    # restart queued jobs are re-enqueued; jobs that were running are
+    # failed, or re-queued when requeue_interrupted is set.
+    job_db: Optional[str] = None
+    requeue_interrupted: bool = False
     shutdown_grace_seconds: int = 60
     # Allow clients to register an outbound HTTP webhook on job completion.
     # Off by default — the daemon must explicitly opt in via --allow-webhooks
@@ -97,6 +135,10 @@ class ServerConfig:
     allow_stream: bool = False
     max_stream_duration_seconds: int = 60 * 60
     stream_decode_interval_ms: int = 200
+    # Concurrent /v1/stream sessions. Above 1, the faster-whisper backend
+    # shares one decoder per model across sessions and batches their
+    # decodes (see stream_backend.DecodeService).
+    max_streams: int = 1
 
     def requires_auth(self) -> bool:
         return not _is_loopback(self.host)
@@ -108,6 +150,24 @@ class ServerConfig:
             raise ValueError(f"--prefetch must be one of lazy|eager|none, got {self.prefetch!r}")
         if self.max_queue < 1:
             raise ValueError("--max-queue must be >= 1")
+        if self.max_queue_wait_seconds is not None and self.max_queue_wait_seconds < 0:
+            raise ValueError("--max-queue-wait must be >= 0")
+        if self.workers < 0:
+            raise ValueError("--workers must be >= 0 (0 = one per CUDA device)")
+        if self.fetch_ahead < 0:
+            raise ValueError("--fetch-ahead must be >= 0")
+        if self.fetch_scratch_bytes < 1:
+            raise ValueError("--fetch-scratch-bytes must be >= 1")
+        if self.max_job_root_bytes is not None and self.max_job_root_bytes < 1:
+            raise ValueError("--max-job-root-bytes must be >= 1")
+        if self.max_upload_sessions < 1:
+            raise ValueError("--max-upload-sessions must be >= 1")
+        if self.max_upload_reserved_bytes < 1:
+            raise ValueError("--max-upload-reserved-bytes must be >= 1")
+        if self.max_streams < 1:
+            raise ValueError("--max-streams must be >= 1")
+        if self.job_db and not self.job_root:
+            raise ValueError("--job-db needs a fixed --job-root so recovered jobs can find their artifact dirs")
 
 
 class JobStatus(str, Enum):
@@ -128,6 +188,22 @@ class Job:
     completed_at: Optional[float] = None
     error: Optional[str] = None
     artifacts: list = field(default_factory=list)
+    # Worker slot that ran the job and the CUDA device it was pinned to.
+    worker: Optional[int] = None
+    device_id: Optional[str] = None
+    # SHA-256 of an uploaded input, computed while it was saved.
+    input_sha256: Optional[str] = None
+    # Fraction of the input audio transcribed (0..1) while RUNNING, the
+    # extrapolated seconds left, and when the backend last reported; a
+    # stale progress_updated_at on a running job means it's stuck.
+    progress: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    progress_updated_at: Optional[float] = None
+    # Duration of the input audio: probed at submit when possible, else
+    # once the input is prefetched or the backend reports it.
+    audio_seconds: Optional[float] = None
+    # Set for jobs submitted through POST /v1/batches.
+    batch_id: Optional[str] = None
 
     def to_public_dict(self) -> dict:
         return {
@@ -138,11 +214,42 @@ class Job:
             "completed_at": self.completed_at,
             "error": self.error,
             "artifacts": list(self.artifacts),
+            "worker": self.worker,
+            "device_id": self.device_id,
+            "input_sha256": self.input_sha256,
+            "progress": self.progress,
+            "eta_seconds": self.eta_seconds,
+            "progress_updated_at": self.progress_updated_at,
+            "audio_seconds": self.audio_seconds,
+            "batch_id": self.batch_id,
         }
 
 
 class QueueFull(Exception):
-    """Raised when the bounded job queue can't accept another job."""
+    """Raised when the bounded job queue can't accept another job.
+
+    ``retry_after`` is the predicted number of seconds until it could.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+BATCH_POLICIES = ("atomic", "partial")
+
+
+@dataclass
+class Batch:
+    """Jobs submitted together through ``POST /v1/batches``."""
+
+    batch_id: str
+    created_at: float
+    job_ids: list = field(default_factory=list)
+    # Inputs not admitted under the "partial" policy: {index, input, error}.
+    rejected: list = field(default_factory=list)
+    # Predicted seconds until the rejected inputs could be resubmitted.
+    retry_after: Optional[float] = None
 
 
 class SettingsViolation(ValueError):
@@ -228,39 +335,350 @@ def _default_transcribe_fn(**kwargs: Any) -> str:
     return transcribe(**kwargs)
 
 
+def _default_fetch_fn(url_or_file: str, wav_path: str) -> None:
+    """Lazy thin wrapper around ``transcribe_anything.api.fetch_input``."""
+    from transcribe_anything.api import fetch_input  # local import: heavy
+
+    fetch_input(url_or_file, wav_path)
+
+
+def _default_duration_fn(url_or_file: str) -> Optional[float]:
+    """Lazy thin wrapper around ``transcribe_anything.audio.probe_audio_seconds``."""
+    from transcribe_anything.audio import probe_audio_seconds  # local import: heavy
+
+    return probe_audio_seconds(url_or_file)
+
+
+# Backends that can't be pinned to a CUDA device: their slots run unpinned.
+_UNPINNED_DEVICES = {"cpu", "mlx", "xpu"}
+
+
+def _detect_cuda_device_ids() -> list:
+    """Visible CUDA device ids, or ``[]`` when there are none / detection fails."""
+    try:
+        from transcribe_anything.insanely_fast_whisper import (  # local import: heavy
+            get_device_ids,
+        )
+
+        return [d for d in get_device_ids() if d != "mps"]
+    except Exception as exc:  # pylint: disable=broad-except
+        LOG.warning("CUDA device detection failed, worker slots run unpinned: %s", exc)
+        return []
+
+
+def resolve_worker_devices(config: ServerConfig, detect_fn: Optional[Callable[[], list]] = None) -> list:
+    """One entry per worker slot: the CUDA device id it is pinned to, or None.
+
+    ``workers=1`` stays unpinned (the backend picks its default card, as
+    before). ``workers=0`` means one slot per detected CUDA device (one
+    unpinned slot if there are none). ``workers=N`` spreads N slots
+    round-robin over the detected devices.
+    """
+    if config.workers == 1:
+        return [None]
+    device_ids: list = []
+    if (config.device or "").lower() not in _UNPINNED_DEVICES:
+        device_ids = list((detect_fn or _detect_cuda_device_ids)())
+    if config.workers == 0:
+        return device_ids or [None]
+    if not device_ids:
+        return [None] * config.workers
+    return [device_ids[i % len(device_ids)] for i in range(config.workers)]
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def _accepts_kwarg(fn: Callable[..., Any], name: str) -> bool:
+    """Whether ``fn`` can be called with keyword ``name`` (directly or via ``**kwargs``)."""
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return True
+    return name in params or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+
+
 class JobStore:
-    """In-memory job registry + bounded queue + single worker thread."""
+    """In-memory job registry + bounded queue + a pool of worker slots.
+
+    Each slot is a thread pulling from the shared queue; a slot pinned to a
+    CUDA device passes ``device_id`` through to ``transcribe_fn``. With a
+    ``db`` (a :class:`~transcribe_anything.server_jobdb.JobDatabase`) every
+    state change is written through so :meth:`recover` can rebuild the
+    store after a restart.
+    """
 
-    def __init__(self, config: ServerConfig, transcribe_fn: Optional[Callable[..., str]] = None) -> None:
+    def __init__(
+        self,
+        config: ServerConfig,
+        transcribe_fn: Optional[Callable[..., str]] = None,
+        worker_devices: Optional[list] = None,
+        db: Any = None,
+        fetch_fn: Optional[Callable[[str, str], None]] = None,
+        duration_fn: Optional[Callable[[str], Optional[float]]] = None,
+    ) -> None:
         self.config = config
         self.transcribe_fn = transcribe_fn or _default_transcribe_fn
+        self.duration_fn = duration_fn or _default_duration_fn
+        # Custom transcribe_fns written before progress/stage reporting
+        # existed don't take the callbacks; only pass what they accept.
+        self._fn_hooks = {name for name in ("progress_callback", "stage_callback") if _accepts_kwarg(self.transcribe_fn, name)}
+        self.worker_devices: list = list(worker_devices) if worker_devices is not None else resolve_worker_devices(config)
+        self._db = db
         self._jobs: dict = {}
         self._lock = threading.Lock()
         self._queue: Queue = Queue(maxsize=config.max_queue)
         self._stop = threading.Event()
-        self._worker: Optional[threading.Thread] = None
+        self._workers: list = []
+        self._reaper: Optional[threading.Thread] = None
         # Lifetime job-status counters for /metrics. Keys mirror JobStatus
         # values; we count terminal transitions, not intermediate states.
         self._counts: dict = {s.value: 0 for s in JobStatus}
+        self._reaped: dict = {"ttl": 0, "quota": 0}
+        self._listeners: list = []
+        self._reap_hooks: list = []
+        self._batches: dict = {}
+        # Per-job latency / throughput histograms for /metrics.
+        self.metrics = JobMetrics()
+        # Prices jobs for admission control and start/finish predictions.
+        self.cost = CostModel()
+        self._input_prefetch: Optional[InputPrefetcher] = None
+        if config.fetch_ahead > 0:
+            scratch = Path(config.job_root) / "_prefetch" if config.job_root else None
+            self._input_prefetch = InputPrefetcher(fetch_fn or _default_fetch_fn, self._queued_inputs, config.fetch_ahead, config.fetch_scratch_bytes, scratch, on_fetched=self._on_prefetched)
 
     def start(self) -> None:
-        if self._worker is not None:
+        if self._workers:
             return
-        self._worker = threading.Thread(target=self._run_worker, name="transcribe-worker", daemon=True)
-        self._worker.start()
+        for slot, device_id in enumerate(self.worker_devices):
+            name = "transcribe-worker" if len(self.worker_devices) == 1 else f"transcribe-worker-{slot}"
+            worker = threading.Thread(target=self._run_worker, args=(slot, device_id), name=name, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        if self.config.artifact_ttl_seconds > 0 or self.config.max_job_root_bytes:
+            self._reaper = threading.Thread(target=self._run_reaper, name="transcribe-reaper", daemon=True)
+            self._reaper.start()
 
     def stop(self, timeout: Optional[float] = None) -> None:
         self._stop.set()
+        for _ in self._workers:
+            try:
+                self._queue.put_nowait(None)
+            except Full:
+                # Workers also poll _stop between jobs.
+                break
+        deadline = time.monotonic() + (timeout if timeout is not None else self.config.shutdown_grace_seconds)
+        for worker in self._workers:
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+        self._workers = []
+        if self._reaper is not None:
+            self._reaper.join(timeout=max(0.0, deadline - time.monotonic()))
+            self._reaper = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._input_prefetch is not None:
+            self._input_prefetch.close()
+
+    def _persist(self, job: Job) -> None:
+        """Write ``job`` through to the job database, if there is one."""
+        db = self._db
+        if db is None:
+            return
         try:
-            self._queue.put_nowait(None)
-        except Full:
-            pass
-        worker = self._worker
-        if worker is not None:
-            worker.join(timeout=timeout if timeout is not None else self.config.shutdown_grace_seconds)
-        self._worker = None
+            db.save(job)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.warning("failed to persist job %s: %s", job.job_id, exc)
 
-    def submit(self, request: dict, artifact_dir: str) -> Job:
+    def add_reap_hook(self, fn: Callable[[], Any]) -> None:
+        """Calls ``fn()`` on every reaper pass, after the job reap (e.g. to expire upload sessions)."""
+        self._reap_hooks.append(fn)
+
+    def add_listener(self, fn: Callable[[str], None]) -> None:
+        """Calls ``fn(job_id)`` after every state change of a job, including deletion.
+
+        Listeners run on whichever thread made the change (usually a worker
+        slot) and must not block.
+        """
+        self._listeners.append(fn)
+
+    def _notify(self, job_id: str) -> None:
+        for fn in list(self._listeners):
+            try:
+                fn(job_id)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOG.warning("job listener failed for %s: %s", job_id, exc)
+
+    def _unpersist(self, job_id: str) -> None:
+        db = self._db
+        if db is None:
+            return
+        try:
+            db.delete(job_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.warning("failed to delete job %s from the job database: %s", job_id, exc)
+
+    def recover(self, job_root: Path) -> dict:
+        """Reload the job index from the database and reconcile it with ``job_root``.
+
+        Queued jobs go back on the queue in submission order (past
+        ``max_queue`` if need be: they were already admitted). Jobs that
+        were running when the previous process died are failed, or
+        re-queued with ``requeue_interrupted``. Jobs whose artifact dir is
+        gone are dropped, completed jobs get their artifact list re-read
+        from disk, and ``ta-job-*`` dirs no job refers to are removed.
+        Returns counts per action for logging.
+        """
+        summary = {"requeued": 0, "interrupted": 0, "restored": 0, "dropped": 0, "orphans_removed": 0}
+        if self._db is None:
+            return summary
+        known_dirs = set()
+        for job in self._db.load_all():
+            if not Path(job.artifact_dir).is_dir():
+                self._unpersist(job.job_id)
+                summary["dropped"] += 1
+                continue
+            known_dirs.add(Path(job.artifact_dir).resolve())
+            if job.status == JobStatus.RUNNING:
+                if self.config.requeue_interrupted:
+                    job.status = JobStatus.QUEUED
+                    job.started_at = None
+                    job.worker = None
+                    job.device_id = None
+                else:
+                    job.status = JobStatus.FAILED
+                    job.completed_at = time.time()
+                    job.error = "interrupted by a daemon restart; resubmit to retry"
+                    summary["interrupted"] += 1
+            elif job.status == JobStatus.COMPLETED:
+                job.artifacts = self.list_artifacts(job)
+            with self._lock:
+                self._jobs[job.job_id] = job
+                if job.batch_id:
+                    # Rejected inputs aren't persisted; the batch comes back with its jobs only.
+                    self._batches.setdefault(job.batch_id, Batch(batch_id=job.batch_id, created_at=job.created_at)).job_ids.append(job.job_id)
+            if job.status == JobStatus.QUEUED:
+                self._enqueue_recovered(job.job_id)
+                summary["requeued"] += 1
+            else:
+                summary["restored"] += 1
+            self._persist(job)
+        if job_root.is_dir():
+            for path in job_root.glob("ta-job-*"):
+                if path.is_dir() and path.resolve() not in known_dirs:
+                    shutil.rmtree(path, ignore_errors=True)
+                    summary["orphans_removed"] += 1
+        LOG.info("recovered job store: %s", summary)
+        return summary
+
+    def _enqueue_recovered(self, job_id: str) -> None:
+        # Bypass the maxsize check: max_queue is admission control for new
+        # submissions, and these jobs were admitted before the restart.
+        with self._queue.mutex:
+            self._queue.queue.append(job_id)
+            self._queue.unfinished_tasks += 1
+            self._queue.not_empty.notify()
+        self._schedule_input_prefetch()
+
+    def _queued_inputs(self) -> list:
+        """``[(job_id, input)]`` of the queued jobs, next to run first."""
+        with self._queue.mutex:
+            job_ids = [job_id for job_id in self._queue.queue if job_id is not None]
+        with self._lock:
+            return [(job_id, self._jobs[job_id].request["input"]) for job_id in job_ids if job_id in self._jobs]
+
+    def _schedule_input_prefetch(self) -> None:
+        if self._input_prefetch is not None:
+            self._input_prefetch.schedule()
+
+    def _on_prefetched(self, job_id: str, wav_path: str) -> None:
+        # The normalized wav gives the exact duration for the cost model.
+        try:
+            with wave.open(wav_path, "rb") as wav:
+                seconds = wav.getnframes() / float(wav.getframerate())
+        except (OSError, EOFError, wave.Error):
+            return
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.audio_seconds:
+                job.audio_seconds = seconds
+
+    def _model_label(self, request: dict) -> str:
+        return request.get("model") or self.config.model or "default"
+
+    def _job_seconds(self, job: Job) -> float:
+        return self.cost.job_seconds(self._model_label(job.request), job.audio_seconds)
+
+    def _forecast(self, order: list, now: float) -> tuple:
+        """:func:`forecast` over the running jobs and the queued job ids ``order``."""
+        with self._lock:
+            running = []
+            for job in self._jobs.values():
+                if job.status != JobStatus.RUNNING:
+                    continue
+                started_at = job.started_at or now
+                if job.eta_seconds is not None and job.progress_updated_at:
+                    finish_at = job.progress_updated_at + job.eta_seconds
+                else:
+                    finish_at = started_at + self._job_seconds(job)
+                running.append((job.job_id, started_at, finish_at))
+            queued = [(job_id, self._job_seconds(self._jobs[job_id])) for job_id in order if job_id in self._jobs]
+        return forecast(now, len(self.worker_devices), running, queued)
+
+    def _queue_order(self) -> list:
+        with self._queue.mutex:
+            return [job_id for job_id in self._queue.queue if job_id is not None]
+
+    def predictions(self) -> dict:
+        """Predicted ``(start_at, finish_at)`` of every queued and running job."""
+        return self._forecast(self._queue_order(), time.time())[0]
+
+    def predicted_wait(self) -> float:
+        """Seconds a job submitted now would wait before a worker picks it up."""
+        now = time.time()
+        _schedule, free = self._forecast(self._queue_order(), now)
+        return max(0.0, min(free) - now) if free else 0.0
+
+    def probe_audio_seconds(self, url_or_file: str) -> Optional[float]:
+        """Duration of an input about to be submitted, so admission can price it; None if unknown.
+
+        Blocking. Local files only need a header read and are always probed;
+        a URL costs a yt-dlp metadata pass (cached for the download), so it
+        is only probed when ``max_queue_wait_seconds`` admission is on.
+        """
+        if self.config.max_queue_wait_seconds is None and not os.path.isfile(url_or_file):
+            return None
+        try:
+            seconds = self.duration_fn(url_or_file)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.warning("could not probe the duration of %s: %s", url_or_file, exc)
+            return None
+        return seconds if seconds and seconds > 0 else None
+
+    def _admission(self, order: list, jobs: list, now: float) -> tuple:
+        """``(how many of jobs fit the wait limit, Retry-After, seconds until a queued job starts)``.
+
+        The last is when a full queue frees a spot: the head of the queue
+        starting (or, with nothing queued, a slot freeing up).
+        """
+        schedule, free = self._forecast(order, now)
+        starts = [schedule[job_id][0] for job_id in order if job_id in schedule] or free
+        next_start = max(0.0, min(starts) - now) if starts else 0.0
+        # Jobs of unknown length are priced at the model's average.
+        costs = [self._job_seconds(job) for job in jobs]
+        fits, retry_after = admit(free, now, costs, self.config.max_queue_wait_seconds)
+        return fits, retry_after, next_start
+
+    def submit(self, request: dict, artifact_dir: str, input_sha256: Optional[str] = None, audio_seconds: Optional[float] = None) -> Job:
+        """Queues ``request``; ``audio_seconds`` (see :meth:`probe_audio_seconds`) prices it for admission."""
         job_id = uuid.uuid4().hex
         job = Job(
             job_id=job_id,
@@ -268,18 +686,100 @@ class JobStore:
             request=request,
             artifact_dir=artifact_dir,
             created_at=time.time(),
+            input_sha256=input_sha256,
+            audio_seconds=audio_seconds,
         )
+        limit = self.config.max_queue_wait_seconds
+        if limit is not None:
+            fits, retry_after, _ = self._admission(self._queue_order(), [job], job.created_at)
+            if not fits:
+                raise QueueFull(f"predicted queue wait is over the {limit:g}s limit", retry_after=retry_after)
         with self._lock:
             self._jobs[job_id] = job
             self._counts[JobStatus.QUEUED.value] += 1
+        # Persist before the job becomes visible to a worker, so a RUNNING
+        # row can never be overwritten by a late QUEUED one.
+        self._persist(job)
         try:
             self._queue.put_nowait(job_id)
         except Full as exc:
             with self._lock:
                 self._jobs.pop(job_id, None)
-            raise QueueFull("transcription queue is full") from exc
+                self._counts[JobStatus.QUEUED.value] -= 1
+            self._unpersist(job_id)
+            _, _, next_start = self._admission(self._queue_order(), [], time.time())
+            raise QueueFull("transcription queue is full", retry_after=next_start) from exc
+        self._schedule_input_prefetch()
         return job
 
+    def submit_batch(self, requests: list, policy: str = "atomic", audio_seconds: Optional[list] = None) -> tuple:
+        """Admits ``requests`` (a list of ``(request, artifact_dir)``) as one batch.
+
+        ``atomic`` admits every job or none (:class:`QueueFull`); ``partial``
+        admits as many as the queue has room for (and, with
+        ``max_queue_wait_seconds``, as many as start within the wait
+        limit), in order. The capacity check and the enqueue happen under
+        the queue's own mutex, so a
+        concurrent single submit can't split an atomic batch. Returns
+        ``(batch, admitted jobs, indexes of requests not admitted)``.
+        ``audio_seconds`` holds each request's probed duration, as in
+        :meth:`submit`.
+        """
+        if policy not in BATCH_POLICIES:
+            raise ValueError(f"batch policy must be one of {BATCH_POLICIES}, got {policy!r}")
+        batch = Batch(batch_id=uuid.uuid4().hex, created_at=time.time())
+        jobs = [
+            Job(
+                job_id=uuid.uuid4().hex,
+                status=JobStatus.QUEUED,
+                request=request,
+                artifact_dir=artifact_dir,
+                created_at=batch.created_at,
+                batch_id=batch.batch_id,
+                audio_seconds=seconds,
+            )
+            for (request, artifact_dir), seconds in zip(requests, audio_seconds or [None] * len(requests))
+        ]
+        with self._queue.mutex:
+            room = len(jobs) if self._queue.maxsize <= 0 else min(len(jobs), max(0, self._queue.maxsize - len(self._queue.queue)))
+            order = [job_id for job_id in self._queue.queue if job_id is not None]
+            fits, wait_retry, next_start = self._admission(order, jobs, batch.created_at)
+            if policy == "atomic" and room < len(jobs):
+                raise QueueFull(f"transcription queue has room for {room} jobs, batch has {len(jobs)}", retry_after=next_start)
+            if policy == "atomic" and fits < len(jobs):
+                raise QueueFull(f"predicted queue wait of the batch is over the {self.config.max_queue_wait_seconds:g}s limit", retry_after=wait_retry)
+            reason, retry_after = "transcription queue is full", next_start
+            if fits < room:
+                room, retry_after = fits, wait_retry
+                reason = f"predicted queue wait is over the {self.config.max_queue_wait_seconds:g}s limit"
+            admitted = jobs[:room]
+            rejected = list(range(room, len(jobs)))
+            batch.rejected = [{"index": index, "input": jobs[index].request.get("input"), "error": reason} for index in rejected]
+            batch.retry_after = retry_after if rejected else None
+            # Register and persist before a worker can see the ids.
+            with self._lock:
+                for job in admitted:
+                    self._jobs[job.job_id] = job
+                self._counts[JobStatus.QUEUED.value] += len(admitted)
+                batch.job_ids = [job.job_id for job in admitted]
+                self._batches[batch.batch_id] = batch
+            for job in admitted:
+                self._persist(job)
+                self._queue.queue.append(job.job_id)
+            self._queue.unfinished_tasks += len(admitted)
+            self._queue.not_empty.notify(len(admitted))
+        self._schedule_input_prefetch()
+        return batch, admitted, rejected
+
+    def get_batch(self, batch_id: str) -> Optional[tuple]:
+        """``(batch, jobs)`` for a known batch; jobs already reaped or deleted are omitted."""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            if batch is None:
+                return None
+            jobs = [self._jobs[job_id] for job_id in batch.job_ids if job_id in self._jobs]
+        return batch, jobs
+
     def snapshot_metrics(self) -> dict:
         """Counters + gauges for the /metrics endpoint."""
         with self._lock:
@@ -291,6 +791,8 @@ class JobStore:
             "in_flight": in_flight,
             "queued_now": queued,
             "queue_capacity": self.config.max_queue,
+            "workers": len(self.worker_devices),
+            "reaped_lifetime": dict(self._reaped),
         }
 
     def get(self, job_id: str) -> Optional[Job]:
@@ -300,21 +802,81 @@ class JobStore:
     def delete(self, job_id: str) -> bool:
         with self._lock:
             job = self._jobs.pop(job_id, None)
+            batch = self._batches.get(job.batch_id) if job is not None and job.batch_id else None
+            if batch is not None and not any(other in self._jobs for other in batch.job_ids):
+                del self._batches[batch.batch_id]
         if job is None:
             return False
+        if self._input_prefetch is not None:
+            self._input_prefetch.release(job_id)
+        self._unpersist(job_id)
+        self._notify(job_id)
         try:
             shutil.rmtree(job.artifact_dir, ignore_errors=True)
         except OSError:
             pass
         return True
 
+    def reap(self, now: Optional[float] = None) -> dict:
+        """Deletes expired finished jobs, then evicts more until under the byte quota.
+
+        Only completed / failed jobs are ever removed; queued and running
+        jobs don't count against the TTL and are never evicted. Returns
+        ``{"ttl": n, "quota": m}`` for this pass.
+        """
+        now = time.time() if now is None else now
+        ttl = self.config.artifact_ttl_seconds
+        with self._lock:
+            finished = sorted(
+                (j for j in self._jobs.values() if j.status in (JobStatus.COMPLETED, JobStatus.FAILED)),
+                key=lambda j: j.completed_at or j.created_at,
+            )
+        reaped = {"ttl": 0, "quota": 0}
+        keep = []
+        for job in finished:
+            if ttl > 0 and (job.completed_at or job.created_at) + ttl <= now:
+                if self.delete(job.job_id):
+                    reaped["ttl"] += 1
+            else:
+                keep.append(job)
+        quota = self.config.max_job_root_bytes
+        if quota:
+            with self._lock:
+                dirs = [j.artifact_dir for j in self._jobs.values()]
+            total = sum(_dir_size(Path(d)) for d in dirs)
+            for job in keep:
+                if total <= quota:
+                    break
+                size = _dir_size(Path(job.artifact_dir))
+                if self.delete(job.job_id):
+                    total -= size
+                    reaped["quota"] += 1
+        if reaped["ttl"] or reaped["quota"]:
+            with self._lock:
+                for reason, n in reaped.items():
+                    self._reaped[reason] += n
+            LOG.info("reaped %d expired and %d over-quota jobs", reaped["ttl"], reaped["quota"])
+        return reaped
+
+    def _run_reaper(self) -> None:
+        while not self._stop.wait(self.config.reaper_interval_seconds):
+            try:
+                self.reap()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOG.warning("artifact reaper pass failed: %s", exc)
+            for hook in list(self._reap_hooks):
+                try:
+                    hook()
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOG.warning("reaper hook failed: %s", exc)
+
     def list_artifacts(self, job: Job) -> list:
         path = Path(job.artifact_dir)
         if not path.is_dir():
             return []
         return sorted(p.name for p in path.iterdir() if p.is_file())
 
-    def _run_worker(self) -> None:
+    def _run_worker(self, slot: int = 0, device_id: Optional[str] = None) -> None:
         while not self._stop.is_set():
             try:
                 job_id = self._queue.get(timeout=1.0)
@@ -326,14 +888,44 @@ class JobStore:
                 job = self._jobs.get(job_id)
             if job is None:
                 continue
-            self._run_one(job)
+            self._run_one(job, slot, device_id)
 
-    def _run_one(self, job: Job) -> None:
+    def _run_one(self, job: Job, slot: int = 0, device_id: Optional[str] = None) -> None:
         with self._lock:
             job.status = JobStatus.RUNNING
             job.started_at = time.time()
+            job.worker = slot
+            job.device_id = device_id
+            job.progress = 0.0
+            job.eta_seconds = None
+            job.progress_updated_at = job.started_at
             self._counts[JobStatus.RUNNING.value] += 1
+        self._persist(job)
+        self._notify(job.job_id)
         request = job.request
+        # Pinned slots are labelled with their own card so a slow or
+        # thermally throttled GPU shows up on its own series.
+        device_label = f"cuda:{device_id}" if device_id is not None else self.config.device or "auto"
+        labels = {"device": device_label, "model": self._model_label(request)}
+        self.metrics.queue_wait.observe(max(0.0, job.started_at - job.created_at), **labels)
+        stages: dict = {}
+
+        def record_stage(stage: str, seconds: float) -> None:
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+        # Optional kwargs are only passed when they apply: device_id for
+        # pinned slots, and the callbacks when transcribe_fn takes them.
+        pin: dict = {"device_id": device_id} if device_id is not None else {}
+        if "progress_callback" in self._fn_hooks:
+            pin["progress_callback"] = lambda processed, total: self._report_progress(job, processed, total)
+        if "stage_callback" in self._fn_hooks:
+            pin["stage_callback"] = record_stage
+        # Likewise fetched_wav: only when the prefetch stage already
+        # normalized this job's input.
+        fetched = self._input_prefetch.claim(job.job_id) if self._input_prefetch is not None else None
+        if fetched is not None:
+            pin["fetched_wav"] = fetched[0]
+            record_stage("fetch", fetched[1])
         try:
             self.transcribe_fn(
                 url_or_file=request["input"],
@@ -347,13 +939,20 @@ class JobStore:
                 initial_prompt=request.get("initial_prompt"),
                 align=bool(request.get("align", False)),
                 align_model=request.get("align_model"),
+                **pin,
             )
             artifacts = self.list_artifacts(job)
             with self._lock:
                 job.status = JobStatus.COMPLETED
                 job.completed_at = time.time()
                 job.artifacts = artifacts
+                job.progress = 1.0
+                job.eta_seconds = 0.0
+                job.progress_updated_at = job.completed_at
                 self._counts[JobStatus.COMPLETED.value] += 1
+            self._persist(job)
+            self._notify(job.job_id)
+            self._observe_completed(job, stages, labels)
         except Exception as exc:  # pylint: disable=broad-except
             tb = traceback.format_exc()
             redacted = _redact_secrets(f"{exc}\n{tb}", self.config.hf_token)
@@ -362,6 +961,10 @@ class JobStore:
                 job.completed_at = time.time()
                 job.error = redacted
                 self._counts[JobStatus.FAILED.value] += 1
+            self._persist(job)
+            self._notify(job.job_id)
+        if self._input_prefetch is not None:
+            self._input_prefetch.release(job.job_id)
         # Webhook fires after the job reaches a terminal state regardless of
         # outcome. Fire-and-forget on a daemon thread: a slow / wedged
         # webhook receiver MUST NOT delay the next job picking up the GPU.
@@ -370,6 +973,35 @@ class JobStore:
             t = threading.Thread(target=self._fire_webhook, args=(job, webhook_url), name=f"webhook-{job.job_id}", daemon=True)
             t.start()
 
+    def _observe_completed(self, job: Job, stages: dict, labels: dict) -> None:
+        run_seconds = max(0.0, (job.completed_at or 0.0) - (job.started_at or 0.0))
+        self.metrics.run.observe(run_seconds, **labels)
+        for stage, seconds in stages.items():
+            self.metrics.stage.observe(seconds, stage=stage, **labels)
+        if job.audio_seconds:
+            self.metrics.audio.observe(job.audio_seconds, **labels)
+            self.metrics.rtf.observe(run_seconds / job.audio_seconds, **labels)
+            self.cost.observe(labels["model"], job.audio_seconds, run_seconds)
+
+    def _report_progress(self, job: Job, processed_seconds: float, total_seconds: float) -> None:
+        """``progress_callback`` handed to ``transcribe_fn``; runs on the worker thread."""
+        fraction = min(1.0, max(0.0, processed_seconds / total_seconds)) if total_seconds > 0 else 1.0
+        now = time.time()
+        with self._lock:
+            if job.status != JobStatus.RUNNING:
+                return
+            previous = job.progress or 0.0
+            job.progress_updated_at = now
+            if total_seconds > 0:
+                job.audio_seconds = total_seconds
+            # Waiters are woken per whole percent, not per decoded segment.
+            if fraction > 0 and fraction - previous < 0.01 and fraction < 1.0:
+                return
+            job.progress = round(fraction, 4)
+            elapsed = now - (job.started_at or now)
+            job.eta_seconds = round(elapsed * (1.0 - fraction) / fraction, 1) if fraction > 0 else None
+        self._notify(job.job_id)
+
     def _fire_webhook(self, job: Job, webhook_url: str) -> None:
         """POST the terminal job manifest to ``webhook_url``. Errors swallowed."""
         try:
@@ -443,7 +1075,7 @@ class WarmupRunner:
 # Realtime streaming (#122).
 #
 # This module owns the FastAPI-free skeleton: the ``StreamSession``
-# serializer (one in-flight WS connection per daemon) and the pluggable
+# pool (``--max-streams`` in-flight WS connections per daemon) and the pluggable
 # ``StreamingTranscribeFn`` protocol. The actual WebSocket route lives in
 # ``server_app.py`` so this module stays importable without FastAPI.
 #
@@ -457,7 +1089,7 @@ class WarmupRunner:
 
 # Wire-protocol close codes (private 4000-4999 range per RFC 6455).
 WS_CLOSE_UNAUTHORIZED = 4401
-WS_CLOSE_BUSY = 4429  # another stream is already in-flight
+WS_CLOSE_BUSY = 4429  # --max-streams streams are already in-flight
 WS_CLOSE_DURATION_EXCEEDED = 4408
 WS_CLOSE_INTERNAL = 4499
 WS_CLOSE_NOT_ALLOWED = 4403  # daemon was not started with --allow-stream
@@ -468,18 +1100,21 @@ class StreamCancelled(Exception):
 
 
 class StreamSession:
-    """Serializes the one-streaming-connection-per-daemon invariant.
+    """State of one streaming connection: liveness, cancellation and decode latency.
 
-    Use as a context manager from the WebSocket handler. ``acquire()``
-    returns False if another session is already live; the handler then
-    closes the new connection with :data:`WS_CLOSE_BUSY`.
+    ``acquire()`` returns False if the session is already live. The
+    WebSocket handler gets its sessions from a :class:`StreamSessionPool`.
+    Backends report each decode through :meth:`record_decode`;
+    :meth:`latency_stats` summarizes the recent ones per kind.
     """
 
     def __init__(self) -> None:
+        self.session_id = uuid.uuid4().hex[:12]
         self._lock = threading.Lock()
         self._active: bool = False
         self._cancel = threading.Event()
         self._started_at: Optional[float] = None
+        self._latency: dict = {}  # kind -> (count, recent decode seconds)
 
     def acquire(self) -> bool:
         with self._lock:
@@ -488,6 +1123,7 @@ class StreamSession:
             self._active = True
             self._cancel.clear()
             self._started_at = time.time()
+            self._latency = {}
             return True
 
     def release(self) -> None:
@@ -515,6 +1151,168 @@ class StreamSession:
                 return None
             return time.time() - self._started_at
 
+    def record_decode(self, kind: str, seconds: float) -> None:
+        """Records how long one ``partial`` / ``final`` decode took, queueing included."""
+        with self._lock:
+            count, recent = self._latency.get(kind, (0, []))
+            recent = (recent + [seconds])[-STREAM_LATENCY_WINDOW:]
+            self._latency[kind] = (count + 1, recent)
+
+    def latency_stats(self) -> dict:
+        """``{kind: {count, p50_ms, p95_ms, max_ms}}`` over the last decodes of each kind."""
+        with self._lock:
+            latency = dict(self._latency)
+        stats: dict = {}
+        for kind, (count, recent) in latency.items():
+            ordered = sorted(recent)
+            stats[kind] = {
+                "count": count,
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000.0, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000.0, 1),
+                "max_ms": round(ordered[-1] * 1000.0, 1),
+            }
+        return stats
+
+
+# Decodes per kind that StreamSession.latency_stats summarizes.
+STREAM_LATENCY_WINDOW = 256
+
+
+class StreamSessionPool:
+    """Hands out up to ``max_streams`` concurrent :class:`StreamSession` s.
+
+    ``acquire()`` returns None when that many are live; the handler then
+    closes the new connection with :data:`WS_CLOSE_BUSY`.
+    """
+
+    def __init__(self, max_streams: int = 1) -> None:
+        self.max_streams = max_streams
+        self._lock = threading.Lock()
+        self._live: list = []
+
+    def acquire(self) -> Optional[StreamSession]:
+        with self._lock:
+            if len(self._live) >= self.max_streams:
+                return None
+            session = StreamSession()
+            session.acquire()
+            self._live.append(session)
+            return session
+
+    def release(self, session: StreamSession) -> None:
+        session.release()
+        with self._lock:
+            if session in self._live:
+                self._live.remove(session)
+
+    def live(self) -> list:
+        with self._lock:
+            return list(self._live)
+
+
+# Audio an AudioBridge holds before the socket reader stops reading: 5 s
+# of 16 kHz PCM16.
+STREAM_MAX_QUEUED_BYTES = 5 * 16000 * 2
+
+
+class AudioBridge:
+    """Thread-safe handoff of audio frames from the WS reader to a sync streaming backend.
+
+    The reader calls :meth:`try_put` and, when that returns False because
+    :data:`STREAM_MAX_QUEUED_BYTES` are already waiting, :meth:`put` from
+    a worker thread, so it stops reading the socket while the decoder is
+    behind (TCP backpressure on the client). The backend iterates the
+    bridge: each ``iter()`` blocks until a frame arrives or the bridge is
+    closed (end of input, cancel, disconnect), then yields the queued
+    frames and returns once they're drained; :meth:`frames` does the same
+    with a timeout. :meth:`stats` reports how long the frames waited.
+    """
+
+    def __init__(self, max_bytes: int = STREAM_MAX_QUEUED_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._cond = threading.Condition()
+        self._frames: deque = deque()  # (bytes, enqueued_at)
+        self._queued_bytes = 0
+        self._closed = False
+        self._lag = 0.0
+        self._max_lag = 0.0
+        self._backpressure_waits = 0
+
+    def _fits(self, frame: bytes) -> bool:
+        # A frame bigger than the whole budget still goes through on its own.
+        return not self._frames or self._queued_bytes + len(frame) <= self.max_bytes
+
+    def _append(self, frame: bytes) -> None:
+        self._frames.append((frame, time.monotonic()))
+        self._queued_bytes += len(frame)
+        self._cond.notify_all()
+
+    def try_put(self, frame: bytes) -> bool:
+        """Queues ``frame`` if there's room (or the bridge is closed, which drops it)."""
+        with self._cond:
+            if self._closed:
+                return True
+            if not self._fits(frame):
+                return False
+            self._append(frame)
+            return True
+
+    def put(self, frame: bytes) -> None:
+        """Queues ``frame``, blocking while the backend is behind. Dropped once closed."""
+        with self._cond:
+            self._backpressure_waits += 1
+            while not self._closed and not self._fits(frame):
+                self._cond.wait()
+            if not self._closed:
+                self._append(frame)
+
+    def close(self) -> None:
+        """No more input: wakes the backend and any blocked :meth:`put`."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        """True once closed and every queued frame has been consumed."""
+        with self._cond:
+            return self._closed and not self._frames
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.frames()
+
+    def frames(self, timeout: Optional[float] = None) -> Iterator[bytes]:
+        """Waits up to ``timeout`` (forever if None) for a frame or close, then yields the queued frames."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._frames and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return
+                self._cond.wait(remaining)
+        while True:
+            with self._cond:
+                if not self._frames:
+                    return
+                frame, enqueued_at = self._frames.popleft()
+                self._queued_bytes -= len(frame)
+                self._lag = time.monotonic() - enqueued_at
+                self._max_lag = max(self._max_lag, self._lag)
+                self._cond.notify_all()
+            yield frame
+
+    def stats(self) -> dict:
+        """Queue lag of the last frame taken, the worst since the last call, and what's waiting now."""
+        with self._cond:
+            stats = {
+                "queue_lag_ms": round(self._lag * 1000.0, 1),
+                "max_queue_lag_ms": round(self._max_lag * 1000.0, 1),
+                "queued_ms": round(self._queued_bytes / 32.0, 1),  # 16 kHz PCM16
+                "backpressure_waits": self._backpressure_waits,
+            }
+            self._max_lag = self._lag
+        return stats
+
 
 def _canned_streaming_fn(audio_iter: Any, *, session: StreamSession, **_kwargs: Any):
     """Stand-in streaming backend.
@@ -550,6 +1348,64 @@ def _canned_streaming_fn(audio_iter: Any, *, session: StreamSession, **_kwargs:
     yield {"type": "metrics", "audio_frames_received": drained}
 
 
+# Artifacts that are already compressed: deflating them again costs CPU for
+# no size win, so they go into the zip STORED.
+_STORED_SUFFIXES = {".mp4", ".m4a", ".mkv", ".mov", ".webm", ".mp3", ".aac", ".ogg", ".opus", ".flac", ".zip", ".gz", ".png", ".jpg", ".jpeg"}
+
+ZIP_STREAM_CHUNK_BYTES = 256 * 1024
+
+
+class _ZipSink:
+    """Write-only, unseekable sink: zipfile falls back to data descriptors
+    and we hand out whatever it has written since the last drain."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        out = bytes(self._buf)
+        self._buf.clear()
+        return out
+
+
+def iter_artifacts_zip(files: list, chunk_size: int = ZIP_STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yields a ZIP of ``files`` (paths, stored under their base names) piece by piece.
+
+    Each member is read ``chunk_size`` bytes at a time and the compressed
+    bytes are yielded as soon as zipfile produces them, so memory stays
+    around ``chunk_size`` no matter how large the artifacts are and the
+    first bytes go out before the last member is read.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w") as zf:  # type: ignore[arg-type]
+        for path in files:
+            path = Path(path)
+            info = zipfile.ZipInfo.from_file(path, arcname=path.name)
+            info.compress_type = zipfile.ZIP_STORED if path.suffix.lower() in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+            with open(path, "rb") as src, zf.open(info, "w") as dest:
+                while True:
+                    block = src.read(chunk_size)
+                    if not block:
+                        break
+                    dest.write(block)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    data = sink.drain()
+    if data:
+        yield data
+
+
 def _make_silent_wav(duration_seconds: float = 1.0, sample_rate: int = 16000) -> Path:
     """Synthesize a tiny silent WAV file for warmup. Returned path is unlinked by caller."""
     import struct
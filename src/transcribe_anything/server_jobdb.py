@@ -0,0 +1,114 @@
+"""
+SQLite-backed persistence for the daemon's job index (``--job-db``).
+
+:class:`JobStore` keeps its in-memory dict + queue as the working set and
+writes every state transition through to this table, so a restart can
+pick up where the previous process left off (see :meth:`JobStore.recover`).
+The database runs in WAL mode: writes from the worker slots never block
+readers, and a crash mid-write leaves the last committed state intact.
+
+Stdlib only, like :mod:`server_config`, so the host-side launcher can
+import it without FastAPI.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Union
+
+from transcribe_anything.server_config import Job, JobStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    artifact_dir TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    error TEXT,
+    artifacts TEXT NOT NULL,
+    worker INTEGER,
+    device_id TEXT,
+    input_sha256 TEXT,
+    batch_id TEXT
+)
+"""
+
+_COLUMNS = ("job_id", "status", "request", "artifact_dir", "created_at", "started_at", "completed_at", "error", "artifacts", "worker", "device_id", "input_sha256", "batch_id")
+
+
+class JobDatabase:
+    """Write-through job table. Thread-safe; one connection shared behind a lock."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable across process crashes in WAL mode; only an OS
+        # crash can lose the last few transactions.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        # Databases written before a column existed get it added in place.
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column in _COLUMNS:
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column}")
+
+    def save(self, job: Job) -> None:
+        row = (
+            job.job_id,
+            job.status.value,
+            json.dumps(job.request),
+            job.artifact_dir,
+            job.created_at,
+            job.started_at,
+            job.completed_at,
+            job.error,
+            json.dumps(list(job.artifacts)),
+            job.worker,
+            job.device_id,
+            job.input_sha256,
+            job.batch_id,
+        )
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO jobs ({', '.join(_COLUMNS)}) VALUES ({placeholders})", row)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def load_all(self) -> list:
+        """Every stored job, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs ORDER BY created_at").fetchall()
+        jobs = []
+        for row in rows:
+            values = dict(zip(_COLUMNS, row))
+            jobs.append(
+                Job(
+                    job_id=values["job_id"],
+                    status=JobStatus(values["status"]),
+                    request=json.loads(values["request"]),
+                    artifact_dir=values["artifact_dir"],
+                    created_at=values["created_at"],
+                    started_at=values["started_at"],
+                    completed_at=values["completed_at"],
+                    error=values["error"],
+                    artifacts=json.loads(values["artifacts"]),
+                    worker=values["worker"],
+                    device_id=values["device_id"],
+                    input_sha256=values["input_sha256"],
+                    batch_id=values["batch_id"],
+                )
+            )
+        return jobs
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
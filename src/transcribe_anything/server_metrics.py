@@ -0,0 +1,91 @@
+"""
+Prometheus histograms for the daemon's ``/metrics`` endpoint.
+
+:class:`JobStore` records one observation per finished job (queue wait,
+per-stage time, audio seconds, real-time factor), labelled by device and
+model; ``server_app`` renders them in the text exposition format next to
+the existing counters and gauges.
+
+Stdlib only, like :mod:`server_config`; no prometheus_client dependency.
+"""
+
+import math
+import threading
+from typing import Iterable
+
+# Wall-clock seconds: sub-second cache hits up to multi-hour backlogs.
+TIME_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+# Length of the input audio, 10 s clips to 4 h recordings.
+AUDIO_BUCKETS = (10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0, 14400.0)
+# Processing seconds per audio second; < 1 is faster than real time.
+RTF_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+# Stages reported through ``stage_callback``; see api.transcribe.
+STAGES = ("fetch", "inference", "alignment", "postprocess")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a fixed tuple of label names. Thread-safe."""
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str], buckets: Iterable[float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._lock = threading.Lock()
+        # label values -> [bucket counts..., sum, count]
+        self._series: dict = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> dict:
+        """``{label values: {"buckets": [...], "sum": s, "count": n}}``."""
+        with self._lock:
+            return {key: {"buckets": list(s[:-2]), "sum": s[-2], "count": s[-1]} for key, s in self._series.items()}
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self.snapshot().items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, key))
+            sep = "," if labels else ""
+            for bound, count in zip(self.buckets, series["buckets"]):
+                lines.append(f'{self.name}_bucket{{{labels}{sep}le="{_format_value(bound)}"}} {count}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series['sum']}")
+            lines.append(f"{self.name}_count{{{labels}}} {series['count']}")
+        return lines
+
+
+class JobMetrics:
+    """The daemon's job histograms."""
+
+    def __init__(self) -> None:
+        labels = ("device", "model")
+        self.queue_wait = Histogram("transcribe_anything_job_queue_wait_seconds", "Seconds a job waited in the queue before a worker picked it up.", labels, TIME_BUCKETS)
+        self.run = Histogram("transcribe_anything_job_run_seconds", "Seconds from a worker picking a job up to its completion.", labels, TIME_BUCKETS)
+        self.stage = Histogram("transcribe_anything_job_stage_seconds", "Seconds spent per pipeline stage of a completed job.", labels + ("stage",), TIME_BUCKETS)
+        self.audio = Histogram("transcribe_anything_job_audio_seconds", "Length of each completed job's audio; _sum is total audio processed.", labels, AUDIO_BUCKETS)
+        self.rtf = Histogram("transcribe_anything_job_rtf", "Real-time factor of each completed job (run seconds / audio seconds).", labels, RTF_BUCKETS)
+
+    def render(self) -> list:
+        lines: list = []
+        for histogram in (self.queue_wait, self.run, self.stage, self.audio, self.rtf):
+            lines.extend(histogram.render())
+        return lines
@@ -0,0 +1,180 @@
+"""
+Input prefetch for the daemon's job queue (``--fetch-ahead``).
+
+``api.transcribe`` spends the first part of every job downloading the
+input (yt-dlp) and normalizing it to a 16 kHz wav (ffmpeg) while the
+device sits idle. :class:`InputPrefetcher` runs that fetch stage for the
+next ``ahead`` queued jobs on its own threads, so by the time a worker
+slot picks a job up its wav is usually already on disk and only
+inference is serialized on the device. It is the daemon-side counterpart
+of the producer stage in :func:`transcribe_anything.api.transcribe_many`.
+
+Prefetching is best-effort: a fetch that fails, or a job the prefetcher
+never got to, is simply fetched inline by ``transcribe_fn`` as before, so
+errors surface on the job exactly as they would without prefetch.
+
+Stdlib only, like :mod:`server_config`.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+LOG = logging.getLogger(__name__)
+
+# (url_or_file, wav_path)
+FetchFn = Callable[[str, str], None]
+# -> [(job_id, url_or_file), ...] of queued jobs, next to run first.
+PeekFn = Callable[[], list]
+
+
+class _Entry:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.size = 0
+        self.seconds = 0.0
+        self.claimed = False
+        self.discarded = False
+
+
+class InputPrefetcher:
+    """Fetches the audio of upcoming queued jobs into a bounded scratch dir.
+
+    ``ahead`` caps how many unclaimed fetches (running or finished) exist
+    at once; ``budget_bytes`` caps the wav bytes held in ``scratch_dir``.
+    A new fetch only starts while the held bytes, plus the largest wav seen
+    so far for each fetch still running, are under the budget. Sizes
+    aren't known up front, so one unusually long input can still overshoot.
+
+    Scheduling is event-driven: :class:`JobStore` calls :meth:`schedule`
+    whenever the queue changes, and every finished fetch reschedules.
+    ``on_fetched(job_id, wav_path)`` is called after each successful fetch.
+    """
+
+    def __init__(
+        self,
+        fetch_fn: FetchFn,
+        peek_fn: PeekFn,
+        ahead: int,
+        budget_bytes: int,
+        scratch_dir: Optional[Path] = None,
+        on_fetched: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        self.fetch_fn = fetch_fn
+        self.peek_fn = peek_fn
+        self.on_fetched = on_fetched
+        self.ahead = max(1, ahead)
+        self.budget_bytes = budget_bytes
+        if scratch_dir is None:
+            scratch_dir = Path(tempfile.mkdtemp(prefix="ta-prefetch-"))
+        else:
+            # Leftovers from a previous process belong to no one.
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+            scratch_dir.mkdir(parents=True, exist_ok=True)
+        self.scratch_dir = scratch_dir
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+        self._closed = False
+        self._largest = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.ahead, thread_name_prefix="transcribe-prefetch")
+
+    def held_bytes(self) -> int:
+        with self._lock:
+            return sum(e.size for e in self._entries.values())
+
+    def schedule(self) -> None:
+        """Starts fetches for the next queued jobs that have none, within the limits."""
+        upcoming = self.peek_fn()
+        with self._lock:
+            if self._closed:
+                return
+            for job_id, url_or_file in upcoming:
+                # A failed fetch stays listed (so it isn't retried) but holds no slot.
+                pending = sum(1 for e in self._entries.values() if not e.claimed and e.error is None)
+                committed = sum(e.size if e.done.is_set() else self._largest for e in self._entries.values())
+                if pending >= self.ahead or committed >= self.budget_bytes:
+                    break
+                if job_id in self._entries:
+                    continue
+                entry = _Entry(self.scratch_dir / f"{job_id}.wav")
+                self._entries[job_id] = entry
+                self._executor.submit(self._fetch, job_id, url_or_file, entry)
+
+    def _fetch(self, job_id: str, url_or_file: str, entry: _Entry) -> None:
+        start = time.monotonic()
+        try:
+            self.fetch_fn(url_or_file, str(entry.path))
+            entry.size = os.path.getsize(entry.path)
+            with self._lock:
+                self._largest = max(self._largest, entry.size)
+            if self.on_fetched is not None:
+                self.on_fetched(job_id, str(entry.path))
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.info("prefetch of job %s failed, it will fetch inline: %s", job_id, exc)
+            entry.error = exc
+        entry.seconds = time.monotonic() - start
+        entry.done.set()
+        with self._lock:
+            orphaned = entry.discarded or self._closed
+        if orphaned:
+            self._drop(job_id, entry)
+        self.schedule()
+
+    def claim(self, job_id: str) -> Optional[tuple]:
+        """``(wav_path, fetch_seconds)`` for a job a worker is about to run, or None.
+
+        A fetch that is still running is waited for: it got a head start on
+        anything the worker could do inline. Call :meth:`release` once the
+        job no longer needs the file.
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None or entry.discarded:
+                return None
+            entry.claimed = True
+        entry.done.wait()
+        if entry.error is not None:
+            return None
+        # A freed ahead slot can go to the next queued job right away.
+        self.schedule()
+        return str(entry.path), entry.seconds
+
+    def release(self, job_id: str) -> None:
+        """Deletes the job's prefetched wav (if any) and frees its budget."""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return
+            entry.discarded = True
+            done = entry.done.is_set()
+        if done:
+            self._drop(job_id, entry)
+            self.schedule()
+
+    def _drop(self, job_id: str, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(job_id) is entry:
+                del self._entries[job_id]
+        try:
+            entry.path.unlink()
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            # Fetches that will never run must not leave a claim() waiting.
+            for entry in self._entries.values():
+                if not entry.done.is_set():
+                    entry.error = entry.error or RuntimeError("prefetcher closed")
+                    entry.done.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
@@ -0,0 +1,321 @@
+"""
+Resumable upload sessions for the daemon (``/v1/uploads``).
+
+A client creates a session for a file of known size, PUTs byte ranges in
+any order (and in parallel), asks which ranges have arrived after a
+dropped connection, and finalizes the session into an ordinary job. Each
+session is a directory under ``<job_root>/_uploads/<upload_id>/`` holding
+a preallocated ``data.part`` that ranges are written into at their offset
+and a ``session.json`` with the received ranges, rewritten after every
+range so a daemon restart doesn't lose progress.
+
+FastAPI-free (stdlib only), like :mod:`server_config`.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+# Largest single PUT the daemon accepts. A range is written to disk as it
+# arrives but only recorded once all of it has, so this bounds how much a
+# dropped connection throws away.
+MAX_UPLOAD_CHUNK_BYTES = 64 * 1024 * 1024
+
+_HASH_BLOCK = 1024 * 1024
+
+
+class UploadError(ValueError):
+    """Invalid upload request; ``status_code`` is the HTTP status to answer with."""
+
+    def __init__(self, message: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _merge_ranges(ranges: list) -> list:
+    """Sorts and coalesces half-open ``[start, end)`` ranges."""
+    merged: list = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def missing_ranges(received: list, size: int) -> list:
+    """Half-open ``[start, end)`` gaps in ``received`` over ``[0, size)``."""
+    gaps = []
+    cursor = 0
+    for start, end in _merge_ranges(received):
+        if start > cursor:
+            gaps.append([cursor, start])
+        cursor = max(cursor, end)
+    if cursor < size:
+        gaps.append([cursor, size])
+    return gaps
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    filename: str
+    size: int
+    options: dict
+    created_at: float
+    updated_at: float
+    # Half-open [start, end) byte ranges already on disk, coalesced.
+    received: list = field(default_factory=list)
+
+    @property
+    def offset(self) -> int:
+        """Bytes received contiguously from the start of the file."""
+        if self.received and self.received[0][0] == 0:
+            return self.received[0][1]
+        return 0
+
+    @property
+    def complete(self) -> bool:
+        return self.offset >= self.size
+
+    def to_public_dict(self) -> dict:
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "size": self.size,
+            "offset": self.offset,
+            "received": [list(r) for r in self.received],
+            "missing": missing_ranges(self.received, self.size),
+            "complete": self.complete,
+        }
+
+
+class UploadStore:
+    """Upload sessions on disk under ``root``. Thread-safe."""
+
+    def __init__(self, root: Path, max_upload_size_bytes: int, max_sessions: Optional[int] = None, max_reserved_bytes: Optional[int] = None) -> None:
+        self.root = Path(root)
+        self.max_upload_size_bytes = max_upload_size_bytes
+        # Every session preallocates its full size, so bound how many can be
+        # open and how much disk they hold between them. None = no cap.
+        self.max_sessions = max_sessions
+        self.max_reserved_bytes = max_reserved_bytes
+        self._lock = threading.Lock()
+        self._sessions: dict = {}
+        self._finalizing: set = set()
+        self._load_existing()
+
+    def _dir(self, upload_id: str) -> Path:
+        return self.root / upload_id
+
+    def _load_existing(self) -> None:
+        if not self.root.is_dir():
+            return
+        for manifest in self.root.glob("*/session.json"):
+            try:
+                data = json.loads(manifest.read_text(encoding="utf-8"))
+                session = UploadSession(**data)
+            except (OSError, ValueError, TypeError):
+                shutil.rmtree(manifest.parent, ignore_errors=True)
+                continue
+            self._sessions[session.upload_id] = session
+
+    def _save_manifest(self, session: UploadSession) -> None:
+        path = self._dir(session.upload_id) / "session.json"
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(asdict(session)), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def create(self, filename: str, size: int, options: Optional[dict] = None) -> UploadSession:
+        if not isinstance(size, int) or size < 1:
+            raise UploadError("upload size must be a positive integer")
+        if size > self.max_upload_size_bytes:
+            raise UploadError(f"upload exceeds max-upload-size {self.max_upload_size_bytes} bytes", status_code=413)
+        now = time.time()
+        session = UploadSession(
+            upload_id=uuid.uuid4().hex,
+            filename=Path(filename or "upload.bin").name or "upload.bin",
+            size=size,
+            options=dict(options or {}),
+            created_at=now,
+            updated_at=now,
+        )
+        # Reserve under the lock so concurrent creates can't overshoot the caps.
+        with self._lock:
+            if self.max_sessions is not None and len(self._sessions) >= self.max_sessions:
+                raise UploadError(f"{len(self._sessions)} upload sessions already open (max {self.max_sessions})", status_code=429)
+            reserved = sum(s.size for s in self._sessions.values())
+            if self.max_reserved_bytes is not None and reserved + size > self.max_reserved_bytes:
+                raise UploadError(f"open uploads already reserve {reserved} of {self.max_reserved_bytes} bytes", status_code=507)
+            self._sessions[session.upload_id] = session
+        directory = self._dir(session.upload_id)
+        try:
+            directory.mkdir(parents=True)
+            with open(directory / "data.part", "wb") as fh:
+                fh.truncate(size)
+            with self._lock:
+                self._save_manifest(session)
+        except BaseException:
+            self.delete(session.upload_id)
+            raise
+        return session
+
+    @property
+    def reserved_bytes(self) -> int:
+        """Disk preallocated by the open sessions."""
+        with self._lock:
+            return sum(s.size for s in self._sessions.values())
+
+    def get(self, upload_id: str) -> Optional[UploadSession]:
+        with self._lock:
+            return self._sessions.get(upload_id)
+
+    def open_range(self, upload_id: str, start: int, length: int) -> "RangeWriter":
+        """Opens ``[start, start + length)`` of an upload for writing. Blocking."""
+        end = start + length
+        with self._lock:
+            session = self._sessions.get(upload_id)
+            if session is None:
+                raise UploadError("unknown upload", status_code=404)
+            if upload_id in self._finalizing:
+                raise UploadError("upload is being finalized", status_code=409)
+        if start < 0 or end > session.size or length < 1:
+            raise UploadError(f"range {start}-{end - 1} is outside the {session.size}-byte upload", status_code=416)
+        # Own handle per range: parallel PUTs of different ranges don't share
+        # a file position.
+        try:
+            fh = open(self._dir(upload_id) / "data.part", "r+b")  # pylint: disable=consider-using-with
+        except FileNotFoundError as exc:
+            # finalize() moved (or delete() removed) the file after the check above.
+            raise UploadError("upload was finalized or deleted", status_code=409) from exc
+        fh.seek(start)
+        return RangeWriter(self, session, fh, start, end)
+
+    def write_range(self, upload_id: str, start: int, data: bytes) -> UploadSession:
+        """Writes ``data`` at byte ``start``. Blocking; call it off the event loop."""
+        writer = self.open_range(upload_id, start, len(data))
+        try:
+            writer.write(data)
+            return writer.commit()
+        finally:
+            writer.close()
+
+    def _record_range(self, session: UploadSession, start: int, end: int) -> UploadSession:
+        with self._lock:
+            if self._sessions.get(session.upload_id) is not session:
+                raise UploadError("upload was finalized or deleted", status_code=409)
+            session.received = _merge_ranges(session.received + [[start, end]])
+            session.updated_at = time.time()
+            self._save_manifest(session)
+        return session
+
+    def finalize(self, upload_id: str, dest_dir: Path) -> tuple:
+        """Moves a complete upload to ``dest_dir/_input/<filename>``.
+
+        Returns ``(path, sha256 hex)``. Blocking (hashes the whole file).
+        The session stays claimed until :meth:`commit` (job accepted) or
+        :meth:`unfinalize` (job rejected, e.g. queue full: the client can
+        finalize again later without re-uploading).
+        """
+        with self._lock:
+            session = self._sessions.get(upload_id)
+            if session is None:
+                raise UploadError("unknown upload", status_code=404)
+            if not session.complete:
+                raise UploadError(f"upload incomplete: missing {missing_ranges(session.received, session.size)}", status_code=409)
+            if upload_id in self._finalizing:
+                raise UploadError("upload is already being finalized", status_code=409)
+            self._finalizing.add(upload_id)
+        try:
+            src = self._dir(upload_id) / "data.part"
+            digest = hashlib.sha256()
+            with open(src, "rb") as fh:
+                while True:
+                    block = fh.read(_HASH_BLOCK)
+                    if not block:
+                        break
+                    digest.update(block)
+            out = dest_dir / "_input" / session.filename
+            out.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(src), str(out))
+        except BaseException:
+            with self._lock:
+                self._finalizing.discard(upload_id)
+            raise
+        return str(out), digest.hexdigest()
+
+    def commit(self, upload_id: str) -> None:
+        """Drops a finalized session once its job has been accepted."""
+        with self._lock:
+            self._finalizing.discard(upload_id)
+        self.delete(upload_id)
+
+    def unfinalize(self, upload_id: str, path: str) -> None:
+        """Moves a finalized upload back into its session so it can be finalized again."""
+        try:
+            shutil.move(path, str(self._dir(upload_id) / "data.part"))
+        finally:
+            with self._lock:
+                self._finalizing.discard(upload_id)
+
+    def delete(self, upload_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(upload_id, None)
+        if session is None:
+            # Unknown ids never touch the filesystem (they come from the URL).
+            return False
+        shutil.rmtree(self._dir(upload_id), ignore_errors=True)
+        return True
+
+    def expire(self, max_idle_seconds: float, now: Optional[float] = None) -> int:
+        """Drops sessions with no activity for ``max_idle_seconds``."""
+        now = time.time() if now is None else now
+        with self._lock:
+            stale = [s.upload_id for s in self._sessions.values() if s.updated_at + max_idle_seconds <= now]
+        for upload_id in stale:
+            self.delete(upload_id)
+        return len(stale)
+
+
+class RangeWriter:
+    """One PUT's byte range, written into ``data.part`` as the body arrives.
+
+    The range only counts as received once :meth:`commit` has run, so a
+    connection that drops halfway leaves the range missing rather than
+    half-filled. Blocking; drive it from a threadpool.
+    """
+
+    def __init__(self, store: UploadStore, session: UploadSession, fh, start: int, end: int) -> None:
+        self._store = store
+        self._session = session
+        self._fh = fh
+        self.start = start
+        self.end = end
+        self.written = 0
+
+    def write(self, chunk: bytes) -> None:
+        if self.written + len(chunk) > self.end - self.start:
+            raise UploadError("body is longer than its Content-Range")
+        self._fh.write(chunk)
+        self.written += len(chunk)
+
+    def commit(self) -> UploadSession:
+        """Flushes the range to disk and records it on the session."""
+        if self.written != self.end - self.start:
+            raise UploadError(f"body has {self.written} bytes, Content-Range says {self.end - self.start}")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self.close()
+        return self._store._record_range(self._session, self.start, self.end)  # pylint: disable=protected-access
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
@@ -21,6 +21,10 @@ Layout:
   can monkey-patch the actual model away.
 * :class:`_VadChunker` — silero-vad wrapper that takes PCM samples
   and returns ``(provisional_tail_samples, finalised_chunks)``.
+* :class:`DecodeService` / :class:`SharedDecoders` — with
+  ``--max-streams`` above 1, one decoder per model is shared by every
+  live session; each decode tick batches the pending finals and partial
+  tails of all sessions into a single call.
 
 All heavy work is hidden behind ``_lazy_imports()`` so the host process
 can import this module without ``faster-whisper`` installed (the route
@@ -30,10 +34,15 @@ in ``server_app`` only instantiates the function pointer at startup).
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, Iterator, Optional
 
-from transcribe_anything.server_config import StreamCancelled, StreamSession
+from transcribe_anything.server_config import (
+    AudioBridge,
+    StreamCancelled,
+    StreamSession,
+)
 
 if TYPE_CHECKING:
     # numpy lives in the iso-env only.
@@ -45,6 +54,18 @@ SAMPLE_RATE = 16000
 DEFAULT_VAD_MIN_SILENCE_MS = 200
 DEFAULT_MAX_WINDOW_SECONDS = 28.0
 PROVISIONAL_OVERLAP_SECONDS = 2.0
+# A forced cut lands on the quietest 20 ms frame within this many seconds
+# of the window's end.
+FORCED_CUT_SEARCH_SECONDS = 2.0
+# Upper bound on clips decoded together in one DecodeService tick.
+DEFAULT_MAX_DECODE_BATCH = 16
+# How long a tick waits for the other live sessions to submit before it
+# decodes whatever is pending.
+DEFAULT_GATHER_SECONDS = 0.02
+# Cadence of the queue-lag metrics events while audio flows through a bridge.
+QUEUE_METRICS_INTERVAL_SECONDS = 1.0
+# Tail of the committed text fed back to the decoder as its prompt.
+COMMITTED_PROMPT_CHARS = 200
 
 
 def _lazy_imports():
@@ -71,65 +92,465 @@ class _Decoder:
         _, WhisperModel, _, _ = _lazy_imports()
         self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
 
-    def transcribe(self, audio, *, language: Optional[str] = None) -> str:
+    def transcribe(self, audio, *, language: Optional[str] = None, prompt: Optional[str] = None) -> str:
         """Return the concatenated transcript text for ``audio`` (1-D float32)."""
-        segments, _info = self._model.transcribe(audio, language=language, beam_size=1, word_timestamps=False)
-        parts: list[str] = []
-        for seg in segments:
-            parts.append(seg.text)
-        return "".join(parts).strip()
+        return "".join(text for _start, _end, text in self.transcribe_segments(audio, language=language, prompt=prompt)).strip()
+
+    def transcribe_segments(self, audio, *, language: Optional[str] = None, prompt: Optional[str] = None) -> list:
+        """Return ``[(start_s, end_s, text), ...]`` for ``audio``, conditioned on ``prompt`` (earlier text)."""
+        segments, _info = self._model.transcribe(audio, language=language, beam_size=1, word_timestamps=False, initial_prompt=prompt or None)
+        return [(seg.start, seg.end, seg.text) for seg in segments]
+
+    def transcribe_batch(self, audios: list, *, languages: list, prompts: Optional[list] = None) -> list:
+        """Return the segments of each clip in ``audios``, encoding and decoding them as one batch.
+
+        Clips are padded/trimmed to Whisper's 30 s window, so callers pass
+        VAD segments and tails, not whole recordings. Clips without a
+        language need detection first and go through :meth:`transcribe_segments`.
+        """
+        prompts = prompts or [None] * len(audios)
+        out: list = [None] * len(audios)
+        batched = [i for i, language in enumerate(languages) if language]
+        if len(batched) < 2:
+            batched = []
+        for i in range(len(audios)):
+            if i not in batched:
+                out[i] = self.transcribe_segments(audios[i], language=languages[i], prompt=prompts[i])
+        if not batched:
+            return out
+        np, _, _, _ = _lazy_imports()
+        from faster_whisper.audio import pad_or_trim  # type: ignore[import-not-found]
+        from faster_whisper.tokenizer import Tokenizer  # type: ignore[import-not-found]
+
+        model = self._model
+        features = np.stack([pad_or_trim(model.feature_extractor(audios[i])) for i in batched])
+        encoder_output = model.encode(features)
+        tokenizers = [Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=languages[i]) for i in batched]
+        token_prompts = []
+        for i, tok in zip(batched, tokenizers):
+            previous = tok.encode(" " + prompts[i].strip())[-(448 // 2 - 1) :] if prompts[i] else []
+            token_prompts.append(([tok.sot_prev] + previous if previous else []) + list(tok.sot_sequence))
+        results = model.model.generate(encoder_output, token_prompts, beam_size=1, max_length=448, suppress_blank=True)
+        for i, tok, result in zip(batched, tokenizers, results):
+            out[i] = _split_timestamped(result.sequences_ids[0], tok)
+        return out
+
+
+def _split_timestamped(tokens: list, tokenizer) -> list:
+    """Turn ``<|t0|> text <|t1|>`` token runs into ``[(t0, t1, text), ...]``.
+
+    Text after the last timestamp (the model ran out of audio mid-segment)
+    becomes a segment with ``end=None``.
+    """
+    segments: list = []
+    start = 0.0
+    text_tokens: list = []
+    for token in tokens:
+        if token >= tokenizer.timestamp_begin:
+            at = (token - tokenizer.timestamp_begin) * 0.02
+            if text_tokens:
+                segments.append((start, at, tokenizer.decode(text_tokens)))
+                text_tokens = []
+            start = at
+        elif token < tokenizer.eot:
+            text_tokens.append(token)
+    if text_tokens:
+        segments.append((start, None, tokenizer.decode(text_tokens)))
+    return segments
+
+
+def _decode_segments(decoder, audio, *, language: Optional[str], prompt: Optional[str]) -> list:
+    """``decoder.transcribe_segments``, or one open-ended segment from a text-only decoder."""
+    segments_fn = getattr(decoder, "transcribe_segments", None)
+    if segments_fn is not None:
+        return segments_fn(audio, language=language, prompt=prompt)
+    return [(0.0, None, decoder.transcribe(audio, language=language))]
+
+
+def _segments_text(segments: list) -> str:
+    return "".join(text for _start, _end, text in segments).strip()
+
+
+def _normalize_word(word: str) -> str:
+    return "".join(ch for ch in word.lower() if ch.isalnum() or ch == "'")
+
+
+class _PrefixCommitter:
+    """LocalAgreement-2 over the decoded segments of the open speech window.
+
+    Each partial decode covers only the audio after the committed point,
+    prompted with the committed text. Words that come out the same in two
+    consecutive decodes are agreed; every leading segment made up entirely
+    of agreed words is committed, and :meth:`update` returns where the
+    last one ends so the caller can trim that audio from the window.
+    Committing whole segments keeps the committed text and the trimmed
+    audio in step, and the window stays around one or two Whisper
+    segments however long the speaker goes without a pause.
+    """
+
+    def __init__(self) -> None:
+        self.committed: list = []
+        self._previous: list = []
+        self._context = ""
+
+    @property
+    def text(self) -> str:
+        return "".join(self.committed).strip()
+
+    @property
+    def prompt(self) -> str:
+        return (self._context + " " + self.text).strip()[-COMMITTED_PROMPT_CHARS:]
+
+    def update(self, segments: list) -> tuple:
+        """``(trim_seconds, uncommitted_text)`` after the decode that produced ``segments``."""
+        words = [_normalize_word(w) for _start, _end, text in segments for w in text.split()]
+        agreed = 0
+        while agreed < min(len(words), len(self._previous)) and words[agreed] == self._previous[agreed]:
+            agreed += 1
+        trim = 0.0
+        consumed = 0
+        kept = 0
+        for _start, end, text in segments:
+            n_words = len(text.split())
+            if end is None or consumed + n_words > agreed:
+                break
+            consumed += n_words
+            trim = end
+            kept += 1
+            self.committed.append(text)
+        self._previous = words[consumed:]
+        return trim, _segments_text(segments[kept:])
+
+    def reset(self, context: str = "") -> None:
+        """Start a new window; ``context`` (text the window continues) only goes into the prompt."""
+        self.committed = []
+        self._previous = []
+        self._context = context
+
+
+class _DecodeRequest:
+    __slots__ = ("audio", "language", "prompt", "done", "segments", "error")
+
+    def __init__(self, audio, language: Optional[str], prompt: Optional[str]) -> None:
+        self.audio = audio
+        self.language = language
+        self.prompt = prompt
+        self.done = threading.Event()
+        self.segments: Optional[list] = None
+        self.error: Optional[BaseException] = None
+
+
+class DecodeService:
+    """One decoder shared by every live stream session of a model.
+
+    Sessions call :meth:`decode` from their backend threads and block for
+    the result. A single thread runs decode ticks: it waits for the first
+    request, gives the other registered sessions ``gather_seconds`` to
+    submit theirs (each session has at most one decode in flight), then
+    decodes everything pending — finalised segments and partial tails
+    alike — in one ``decoder.transcribe_batch`` call and routes each
+    result back to its caller. Decoders without ``transcribe_batch``
+    (test fakes) are called once per clip.
+    """
+
+    def __init__(self, decoder, *, max_batch: int = DEFAULT_MAX_DECODE_BATCH, gather_seconds: float = DEFAULT_GATHER_SECONDS) -> None:
+        self.decoder = decoder
+        self.max_batch = max(1, max_batch)
+        self.gather_seconds = gather_seconds
+        self._cond = threading.Condition()
+        self._pending: list = []
+        self._sessions = 0
+        self._closed = False
+        self._ticks = 0
+        self._decoded = 0
+        self._largest_batch = 0
+        self._thread = threading.Thread(target=self._run, name="transcribe-stream-decoder", daemon=True)
+        self._thread.start()
+
+    def register(self) -> None:
+        with self._cond:
+            self._sessions += 1
+
+    def unregister(self) -> None:
+        with self._cond:
+            self._sessions = max(0, self._sessions - 1)
+            # A tick waiting for this session shouldn't wait any longer.
+            self._cond.notify_all()
+
+    def decode(self, audio, *, language: Optional[str] = None, prompt: Optional[str] = None) -> list:
+        """Queue ``audio`` for the next tick and wait for its ``[(start_s, end_s, text), ...]``."""
+        request = _DecodeRequest(audio, language, prompt)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("decode service is closed")
+            self._pending.append(request)
+            self._cond.notify_all()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.segments or []
+
+    def _take_batch(self) -> list:
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            deadline = time.monotonic() + self.gather_seconds
+            while not self._closed and len(self._pending) < min(self._sessions, self.max_batch):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return  # closed and drained
+            try:
+                batch_fn = getattr(self.decoder, "transcribe_batch", None)
+                if batch_fn is not None:
+                    results = batch_fn([r.audio for r in batch], languages=[r.language for r in batch], prompts=[r.prompt for r in batch])
+                else:
+                    results = [_decode_segments(self.decoder, r.audio, language=r.language, prompt=r.prompt) for r in batch]
+                for request, segments in zip(batch, results):
+                    request.segments = segments
+            except Exception as exc:  # pylint: disable=broad-except
+                LOG.warning("batched stream decode of %d clips failed: %s", len(batch), exc)
+                for request in batch:
+                    request.error = exc
+            with self._cond:
+                self._ticks += 1
+                self._decoded += len(batch)
+                self._largest_batch = max(self._largest_batch, len(batch))
+            for request in batch:
+                request.done.set()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "sessions": self._sessions,
+                "ticks": self._ticks,
+                "decoded": self._decoded,
+                "mean_batch": round(self._decoded / self._ticks, 2) if self._ticks else 0.0,
+                "largest_batch": self._largest_batch,
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=5)
+
+
+class SharedDecoders:
+    """Lazily-built :class:`DecodeService` per model, shared by a daemon's stream sessions."""
+
+    def __init__(self, decoder_factory=None, **service_kwargs) -> None:
+        self._factory = decoder_factory or (lambda model_size: _Decoder(model_size=model_size))
+        self._service_kwargs = service_kwargs
+        self._lock = threading.Lock()
+        self._services: dict = {}
+
+    def get(self, model_size: str) -> DecodeService:
+        # Loading the model under the lock keeps two first sessions from
+        # loading it twice; later sessions of a loaded model don't wait.
+        with self._lock:
+            service = self._services.get(model_size)
+            if service is None:
+                service = DecodeService(self._factory(model_size), **self._service_kwargs)
+                self._services[model_size] = service
+            return service
+
+    def stats(self) -> dict:
+        with self._lock:
+            services = dict(self._services)
+        return {model: service.stats() for model, service in services.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            services = list(self._services.values())
+            self._services.clear()
+        for service in services:
+            service.close()
+
+
+class _PcmRing:
+    """Preallocated float32 sample window for one stream session.
+
+    The open segment lives in one array of twice ``capacity`` samples.
+    Appends convert PCM16 in place into the free space after the live
+    samples, dropping from the front just moves ``start``, and
+    :meth:`view` is a contiguous zero-copy slice. When the free space
+    runs out the live samples are moved back to the front (at most once
+    per ``capacity`` samples appended), so the steady state allocates no
+    sample arrays per frame. A window longer than ``capacity`` grows the
+    array once.
+    """
+
+    def __init__(self, capacity: int):
+        np, _, _, _ = _lazy_imports()
+        self._np = np
+        self._data = np.empty(2 * max(1, capacity), dtype=np.float32)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _reserve(self, n: int):
+        """The writable slice for ``n`` more samples."""
+        size = len(self)
+        if self._end + n > len(self._data):
+            if size + n > len(self._data) // 2:
+                grown = self._np.empty(2 * (size + n), dtype=self._np.float32)
+                grown[:size] = self._data[self._start : self._end]
+                self._data = grown
+            else:
+                # start >= len/2 >= size here, so source and destination don't overlap.
+                self._data[:size] = self._data[self._start : self._end]
+            self._start, self._end = 0, size
+        return self._data[self._end : self._end + n]
+
+    def write(self, samples_f32) -> None:
+        out = self._reserve(len(samples_f32))
+        out[:] = samples_f32
+        self._end += len(out)
+
+    def write_pcm16(self, buf: bytes) -> None:
+        """Append PCM16-LE bytes, converting to float32 straight into the buffer."""
+        np = self._np
+        src = np.frombuffer(buf, dtype=np.int16)
+        out = self._reserve(len(src))
+        np.copyto(out, src, casting="unsafe")
+        out *= np.float32(1.0 / 32768.0)
+        self._end += len(out)
+
+    def view(self):
+        """The held samples, without copying. Valid until the next write."""
+        return self._data[self._start : self._end]
+
+    def drop(self, n: int) -> None:
+        self._start += max(0, min(n, len(self)))
 
 
 class _VadChunker:
-    """silero-vad wrapper that produces speech-segment boundaries."""
+    """silero-vad wrapper that produces speech-segment boundaries.
+
+    Samples are held in a per-session :class:`_PcmRing`; closed segments
+    are copied out of it, the provisional tail is a view into it.
+
+    Segments close on a VAD "end". Speech (or music) that never pauses is
+    force-cut once the open window reaches ``max_window_seconds`` (long
+    silence is just dropped), so neither the buffer nor a final's decode
+    outgrows Whisper's 30 s context: the cut lands on the quietest point
+    of the last :data:`FORCED_CUT_SEARCH_SECONDS`, and the
+    ``overlap_seconds`` before it are carried into the next window so a
+    word split by the cut is heard whole once more.
+    """
+
+    # silero-vad processes 512-sample windows at 16 kHz.
+    VAD_WINDOW = 512
 
-    def __init__(self, *, vad_min_silence_ms: int = DEFAULT_VAD_MIN_SILENCE_MS):
+    def __init__(
+        self,
+        *,
+        vad_min_silence_ms: int = DEFAULT_VAD_MIN_SILENCE_MS,
+        max_window_seconds: float = DEFAULT_MAX_WINDOW_SECONDS,
+        overlap_seconds: float = PROVISIONAL_OVERLAP_SECONDS,
+    ):
         _, _, VADIterator, load_silero_vad = _lazy_imports()
         self._model = load_silero_vad()
         self._iter = VADIterator(self._model, sampling_rate=SAMPLE_RATE, min_silence_duration_ms=vad_min_silence_ms)
-        self._buf_samples: list = []  # PCM samples (float32) since the last finalised cut
         self._in_speech = False
+        self._max_window = int(max_window_seconds * SAMPLE_RATE)
+        self._overlap = int(overlap_seconds * SAMPLE_RATE)
+        # Room for a full window plus one WS frame's worth of unscanned samples.
+        self._ring = _PcmRing(self._max_window + SAMPLE_RATE)
+        self._scanned = 0  # leading samples of the ring already run through the VAD
 
     def push(self, samples_f32):
-        """Feed PCM samples (float32, 1-D). Returns a list of finalised chunks (numpy arrays)."""
-        np, _, _, _ = _lazy_imports()
+        """Feed PCM samples (float32, 1-D). Returns the finalised chunks as ``[(samples, forced), ...]``.
+
+        ``forced`` marks a chunk closed by the max-window cut rather than a
+        VAD "end"; the window after it starts with overlapping audio.
+        """
+        self._ring.write(samples_f32)
+        return self._scan()
+
+    def push_pcm16(self, buf: bytes):
+        """:meth:`push` for raw PCM16-LE bytes, converted in place into the ring."""
+        self._ring.write_pcm16(buf)
+        return self._scan()
+
+    def _scan(self) -> list:
         finalised = []
-        # silero-vad processes 512-sample windows at 16 kHz.
-        window = 512
-        offset = 0
-        n = len(samples_f32)
-        while offset + window <= n:
-            chunk = samples_f32[offset : offset + window]
+        window = self.VAD_WINDOW
+        # Samples that don't fill a VAD window yet wait in the ring for the next push.
+        while self._scanned + window <= len(self._ring):
+            chunk = self._ring.view()[self._scanned : self._scanned + window]
             event = self._iter(chunk, return_seconds=False)
-            self._buf_samples.append(chunk)
+            self._scanned += window
             if isinstance(event, dict):
                 if "start" in event:
                     self._in_speech = True
                 if "end" in event and self._in_speech:
                     # Close the current chunk at this VAD boundary.
-                    closed = np.concatenate(self._buf_samples) if self._buf_samples else np.zeros(0, dtype=np.float32)
-                    finalised.append(closed)
-                    self._buf_samples = []
+                    finalised.append((self._ring.view()[: self._scanned].copy(), False))
+                    self.drop_head(self._scanned)
                     self._in_speech = False
-            offset += window
-        # Any tail bytes that didn't form a full window are kept for next push.
-        if offset < n:
-            self._buf_samples.append(samples_f32[offset:])
+            if self._scanned >= self._max_window:
+                if self._in_speech:
+                    finalised.append((self._force_cut(), True))
+                else:
+                    # Nothing to transcribe; keep only a little pre-roll.
+                    self.drop_head(self._scanned - self._overlap)
         return finalised
 
+    def _force_cut(self):
+        audio = self._ring.view()[: self._scanned]
+        cut = _quietest_point(audio, len(audio) - int(FORCED_CUT_SEARCH_SECONDS * SAMPLE_RATE))
+        closed = audio[:cut].copy()
+        self.drop_head(max(0, cut - self._overlap))
+        return closed
+
+    def drop_head(self, n_samples: int) -> None:
+        """Forget the first ``n_samples`` of the open segment; their text is already committed."""
+        n_samples = max(0, min(n_samples, len(self._ring)))
+        self._ring.drop(n_samples)
+        self._scanned = max(0, self._scanned - n_samples)
+
     def provisional_tail(self):
-        """Return the buffered (still-open) speech tail as a 1-D float32 array."""
-        np, _, _, _ = _lazy_imports()
-        if not self._buf_samples:
-            return np.zeros(0, dtype=np.float32)
-        return np.concatenate(self._buf_samples)
+        """Return the buffered (still-open) speech tail as a 1-D float32 view, valid until the next push."""
+        return self._ring.view()
+
+
+def _quietest_point(audio, search_from: int, frame: int = 320) -> int:
+    """Sample index at the centre of the lowest-energy ``frame`` in ``audio[search_from:]``."""
+    search_from = max(0, search_from)
+    n_frames = (len(audio) - search_from) // frame
+    if n_frames == 0:
+        return len(audio)
+    frames = audio[search_from : search_from + n_frames * frame].reshape(n_frames, frame)
+    energy = (frames * frames).mean(axis=1)
+    return search_from + int(energy.argmin()) * frame + frame // 2
+
 
+def _strip_overlap(previous: str, text: str) -> str:
+    """Drop the words at the start of ``text`` that repeat the end of ``previous``.
 
-def _pcm16_to_float32(buf: bytes):
-    """Convert PCM16-LE bytes to mono float32 NumPy array."""
-    np, _, _, _ = _lazy_imports()
-    arr = np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0
-    return arr
+    The window after a forced cut re-hears the audio just before it, so
+    its transcript usually begins with the last words of the previous final.
+    """
+    before = [_normalize_word(w) for w in previous.split()]
+    words = text.split()
+    normalized = [_normalize_word(w) for w in words]
+    for k in range(min(len(before), len(normalized)), 0, -1):
+        if before[-k:] == normalized[:k]:
+            return " ".join(words[k:])
+    return text
 
 
 def faster_whisper_streaming_fn(
@@ -140,19 +561,41 @@ def faster_whisper_streaming_fn(
     hello: dict,
     decoder: Optional[_Decoder] = None,
     chunker: Optional[_VadChunker] = None,
+    decoders: Optional[SharedDecoders] = None,
 ) -> Iterator[dict]:
     """Streaming-fn entry point for the WS /v1/stream route.
 
     Loops:
 
     1. Pull whatever PCM has arrived since the last cycle out of
-       ``audio_iter``.
+       ``audio_iter``. An :class:`AudioBridge` (what the WS route passes)
+       is waited on until audio arrives, the input ends or the session is
+       cancelled, or until the next partial is due; a plain iterable is
+       polled.
     2. Convert to float32, hand it to silero-vad.
     3. For each finalised speech segment, run a full decode and yield
        a ``final`` event.
     4. Periodically (``stream_decode_interval_ms`` from config) yield a
        provisional ``partial`` event for the still-open tail.
 
+    Partials use :class:`_PrefixCommitter`: only the uncommitted part of
+    the tail is decoded, prompted with the committed text, so a partial
+    costs about the same however long the current utterance has run.
+    A ``final`` is the committed text plus a decode of the remainder.
+    After a forced max-window cut the next window is prompted with the
+    last final, and the words its overlap repeats are dropped.
+
+    With ``decoders`` (the daemon's :class:`SharedDecoders`, set when
+    ``--max-streams`` is above 1) decodes go through the model's shared
+    :class:`DecodeService` instead of a private decoder. Every decode's
+    latency is recorded on ``session``; a ``metrics`` event carrying the
+    session's latency stats follows each ``final``. With a bridge, that
+    event and one at most every :data:`QUEUE_METRICS_INTERVAL_SECONDS`
+    while audio flows also carry the bridge's queue lag.
+
+    When the bridge closes without a cancel (``end_of_input``) the open
+    tail is decoded as a last ``final`` and the generator returns.
+
     Raises :class:`StreamCancelled` when the session is cancelled.
     """
     np, _WhisperModel, _VADIterator, _load_silero_vad = _lazy_imports()  # noqa: F841
@@ -160,59 +603,124 @@ def faster_whisper_streaming_fn(
     model_size = (hello.get("model") if hello else None) or getattr(config, "model", None) or "small.en"
     language = hello.get("language") if hello else None
 
-    if decoder is None:
+    service: Optional[DecodeService] = None
+    if decoder is None and decoders is not None:
+        service = decoders.get(model_size)
+    elif decoder is None:
         decoder = _Decoder(model_size=model_size)
     if chunker is None:
         chunker = _VadChunker()
 
+    def _decode(audio, kind: str, prompt: str) -> list:
+        start = time.monotonic()
+        if service is not None:
+            segments = service.decode(audio, language=language, prompt=prompt or None)
+        else:
+            segments = _decode_segments(decoder, audio, language=language, prompt=prompt or None)
+        session.record_decode(kind, time.monotonic() - start)
+        return segments
+
     decode_interval_s = float(getattr(config, "stream_decode_interval_ms", 200)) / 1000.0
+    bridge = audio_iter if isinstance(audio_iter, AudioBridge) else None
     rev = 0
     last_partial_text = ""
     last_partial_emit = 0.0
+    last_queue_report = time.monotonic()
+    tail_changed = False  # audio arrived since the last partial decode
+    committer = _PrefixCommitter()
+    last_final = ""
+    overlapped = False  # the open window starts with audio the last final covered
+
+    def _final_text(closed, forced: bool) -> str:
+        nonlocal last_final, overlapped
+        rest = _decode(closed, "final", committer.prompt) if closed.size else []
+        text = " ".join(part for part in (committer.text, _segments_text(rest)) if part)
+        if overlapped:
+            text = _strip_overlap(last_final, text)
+        overlapped = forced
+        if text:
+            last_final = text
+        committer.reset(context=last_final if forced else "")
+        return text
+
+    def _metrics() -> dict:
+        event = {"type": "metrics", "latency": session.latency_stats()}
+        if bridge is not None:
+            event["queue"] = bridge.stats()
+        return event
 
     yield {"type": "metrics", "backend": "faster-whisper", "model": model_size}
 
-    while True:
-        if session.is_cancelled:
-            raise StreamCancelled("stream cancelled by client")
-
-        # Drain whatever audio is currently buffered. The host-side
-        # _audio_iterable returns when the queue is empty, so this loop
-        # exits naturally and gives us a chance to emit a partial.
-        any_audio = False
-        for chunk_bytes in audio_iter:
-            any_audio = True
-            samples = _pcm16_to_float32(chunk_bytes)
-            for closed in chunker.push(samples):
+    if service is not None:
+        service.register()
+    try:
+        while True:
+            if session.is_cancelled:
+                raise StreamCancelled("stream cancelled by client")
+
+            # Drain whatever audio is currently buffered. A bridge blocks
+            # until there is some, the input ends or the session is
+            # cancelled — or, with new audio not yet in a partial, until
+            # the next partial is due.
+            if bridge is not None:
+                timeout = None
+                if tail_changed:
+                    timeout = max(0.0, last_partial_emit + decode_interval_s - time.time())
+                frames = bridge.frames(timeout=timeout)
+            else:
+                frames = iter(audio_iter)
+            any_audio = False
+            for chunk_bytes in frames:
+                any_audio = True
+                tail_changed = True
+                for closed, forced in chunker.push_pcm16(chunk_bytes):
+                    if session.is_cancelled:
+                        raise StreamCancelled("stream cancelled by client")
+                    text = _final_text(closed, forced)
+                    if text:
+                        rev += 1
+                        last_partial_text = ""
+                        yield {"type": "final", "text": text, "rev": rev}
+                        yield _metrics()
+
+            if bridge is not None and bridge.closed:
                 if session.is_cancelled:
                     raise StreamCancelled("stream cancelled by client")
-                if closed.size == 0:
-                    continue
-                text = decoder.transcribe(closed, language=language)
+                # end_of_input: whatever is still open is final.
+                tail = chunker.provisional_tail()
+                text = _final_text(tail, False) if tail.size or committer.text else ""
                 if text:
                     rev += 1
-                    last_partial_text = ""
                     yield {"type": "final", "text": text, "rev": rev}
-
-        # Provisional partial every decode_interval_s.
-        now = time.time()
-        if now - last_partial_emit >= decode_interval_s:
-            tail = chunker.provisional_tail()
-            if tail.size >= int(0.5 * SAMPLE_RATE):  # ≥ 500ms of speech tail
-                partial_text = decoder.transcribe(tail, language=language)
-                if partial_text and partial_text != last_partial_text:
-                    rev += 1
-                    last_partial_text = partial_text
-                    yield {"type": "partial", "text": partial_text, "rev": rev}
-            last_partial_emit = now
-
-        # No new audio AND no provisional fired — the route's
-        # _audio_iterable returns empty when the WS pumper is idle. We
-        # spin briefly so the cancellation flag is checked at the
-        # configured cadence rather than busy-looping.
-        if not any_audio:
-            time.sleep(max(decode_interval_s / 4.0, 0.01))
-
-        # If the client sent end_of_input the WS handler will close the
-        # connection; that triggers cancel and we exit. No explicit EOF
-        # check needed here — the cancellation flag is the contract.
+                    yield _metrics()
+                return
+
+            # Provisional partial every decode_interval_s.
+            now = time.time()
+            if now - last_partial_emit >= decode_interval_s:
+                tail = chunker.provisional_tail()
+                if tail.size >= int(0.5 * SAMPLE_RATE):  # ≥ 500ms of speech tail
+                    trim, pending = committer.update(_decode(tail, "partial", committer.prompt))
+                    chunker.drop_head(int(trim * SAMPLE_RATE))
+                    partial_text = " ".join(part for part in (committer.text, pending) if part)
+                    if overlapped:
+                        partial_text = _strip_overlap(last_final, partial_text)
+                    if partial_text and partial_text != last_partial_text:
+                        rev += 1
+                        last_partial_text = partial_text
+                        yield {"type": "partial", "text": partial_text, "rev": rev}
+                last_partial_emit = now
+                tail_changed = False
+
+            if bridge is not None and any_audio and time.monotonic() - last_queue_report >= QUEUE_METRICS_INTERVAL_SECONDS:
+                last_queue_report = time.monotonic()
+                yield {"type": "metrics", "queue": bridge.stats()}
+
+            # A plain iterable returns at once when it has nothing; spin
+            # briefly so the cancellation flag is checked at the configured
+            # cadence rather than busy-looping.
+            if bridge is None and not any_audio:
+                time.sleep(max(decode_interval_s / 4.0, 0.01))
+    finally:
+        if service is not None:
+            service.unregister()
@@ -0,0 +1,167 @@
+"""
+Content-addressed cache of finished transcripts.
+
+The key is the SHA-256 of the normalized 16 kHz mono WAV that the backend
+would have consumed, combined with every setting that changes the output
+(backend, model, task, language, initial prompt, alignment, backend args,
+diarization). Re-running the same media — after a retry, a re-ingest, or
+with a different ``output_dir`` — therefore finds the earlier result no
+matter where the media came from or what it was called.
+
+Each entry is a directory ``<root>/<key>/`` holding the ``out.*`` /
+``speaker.json`` artifacts plus a ``manifest.json``. Entries are evicted
+least-recently-used first once the store grows past ``max_bytes``; a hit
+refreshes the entry's manifest mtime, which is what the LRU order uses.
+
+``disklru`` only bounds the number of entries, not their size, and keeps
+the artifacts inside SQLite; a plain directory store lets us copy the
+artifacts straight out and bound the cache in bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from filelock import FileLock
+
+from transcribe_anything.util import get_runtime_dir
+
+CACHE_ENV_VAR = "TRANSCRIBE_ANYTHING_CACHE"
+CACHE_MAX_BYTES_ENV_VAR = "TRANSCRIBE_ANYTHING_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB
+MANIFEST_NAME = "manifest.json"
+
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "on"}
+
+
+def cache_enabled_from_env() -> bool:
+    """Return True when ``TRANSCRIBE_ANYTHING_CACHE`` opts into the transcript cache."""
+    return os.environ.get(CACHE_ENV_VAR, "").strip().lower() in _TRUE_VALUES
+
+
+def hash_file(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 hex digest of a file's content, read in ``chunk_size`` blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_cache_key(wav_sha256: str, settings: dict[str, Any]) -> str:
+    """Combine the WAV digest with the output-affecting settings into one key."""
+    payload = json.dumps({"wav": wav_sha256, "settings": settings}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for entry in path.iterdir():
+        if entry.is_file():
+            total += entry.stat().st_size
+    return total
+
+
+class TranscriptCache:
+    """Size-bounded LRU store of transcript artifacts keyed by content hash."""
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None) -> None:
+        if root is None:
+            root = get_runtime_dir() / "transcript_cache"
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV_VAR, DEFAULT_MAX_BYTES))
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = FileLock(str(self.root / "cache.lock"))
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def get(self, key: str, output_dir: str | Path) -> Optional[list[str]]:
+        """Copy the cached artifacts for ``key`` into ``output_dir``.
+
+        Returns the artifact names on a hit, ``None`` on a miss.
+        """
+        entry = self._entry_dir(key)
+        manifest_path = entry / MANIFEST_NAME
+        with self._lock:
+            if not manifest_path.is_file():
+                return None
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+            files: list[str] = manifest.get("files", [])
+            if not files or not all((entry / name).is_file() for name in files):
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+            out = Path(output_dir)
+            out.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                dest = out / name
+                if dest.exists():
+                    dest.unlink()
+                shutil.copyfile(entry / name, dest)
+            # Refresh the LRU position.
+            os.utime(manifest_path, None)
+        return files
+
+    def put(self, key: str, artifacts: list[str | Path], settings: Optional[dict[str, Any]] = None) -> None:
+        """Store ``artifacts`` under ``key``, then evict down to ``max_bytes``."""
+        if not artifacts:
+            return
+        entry = self._entry_dir(key)
+        # A fresh staging dir per call: concurrent puts of the same key (two
+        # threads, or two processes sharing the cache) must not share one.
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=f".{key}.", suffix=".tmp"))
+        names: list[str] = []
+        try:
+            for artifact in artifacts:
+                src = Path(artifact)
+                shutil.copyfile(src, staging / src.name)
+                names.append(src.name)
+            manifest = {"files": names, "created_at": time.time(), "settings": settings or {}}
+            (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        with self._lock:
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+            self._evict_locked(keep=key)
+
+    def evict(self) -> None:
+        """Evict least-recently-used entries until the store fits ``max_bytes``."""
+        with self._lock:
+            self._evict_locked(keep=None)
+
+    def _evict_locked(self, keep: Optional[str]) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for entry in self.root.iterdir():
+            manifest_path = entry / MANIFEST_NAME
+            if entry.name.startswith(".") or not entry.is_dir() or not manifest_path.is_file():
+                continue
+            size = _dir_size(entry)
+            total += size
+            entries.append((manifest_path.stat().st_mtime, size, entry))
+        entries.sort(key=lambda item: item[0])
+        for _mtime, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
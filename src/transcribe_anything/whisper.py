@@ -2,6 +2,7 @@
 Runs whisper api.
 """
 
+import os
 import subprocess
 import sys
 import time
@@ -10,6 +11,7 @@ from typing import Optional
 
 from iso_env import IsoEnv, IsoEnvArgs, PyProjectToml  # type: ignore
 
+from transcribe_anything.progress import ProgressCallback, ProgressTracker, pump_lines
 from transcribe_anything.util import get_runtime_venv_dir, has_nvidia_smi
 from transcribe_anything.xpu_iso_env import XpuIsoEnv
 
@@ -141,8 +143,32 @@ def run_whisper(  # pylint: disable=too-many-arguments
     task: str,
     language: str,
     other_args: list[str] | None = None,
+    cpu_workers: int = 1,
+    progress_callback: ProgressCallback | None = None,
 ) -> None:
-    """Runs whisper."""
+    """Runs whisper.
+
+    With ``device="cpu"`` and ``cpu_workers > 1`` the wav is cut at quiet
+    points and transcribed by that many whisper processes in parallel; see
+    :mod:`transcribe_anything.whisper_parallel`.
+
+    ``progress_callback(processed_seconds, total_seconds)`` follows the
+    segments whisper prints as it decodes.
+    """
+    if device == "cpu" and cpu_workers > 1:
+        from transcribe_anything.whisper_parallel import run_whisper_parallel
+
+        run_whisper_parallel(
+            input_wav=input_wav,
+            model=model,
+            output_dir=output_dir,
+            task=task,
+            language=language,
+            workers=cpu_workers,
+            other_args=other_args,
+            progress_callback=progress_callback,
+        )
+        return
     env = get_environment()
     cmd_list = []
     # if sys.platform == "win32":
@@ -172,7 +198,20 @@ def run_whisper(  # pylint: disable=too-many-arguments
     # cmd = " ".join(cmd_list)
     cmd = subprocess.list2cmdline(cmd_list)
     sys.stderr.write(f"Running:\n  {cmd}\n")
-    proc = env.open_proc(cmd_list, shell=False)
+    tracker = None
+    reader = None
+    if progress_callback is None:
+        proc = env.open_proc(cmd_list, shell=False)
+    else:
+        from transcribe_anything.insanely_fast_whisper import get_wave_duration
+
+        tracker = ProgressTracker(progress_callback, get_wave_duration(input_wav))
+        tracker.update(0.0)
+        # Read the segment lines for progress and echo them on; unbuffered so
+        # they arrive as they are decoded rather than in 8 KiB blocks.
+        proc_env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        proc = env.open_proc(cmd_list, shell=False, env=proc_env, stdout=subprocess.PIPE, universal_newlines=True, encoding="utf-8")
+        reader = pump_lines(proc.stdout, tracker, echo=sys.stdout)
     while True:
         rtn = proc.poll()
         if rtn is None:
@@ -182,3 +221,7 @@ def run_whisper(  # pylint: disable=too-many-arguments
             msg = f"Failed to execute {cmd}\n "
             raise OSError(msg)
         break
+    if reader is not None:
+        reader.join()
+    if tracker is not None:
+        tracker.done()
@@ -0,0 +1,142 @@
+"""
+Process-parallel ``--device cpu`` transcription.
+
+A single ``whisper`` process leaves most cores of a big CPU-only node idle:
+past a handful of threads torch's intra-op scaling flattens out. This
+splits the 16 kHz wav at quiet points into one window per worker, runs
+``workers`` whisper processes side by side (each capped at
+``threads_per_worker`` torch threads via ``--threads``), and merges the
+segments back with their offsets into the files the single-process path
+writes (``<stem>.json/srt/vtt/txt/tsv``).
+
+Selected through ``run_whisper(..., cpu_workers=K)``.
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from transcribe_anything.audio_split import (
+    find_split_points,
+    split_wav,
+    stitch_transcripts,
+)
+from transcribe_anything.insanely_fast_whisper import get_wave_duration
+from transcribe_anything.progress import ProgressCallback, ProgressTracker
+
+# Each worker loads its own model; windows shorter than this aren't worth it.
+MIN_WINDOW_SECONDS = 60.0
+
+
+def default_threads_per_worker(workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _format_timestamp(seconds: float, decimal_marker: str, always_include_hours: bool) -> str:
+    milliseconds = round(max(0.0, seconds) * 1000.0)
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    hours_marker = f"{hours:02d}:" if always_include_hours or hours > 0 else ""
+    return f"{hours_marker}{minutes:02d}:{secs:02d}{decimal_marker}{milliseconds:03d}"
+
+
+def write_whisper_outputs(result: dict[str, Any], output_dir: Path, stem: str) -> None:
+    """Writes ``result`` in every format the whisper CLI emits, matching its layout."""
+    segments = result.get("segments", [])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / f"{stem}.json").write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+    (output_dir / f"{stem}.txt").write_text("".join(f"{seg['text'].strip()}\n" for seg in segments), encoding="utf-8")
+    srt = []
+    vtt = ["WEBVTT\n\n"]
+    tsv = ["start\tend\ttext\n"]
+    for index, seg in enumerate(segments, start=1):
+        text = seg["text"].strip().replace("-->", "->")
+        srt.append(f"{index}\n{_format_timestamp(seg['start'], ',', True)} --> {_format_timestamp(seg['end'], ',', True)}\n{text}\n\n")
+        vtt.append(f"{_format_timestamp(seg['start'], '.', False)} --> {_format_timestamp(seg['end'], '.', False)}\n{text}\n\n")
+        tsv.append(f"{round(1000 * seg['start'])}\t{round(1000 * seg['end'])}\t{text.replace(chr(9), ' ')}\n")
+    (output_dir / f"{stem}.srt").write_text("".join(srt), encoding="utf-8")
+    (output_dir / f"{stem}.vtt").write_text("".join(vtt), encoding="utf-8")
+    (output_dir / f"{stem}.tsv").write_text("".join(tsv), encoding="utf-8")
+
+
+def _with_threads(other_args: Optional[list[str]], threads: int) -> list[str]:
+    args = list(other_args or [])
+    if "--threads" in args:
+        # The caller pinned it explicitly.
+        return args
+    return args + ["--threads", str(threads)]
+
+
+def run_whisper_parallel(
+    input_wav: Path,
+    model: str,
+    output_dir: Path,
+    task: str,
+    language: str,
+    workers: int,
+    other_args: Optional[list[str]] = None,
+    threads_per_worker: Optional[int] = None,
+    backend_fn: Optional[Callable[..., None]] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> None:
+    """Transcribes ``input_wav`` on CPU with ``workers`` whisper processes in parallel.
+
+    ``backend_fn`` runs one window; it defaults to the single-process
+    :func:`transcribe_anything.whisper.run_whisper`. Progress is the sum
+    of what each window has processed.
+    """
+    if backend_fn is None:
+        from transcribe_anything.whisper import run_whisper
+
+        backend_fn = run_whisper
+    threads = threads_per_worker or default_threads_per_worker(workers)
+    duration = get_wave_duration(input_wav)
+    num_windows = max(1, min(workers, int(duration // MIN_WINDOW_SECONDS)))
+    if num_windows == 1:
+        single: dict[str, Any] = {"progress_callback": progress_callback} if progress_callback is not None else {}
+        backend_fn(input_wav=input_wav, device="cpu", model=model, output_dir=output_dir, task=task, language=language, other_args=_with_threads(other_args, threads), **single)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="ta-cpu-windows-") as tmpdir:
+        tmp = Path(tmpdir)
+        pieces = split_wav(input_wav, tmp / "audio", find_split_points(input_wav, num_windows))
+        print(f"Transcribing {duration:.0f}s of audio as {len(pieces)} windows on {len(pieces)} CPU workers x {threads} threads")
+        tracker = ProgressTracker(progress_callback, duration)
+        window_done = [0.0] * len(pieces)
+
+        def window_progress(index: int) -> dict[str, Any]:
+            if progress_callback is None:
+                return {}
+
+            def report(processed: float, _total: float) -> None:
+                window_done[index] = processed
+                tracker.update(sum(window_done))
+
+            return {"progress_callback": report}
+
+        def run_window(index: int) -> dict[str, Any]:
+            piece = pieces[index]
+            window_dir = tmp / f"out_{index:03d}"
+            backend_fn(
+                input_wav=piece.path,
+                device="cpu",
+                model=model,
+                output_dir=window_dir,
+                task=task,
+                language=language,
+                other_args=_with_threads(other_args, threads),
+                **window_progress(index),
+            )
+            window_done[index] = piece.end - piece.start
+            tracker.update(sum(window_done))
+            return json.loads((window_dir / f"{piece.path.stem}.json").read_text(encoding="utf-8"))
+
+        with ThreadPoolExecutor(max_workers=len(pieces), thread_name_prefix="whisper-cpu") as executor:
+            results = list(executor.map(run_window, range(len(pieces))))
+
+    merged = stitch_transcripts(list(zip(pieces, results)))
+    write_whisper_outputs(merged, output_dir, input_wav.stem)
@@ -19,6 +19,7 @@ import webvtt  # type: ignore
 
 from transcribe_anything.generate_speaker_json import Chunk
 from transcribe_anything.generate_speaker_json import reduce as reduce_speaker_chunks
+from transcribe_anything.progress import ProgressCallback, ProgressTracker, pump_lines
 from transcribe_anything.util import get_static_ffmpeg_runtime_dir, has_nvidia_smi
 from transcribe_anything.whisperx_reqs import get_environment
 
@@ -434,8 +435,13 @@ def run_whisperx(  # pylint: disable=too-many-arguments
     hugging_face_token: str | None = None,
     other_args: list[str] | None = None,
     use_xpu: bool = False,
+    progress_callback: ProgressCallback | None = None,
 ) -> None:
-    """Run WhisperX through its isolated environment."""
+    """Run WhisperX through its isolated environment.
+
+    ``progress_callback(processed_seconds, total_seconds)`` follows the
+    ``Transcript: [start --> end]`` lines WhisperX prints per segment.
+    """
     ffmpeg_cache = get_static_ffmpeg_runtime_dir()
     static_ffmpeg_run.LOCK_FILE = str(ffmpeg_cache / "lock.file")
     static_ffmpeg.add_paths(download_dir=str(ffmpeg_cache / static_ffmpeg_run.get_platform_key()))
@@ -477,13 +483,26 @@ def run_whisperx(  # pylint: disable=too-many-arguments
         cmd_list = [str(item).strip() for item in cmd_list if str(item).strip()]
         cmd = subprocess.list2cmdline(cmd_list)
         sys.stderr.write(f"Running:\n  {cmd}\n")
+        tracker = None
+        reader = None
+        pipe_args: dict[str, Any] = {}
+        if progress_callback is not None:
+            from transcribe_anything.insanely_fast_whisper import get_wave_duration
+
+            tracker = ProgressTracker(progress_callback, get_wave_duration(input_wav))
+            tracker.update(0.0)
+            env["PYTHONUNBUFFERED"] = "1"
+            pipe_args["stdout"] = subprocess.PIPE
         proc = iso_env.open_proc(  # pylint: disable=consider-using-with
             cmd_list,
             shell=False,
             universal_newlines=True,
             encoding="utf-8",
             env=env,
+            **pipe_args,
         )
+        if tracker is not None:
+            reader = pump_lines(proc.stdout, tracker, echo=sys.stdout)
         while True:
             rtn = proc.poll()
             if rtn is None:
@@ -493,5 +512,9 @@ def run_whisperx(  # pylint: disable=too-many-arguments
                 raise OSError(f"Failed to execute {cmd}\n")
             break
         proc.wait()
+        if reader is not None:
+            reader.join()
+        if tracker is not None:
+            tracker.done()
 
         _normalize_outputs(whisperx_output_dir, output_dir)
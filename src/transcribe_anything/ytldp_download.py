@@ -1,31 +1,157 @@
 """
 Download utility for yt-dlp.
+
+Metadata is extracted once per URL with ``yt-dlp -J`` and the full info
+dict is cached on disk (keyed by URL, with a TTL). Naming the output dir,
+the streaming ingest and the fallback download all reuse it — the
+downloads via ``--load-info-json`` — so yt-dlp hits the extractor and the
+video page once per URL instead of once per step.
 """
 
+import hashlib
+import json
 import os
+import shutil
 import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from transcribe_anything.util import PROCESS_TIMEOUT, get_runtime_dir
+
+INFO_TTL_ENV_VAR = "TRANSCRIBE_ANYTHING_YTDLP_INFO_TTL"
+# Format URLs in the info dict are signed and expire (hours on YouTube), so
+# keep the default well under that.
+DEFAULT_INFO_TTL_SECONDS = 30 * 60
+INFO_TIMEOUT = 5 * 60
+
+
+@dataclass
+class VideoInfo:
+    """The parts of yt-dlp's info dict we use, plus where the full dict is cached."""
+
+    url: str
+    title: Optional[str]
+    duration: Optional[float]
+    format_id: Optional[str]
+    ext: Optional[str]
+    filename: Optional[str]
+    info_json: Path
+
 
-from transcribe_anything.util import PROCESS_TIMEOUT
+def _ytdlp_path() -> str:
+    ytdlp_path = shutil.which("yt-dlp")
+    if ytdlp_path is None:
+        raise FileNotFoundError("No path for yt-dlp")
+    return ytdlp_path
+
+
+def _info_ttl() -> float:
+    try:
+        return float(os.environ.get(INFO_TTL_ENV_VAR, DEFAULT_INFO_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_INFO_TTL_SECONDS
+
+
+def _info_json_path(url: str) -> Path:
+    cache_dir = get_runtime_dir() / "ytdlp_info"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.info.json"
+
+
+def _video_info_from_dict(url: str, data: dict, info_json: Path) -> VideoInfo:
+    duration = data.get("duration")
+    return VideoInfo(
+        url=url,
+        title=data.get("title"),
+        duration=float(duration) if duration is not None else None,
+        format_id=data.get("format_id"),
+        ext=data.get("ext"),
+        filename=data.get("filename") or data.get("_filename"),
+        info_json=info_json,
+    )
+
+
+def get_video_info(url: str, ttl: Optional[float] = None) -> VideoInfo:
+    """Returns the metadata for ``url``, running yt-dlp only if the disk cache is missing or stale.
+
+    Raises ``subprocess.CalledProcessError`` / ``ValueError`` if yt-dlp can't
+    extract a single video from ``url``.
+    """
+    ttl = _info_ttl() if ttl is None else ttl
+    info_json = _info_json_path(url)
+    try:
+        if time.time() - info_json.stat().st_mtime < ttl:
+            return _video_info_from_dict(url, json.loads(info_json.read_text(encoding="utf-8")), info_json)
+    except (OSError, json.JSONDecodeError):
+        pass
+    cmd_list = [_ytdlp_path(), "--no-check-certificate", "--no-playlist", "-f", "bestaudio/best", "-J", url]
+    print(f"Running:\n  {subprocess.list2cmdline(cmd_list)}")
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+    cp = subprocess.run(
+        cmd_list,
+        check=True,
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+        timeout=INFO_TIMEOUT,
+    )
+    data = json.loads(cp.stdout)
+    if not isinstance(data, dict) or data.get("_type", "video") != "video":
+        raise ValueError(f"yt-dlp did not return a single video for {url}")
+    tmp = info_json.with_name(f"{info_json.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, info_json)
+    return _video_info_from_dict(url, data, info_json)
+
+
+def _cached_info_args(url: str) -> Optional[list[str]]:
+    """``--load-info-json`` args for ``url``, or None if the metadata pass failed."""
+    try:
+        info = get_video_info(url)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, OSError) as exc:
+        print(f"yt-dlp metadata pass failed for {url}: {exc}")
+        return None
+    return ["--load-info-json", str(info.info_json)]
 
 
 def ytdlp_download(url: str, outdir: str) -> str:
     """Downloads a file using ytdlp."""
     os.makedirs(outdir, exist_ok=True)
-    # remove all files in the directory
-    for file in os.listdir(outdir):
-        os.remove(os.path.join(outdir, file))
-    cmd = f'yt-dlp --no-check-certificate -x {url} -o "out.%(ext)s"'
-    print(f"Running:\n  {cmd}")
-    subprocess.run(
-        cmd,
-        shell=True,
-        cwd=outdir,
-        check=True,
-        timeout=PROCESS_TIMEOUT,
-        universal_newlines=True,
-    )
+    base_cmd = [_ytdlp_path(), "--no-check-certificate", "-x", "-o", "out.%(ext)s"]
+    info_args = _cached_info_args(url)
+    attempts = [base_cmd + info_args, base_cmd + [url]] if info_args else [base_cmd + [url]]
+    for attempt, cmd_list in enumerate(attempts):
+        # remove all files in the directory
+        for file in os.listdir(outdir):
+            os.remove(os.path.join(outdir, file))
+        print(f"Running:\n  {subprocess.list2cmdline(cmd_list)}")
+        try:
+            subprocess.run(
+                cmd_list,
+                cwd=outdir,
+                check=True,
+                timeout=PROCESS_TIMEOUT,
+                universal_newlines=True,
+            )
+            break
+        except subprocess.CalledProcessError:
+            # The cached format URLs may have expired; retry with a fresh extraction.
+            if attempt == len(attempts) - 1:
+                raise
     new_files = os.listdir(outdir)
     assert len(new_files) == 1, f"Expected 1 file, got {new_files}"
     downloaded_file = os.path.join(outdir, new_files[0])
     assert os.path.exists(downloaded_file), f"The expected file {downloaded_file} doesn't exist"
     return downloaded_file
+
+
+def ytdlp_stream_cmd(url: str) -> list[str]:
+    """Returns the yt-dlp command that writes the best audio stream of ``url`` to stdout."""
+    # -x needs a finished file to post-process, so pick an audio-only format
+    # (falling back to the best muxed one) and let ffmpeg do the extraction.
+    source = _cached_info_args(url) or [url]
+    return [_ytdlp_path(), "--no-check-certificate", "--no-part", "-f", "bestaudio/best", "-o", "-"] + source
@@ -0,0 +1,143 @@
+"""Silence splitter, transcript stitcher and multi-GPU sharding (fake backend, CPU only)."""
+
+from __future__ import annotations
+
+import json
+import wave
+from array import array
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything.audio_split import (
+    AudioPiece,
+    find_split_points,
+    split_wav,
+    stitch_transcripts,
+)
+
+RATE = 16000
+
+
+def _write_wav(path: Path, seconds: float, silences: list[tuple[float, float]]) -> Path:
+    samples = array("h")
+    for i in range(int(seconds * RATE)):
+        t = i / RATE
+        quiet = any(start <= t < end for start, end in silences)
+        samples.append(0 if quiet else (8000 if i % 2 else -8000))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(samples.tobytes())
+    return path
+
+
+def test_split_points_land_in_silence(tmp_path: Path) -> None:
+    wav = _write_wav(tmp_path / "in.wav", 60.0, [(17.0, 18.0), (43.0, 44.0)])
+    cuts = find_split_points(wav, 3, search_seconds=5.0)
+    assert len(cuts) == 2
+    assert 17.0 <= cuts[0] <= 18.0
+    assert 43.0 <= cuts[1] <= 44.0
+
+
+def test_split_wav_pieces_cover_the_input(tmp_path: Path) -> None:
+    wav = _write_wav(tmp_path / "in.wav", 10.0, [])
+    pieces = split_wav(wav, tmp_path / "pieces", [2.5, 7.0])
+    assert [(p.start, p.end) for p in pieces] == [(0.0, 2.5), (2.5, 7.0), (7.0, 10.0)]
+    frames = 0
+    for piece in pieces:
+        with wave.open(str(piece.path), "rb") as out:
+            assert out.getframerate() == RATE
+            frames += out.getnframes()
+    assert frames == 10 * RATE
+
+
+def test_stitch_offsets_chunks_and_segments(tmp_path: Path) -> None:
+    first = AudioPiece(0, 0.0, 30.0, tmp_path / "a.wav")
+    second = AudioPiece(1, 30.0, 50.0, tmp_path / "b.wav")
+    stitched = stitch_transcripts(
+        [
+            (first, {"speakers": [], "text": " hello", "chunks": [{"timestamp": [0.0, 2.0], "text": " hello"}, {"timestamp": [29.0, None], "text": " there"}]}),
+            (second, {"speakers": [], "text": " world", "chunks": [{"timestamp": [1.5, None], "text": " world", "words": [{"word": "world", "start": 1.5, "end": 2.0}]}]}),
+        ]
+    )
+    assert stitched["text"] == "hello world"
+    assert [c["timestamp"] for c in stitched["chunks"]] == [[0.0, 2.0], [29.0, 30.0], [31.5, 50.0]]
+    assert stitched["chunks"][2]["words"][0] == {"word": "world", "start": 31.5, "end": 32.0}
+
+    whisper = stitch_transcripts(
+        [
+            (first, {"text": "a", "segments": [{"id": 0, "start": 1.0, "end": 2.0, "text": "a"}], "language": "en"}),
+            (second, {"text": "b", "segments": [{"id": 0, "start": 0.5, "end": 1.0, "text": "b"}], "language": "en"}),
+        ]
+    )
+    assert [(s["id"], s["start"], s["end"]) for s in whisper["segments"]] == [(0, 1.0, 2.0), (1, 30.5, 31.0)]
+    assert whisper["language"] == "en"
+
+
+def _fake_backend(calls: list[dict[str, Any]]):
+    def backend(**kwargs: Any) -> None:
+        calls.append(kwargs)
+        with wave.open(str(kwargs["input_wav"]), "rb") as wav:
+            length = wav.getnframes() / wav.getframerate()
+        out = Path(kwargs["output_dir"])
+        out.mkdir(parents=True, exist_ok=True)
+        data = {"speakers": [], "text": f" dev{kwargs['device_id']}", "chunks": [{"timestamp": [0.0, length], "text": f" dev{kwargs['device_id']}"}]}
+        (out / "out.json").write_text(json.dumps(data), encoding="utf-8")
+
+    return backend
+
+
+def test_sharded_run_uses_every_device_and_stitches(tmp_path: Path) -> None:
+    from transcribe_anything.insane_sharded import run_insanely_fast_whisper_sharded
+
+    wav = _write_wav(tmp_path / "in.wav", 40.0, [(9.5, 10.5), (19.5, 20.5), (29.5, 30.5)])
+    calls: list[dict[str, Any]] = []
+    out_dir = tmp_path / "out"
+
+    run_insanely_fast_whisper_sharded(
+        input_wav=wav,
+        model="openai/whisper-tiny",
+        output_dir=out_dir,
+        task="transcribe",
+        language="en",
+        other_args=["--batch-size", "4"],
+        device_ids=["0", "1", "2", "3"],
+        min_shard_seconds=0,
+        backend_fn=_fake_backend(calls),
+    )
+
+    assert sorted(call["device_id"] for call in calls) == ["0", "1", "2", "3"]
+    assert all(call["other_args"] == ["--batch-size", "4"] for call in calls)
+    data = json.loads((out_dir / "out.json").read_text(encoding="utf-8"))
+    assert data["text"] == "dev0 dev1 dev2 dev3"
+    stamps = [chunk["timestamp"] for chunk in data["chunks"]]
+    assert stamps[0][0] == 0.0
+    assert stamps[-1][1] == pytest.approx(40.0)
+    for prev, cur in zip(stamps, stamps[1:]):
+        assert prev[1] == pytest.approx(cur[0])
+    for name in ("out.srt", "out.txt", "out.vtt"):
+        assert (out_dir / name).exists()
+
+
+def test_sharded_run_falls_back_to_single_device(tmp_path: Path) -> None:
+    from transcribe_anything.insane_sharded import run_insanely_fast_whisper_sharded
+
+    wav = _write_wav(tmp_path / "in.wav", 5.0, [])
+    calls: list[dict[str, Any]] = []
+    run_insanely_fast_whisper_sharded(
+        input_wav=wav,
+        model="tiny",
+        output_dir=tmp_path / "out",
+        task="transcribe",
+        language="en",
+        hugging_face_token="hf_xxx",
+        device_ids=["0", "1"],
+        min_shard_seconds=0,
+        backend_fn=_fake_backend(calls),
+    )
+    assert len(calls) == 1
+    assert calls[0]["input_wav"] == wav
+    assert calls[0]["device_id"] == "0"
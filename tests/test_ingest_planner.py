@@ -0,0 +1,103 @@
+"""ffprobe-driven ingest planner tests."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import wave
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything import audio
+
+
+def _probe(codec: str = "pcm_s16le", rate: str = "16000", channels: int = 1, format_name: str = "wav", video: bool = False, tag: str = "0x0001") -> dict[str, Any]:
+    streams: list[dict[str, Any]] = []
+    if video:
+        streams.append({"codec_type": "video", "codec_name": "h264"})
+    streams.append({"codec_type": "audio", "codec_name": codec, "codec_tag": tag, "sample_rate": rate, "channels": channels})
+    return {"format": {"format_name": format_name}, "streams": streams}
+
+
+def test_plan_zero_copy_for_normalized_wav() -> None:
+    assert audio.plan_ingest(_probe()).mode == audio.INGEST_ZERO_COPY
+
+
+def test_plan_remux_for_matching_audio_in_other_container() -> None:
+    assert audio.plan_ingest(_probe(format_name="matroska,webm")).mode == audio.INGEST_REMUX
+    # WAVE_FORMAT_EXTENSIBLE: same samples, but not readable by ``wave`` on Python < 3.12.
+    assert audio.plan_ingest(_probe(tag="0xfffe")).mode == audio.INGEST_REMUX
+    assert audio.plan_ingest(_probe(format_name="mov,mp4,m4a,3gp,3g2,mj2", video=True)).mode == audio.INGEST_REMUX
+
+
+def test_plan_decode_otherwise() -> None:
+    assert audio.plan_ingest(_probe(rate="48000", channels=2)).mode == audio.INGEST_DECODE
+    assert audio.plan_ingest(_probe(codec="aac", format_name="mov,mp4,m4a,3gp,3g2,mj2")).mode == audio.INGEST_DECODE
+    assert audio.plan_ingest(None).mode == audio.INGEST_DECODE
+    assert audio.plan_ingest({"format": {}, "streams": []}).mode == audio.INGEST_DECODE
+
+
+def test_zero_copy_hardlinks_without_running_ffmpeg(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    src = tmp_path / "in.wav"
+    with wave.open(str(src), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\0\0" * 1600)
+    out_wav = tmp_path / "out.wav"
+    out_wav.touch()
+
+    def no_ffmpeg(*_args: Any, **_kwargs: Any) -> None:
+        raise AssertionError("zero-copy ingest must not run ffmpeg")
+
+    monkeypatch.setattr(audio, "_ffprobe", lambda _path: _probe())
+    monkeypatch.setattr(audio.subprocess, "run", no_ffmpeg)
+
+    report = audio.fetch_audio(str(src), str(out_wav))
+
+    assert report.mode == audio.INGEST_ZERO_COPY
+    assert out_wav.read_bytes() == src.read_bytes()
+    assert os.stat(out_wav).st_ino == os.stat(src).st_ino
+
+
+@pytest.mark.parametrize(
+    "probe,expected,unexpected",
+    [
+        (_probe(format_name="matroska,webm"), ["-map", "0:a:0", "-c:a", "copy"], ["-ar"]),
+        (_probe(codec="aac", rate="44100", channels=2, video=True), ["-map", "0:a:0", "-vn", "-ar", "16000", "-ac", "1"], ["copy"]),
+    ],
+)
+def test_remux_and_decode_commands(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, probe: dict, expected: list[str], unexpected: list[str]) -> None:
+    src = tmp_path / "in.mkv"
+    src.write_bytes(b"media")
+    out_wav = tmp_path / "out.wav"
+    commands: list[list[str]] = []
+
+    def fake_run(cmd_list: list[str], **_kwargs: Any) -> subprocess.CompletedProcess:
+        commands.append(cmd_list)
+        Path(cmd_list[-1]).write_bytes(b"RIFF")
+        return subprocess.CompletedProcess(cmd_list, 0, b"", b"")
+
+    monkeypatch.setattr(audio, "_ffprobe", lambda _path: probe)
+    monkeypatch.setattr(audio.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(audio.subprocess, "run", fake_run)
+
+    report = audio.ingest_local_file(str(src), str(out_wav))
+
+    assert report.mode == audio.plan_ingest(probe).mode
+    assert report.seconds >= 0
+    (cmd,) = commands
+    assert cmd[-1] == str(out_wav)
+    for arg in expected:
+        assert arg in cmd
+    for arg in unexpected:
+        assert arg not in cmd
+
+
+def test_fetch_audio_reports_url_ingest_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    out_wav = tmp_path / "out.wav"
+    monkeypatch.setattr(audio, "_stream_url_to_wav", lambda _url, outpath, **_kwargs: Path(outpath).write_bytes(b"RIFF"))
+    report = audio.fetch_audio("https://example.com/a.mp3", str(out_wav))
+    assert report.mode == audio.INGEST_STREAM
@@ -228,6 +228,8 @@ def test_run_insanely_fast_whisper_uses_flash_env_and_forces_flash_arg(monkeypat
     monkeypatch.setattr(insane, "get_device_id", lambda: "0")
     monkeypatch.setattr(insane, "get_batch_size", lambda: None)
     monkeypatch.setattr(insane, "get_wave_duration", lambda _path: 1.0)
+    # Exercise the one-shot CLI path, not the resident worker.
+    monkeypatch.setenv("TRANSCRIBE_ANYTHING_INSANE_WORKER", "0")
 
     insane.run_insanely_fast_whisper(
         input_wav=input_wav,
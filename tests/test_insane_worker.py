@@ -0,0 +1,179 @@
+"""Unit tests for the resident insane model worker (host side).
+
+The real runner needs torch + transformers inside the insane iso-env, so
+these tests swap the iso-env for a stub whose ``open_proc`` launches a
+tiny fake worker speaking the same JSON-lines protocol.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything import insane_worker
+from transcribe_anything.insane_worker import (
+    InsaneWorker,
+    InsaneWorkerError,
+    WorkerKey,
+    parse_worker_args,
+    worker_enabled,
+)
+
+FAKE_WORKER = r"""
+import json, os, sys, time
+print(json.dumps({"type": "ready"}), flush=True)
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["type"] == "shutdown":
+        break
+    if job["file_name"].endswith("hang.wav"):
+        time.sleep(60)
+    if job["file_name"].endswith("bad.wav"):
+        print(json.dumps({"type": "error", "id": job["id"], "error": "boom"}), flush=True)
+        continue
+    with open(job["transcript_path"], "w", encoding="utf8") as fp:
+        json.dump({"text": str(os.getpid()), "chunks": [{"timestamp": [0.0, 1.0], "text": " hi"}], "timestamp": job["timestamp"]}, fp)
+    print(json.dumps({"type": "done", "id": job["id"]}), flush=True)
+"""
+
+FAILING_WORKER = r"""
+import json
+print(json.dumps({"type": "error", "id": None, "error": "no cuda"}), flush=True)
+"""
+
+
+class _StubIsoEnv:
+    def __init__(self, script: str) -> None:
+        self.script = script
+        self.launches: list[list[str]] = []
+
+    def open_proc(self, cmd_list: list[str], **kwargs: Any) -> subprocess.Popen:
+        self.launches.append(cmd_list)
+        return subprocess.Popen([sys.executable, "-c", self.script], **kwargs)  # pylint: disable=consider-using-with
+
+
+KEY = WorkerKey(model="openai/whisper-tiny", device_id="0", flash=False)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    insane_worker.shutdown_workers()
+    yield
+    insane_worker.shutdown_workers()
+
+
+def test_worker_reuses_one_process_across_jobs(tmp_path: Path) -> None:
+    iso_env = _StubIsoEnv(FAKE_WORKER)
+    pids = []
+    for i in range(3):
+        worker = insane_worker.get_worker(iso_env, KEY)
+        out = tmp_path / f"out{i}.json"
+        worker.transcribe(tmp_path / "a.wav", out, task="transcribe", language="en", batch_size=None, timestamp="word")
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["timestamp"] == "word"
+        pids.append(data["text"])
+    assert len(iso_env.launches) == 1
+    assert len(set(pids)) == 1
+    assert "--model-name" in iso_env.launches[0]
+
+
+def test_worker_job_error_keeps_worker_alive(tmp_path: Path) -> None:
+    worker = insane_worker.get_worker(_StubIsoEnv(FAKE_WORKER), KEY)
+    with pytest.raises(InsaneWorkerError, match="boom"):
+        worker.transcribe(tmp_path / "bad.wav", tmp_path / "out.json", task="transcribe", language="", batch_size=4)
+    assert worker.is_alive
+    worker.transcribe(tmp_path / "good.wav", tmp_path / "out.json", task="transcribe", language="", batch_size=4)
+    assert (tmp_path / "out.json").is_file()
+
+
+def test_worker_start_failure_raises() -> None:
+    worker = InsaneWorker(_StubIsoEnv(FAILING_WORKER), KEY)
+    with pytest.raises(InsaneWorkerError, match="no cuda"):
+        worker.start()
+    assert not worker.is_alive
+
+
+def test_dead_worker_is_replaced(tmp_path: Path) -> None:
+    iso_env = _StubIsoEnv(FAKE_WORKER)
+    worker = insane_worker.get_worker(iso_env, KEY)
+    worker.close()
+    replacement = insane_worker.get_worker(iso_env, KEY)
+    assert replacement is not worker
+    assert len(iso_env.launches) == 2
+
+
+def test_parse_worker_args() -> None:
+    assert parse_worker_args([]) == {"timestamp": "chunk"}
+    assert parse_worker_args(["--timestamp", "word"]) == {"timestamp": "word"}
+    assert parse_worker_args(["--flash", "True", "--timestamp=word"]) == {"timestamp": "word"}
+    assert parse_worker_args(["--diarization_model", "x"]) is None
+    assert parse_worker_args(["--timestamp", "bogus"]) is None
+
+
+def test_worker_enabled_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(insane_worker.WORKER_ENV_VAR, raising=False)
+    assert worker_enabled()
+    monkeypatch.setenv(insane_worker.WORKER_ENV_VAR, "0")
+    assert not worker_enabled()
+
+
+def test_run_insanely_fast_whisper_routes_through_worker(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import transcribe_anything.insanely_fast_whisper as insane
+
+    iso_env = _StubIsoEnv(FAKE_WORKER)
+    monkeypatch.delenv(insane_worker.WORKER_ENV_VAR, raising=False)
+    monkeypatch.setattr(insane.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(insane, "get_environment", lambda **_kwargs: iso_env)
+    monkeypatch.setattr(insane, "get_device_id", lambda: "0")
+    monkeypatch.setattr(insane, "get_batch_size", lambda: None)
+    monkeypatch.setattr(insane, "get_wave_duration", lambda _path: 1.0)
+
+    for name in ("a", "b"):
+        output_dir = tmp_path / name
+        insane.run_insanely_fast_whisper(
+            input_wav=tmp_path / f"{name}.wav",
+            model="tiny",
+            output_dir=output_dir,
+            task="transcribe",
+            language="en",
+            other_args=["--timestamp", "word"],
+        )
+        assert (output_dir / "out.srt").exists()
+        assert (output_dir / "out.txt").exists()
+
+    assert len(iso_env.launches) == 1
+    assert iso_env.launches[0][1].endswith("insane_worker_runner.py")
+
+
+def test_failed_job_discards_worker_before_cli_fallback(tmp_path: Path) -> None:
+    import transcribe_anything.insanely_fast_whisper as insane
+
+    iso_env = _StubIsoEnv(FAKE_WORKER)
+    worker = insane_worker.get_worker(iso_env, KEY)
+    with pytest.warns(UserWarning, match="falling back to the CLI"):
+        ran = insane._run_in_worker(iso_env, KEY, {}, tmp_path / "bad.wav", tmp_path / "out.json", "transcribe", "", None, "chunk", 1.0)  # pylint: disable=protected-access
+    assert not ran
+    assert KEY not in insane_worker._WORKERS  # pylint: disable=protected-access
+    assert not worker.is_alive
+
+
+def test_hung_worker_is_killed_and_the_job_falls_back(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import transcribe_anything.insanely_fast_whisper as insane
+
+    iso_env = _StubIsoEnv(FAKE_WORKER)
+    worker = insane_worker.get_worker(iso_env, KEY)
+    with pytest.raises(InsaneWorkerError, match="no answer"):
+        worker.transcribe(tmp_path / "hang.wav", tmp_path / "out.json", task="transcribe", language="", batch_size=None, timeout=0.5)
+    assert not worker.is_alive
+
+    monkeypatch.setattr(insane_worker, "JOB_TIMEOUT_BASE_SECONDS", 0.5)
+    monkeypatch.setattr(insane_worker, "JOB_TIMEOUT_PER_AUDIO_SECOND", 0.0)
+    with pytest.warns(UserWarning, match="falling back to the CLI"):
+        ran = insane._run_in_worker(iso_env, KEY, {}, tmp_path / "hang.wav", tmp_path / "out.json", "transcribe", "", None, "chunk", 1.0)  # pylint: disable=protected-access
+    assert not ran
+    assert KEY not in insane_worker._WORKERS  # pylint: disable=protected-access
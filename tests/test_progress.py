@@ -0,0 +1,232 @@
+"""Backend progress reporting: segment parsing, runners, and the daemon job fields."""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything import whisper, whisper_parallel
+from transcribe_anything.progress import (
+    ProgressTracker,
+    cli_progress,
+    parse_segment_end,
+)
+from transcribe_anything.server_config import JobStatus, JobStore, ServerConfig
+
+RATE = 16000
+
+
+def _write_silence(path: Path, seconds: float) -> Path:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(b"\0\0" * int(seconds * RATE))
+    return path
+
+
+def test_parse_segment_end() -> None:
+    assert parse_segment_end("[00:12.000 --> 00:15.480]  hello") == pytest.approx(15.48)
+    assert parse_segment_end("[01:02:03.500 --> 01:02:04.000] x") == pytest.approx(3724.0)
+    assert parse_segment_end("Transcript: [12.0 --> 15.48] hi") == pytest.approx(15.48)
+    assert parse_segment_end("Detecting language...") is None
+
+
+def test_tracker_is_monotonic_and_clamped() -> None:
+    seen: list = []
+    tracker = ProgressTracker(lambda done, total: seen.append((done, total)), 10.0)
+    for value in (0.0, 4.0, 3.0, 4.0, 12.0):
+        tracker.update(value)
+    tracker.done()
+    assert seen == [(0.0, 10.0), (4.0, 10.0), (10.0, 10.0)]
+
+
+def test_cli_progress_prints_in_steps() -> None:
+    out = io.StringIO()
+    report = cli_progress(out, step_percent=25)
+    for done in range(0, 101, 5):
+        report(float(done), 100.0)
+    report(100.0, 100.0)
+    assert out.getvalue().splitlines() == [
+        "progress: 0% (0s / 100s)",
+        "progress: 25% (25s / 100s)",
+        "progress: 50% (50s / 100s)",
+        "progress: 75% (75s / 100s)",
+        "progress: 100% (100s / 100s)",
+    ]
+
+
+def test_cli_wires_progress_only_when_watched(monkeypatch: pytest.MonkeyPatch) -> None:
+    import argparse
+
+    from transcribe_anything import _cmd
+
+    def wants(device: str, progress: bool, tty: bool) -> bool:
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: tty)
+        return _cmd._wants_cli_progress(argparse.Namespace(device=device, progress=progress))  # pylint: disable=protected-access
+
+    assert not wants("cpu", progress=False, tty=False)
+    assert wants("cpu", progress=True, tty=False)
+    assert wants("cuda", progress=False, tty=True)
+    assert not wants("insane", progress=True, tty=True)
+
+
+def test_run_whisper_reports_segment_progress(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    wav = _write_silence(tmp_path / "in.wav", 10.0)
+    script = "print('[00:00.000 --> 00:04.000]  one'); print('[00:04.000 --> 00:07.500]  two')"
+
+    class FakeEnv:
+        def open_proc(self, _cmd: list, **kwargs: Any) -> subprocess.Popen:
+            kwargs.pop("shell", None)
+            return subprocess.Popen([sys.executable, "-c", script], **kwargs)  # pylint: disable=consider-using-with
+
+    monkeypatch.setattr(whisper, "get_environment", FakeEnv)
+    seen: list = []
+    whisper.run_whisper(
+        input_wav=wav,
+        device="cpu",
+        model="tiny",
+        output_dir=tmp_path / "out",
+        task="transcribe",
+        language="en",
+        progress_callback=lambda done, total: seen.append((done, total)),
+    )
+    assert seen == [(0.0, 10.0), (4.0, 10.0), (7.5, 10.0), (10.0, 10.0)]
+
+
+def test_parallel_windows_sum_their_progress(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(whisper_parallel, "MIN_WINDOW_SECONDS", 1.0)
+    wav = _write_silence(tmp_path / "in.wav", 4.0)
+
+    def backend(**kwargs: Any) -> None:
+        with wave.open(str(kwargs["input_wav"]), "rb") as w:
+            length = w.getnframes() / w.getframerate()
+        kwargs["progress_callback"](length / 2, length)
+        out = Path(kwargs["output_dir"])
+        out.mkdir(parents=True, exist_ok=True)
+        stem = Path(kwargs["input_wav"]).stem
+        (out / f"{stem}.json").write_text('{"text": "", "segments": [], "language": "en"}', encoding="utf-8")
+
+    seen: list = []
+    whisper_parallel.run_whisper_parallel(
+        input_wav=wav,
+        model="tiny",
+        output_dir=tmp_path / "out",
+        task="transcribe",
+        language="en",
+        workers=2,
+        backend_fn=backend,
+        progress_callback=lambda done, total: seen.append(done),
+    )
+    assert seen == sorted(seen)
+    assert seen[-1] == pytest.approx(4.0)
+
+
+def test_job_exposes_progress_and_eta() -> None:
+    halfway = threading.Event()
+    release = threading.Event()
+
+    def transcribe(*, progress_callback, **_kwargs) -> str:
+        time.sleep(0.05)
+        progress_callback(30.0, 60.0)
+        halfway.set()
+        release.wait(5)
+        return ""
+
+    store = JobStore(ServerConfig(), transcribe_fn=transcribe, worker_devices=[None])
+    store.start()
+    try:
+        job = store.submit({"input": "x.wav"}, "/nonexistent")
+        assert halfway.wait(5)
+        running = store.get(job.job_id).to_public_dict()
+        assert running["status"] == "running"
+        assert running["progress"] == 0.5
+        # As long again as it has taken so far.
+        assert 0.0 < running["eta_seconds"] < 5.0
+        assert running["progress_updated_at"] >= running["started_at"]
+        release.set()
+        deadline = time.time() + 5
+        while store.get(job.job_id).status != JobStatus.COMPLETED and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        release.set()
+        store.stop(timeout=5)
+    done = store.get(job.job_id).to_public_dict()
+    assert done["progress"] == 1.0
+    assert done["eta_seconds"] == 0.0
+
+
+def test_api_transcribe_reports_stages_and_final_progress(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import api
+
+    temp_wav = tmp_path / "input.wav"
+
+    def fake_run_whisper(**kwargs: Any) -> None:
+        out = Path(kwargs["output_dir"])
+        (out / "out.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n", encoding="utf-8")
+        (out / "out.txt").write_text("Hi", encoding="utf-8")
+
+    monkeypatch.setattr(api.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api, "make_temp_wav", lambda: str(temp_wav))
+    monkeypatch.setattr(api, "fetch_audio", lambda _src, wav_path: _write_silence(Path(wav_path), 3.0))
+    monkeypatch.setattr(api, "run_whisper", fake_run_whisper)
+    src = tmp_path / "in.mp4"
+    src.write_bytes(b"x")
+    stages: list = []
+    progress: list = []
+    api.transcribe(
+        url_or_file=str(src),
+        output_dir=str(tmp_path / "out"),
+        device="cpu",
+        use_cache=False,
+        progress_callback=lambda done, total: progress.append((done, total)),
+        stage_callback=lambda stage, seconds: stages.append(stage),
+    )
+    assert stages == ["fetch", "inference", "postprocess"]
+    assert progress[-1] == (3.0, 3.0)
+
+
+def test_concurrent_shard_alignment_is_timed_as_wall_clock(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import api
+
+    temp_wav = tmp_path / "input.wav"
+
+    def fake_sharded(**kwargs: Any) -> None:
+        # Two shards align side by side for 0.3 s each.
+        def shard() -> None:
+            with api.timed_stage(kwargs["stage_callback"], "alignment"):
+                time.sleep(0.3)
+
+        threads = [threading.Thread(target=shard) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        out = Path(kwargs["output_dir"])
+        (out / "out.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n", encoding="utf-8")
+
+    monkeypatch.setattr(api.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api, "make_temp_wav", lambda: str(temp_wav))
+    monkeypatch.setattr(api, "fetch_audio", lambda _src, wav_path: _write_silence(Path(wav_path), 3.0))
+    monkeypatch.setattr(api, "run_insanely_fast_whisper_sharded", fake_sharded)
+    src = tmp_path / "in.mp4"
+    src.write_bytes(b"x")
+    stages: dict = {}
+    api.transcribe(
+        url_or_file=str(src),
+        output_dir=str(tmp_path / "out"),
+        device="insane",
+        multi_gpu=True,
+        use_cache=False,
+        stage_callback=lambda stage, seconds: stages.__setitem__(stage, stages.get(stage, 0.0) + seconds),
+    )
+    assert 0.3 <= stages["alignment"] < 0.5
+    assert stages["inference"] >= 0.0
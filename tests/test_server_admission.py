@@ -0,0 +1,213 @@
+"""Cost-aware admission: predicted queue wait, Retry-After, and client retries."""
+
+from __future__ import annotations
+
+import threading
+import wave
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from transcribe_anything import client as client_mod
+from transcribe_anything.client import transcribe_remote
+from transcribe_anything.server_admission import CostModel, admit, forecast
+from transcribe_anything.server_app import ServerConfig, create_app
+
+
+def test_cost_model_moving_averages() -> None:
+    cost = CostModel(smoothing=0.5)
+    assert cost.job_seconds("tiny", 60.0) == 60.0  # real time until measured
+    cost.observe("tiny", audio_seconds=100.0, run_seconds=20.0)
+    assert cost.rtf("tiny") == pytest.approx(0.2)
+    cost.observe("tiny", audio_seconds=300.0, run_seconds=120.0)
+    assert cost.rtf("tiny") == pytest.approx(0.3)
+    # Unmeasured audio is priced at the average length seen so far.
+    assert cost.job_seconds("tiny", None) == pytest.approx(200.0 * 0.3)
+    assert cost.rtf("large") == 1.0
+
+
+def test_forecast_spreads_the_queue_over_slots() -> None:
+    schedule, free = forecast(now=100.0, slots=2, running=[("r", 90.0, 110.0)], queued=[("a", 30.0), ("b", 20.0), ("c", 5.0)])
+    assert schedule["r"] == (90.0, 110.0)
+    assert schedule["a"] == (100.0, 130.0)  # the idle slot
+    assert schedule["b"] == (110.0, 130.0)  # after "r"
+    assert schedule["c"] == (130.0, 135.0)
+    assert sorted(free) == [130.0, 135.0]
+
+
+def test_admit_reports_when_the_backlog_drains_enough() -> None:
+    _schedule, free = forecast(now=0.0, slots=1, running=[("r", 0.0, 50.0)], queued=[])
+    fits, retry_after = admit(free, 0.0, [50.0, 50.0], max_wait=60.0)
+    assert fits == 1
+    # The second job would start at 100 s; it fits once 40 s have passed.
+    assert retry_after == pytest.approx(40.0)
+
+
+def _gated_app(tmp_path: Path, durations: Optional[dict] = None, **config):
+    gate = threading.Event()
+    started = threading.Event()
+
+    def transcribe(*, output_dir: str, **_kwargs) -> str:
+        started.set()
+        gate.wait(10)
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs"), **config), transcribe_fn=transcribe, duration_fn=(durations or {}).get)
+    # 100 s clips at half real time: every job is priced at 50 s.
+    app.state.store.cost.observe("tiny", audio_seconds=100.0, run_seconds=50.0)
+    return app, gate, started
+
+
+def test_submissions_over_the_wait_limit_get_429_with_retry_after(tmp_path: Path) -> None:
+    app, gate, started = _gated_app(tmp_path, max_queue_wait_seconds=60.0)
+    try:
+        with TestClient(app) as client:
+            running = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()
+            assert started.wait(5)
+            queued = client.post("/v1/transcribe", json={"url": "https://example.com/b.mp3"})
+            assert queued.status_code == 202
+            rejected = client.post("/v1/transcribe", json={"url": "https://example.com/c.mp3"})
+            assert rejected.status_code == 429
+            assert 38 <= int(rejected.headers["Retry-After"]) <= 41
+            job = client.get(f"/v1/jobs/{queued.json()['job_id']}").json()
+            first = client.get(f"/v1/jobs/{running['job_id']}").json()
+            assert job["predicted_start_at"] == pytest.approx(first["predicted_finish_at"], abs=1)
+            assert job["predicted_finish_at"] - job["predicted_start_at"] == pytest.approx(50, abs=1)
+            assert 'transcribe_anything_model_rtf{model="tiny"} 0.5' in client.get("/metrics").text
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_queued_jobs_are_priced_by_their_probed_length(tmp_path: Path) -> None:
+    # 20 s clips cost 10 s each, so five fit where average-priced (50 s) jobs wouldn't.
+    durations = {f"https://example.com/{name}.mp3": 20.0 for name in "abcdefg"}
+    app, gate, started = _gated_app(tmp_path, durations=durations, max_queue_wait_seconds=60.0)
+    try:
+        with TestClient(app) as client:
+            client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"})
+            assert started.wait(5)
+            queued = [client.post("/v1/transcribe", json={"url": f"https://example.com/{name}.mp3"}) for name in "bcdef"]
+            assert [resp.status_code for resp in queued] == [202] * 5
+            job = client.get(f"/v1/jobs/{queued[0].json()['job_id']}").json()
+            assert job["audio_seconds"] == 20.0
+            assert job["predicted_finish_at"] - job["predicted_start_at"] == pytest.approx(10, abs=1)
+            # A job of unknown length still costs the average 50 s, pushing "g" past the limit.
+            assert client.post("/v1/transcribe", json={"url": "https://example.com/long.mp3"}).status_code == 202
+            assert client.post("/v1/transcribe", json={"url": "https://example.com/g.mp3"}).status_code == 429
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_uploads_are_probed_from_disk(tmp_path: Path) -> None:
+    clip = tmp_path / "clip.wav"
+    with wave.open(str(clip), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\0\0" * 16000 * 3)
+    gate = threading.Event()
+
+    def transcribe(*, output_dir: str, **_kwargs) -> str:
+        gate.wait(10)
+        return output_dir
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=transcribe)
+    try:
+        with TestClient(app) as client:
+            resp = client.post("/v1/transcribe", files={"file": ("clip.wav", clip.read_bytes(), "audio/wav")})
+            assert resp.status_code == 202, resp.text
+            assert client.get(f"/v1/jobs/{resp.json()['job_id']}").json()["audio_seconds"] == pytest.approx(3.0)
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_queue_full_429_carries_retry_after(tmp_path: Path) -> None:
+    app, gate, started = _gated_app(tmp_path, max_queue=1)
+    try:
+        with TestClient(app) as client:
+            client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"})
+            assert started.wait(5)
+            client.post("/v1/transcribe", json={"url": "https://example.com/b.mp3"})
+            resp = client.post("/v1/transcribe", json={"url": "https://example.com/c.mp3"})
+            assert resp.status_code == 429
+            # The running job is predicted to free its slot ~50 s from now.
+            assert 48 <= int(resp.headers["Retry-After"]) <= 51
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_client_waits_out_retry_after(tmp_path: Path, monkeypatch) -> None:
+    def transcribe(*, output_dir: str, **_kwargs) -> str:
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=transcribe)
+    busy = [2]
+    slept: list = []
+
+    class BusyClient(TestClient):
+        def post(self, url, *args, **kwargs):  # pylint: disable=arguments-differ
+            if str(url).endswith("/v1/transcribe") and busy[0]:
+                busy[0] -= 1
+                return httpx.Response(429, headers={"Retry-After": "7"}, text="busy", request=httpx.Request("POST", url))
+            return super().post(url, *args, **kwargs)
+
+    monkeypatch.setattr(client_mod.httpx, "Client", lambda *_a, **kw: BusyClient(app, base_url="http://testserver", headers=kw.get("headers") or {}))
+    monkeypatch.setattr(client_mod.time, "sleep", slept.append)
+    with TestClient(app):
+        out = transcribe_remote(url_or_file="https://example.com/a.mp3", remote="http://testserver", output_dir=str(tmp_path / "out"))
+    assert (Path(out) / "out.txt").read_text(encoding="utf-8") == "ok"
+    assert slept[:2] == [7.0, 7.0]
+
+
+def test_client_gives_up_without_a_busy_budget(tmp_path: Path, monkeypatch) -> None:
+    app, gate, started = _gated_app(tmp_path, max_queue=1)
+    monkeypatch.setattr(client_mod.httpx, "Client", lambda *_a, **kw: TestClient(app, base_url="http://testserver", headers=kw.get("headers") or {}))
+    try:
+        with TestClient(app) as client:
+            client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"})
+            assert started.wait(5)
+            client.post("/v1/transcribe", json={"url": "https://example.com/b.mp3"})
+            with pytest.raises(client_mod.RemoteTranscriberError, match="429"):
+                transcribe_remote(url_or_file="https://example.com/c.mp3", remote="http://testserver", busy_timeout_seconds=0)
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_client_retries_a_busy_upload_resumably(tmp_path: Path, monkeypatch) -> None:
+    def transcribe(*, output_dir: str, **_kwargs) -> str:
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=transcribe)
+    busy = [2]
+    posts: list = []
+
+    class BusyClient(TestClient):
+        def post(self, url, *args, **kwargs):  # pylint: disable=arguments-differ
+            posts.append(str(url).rsplit("/v1/", 1)[-1])
+            if (str(url).endswith("/v1/transcribe") or str(url).endswith("/finalize")) and busy[0]:
+                busy[0] -= 1
+                return httpx.Response(429, headers={"Retry-After": "1"}, text="busy", request=httpx.Request("POST", url))
+            return super().post(url, *args, **kwargs)
+
+    local = tmp_path / "clip.wav"
+    local.write_bytes(b"x" * 1000)
+    monkeypatch.setattr(client_mod.httpx, "Client", lambda *_a, **kw: BusyClient(app, base_url="http://testserver", headers=kw.get("headers") or {}))
+    monkeypatch.setattr(client_mod.time, "sleep", lambda _s: None)
+    with TestClient(app):
+        out = transcribe_remote(url_or_file=str(local), remote="http://testserver", output_dir=str(tmp_path / "out"))
+    assert (Path(out) / "out.txt").read_text(encoding="utf-8") == "ok"
+    # One multipart body, then one resumable upload whose finalize alone is retried.
+    assert posts[0] == "transcribe"
+    assert posts.count("transcribe") == 1 and posts.count("uploads") == 1
+    assert sum(p.endswith("/finalize") for p in posts) == 2
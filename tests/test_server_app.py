@@ -377,6 +377,7 @@ def test_metrics_endpoint_exposes_counters(server_client) -> None:
     assert "transcribe_anything_queue_depth" in body
     assert "transcribe_anything_queue_capacity" in body
     assert "transcribe_anything_jobs_in_flight" in body
+    assert "transcribe_anything_workers 1" in body
 
 
 # --------------------- webhook callbacks ---------------------
@@ -0,0 +1,202 @@
+"""Multi-input submission: ``POST /v1/batches`` and ``transcribe_remote_batch``."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from transcribe_anything import client as client_mod
+from transcribe_anything.client import transcribe_remote_batch
+from transcribe_anything.server_app import ServerConfig, create_app
+from transcribe_anything.server_config import JobStore
+from transcribe_anything.server_jobdb import JobDatabase
+
+
+def _writer(*, url_or_file: str, output_dir: str, **_kwargs) -> str:
+    if "bad" in url_or_file:
+        raise RuntimeError("cannot decode")
+    (Path(output_dir) / "out.txt").write_text(url_or_file, encoding="utf-8")
+    return output_dir
+
+
+def _blocked_app(tmp_path: Path, max_queue: int):
+    """One worker held on the first job, so the queue fills predictably."""
+    gate = threading.Event()
+    started = threading.Event()
+
+    def transcribe(**kwargs) -> str:
+        started.set()
+        gate.wait(10)
+        return _writer(**kwargs)
+
+    cfg = ServerConfig(model="tiny", max_queue=max_queue, job_root=str(tmp_path / "jobs"))
+    return create_app(cfg, transcribe_fn=transcribe), gate, started
+
+
+def _wait_batch(client: TestClient, batch_id: str, status: str) -> dict:
+    deadline = time.time() + 5
+    body = client.get(f"/v1/batches/{batch_id}").json()
+    while body["status"] != status and time.time() < deadline:
+        time.sleep(0.02)
+        body = client.get(f"/v1/batches/{batch_id}").json()
+    return body
+
+
+def test_batch_aggregates_status_and_artifacts(tmp_path: Path) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_writer)
+    with TestClient(app) as client:
+        assert client.get("/v1/capabilities").json()["batches"] is True
+        resp = client.post("/v1/batches", json={"inputs": ["https://example.com/a.mp3", "https://example.com/bad.mp3"], "options": {"task": "transcribe"}})
+        assert resp.status_code == 202
+        submitted = resp.json()
+        assert [a["index"] for a in submitted["admitted"]] == [0, 1]
+        assert submitted["rejected"] == []
+        body = _wait_batch(client, submitted["batch_id"], "partial")
+        job_id = submitted["admitted"][0]["job_id"]
+        assert client.get(f"/v1/jobs/{job_id}").json()["batch_id"] == submitted["batch_id"]
+    assert body["counts"]["completed"] == 1
+    assert body["counts"]["failed"] == 1
+    good, bad = body["jobs"]
+    assert good["input"] == "https://example.com/a.mp3"
+    assert good["artifacts"] == [{"name": "out.txt", "url": f"/v1/jobs/{job_id}/artifacts/out.txt"}]
+    assert bad["status"] == "failed" and "cannot decode" in bad["error"]
+
+
+def test_atomic_batch_over_capacity_is_429_and_admits_nothing(tmp_path: Path) -> None:
+    app, gate, started = _blocked_app(tmp_path, max_queue=2)
+    try:
+        with TestClient(app) as client:
+            client.post("/v1/transcribe", json={"url": "https://example.com/running.mp3"})
+            assert started.wait(5)
+            resp = client.post("/v1/batches", json={"inputs": [f"https://example.com/{i}.mp3" for i in range(3)], "policy": "atomic"})
+            assert resp.status_code == 429
+            assert "transcribe_anything_queue_depth 0" in client.get("/metrics").text
+            assert len(list((tmp_path / "jobs").glob("ta-job-*"))) == 1
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_partial_batch_admits_what_fits(tmp_path: Path) -> None:
+    app, gate, started = _blocked_app(tmp_path, max_queue=2)
+    try:
+        with TestClient(app) as client:
+            client.post("/v1/transcribe", json={"url": "https://example.com/running.mp3"})
+            assert started.wait(5)
+            resp = client.post("/v1/batches", json={"inputs": [f"https://example.com/{i}.mp3" for i in range(3)], "policy": "partial"})
+            assert resp.status_code == 202
+            body = resp.json()
+            assert [a["index"] for a in body["admitted"]] == [0, 1]
+            assert body["rejected"] == [{"index": 2, "input": "https://example.com/2.mp3", "error": "transcription queue is full"}]
+            assert client.get(f"/v1/batches/{body['batch_id']}").json()["status"] == "queued"
+            gate.set()
+            done = _wait_batch(client, body["batch_id"], "completed")
+            assert done["counts"]["completed"] == 2
+            assert done["rejected"][0]["index"] == 2
+    finally:
+        gate.set()
+
+
+def test_batch_rejects_bad_requests(tmp_path: Path) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_writer)
+    with TestClient(app) as client:
+        assert client.post("/v1/batches", json={"inputs": []}).status_code == 400
+        assert client.post("/v1/batches", json={"inputs": ["a", 3]}).status_code == 400
+        assert client.post("/v1/batches", json={"inputs": ["a"], "policy": "some"}).status_code == 400
+        assert client.post("/v1/batches", json={"inputs": ["a"], "options": {"device": "cpu"}}).status_code == 400
+        assert client.get("/v1/batches/nope").status_code == 404
+
+
+def test_batches_survive_a_restart(tmp_path: Path) -> None:
+    cfg = ServerConfig(model="tiny")
+    requests = []
+    for i in range(2):
+        d = tmp_path / "jobs" / f"ta-job-{i}"
+        d.mkdir(parents=True)
+        requests.append(({"input": f"{i}.mp3"}, str(d)))
+    db = JobDatabase(tmp_path / "jobs.db")
+    batch, admitted, _ = JobStore(cfg, transcribe_fn=_writer, worker_devices=[None], db=db).submit_batch(requests)
+    db.close()
+
+    db = JobDatabase(tmp_path / "jobs.db")
+    reopened = JobStore(cfg, transcribe_fn=_writer, worker_devices=[None], db=db)
+    reopened.recover(tmp_path / "jobs")
+    found = reopened.get_batch(batch.batch_id)
+    db.close()
+    assert found is not None
+    assert [job.job_id for job in found[1]] == [job.job_id for job in admitted]
+
+
+def test_client_batch_helper_downloads_each_result(tmp_path: Path, monkeypatch) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_writer)
+
+    def factory(*_args, **kwargs):
+        return TestClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    inputs = ["https://example.com/a.mp3", "https://example.com/bad.mp3"]
+    with TestClient(app):
+        results = transcribe_remote_batch(inputs, remote="http://testserver", output_root=str(tmp_path / "out"), poll_interval_seconds=0.02)
+    assert [r["status"] for r in results] == ["completed", "failed"]
+    assert Path(results[0]["output_dir"]).name == "0000_a"
+    assert (Path(results[0]["output_dir"]) / "out.txt").read_text(encoding="utf-8") == inputs[0]
+    assert results[1]["output_dir"] is None and "cannot decode" in results[1]["error"]
+
+
+def test_client_batch_helper_keeps_going_after_a_failed_download(tmp_path: Path, monkeypatch) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_writer)
+
+    def factory(*_args, **kwargs):
+        return TestClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    real_download = client_mod._download_artifacts
+    calls: list = []
+
+    def flaky_download(client, base_url, job_id, names, out_path):
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise client_mod.RemoteTranscriberError("artifact out.txt is gone")
+        return real_download(client, base_url, job_id, names, out_path)
+
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    monkeypatch.setattr(client_mod, "_download_artifacts", flaky_download)
+    inputs = ["https://example.com/a.mp3", "https://example.com/b.mp3"]
+    with TestClient(app):
+        results = transcribe_remote_batch(inputs, remote="http://testserver", output_root=str(tmp_path / "out"), poll_interval_seconds=0.02)
+    assert len(calls) == 2
+    assert sorted(r["status"] for r in results) == ["completed", "failed"]
+    failed = next(r for r in results if r["status"] == "failed")
+    assert failed["output_dir"] is None and "is gone" in failed["error"]
+    done = next(r for r in results if r["status"] == "completed")
+    assert (Path(done["output_dir"]) / "out.txt").read_text(encoding="utf-8") == done["input"]
+
+
+def test_client_batch_helper_fails_jobs_that_vanish_from_the_batch(tmp_path: Path, monkeypatch) -> None:
+    captured: list = []
+
+    def transcribe(**kwargs) -> str:
+        # The single worker is on job 0; delete the still-queued job 1.
+        app.state.store.delete(captured[0][1][1].job_id)
+        return _writer(**kwargs)
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=transcribe)
+    real_submit_batch = app.state.store.submit_batch
+
+    def submit_batch(*args, **kwargs):
+        captured.append(real_submit_batch(*args, **kwargs))
+        return captured[-1]
+
+    def factory(*_args, **kwargs):
+        return TestClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    monkeypatch.setattr(app.state.store, "submit_batch", submit_batch)
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    inputs = ["https://www.youtube.com/watch?v=abc", "https://example.com/b.mp3"]
+    with TestClient(app):
+        results = transcribe_remote_batch(inputs, remote="http://testserver", output_root=str(tmp_path / "out"), poll_interval_seconds=0.02, job_timeout_seconds=5)
+    assert [r["status"] for r in results] == ["completed", "failed"]
+    assert Path(results[0]["output_dir"]).name == "0000_watchv=abc"
+    assert "no longer part of batch" in results[1]["error"]
@@ -0,0 +1,122 @@
+"""Server-push job status: long-poll ``?wait=`` and SSE ``/v1/jobs/{id}/events``."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from transcribe_anything import client as client_mod
+from transcribe_anything.client import transcribe_remote
+from transcribe_anything.server_app import ServerConfig, create_app
+
+
+def _gated_app(tmp_path: Path):
+    gate = threading.Event()
+    started = threading.Event()
+
+    def transcribe(*, url_or_file: str, output_dir: str, **_kwargs) -> str:
+        started.set()
+        gate.wait(10)
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=transcribe)
+    return app, gate, started
+
+
+def _release_after(gate: threading.Event, seconds: float) -> None:
+    threading.Timer(seconds, gate.set).start()
+
+
+def test_capabilities_advertise_job_events(tmp_path: Path) -> None:
+    app, gate, _ = _gated_app(tmp_path)
+    gate.set()
+    with TestClient(app) as client:
+        caps = client.get("/v1/capabilities").json()
+    assert caps["job_events"] is True
+    assert caps["max_job_wait_seconds"] > 0
+
+
+def test_long_poll_returns_on_the_next_transition(tmp_path: Path) -> None:
+    app, gate, started = _gated_app(tmp_path)
+    with TestClient(app) as client:
+        job_id = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()["job_id"]
+        assert started.wait(5)
+        _release_after(gate, 0.3)
+        t0 = time.monotonic()
+        body = client.get(f"/v1/jobs/{job_id}", params={"wait": 10, "since": "running"}).json()
+        elapsed = time.monotonic() - t0
+    assert body["status"] == "completed"
+    assert body["artifacts"] == ["out.txt"]
+    assert 0.2 <= elapsed < 5
+
+
+def test_long_poll_times_out_with_the_current_status(tmp_path: Path) -> None:
+    app, gate, started = _gated_app(tmp_path)
+    try:
+        with TestClient(app) as client:
+            job_id = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()["job_id"]
+            assert started.wait(5)
+            t0 = time.monotonic()
+            body = client.get(f"/v1/jobs/{job_id}", params={"wait": 0.2}).json()
+            assert body["status"] == "running"
+            assert time.monotonic() - t0 >= 0.15
+            # A stale ``since`` answers at once.
+            t0 = time.monotonic()
+            assert client.get(f"/v1/jobs/{job_id}", params={"wait": 10, "since": "queued"}).json()["status"] == "running"
+            assert time.monotonic() - t0 < 1
+            gate.set()
+    finally:
+        gate.set()
+
+
+def test_long_poll_unknown_job_is_404(tmp_path: Path) -> None:
+    app, gate, _ = _gated_app(tmp_path)
+    gate.set()
+    with TestClient(app) as client:
+        assert client.get("/v1/jobs/nope", params={"wait": 1}).status_code == 404
+        assert client.get("/v1/jobs/nope/events").status_code == 404
+
+
+def test_sse_streams_each_transition_then_closes(tmp_path: Path) -> None:
+    app, gate, started = _gated_app(tmp_path)
+    with TestClient(app) as client:
+        job_id = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()["job_id"]
+        assert started.wait(5)
+        _release_after(gate, 0.2)
+        with client.stream("GET", f"/v1/jobs/{job_id}/events") as resp:
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            statuses = [json.loads(line[len("data: ") :])["status"] for line in resp.iter_lines() if line.startswith("data: ")]
+    assert statuses == ["running", "completed"]
+
+
+def test_client_long_polls_instead_of_sleeping(tmp_path: Path, monkeypatch) -> None:
+    app, gate, _ = _gated_app(tmp_path)
+    params_seen: list = []
+
+    class RecordingClient(TestClient):
+        def get(self, url, *args, **kwargs):  # pylint: disable=arguments-differ
+            if "/v1/jobs/" in str(url):
+                params_seen.append(dict(kwargs.get("params") or {}))
+            return super().get(url, *args, **kwargs)
+
+    def factory(*_args, **kwargs):
+        return RecordingClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    def no_sleep(_seconds):
+        raise AssertionError("client slept between polls on a long-polling daemon")
+
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    monkeypatch.setattr(client_mod.time, "sleep", no_sleep)
+    _release_after(gate, 0.3)
+    out_dir = tmp_path / "out"
+    with TestClient(app):
+        transcribe_remote(url_or_file="https://example.com/a.mp3", remote="http://testserver", output_dir=str(out_dir), poll_interval_seconds=30)
+    assert (out_dir / "out.txt").read_text(encoding="utf-8") == "ok"
+    assert params_seen[0] == {}
+    assert all("wait" in p for p in params_seen[1:])
+    assert len(params_seen) <= 4
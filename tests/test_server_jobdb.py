@@ -0,0 +1,146 @@
+"""SQLite job store: write-through persistence and restart recovery."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from transcribe_anything.server_config import Job, JobStatus, JobStore, ServerConfig
+from transcribe_anything.server_jobdb import JobDatabase
+
+
+def _fake_transcribe(order: list):
+    def fake(*, url_or_file: str, output_dir: str, **_kwargs) -> str:
+        order.append(url_or_file)
+        out = Path(output_dir)
+        (out / "out.txt").write_text(url_or_file, encoding="utf-8")
+        return str(out)
+
+    return fake
+
+
+def _job(job_root: Path, name: str, status: JobStatus, created_at: float, make_dir: bool = True) -> Job:
+    artifact_dir = job_root / f"ta-job-{name}"
+    if make_dir:
+        artifact_dir.mkdir(parents=True)
+    return Job(job_id=name, status=status, request={"input": f"https://x/{name}"}, artifact_dir=str(artifact_dir), created_at=created_at)
+
+
+def _wait(store: JobStore, job_ids: list, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if all(store.get(j).status in (JobStatus.COMPLETED, JobStatus.FAILED) for j in job_ids):
+            return
+        time.sleep(0.02)
+    raise AssertionError("jobs did not finish")
+
+
+def test_database_round_trip_in_wal_mode(tmp_path: Path) -> None:
+    db = JobDatabase(tmp_path / "jobs.sqlite3")
+    job = _job(tmp_path, "a", JobStatus.COMPLETED, 1.0)
+    job.artifacts = ["out.txt"]
+    job.worker = 1
+    job.device_id = "1"
+    db.save(job)
+    job.error = "later update"
+    db.save(job)
+    (loaded,) = db.load_all()
+    assert loaded == job
+    db.close()
+    conn = sqlite3.connect(str(tmp_path / "jobs.sqlite3"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_store_writes_transitions_through(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.sqlite3"
+    store = JobStore(ServerConfig(), transcribe_fn=_fake_transcribe([]), db=JobDatabase(db_path))
+    store.start()
+    artifact_dir = tmp_path / "ta-job-1"
+    artifact_dir.mkdir()
+    job = store.submit({"input": "https://x"}, str(artifact_dir))
+    _wait(store, [job.job_id])
+    store.stop(timeout=5)
+
+    (row,) = JobDatabase(db_path).load_all()
+    assert row.job_id == job.job_id
+    assert row.status == JobStatus.COMPLETED
+    assert row.artifacts == ["out.txt"]
+    assert row.started_at is not None and row.completed_at is not None
+
+
+def test_recover_after_crash(tmp_path: Path) -> None:
+    job_root = tmp_path / "jobs"
+    db_path = tmp_path / "jobs.sqlite3"
+    previous = JobDatabase(db_path)
+    done = _job(job_root, "done", JobStatus.COMPLETED, 1.0)
+    (Path(done.artifact_dir) / "out.srt").write_text("1\n", encoding="utf-8")
+    for job in (
+        done,
+        _job(job_root, "running", JobStatus.RUNNING, 2.0),
+        _job(job_root, "q1", JobStatus.QUEUED, 3.0),
+        _job(job_root, "q2", JobStatus.QUEUED, 4.0),
+        _job(job_root, "q3", JobStatus.QUEUED, 5.0),
+        _job(job_root, "gone", JobStatus.COMPLETED, 0.5, make_dir=False),
+    ):
+        previous.save(job)
+    previous.close()  # the old process is gone
+    orphan = job_root / "ta-job-orphan"
+    orphan.mkdir()
+
+    order: list = []
+    # max_queue=1: recovered jobs were already admitted and must all come back.
+    store = JobStore(ServerConfig(max_queue=1), transcribe_fn=_fake_transcribe(order), db=JobDatabase(db_path))
+    summary = store.recover(job_root)
+    assert summary == {"requeued": 3, "interrupted": 1, "restored": 2, "dropped": 1, "orphans_removed": 1}
+    assert not orphan.exists()
+    assert store.get("gone") is None
+    assert store.get("done").artifacts == ["out.srt"]
+    interrupted = store.get("running")
+    assert interrupted.status == JobStatus.FAILED
+    assert "restart" in interrupted.error
+
+    store.start()
+    try:
+        _wait(store, ["q1", "q2", "q3"])
+    finally:
+        store.stop(timeout=5)
+    assert order == ["https://x/q1", "https://x/q2", "https://x/q3"]
+    statuses = {job.job_id: job.status for job in JobDatabase(db_path).load_all()}
+    assert statuses == {"done": JobStatus.COMPLETED, "running": JobStatus.FAILED, "q1": JobStatus.COMPLETED, "q2": JobStatus.COMPLETED, "q3": JobStatus.COMPLETED}
+
+
+def test_requeue_interrupted_reruns_running_jobs(tmp_path: Path) -> None:
+    job_root = tmp_path / "jobs"
+    db_path = tmp_path / "jobs.sqlite3"
+    previous = JobDatabase(db_path)
+    previous.save(_job(job_root, "running", JobStatus.RUNNING, 1.0))
+    previous.close()
+
+    ran = threading.Event()
+    order: list = []
+    fake = _fake_transcribe(order)
+
+    def transcribe(**kwargs) -> str:
+        ran.set()
+        return fake(**kwargs)
+
+    store = JobStore(ServerConfig(requeue_interrupted=True), transcribe_fn=transcribe, db=JobDatabase(db_path))
+    assert store.recover(job_root)["requeued"] == 1
+    store.start()
+    try:
+        _wait(store, ["running"])
+    finally:
+        store.stop(timeout=5)
+    assert ran.is_set()
+    assert store.get("running").status == JobStatus.COMPLETED
+
+
+def test_job_db_requires_job_root() -> None:
+    with pytest.raises(ValueError):
+        ServerConfig(job_db="/tmp/jobs.sqlite3").validate()
+    ServerConfig(job_db="/tmp/jobs.sqlite3", job_root="/tmp/jobs").validate()
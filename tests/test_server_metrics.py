@@ -0,0 +1,79 @@
+"""/metrics histograms: queue wait, per-stage time, audio seconds, RTF."""
+
+from __future__ import annotations
+
+import re
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from transcribe_anything.server_app import ServerConfig, create_app
+from transcribe_anything.server_metrics import Histogram
+
+
+def _series(body: str, name: str) -> dict:
+    """``{label string: value}`` for every sample of ``name``."""
+    out = {}
+    for match in re.finditer(rf"^{re.escape(name)}\{{(.*)\}} (\S+)$", body, re.MULTILINE):
+        out[match.group(1)] = float(match.group(2))
+    return out
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    hist = Histogram("h", "help", ("device",), (1.0, 5.0))
+    for value in (0.5, 2.0, 10.0):
+        hist.observe(value, device="cpu")
+    lines = hist.render()
+    assert 'h_bucket{device="cpu",le="1.0"} 1' in lines
+    assert 'h_bucket{device="cpu",le="5.0"} 2' in lines
+    assert 'h_bucket{device="cpu",le="+Inf"} 3' in lines
+    assert 'h_sum{device="cpu"} 12.5' in lines
+    assert 'h_count{device="cpu"} 3' in lines
+
+
+def test_job_histograms_are_labelled_and_fed_from_the_run(tmp_path: Path) -> None:
+    def transcribe(*, output_dir: str, progress_callback, stage_callback, **_kwargs) -> str:
+        stage_callback("fetch", 0.2)
+        progress_callback(0.0, 120.0)
+        stage_callback("inference", 3.0)
+        progress_callback(120.0, 120.0)
+        stage_callback("postprocess", 0.05)
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    cfg = ServerConfig(model="tiny", device="cpu", job_root=str(tmp_path))
+    app = create_app(cfg, transcribe_fn=transcribe)
+    with TestClient(app) as client:
+        job_id = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()["job_id"]
+        deadline = time.time() + 5
+        while client.get(f"/v1/jobs/{job_id}").json()["status"] != "completed" and time.time() < deadline:
+            time.sleep(0.02)
+        assert client.get(f"/v1/jobs/{job_id}").json()["audio_seconds"] == 120.0
+        body = client.get("/metrics").text
+
+    labels = 'device="cpu",model="tiny"'
+    assert "# TYPE transcribe_anything_job_queue_wait_seconds histogram" in body
+    assert _series(body, "transcribe_anything_job_queue_wait_seconds_count") == {labels: 1.0}
+    assert _series(body, "transcribe_anything_job_run_seconds_count") == {labels: 1.0}
+    stages = _series(body, "transcribe_anything_job_stage_seconds_sum")
+    assert stages == {f'{labels},stage="fetch"': 0.2, f'{labels},stage="inference"': 3.0, f'{labels},stage="postprocess"': 0.05}
+    assert _series(body, "transcribe_anything_job_audio_seconds_sum") == {labels: 120.0}
+    rtf = _series(body, "transcribe_anything_job_rtf_bucket")
+    # The fake finished in well under a second for 120 s of audio.
+    assert rtf[f'{labels},le="0.01"'] == 1.0
+
+
+def test_failed_jobs_record_queue_wait_only(tmp_path: Path) -> None:
+    def failing(**_kwargs) -> str:
+        raise RuntimeError("boom")
+
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path)), transcribe_fn=failing)
+    with TestClient(app) as client:
+        job_id = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"}).json()["job_id"]
+        deadline = time.time() + 5
+        while client.get(f"/v1/jobs/{job_id}").json()["status"] != "failed" and time.time() < deadline:
+            time.sleep(0.02)
+        body = client.get("/metrics").text
+    assert _series(body, "transcribe_anything_job_queue_wait_seconds_count") == {'device="auto",model="tiny"': 1.0}
+    assert _series(body, "transcribe_anything_job_run_seconds_count") == {}
@@ -0,0 +1,154 @@
+"""Daemon input prefetch (``--fetch-ahead``): overlap fetch with inference within a scratch budget."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything.server_config import JobStatus, JobStore, ServerConfig
+from transcribe_anything.server_prefetch import InputPrefetcher
+
+
+def _wait_done(store: JobStore, job_ids: list, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if all(store.get(j).status in (JobStatus.COMPLETED, JobStatus.FAILED) for j in job_ids):
+            return
+        time.sleep(0.01)
+    raise AssertionError("jobs did not finish")
+
+
+def test_queued_jobs_are_fetched_while_the_current_one_runs(tmp_path: Path) -> None:
+    seen: dict = {}
+
+    def fetch(url_or_file: str, wav_path: str) -> None:
+        time.sleep(0.2)
+        Path(wav_path).write_bytes(b"RIFF" + url_or_file.encode())
+
+    def transcribe(*, url_or_file: str, fetched_wav: Any = None, **_kwargs) -> str:
+        if fetched_wav is None:
+            time.sleep(0.2)  # the inline fetch
+        else:
+            seen[url_or_file] = Path(fetched_wav).read_bytes()
+        time.sleep(0.2)
+        return ""
+
+    cfg = ServerConfig(fetch_ahead=2, job_root=str(tmp_path))
+    store = JobStore(cfg, transcribe_fn=transcribe, worker_devices=[None], fetch_fn=fetch)
+    store.start()
+    try:
+        t0 = time.monotonic()
+        jobs = [store.submit({"input": f"https://example.com/{i}.mp3"}, str(tmp_path / f"ta-job-{i}")) for i in range(4)]
+        _wait_done(store, [j.job_id for j in jobs])
+        elapsed = time.monotonic() - t0
+        stages = store.metrics.stage.snapshot()
+    finally:
+        store.stop(timeout=5)
+    assert all(store.get(j.job_id).status == JobStatus.COMPLETED for j in jobs)
+    # Every input after the first had its audio ready when its turn came.
+    assert set(seen) >= {f"https://example.com/{i}.mp3" for i in range(1, 4)}
+    assert seen["https://example.com/3.mp3"] == b"RIFFhttps://example.com/3.mp3"
+    # Serial would be 4 x (0.2 fetch + 0.2 inference) = 1.6 s.
+    assert elapsed < 1.3
+    fetch_series = [v for k, v in stages.items() if k[-1] == "fetch"]
+    assert sum(s["count"] for s in fetch_series) == len(seen)
+    # Scratch files are removed once their job has run.
+    assert not list((tmp_path / "_prefetch").glob("*.wav"))
+
+
+def test_scratch_budget_bounds_what_is_held(tmp_path: Path) -> None:
+    calls: list = []
+
+    def fetch(url_or_file: str, wav_path: str) -> None:
+        Path(wav_path).write_bytes(b"x" * 100)
+        calls.append(url_or_file)
+
+    upcoming = [("a", "a.mp3")]
+    prefetcher = InputPrefetcher(fetch, lambda: list(upcoming), ahead=3, budget_bytes=100, scratch_dir=tmp_path / "scratch")
+    try:
+        prefetcher.schedule()
+        deadline = time.time() + 5
+        while prefetcher.held_bytes() < 100 and time.time() < deadline:
+            time.sleep(0.01)
+        # The first fetch filled the budget; the rest wait for it to be released.
+        upcoming.extend([("b", "b.mp3"), ("c", "c.mp3")])
+        prefetcher.schedule()
+        time.sleep(0.05)
+        assert calls == ["a.mp3"]
+        upcoming.pop(0)
+        path, _seconds = prefetcher.claim("a")
+        assert Path(path).read_bytes() == b"x" * 100
+        prefetcher.release("a")
+        assert not Path(path).exists()
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # "b" is expected to be as big as "a", so "c" still waits.
+        assert calls == ["a.mp3", "b.mp3"]
+    finally:
+        prefetcher.close()
+    assert not (tmp_path / "scratch").exists()
+
+
+def test_failed_prefetch_falls_back_to_an_inline_fetch(tmp_path: Path) -> None:
+    kwargs_seen: list = []
+    gate = threading.Event()
+
+    def fetch(url_or_file: str, wav_path: str) -> None:
+        raise RuntimeError("yt-dlp: 403")
+
+    def transcribe(**kwargs) -> str:
+        gate.wait(5)
+        kwargs_seen.append(kwargs)
+        return ""
+
+    store = JobStore(ServerConfig(fetch_ahead=1), transcribe_fn=transcribe, worker_devices=[None], fetch_fn=fetch)
+    store.start()
+    try:
+        jobs = [store.submit({"input": f"{i}.mp3"}, str(tmp_path / f"d{i}")) for i in range(2)]
+        time.sleep(0.1)
+        gate.set()
+        _wait_done(store, [j.job_id for j in jobs])
+    finally:
+        store.stop(timeout=5)
+    assert [store.get(j.job_id).status for j in jobs] == [JobStatus.COMPLETED, JobStatus.COMPLETED]
+    assert all("fetched_wav" not in kw for kw in kwargs_seen)
+
+
+def test_disabled_by_default_keeps_transcribe_kwargs(tmp_path: Path) -> None:
+    kwargs_seen: list = []
+    store = JobStore(ServerConfig(), transcribe_fn=lambda **kw: kwargs_seen.append(kw) or "", worker_devices=[None])
+    store.start()
+    try:
+        job = store.submit({"input": "a.mp3"}, str(tmp_path))
+        _wait_done(store, [job.job_id])
+    finally:
+        store.stop(timeout=5)
+    assert "fetched_wav" not in kwargs_seen[0]
+
+
+def test_api_transcribe_uses_a_fetched_wav(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import api
+
+    wav = tmp_path / "prefetched.wav"
+    wav.write_bytes(b"RIFF")
+    used: list = []
+
+    def no_fetch(*_args, **_kwargs) -> None:
+        raise AssertionError("fetched_wav must skip the fetch stage")
+
+    def fake_transcribe_wav(_url_or_file, tmp_wav, output_dir, **_kwargs) -> str:
+        used.append(tmp_wav)
+        return output_dir
+
+    monkeypatch.setattr(api.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api, "fetch_audio", no_fetch)
+    monkeypatch.setattr(api, "_transcribe_wav", fake_transcribe_wav)
+    api.transcribe(url_or_file="https://example.com/a.mp3", output_dir=str(tmp_path / "out"), fetched_wav=str(wav))
+    assert used == [str(wav)]
+    # The caller owns the file.
+    assert wav.exists()
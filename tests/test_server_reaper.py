@@ -0,0 +1,70 @@
+"""Artifact reaper: TTL expiry and the job-root byte quota."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from transcribe_anything.server_config import Job, JobStatus, JobStore, ServerConfig
+
+
+def _add_job(store: JobStore, tmp_path: Path, name: str, status: JobStatus, completed_at, size: int = 0) -> Job:
+    artifact_dir = tmp_path / f"ta-job-{name}"
+    artifact_dir.mkdir()
+    if size:
+        (artifact_dir / "out.json").write_bytes(b"x" * size)
+    job = Job(job_id=name, status=status, request={"input": name}, artifact_dir=str(artifact_dir), created_at=0.0, completed_at=completed_at)
+    with store._lock:  # pylint: disable=protected-access
+        store._jobs[name] = job  # pylint: disable=protected-access
+    return job
+
+
+def test_ttl_expires_only_finished_jobs(tmp_path: Path) -> None:
+    store = JobStore(ServerConfig(artifact_ttl_seconds=100), transcribe_fn=lambda **_: "")
+    _add_job(store, tmp_path, "old_done", JobStatus.COMPLETED, 1000.0)
+    _add_job(store, tmp_path, "old_failed", JobStatus.FAILED, 1000.0)
+    _add_job(store, tmp_path, "fresh", JobStatus.COMPLETED, 1950.0)
+    _add_job(store, tmp_path, "running", JobStatus.RUNNING, None)
+    _add_job(store, tmp_path, "queued", JobStatus.QUEUED, None)
+
+    assert store.reap(now=2000.0) == {"ttl": 2, "quota": 0}
+
+    assert store.get("old_done") is None and store.get("old_failed") is None
+    assert not (tmp_path / "ta-job-old_done").exists()
+    for name in ("fresh", "running", "queued"):
+        assert store.get(name) is not None
+        assert (tmp_path / f"ta-job-{name}").is_dir()
+    assert store.snapshot_metrics()["reaped_lifetime"] == {"ttl": 2, "quota": 0}
+
+
+def test_ttl_zero_keeps_jobs(tmp_path: Path) -> None:
+    store = JobStore(ServerConfig(artifact_ttl_seconds=0), transcribe_fn=lambda **_: "")
+    _add_job(store, tmp_path, "ancient", JobStatus.COMPLETED, 1.0)
+    assert store.reap(now=1e9) == {"ttl": 0, "quota": 0}
+    assert store.get("ancient") is not None
+
+
+def test_quota_evicts_oldest_finished_first(tmp_path: Path) -> None:
+    store = JobStore(ServerConfig(artifact_ttl_seconds=0, max_job_root_bytes=2500), transcribe_fn=lambda **_: "")
+    _add_job(store, tmp_path, "oldest", JobStatus.COMPLETED, 10.0, size=1000)
+    _add_job(store, tmp_path, "middle", JobStatus.FAILED, 20.0, size=1000)
+    _add_job(store, tmp_path, "newest", JobStatus.COMPLETED, 30.0, size=1000)
+    _add_job(store, tmp_path, "running", JobStatus.RUNNING, None, size=1000)
+
+    assert store.reap(now=100.0) == {"ttl": 0, "quota": 2}
+    assert store.get("oldest") is None and store.get("middle") is None
+    assert store.get("newest") is not None and store.get("running") is not None
+
+
+def test_reaper_thread_runs_in_background(tmp_path: Path) -> None:
+    store = JobStore(ServerConfig(artifact_ttl_seconds=1, reaper_interval_seconds=0.05), transcribe_fn=lambda **_: "")
+    _add_job(store, tmp_path, "done", JobStatus.COMPLETED, time.time() - 5)
+    store.start()
+    try:
+        deadline = time.time() + 5
+        while store.get("done") is not None and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        store.stop(timeout=5)
+    assert store.get("done") is None
+    assert not (tmp_path / "ta-job-done").exists()
@@ -0,0 +1,251 @@
+"""Resumable uploads: /v1/uploads sessions and the client's ranged, resuming uploader."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from transcribe_anything import client as client_mod
+from transcribe_anything.client import transcribe_remote, transcribe_remote_async
+from transcribe_anything.server_app import ServerConfig, create_app
+from transcribe_anything.server_config import QueueFull
+from transcribe_anything.server_uploads import UploadStore, missing_ranges
+
+PAYLOAD = bytes(range(256)) * 400  # 102400 bytes
+
+
+def _fake_transcribe(*, url_or_file: str, output_dir: str, **_kwargs) -> str:
+    (Path(output_dir) / "out.txt").write_text(str(Path(url_or_file).stat().st_size), encoding="utf-8")
+    return output_dir
+
+
+def _wait(client: TestClient, job_id: str) -> dict:
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        body = client.get(f"/v1/jobs/{job_id}").json()
+        if body["status"] in ("completed", "failed"):
+            return body
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+def _put(client: TestClient, upload_id: str, start: int, end: int, size: int = len(PAYLOAD)):
+    return client.put(f"/v1/uploads/{upload_id}", content=PAYLOAD[start:end], headers={"Content-Range": f"bytes {start}-{end - 1}/{size}"})
+
+
+@pytest.fixture
+def app(tmp_path: Path):
+    return create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_fake_transcribe)
+
+
+def test_missing_ranges() -> None:
+    assert missing_ranges([], 10) == [[0, 10]]
+    assert missing_ranges([[4, 6], [0, 2], [2, 3]], 10) == [[3, 4], [6, 10]]
+    assert missing_ranges([[0, 10]], 10) == []
+
+
+def test_out_of_order_ranges_finalize_into_a_job(app) -> None:
+    with TestClient(app) as client:
+        created = client.post("/v1/uploads", json={"filename": "a.wav", "size": len(PAYLOAD), "options": {"language": "en"}})
+        assert created.status_code == 201, created.text
+        upload_id = created.json()["upload_id"]
+
+        assert _put(client, upload_id, 60000, len(PAYLOAD)).status_code == 200
+        assert _put(client, upload_id, 0, 30000).status_code == 200
+        status = client.get(f"/v1/uploads/{upload_id}").json()
+        assert status["offset"] == 30000
+        assert status["missing"] == [[30000, 60000]]
+        assert client.post(f"/v1/uploads/{upload_id}/finalize").status_code == 409
+
+        assert _put(client, upload_id, 30000, 60000).json()["complete"] is True
+        final = client.post(f"/v1/uploads/{upload_id}/finalize")
+        assert final.status_code == 202, final.text
+        job = _wait(client, final.json()["job_id"])
+        assert client.get(f"/v1/uploads/{upload_id}").status_code == 404
+    assert job["status"] == "completed"
+    assert job["input_sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_bad_ranges_are_rejected(app) -> None:
+    with TestClient(app) as client:
+        upload_id = client.post("/v1/uploads", json={"filename": "a.wav", "size": 100}).json()["upload_id"]
+        assert client.put(f"/v1/uploads/{upload_id}", content=b"x").status_code == 400
+        assert _put(client, upload_id, 0, 10, size=999).status_code == 416
+        assert _put(client, upload_id, 95, 105, size=100).status_code == 416
+        short = client.put(f"/v1/uploads/{upload_id}", content=b"abc", headers={"Content-Range": "bytes 0-9/100"})
+        assert short.status_code == 400
+        assert client.put("/v1/uploads/nope", content=b"x", headers={"Content-Range": "bytes 0-0/100"}).status_code == 404
+        assert client.post("/v1/uploads", json={"filename": "a.wav", "size": 0}).status_code == 400
+
+
+def test_queue_full_keeps_the_upload(tmp_path: Path, monkeypatch) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path / "jobs")), transcribe_fn=_fake_transcribe)
+    store = app.state.store
+    real_submit = store.submit
+
+    def full(*_args, **_kwargs):
+        raise QueueFull("queue full")
+
+    with TestClient(app) as client:
+        upload_id = client.post("/v1/uploads", json={"filename": "a.wav", "size": len(PAYLOAD)}).json()["upload_id"]
+        _put(client, upload_id, 0, len(PAYLOAD))
+        monkeypatch.setattr(store, "submit", full)
+        assert client.post(f"/v1/uploads/{upload_id}/finalize").status_code == 429
+        assert client.get(f"/v1/uploads/{upload_id}").json()["complete"] is True
+        monkeypatch.setattr(store, "submit", real_submit)
+        final = client.post(f"/v1/uploads/{upload_id}/finalize")
+        assert final.status_code == 202
+        assert _wait(client, final.json()["job_id"])["input_sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+    assert not [p for p in (tmp_path / "jobs").glob("ta-job-*") if not any(p.iterdir())]
+
+
+def test_sessions_survive_a_store_reload(tmp_path: Path) -> None:
+    store = UploadStore(tmp_path, max_upload_size_bytes=1 << 20)
+    session = store.create("a.wav", 10)
+    store.write_range(session.upload_id, 0, b"01234")
+    reloaded = UploadStore(tmp_path, max_upload_size_bytes=1 << 20).get(session.upload_id)
+    assert reloaded is not None and reloaded.offset == 5
+
+
+def test_interrupted_range_is_not_recorded(tmp_path: Path) -> None:
+    store = UploadStore(tmp_path, max_upload_size_bytes=1 << 20)
+    session = store.create("a.wav", 10)
+    writer = store.open_range(session.upload_id, 0, 10)
+    writer.write(b"0123")
+    writer.close()
+    assert store.get(session.upload_id).received == []
+    writer = store.open_range(session.upload_id, 0, 10)
+    writer.write(b"01234")
+    writer.write(b"56789")
+    assert writer.commit().complete
+
+
+def test_put_racing_finalize_gets_409(app) -> None:
+    with TestClient(app) as client:
+        upload_id = client.post("/v1/uploads", json={"filename": "a.wav", "size": len(PAYLOAD)}).json()["upload_id"]
+        assert _put(client, upload_id, 0, 1000).status_code == 200
+        uploads = app.state.uploads
+        # finalize() has claimed the session ...
+        uploads._finalizing.add(upload_id)  # pylint: disable=protected-access
+        assert _put(client, upload_id, 1000, 2000).status_code == 409
+        uploads._finalizing.discard(upload_id)  # pylint: disable=protected-access
+        # ... or has already moved data.part into the job dir.
+        (uploads.root / upload_id / "data.part").unlink()
+        assert _put(client, upload_id, 1000, 2000).status_code == 409
+
+
+def test_unknown_delete_does_not_touch_disk(tmp_path: Path) -> None:
+    victim = tmp_path / "keep"
+    victim.mkdir()
+    store = UploadStore(tmp_path / "_uploads", max_upload_size_bytes=1 << 20)
+    assert store.delete("../keep") is False
+    assert victim.is_dir()
+
+
+def test_open_sessions_and_reserved_bytes_are_capped(tmp_path: Path) -> None:
+    config = ServerConfig(model="tiny", job_root=str(tmp_path / "jobs"), max_upload_sessions=2, max_upload_reserved_bytes=1000)
+    with TestClient(create_app(config, transcribe_fn=_fake_transcribe)) as client:
+        first = client.post("/v1/uploads", json={"filename": "a.wav", "size": 600}).json()["upload_id"]
+        assert client.post("/v1/uploads", json={"filename": "b.wav", "size": 600}).status_code == 507
+        assert client.post("/v1/uploads", json={"filename": "b.wav", "size": 300}).status_code == 201
+        assert client.post("/v1/uploads", json={"filename": "c.wav", "size": 1}).status_code == 429
+        # Deleting a session gives its reservation back.
+        assert client.delete(f"/v1/uploads/{first}").status_code == 204
+        assert client.post("/v1/uploads", json={"filename": "c.wav", "size": 600}).status_code == 201
+    assert len(list((tmp_path / "jobs" / "_uploads").iterdir())) == 2
+
+
+def test_reaper_expires_idle_upload_sessions(tmp_path: Path) -> None:
+    config = ServerConfig(model="tiny", job_root=str(tmp_path / "jobs"), artifact_ttl_seconds=60, reaper_interval_seconds=0.05)
+    app = create_app(config, transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        upload_id = client.post("/v1/uploads", json={"filename": "a.wav", "size": 100}).json()["upload_id"]
+        app.state.uploads.get(upload_id).updated_at -= 120
+        deadline = time.time() + 5
+        while app.state.uploads.get(upload_id) is not None and time.time() < deadline:
+            time.sleep(0.02)
+        assert client.get(f"/v1/uploads/{upload_id}").status_code == 404
+    assert not (tmp_path / "jobs" / "_uploads" / upload_id).exists()
+
+
+def test_client_resumes_after_dropped_ranges(app, tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "audio.wav"
+    src.write_bytes(PAYLOAD)
+    drops = {"left": 3}
+
+    class FlakyClient(TestClient):
+        def put(self, *args, **kwargs):  # pylint: disable=arguments-differ
+            if drops["left"] > 0:
+                drops["left"] -= 1
+                raise httpx.ConnectError("connection reset")
+            return super().put(*args, **kwargs)
+
+    def factory(*_args, **kwargs):
+        return FlakyClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    monkeypatch.setattr(client_mod, "_backoff_seconds", lambda _attempt: 0.0)
+    out_dir = tmp_path / "out"
+    transcribe_remote(
+        url_or_file=str(src),
+        remote="http://testserver",
+        output_dir=str(out_dir),
+        poll_interval_seconds=0.01,
+        resumable=True,
+        upload_chunk_bytes=16 * 1024,
+        upload_parallelism=3,
+    )
+    assert drops["left"] == 0
+    assert (out_dir / "out.txt").read_text(encoding="utf-8") == str(len(PAYLOAD))
+
+
+def test_client_auto_mode_uses_capabilities(app, tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "audio.wav"
+    src.write_bytes(PAYLOAD)
+    seen: list = []
+
+    class RecordingClient(TestClient):
+        def post(self, url, *args, **kwargs):  # pylint: disable=arguments-differ
+            seen.append(str(url))
+            return super().post(url, *args, **kwargs)
+
+    def factory(*_args, **kwargs):
+        return RecordingClient(app, base_url="http://testserver", headers=kwargs.get("headers") or {})
+
+    monkeypatch.setattr(client_mod.httpx, "Client", factory)
+    monkeypatch.setattr(client_mod, "RESUMABLE_THRESHOLD_BYTES", 1024)
+    transcribe_remote(url_or_file=str(src), remote="http://testserver", output_dir=str(tmp_path / "out"), poll_interval_seconds=0.01)
+    assert any(url.endswith("/v1/uploads") for url in seen)
+    assert not any(url.endswith("/v1/transcribe") for url in seen)
+
+
+def test_async_client_uploads_ranges_in_parallel(app, tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "audio.wav"
+    src.write_bytes(PAYLOAD)
+    transport = httpx.ASGITransport(app=app)
+    real_async_client = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        kwargs.setdefault("transport", transport)
+        return real_async_client(*args, **kwargs)
+
+    monkeypatch.setattr(client_mod.httpx, "AsyncClient", factory)
+    out_dir = tmp_path / "out"
+    with TestClient(app):  # runs the app's lifespan (job worker)
+        asyncio.run(
+            transcribe_remote_async(
+                url_or_file=str(src),
+                remote="http://testserver",
+                output_dir=str(out_dir),
+                poll_interval_seconds=0.01,
+                resumable=True,
+                upload_chunk_bytes=10_000,
+            )
+        )
+    assert (out_dir / "out.txt").read_text(encoding="utf-8") == str(len(PAYLOAD))
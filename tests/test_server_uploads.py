@@ -0,0 +1,124 @@
+"""Upload path of POST /v1/transcribe: off-loop copy, SHA-256, size limit."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from transcribe_anything import server_app as srv
+from transcribe_anything.server_app import ServerConfig, create_app
+from transcribe_anything.server_jobdb import JobDatabase
+
+
+def _fake_transcribe(*, url_or_file: str, output_dir: str, **_kwargs) -> str:
+    (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+    return output_dir
+
+
+def _post_file(client: TestClient, data: bytes):
+    return client.post("/v1/transcribe", files={"file": ("audio.wav", data, "audio/wav")}, data={"options": json.dumps({"language": "en"})})
+
+
+def _wait(client: TestClient, job_id: str) -> dict:
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        body = client.get(f"/v1/jobs/{job_id}").json()
+        if body["status"] in ("completed", "failed"):
+            return body
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+def test_upload_digest_is_recorded_on_the_job(tmp_path: Path) -> None:
+    payload = b"RIFF" + bytes(range(256)) * 5000
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path)), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        resp = _post_file(client, payload)
+        assert resp.status_code == 202, resp.text
+        final = _wait(client, resp.json()["job_id"])
+    assert final["status"] == "completed"
+    assert final["input_sha256"] == hashlib.sha256(payload).hexdigest()
+
+
+def test_url_jobs_have_no_digest(tmp_path: Path) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path)), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        resp = client.post("/v1/transcribe", json={"url": "https://example.com/a.mp3"})
+        assert _wait(client, resp.json()["job_id"])["input_sha256"] is None
+
+
+def test_oversized_upload_is_rejected_and_cleaned_up(tmp_path: Path) -> None:
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path), max_upload_size_bytes=1000), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        resp = _post_file(client, b"x" * 5000)
+    assert resp.status_code == 413
+    assert not list(tmp_path.glob("ta-job-*"))
+
+
+def test_upload_copy_runs_off_the_event_loop(tmp_path: Path, monkeypatch) -> None:
+    real_feed = srv._MultipartUpload.feed
+    seen: set = set()
+
+    def checking_feed(self, chunk):
+        try:
+            asyncio.get_running_loop()
+            seen.add(True)
+        except RuntimeError:
+            seen.add(False)
+        return real_feed(self, chunk)
+
+    monkeypatch.setattr(srv._MultipartUpload, "feed", checking_feed)
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path)), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        assert _post_file(client, b"RIFFdata").status_code == 202
+    assert seen == {False}
+
+
+def test_upload_is_streamed_to_the_job_dir(tmp_path: Path, monkeypatch) -> None:
+    # The body must not be spooled by request.form() before being copied.
+    async def no_form(self, *args, **kwargs):
+        raise AssertionError("request.form() should not be used for uploads")
+
+    monkeypatch.setattr(srv.Request, "form", no_form)
+    payload = bytes(range(256)) * 4000
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path)), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        resp = _post_file(client, payload)
+        assert resp.status_code == 202, resp.text
+        job = app.state.store.get(resp.json()["job_id"])
+    assert Path(job.request["input"]).name == "audio.wav"
+    assert Path(job.request["input"]).read_bytes() == payload
+    assert job.request["language"] == "en"
+
+
+def test_oversized_content_length_is_rejected_before_reading(tmp_path: Path, monkeypatch) -> None:
+    def refuse(*_args, **_kwargs):
+        raise AssertionError("the body should not be parsed")
+
+    monkeypatch.setattr(srv, "_MultipartUpload", refuse)
+    app = create_app(ServerConfig(model="tiny", job_root=str(tmp_path), max_upload_size_bytes=1000), transcribe_fn=_fake_transcribe)
+    with TestClient(app) as client:
+        resp = _post_file(client, b"x" * (1000 + srv._MULTIPART_OVERHEAD_BYTES + 1))
+    assert resp.status_code == 413
+    assert not list(tmp_path.glob("ta-job-*"))
+
+
+def test_job_db_gains_digest_column_in_place(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL, artifact_dir TEXT NOT NULL, "
+        "created_at REAL NOT NULL, started_at REAL, completed_at REAL, error TEXT, artifacts TEXT NOT NULL, worker INTEGER, device_id TEXT)"
+    )
+    conn.execute("INSERT INTO jobs VALUES ('a', 'completed', '{}', '/tmp/a', 1.0, NULL, NULL, NULL, '[]', NULL, NULL)")
+    conn.commit()
+    conn.close()
+    (job,) = JobDatabase(path).load_all()
+    assert job.job_id == "a"
+    assert job.input_sha256 is None
@@ -0,0 +1,141 @@
+"""Daemon worker slots: pool sizing, device pinning and metrics consistency.
+
+Drives :class:`JobStore` directly with a sleep-based fake ``transcribe_fn``
+so no backend, GPU or HTTP layer is involved.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from transcribe_anything.server_config import (
+    JobStatus,
+    JobStore,
+    QueueFull,
+    ServerConfig,
+    resolve_worker_devices,
+)
+
+
+class _SleepyTranscribe:
+    """Sleeps per job and records the peak concurrency and the devices it saw."""
+
+    def __init__(self, seconds: float = 0.2) -> None:
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.devices: list = []
+
+    def __call__(self, *, url_or_file: str, output_dir: str, **kwargs) -> str:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.devices.append(kwargs.get("device_id"))
+        try:
+            time.sleep(self.seconds)
+            out = Path(output_dir)
+            out.mkdir(parents=True, exist_ok=True)
+            (out / "out.txt").write_text(url_or_file, encoding="utf-8")
+            return str(out)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def _wait_terminal(store: JobStore, job_ids: list, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if all(store.get(j).status in (JobStatus.COMPLETED, JobStatus.FAILED) for j in job_ids):
+            return
+        time.sleep(0.02)
+    raise AssertionError("jobs did not finish")
+
+
+def test_resolve_worker_devices() -> None:
+    gpus = lambda: ["0", "1"]  # noqa: E731
+    assert resolve_worker_devices(ServerConfig(workers=1), gpus) == [None]
+    assert resolve_worker_devices(ServerConfig(workers=0), gpus) == ["0", "1"]
+    assert resolve_worker_devices(ServerConfig(workers=3), gpus) == ["0", "1", "0"]
+    assert resolve_worker_devices(ServerConfig(workers=0), lambda: []) == [None]
+    assert resolve_worker_devices(ServerConfig(workers=2, device="cpu"), gpus) == [None, None]
+
+
+def test_serverconfig_rejects_negative_workers() -> None:
+    with pytest.raises(ValueError):
+        ServerConfig(workers=-1).validate()
+
+
+def test_slots_run_jobs_concurrently_pinned_to_devices(tmp_path: Path) -> None:
+    fake = _SleepyTranscribe(seconds=0.3)
+    store = JobStore(ServerConfig(max_queue=8), transcribe_fn=fake, worker_devices=["0", "1"])
+    store.start()
+    try:
+        jobs = [store.submit({"input": f"https://x/{i}"}, str(tmp_path / f"job{i}")) for i in range(4)]
+        _wait_terminal(store, [j.job_id for j in jobs])
+    finally:
+        store.stop(timeout=5)
+
+    assert fake.peak == 2
+    assert sorted(fake.devices) == ["0", "0", "1", "1"]
+    assert {store.get(j.job_id).device_id for j in jobs} == {"0", "1"}
+    assert {store.get(j.job_id).worker for j in jobs} == {0, 1}
+    snap = store.snapshot_metrics()
+    assert snap["workers"] == 2
+    assert snap["in_flight"] == 0
+    assert snap["queued_now"] == 0
+    assert snap["counts_lifetime"] == {"queued": 4, "running": 4, "completed": 4, "failed": 0}
+    # Histograms are labelled with the slot's card, not the daemon-wide device.
+    run_counts = [line for line in store.metrics.render() if line.startswith("transcribe_anything_job_run_seconds_count")]
+    assert sorted(run_counts) == [
+        'transcribe_anything_job_run_seconds_count{device="cuda:0",model="small"} 2',
+        'transcribe_anything_job_run_seconds_count{device="cuda:1",model="small"} 2',
+    ]
+
+
+def test_single_slot_does_not_pass_device_id(tmp_path: Path) -> None:
+    fake = _SleepyTranscribe(seconds=0.0)
+    store = JobStore(ServerConfig(), transcribe_fn=fake)
+    store.start()
+    try:
+        job = store.submit({"input": "https://x"}, str(tmp_path / "job"))
+        _wait_terminal(store, [job.job_id])
+    finally:
+        store.stop(timeout=5)
+    assert fake.devices == [None]
+    assert store.get(job.job_id).worker == 0
+
+
+def test_transcribe_fn_without_callbacks_still_runs(tmp_path: Path) -> None:
+    seen: list = []
+
+    def old_style(*, url_or_file, output_dir, model, task, language, device, hugging_face_token, other_args, initial_prompt, align, align_model) -> str:
+        seen.append(url_or_file)
+        (Path(output_dir) / "out.txt").write_text("ok", encoding="utf-8")
+        return output_dir
+
+    store = JobStore(ServerConfig(), transcribe_fn=old_style)
+    store.start()
+    try:
+        (tmp_path / "job").mkdir()
+        job = store.submit({"input": "https://x"}, str(tmp_path / "job"))
+        _wait_terminal(store, [job.job_id])
+    finally:
+        store.stop(timeout=5)
+    assert store.get(job.job_id).status == JobStatus.COMPLETED, store.get(job.job_id).error
+    assert seen == ["https://x"]
+
+
+def test_rejected_submit_is_not_counted(tmp_path: Path) -> None:
+    store = JobStore(ServerConfig(max_queue=1), transcribe_fn=_SleepyTranscribe(), worker_devices=[None])
+    # Not started: the queue fills without draining.
+    store.submit({"input": "a"}, str(tmp_path / "a"))
+    with pytest.raises(QueueFull):
+        store.submit({"input": "b"}, str(tmp_path / "b"))
+    snap = store.snapshot_metrics()
+    assert snap["counts_lifetime"]["queued"] == 1
+    assert snap["queued_now"] == 1
@@ -0,0 +1,56 @@
+"""Streaming artifacts.zip: valid archive, STORED media, bounded memory."""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+from transcribe_anything.server_config import iter_artifacts_zip
+
+BIG_BYTES = 48 * 1024 * 1024
+
+
+def test_zip_stream_round_trips_and_stores_media(tmp_path: Path) -> None:
+    srt = tmp_path / "out.srt"
+    srt.write_text("1\n00:00:00,000 --> 00:00:01,000\nhello\n" * 200, encoding="utf-8")
+    mp4 = tmp_path / "out.mp4"
+    mp4.write_bytes(os.urandom(300_000))
+
+    archive = tmp_path / "bundle.zip"
+    with archive.open("wb") as fh:
+        for chunk in iter_artifacts_zip([srt, mp4], chunk_size=64 * 1024):
+            fh.write(chunk)
+
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("out.srt").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("out.mp4").compress_type == zipfile.ZIP_STORED
+        assert zf.read("out.mp4") == mp4.read_bytes()
+        assert zf.read("out.srt") == srt.read_bytes()
+
+
+def test_zip_stream_memory_is_bounded_for_large_artifact(tmp_path: Path) -> None:
+    big = tmp_path / "out.mp4"
+    with big.open("wb") as fh:
+        block = os.urandom(1024 * 1024)
+        for _ in range(BIG_BYTES // len(block)):
+            fh.write(block)
+    del block
+
+    total = 0
+    chunks = 0
+    tracemalloc.start()
+    try:
+        for chunk in iter_artifacts_zip([big]):
+            total += len(chunk)
+            chunks += 1
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert total > BIG_BYTES
+    assert chunks > 100  # streamed, not produced in one piece
+    # A buffered archive would peak at well over BIG_BYTES.
+    assert peak < 4 * 1024 * 1024, f"peak {peak} bytes"
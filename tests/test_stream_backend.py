@@ -21,40 +21,19 @@ from transcribe_anything.server_config import ServerConfig, StreamSession
 
 
 def _install_fake_deps():
-    """Mount fake numpy / faster_whisper / silero_vad modules under sys.modules."""
+    """Mount fake faster_whisper / silero_vad modules under sys.modules.
 
-    class _FakeArr:
-        def __init__(self, data):
-            self.data = list(data)
-            self.size = len(self.data)
-
-        def __len__(self):
-            return len(self.data)
-
-        def __getitem__(self, sl):
-            return _FakeArr(self.data[sl])
-
-        def astype(self, _dtype):
-            return self
-
-        def __truediv__(self, _other):
-            return self
-
-    np = types.SimpleNamespace(
-        int16="int16",
-        float32="float32",
-        frombuffer=lambda b, dtype: _FakeArr(list(range(len(b) // 2))),
-        zeros=lambda n, dtype="float32": _FakeArr([0.0] * n),
-        concatenate=lambda arrs: _FakeArr([x for a in arrs for x in a.data]),
-    )
+    numpy stays real: the chunker converts and slices audio in place in a
+    preallocated buffer, which a stand-in can't model.
+    """
 
     class _FakeWhisperModel:
         def __init__(self, *a, **kw):
             self.calls: list = []
 
-        def transcribe(self, audio, language=None, beam_size=1, word_timestamps=False):
+        def transcribe(self, audio, language=None, beam_size=1, word_timestamps=False, initial_prompt=None):
             self.calls.append((audio.size if hasattr(audio, "size") else len(audio), language))
-            seg = types.SimpleNamespace(text=f" hello x{audio.size}")
+            seg = types.SimpleNamespace(start=0.0, end=audio.size / 16000, text=f" hello x{audio.size}")
             return iter([seg]), types.SimpleNamespace()
 
     faster_whisper_mod = types.SimpleNamespace(WhisperModel=_FakeWhisperModel)
@@ -78,18 +57,18 @@ def _install_fake_deps():
         load_silero_vad=lambda: object(),
     )
 
-    sys.modules["numpy"] = np  # type: ignore[assignment]
     sys.modules["faster_whisper"] = faster_whisper_mod  # type: ignore[assignment]
     sys.modules["silero_vad"] = silero_vad_mod  # type: ignore[assignment]
 
 
 def _uninstall_fake_deps():
-    for name in ("numpy", "faster_whisper", "silero_vad"):
+    for name in ("faster_whisper", "silero_vad"):
         sys.modules.pop(name, None)
 
 
 @pytest.fixture
 def fake_deps():
+    pytest.importorskip("numpy")
     _install_fake_deps()
     yield
     _uninstall_fake_deps()
@@ -229,3 +208,364 @@ def test_create_app_picks_faster_whisper_when_deps_available(fake_deps, tmp_path
     assert "metrics" in kinds
     assert kinds[0] == "metrics"
     assert received[0].get("backend") == "faster-whisper"
+
+
+# ----------------------------------------- shared decoder (--max-streams)
+
+
+class _BatchDecoder:
+    """Decoder fake that records how the service grouped its clips."""
+
+    def __init__(self) -> None:
+        self.batches: list = []
+
+    def transcribe_batch(self, audios, *, languages, prompts):
+        self.batches.append(list(audios))
+        return [[(0.0, 1.0, f"{audio}:{language}")] for audio, language in zip(audios, languages)]
+
+
+def test_decode_service_batches_pending_sessions_into_one_call() -> None:
+    import threading
+
+    from transcribe_anything.stream_backend import DecodeService
+
+    decoder = _BatchDecoder()
+    service = DecodeService(decoder, gather_seconds=2.0)
+    results: dict = {}
+    try:
+        for _ in range(3):
+            service.register()
+        threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, service.decode(f"clip{i}", language="en"))) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        stats = service.stats()
+    finally:
+        service.close()
+    # All three sessions had a decode pending, so the tick didn't wait out the gather window.
+    assert [sorted(b) for b in decoder.batches] == [["clip0", "clip1", "clip2"]]
+    assert results == {i: [(0.0, 1.0, f"clip{i}:en")] for i in range(3)}
+    assert stats["ticks"] == 1 and stats["largest_batch"] == 3
+
+
+def test_decode_service_falls_back_to_per_clip_and_reports_errors() -> None:
+    from transcribe_anything.stream_backend import DecodeService
+
+    class _Plain:
+        def transcribe(self, audio, *, language=None):
+            if audio == "bad":
+                raise RuntimeError("decoder exploded")
+            return audio.upper()
+
+    service = DecodeService(_Plain(), gather_seconds=0.0)
+    try:
+        assert service.decode("hi") == [(0.0, None, "HI")]
+        with pytest.raises(RuntimeError, match="exploded"):
+            service.decode("bad")
+    finally:
+        service.close()
+
+
+def test_concurrent_sessions_share_one_decoder(fake_deps) -> None:
+    import threading
+
+    from transcribe_anything.server_config import StreamCancelled
+    from transcribe_anything.stream_backend import (
+        SharedDecoders,
+        faster_whisper_streaming_fn,
+    )
+
+    decoder = _BatchDecoder()
+    built: list = []
+
+    def factory(model_size):
+        built.append(model_size)
+        return decoder
+
+    decoders = SharedDecoders(decoder_factory=factory, gather_seconds=0.5)
+    cfg = ServerConfig(model="small.en", stream_decode_interval_ms=10_000)
+    sessions = [StreamSession() for _ in range(2)]
+    events: dict = {0: [], 1: []}
+    # Audio flows once both sessions have registered with the service.
+    both_live = threading.Barrier(2)
+
+    def audio():
+        both_live.wait(5)
+        yield from [b"\x00" * 1024] * 4
+
+    def run(i: int) -> None:
+        sessions[i].acquire()
+        gen = faster_whisper_streaming_fn(audio(), session=sessions[i], config=cfg, hello={"type": "hello", "language": "en"}, decoders=decoders)
+        try:
+            for evt in gen:
+                events[i].append(evt)
+                if evt["type"] == "final":
+                    sessions[i].cancel()
+        except StreamCancelled:
+            pass
+
+    try:
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        stats = decoders.stats()
+    finally:
+        decoders.close()
+    assert built == ["small.en"]
+    assert [len(b) for b in decoder.batches] == [2]
+    for i in range(2):
+        assert [e["type"] for e in events[i]] == ["metrics", "final", "metrics"]
+        assert events[i][2]["latency"]["final"]["count"] == 1
+    assert stats["small.en"]["sessions"] == 0
+
+
+def test_max_streams_allows_that_many_sessions(tmp_path) -> None:
+    cfg = ServerConfig(model="small.en", allow_stream=True, max_streams=2, job_root=str(tmp_path / "jobs"))
+    app = create_app(cfg, streaming_fn=lambda *_a, **_kw: iter(()))
+    pool = app.state.stream_sessions
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not None and second is not None
+    assert pool.acquire() is None
+    first.record_decode("partial", 0.05)
+    with TestClient(app) as client:
+        assert client.get("/v1/capabilities").json()["max_streams"] == 2
+        streams = client.get("/v1/streams").json()["streams"]
+        assert "transcribe_anything_stream_sessions 2" in client.get("/metrics").text
+    assert {s["session_id"] for s in streams} == {first.session_id, second.session_id}
+    assert [s["latency"] for s in streams if s["session_id"] == first.session_id] == [{"partial": {"count": 1, "p50_ms": 50.0, "p95_ms": 50.0, "max_ms": 50.0}}]
+    pool.release(first)
+    assert pool.acquire() is not None
+
+
+# ----------------------------------------- prefix commitment
+
+
+def test_prefix_committer_commits_segments_agreed_twice() -> None:
+    from transcribe_anything.stream_backend import _PrefixCommitter
+
+    committer = _PrefixCommitter()
+    assert committer.update([(0.0, 1.0, " Hello there."), (1.0, 2.0, " How are")]) == (0.0, "Hello there. How are")
+    # "hello there how are" agree; only the first segment is wholly agreed.
+    assert committer.update([(0.0, 1.0, " Hello there!"), (1.0, 2.5, " How are you")]) == (1.0, "How are you")
+    assert committer.text == "Hello there!"
+    # The next decode covers only the audio after 1.0 s.
+    assert committer.update([(0.0, 1.5, " How are you doing")]) == (0.0, "How are you doing")
+    assert committer.update([(0.0, 1.5, " How are you doing?"), (1.5, None, " I")]) == (1.5, "I")
+    assert committer.text == "Hello there! How are you doing?"
+    assert committer.prompt == committer.text
+    committer.reset()
+    assert committer.text == ""
+
+
+class _WordDecoder:
+    """One word per 0.5 s of audio, numbered from the count of committed words in the prompt."""
+
+    def __init__(self) -> None:
+        self.sizes: list = []
+
+    def transcribe_segments(self, audio, *, language=None, prompt=None):
+        self.sizes.append(audio.size)
+        offset = len(prompt.split()) if prompt else 0
+        return [(k * 0.5, (k + 1) * 0.5, f" w{offset + k}") for k in range(audio.size // 8000)]
+
+
+class _Mic:
+    """Audio iterable that hands over 0.5 s per backend cycle, like the WS pumper."""
+
+    def __init__(self, cycles: int) -> None:
+        self.left = cycles
+
+    def __iter__(self):
+        if self.left > 0:
+            self.left -= 1
+            yield from [b"\x00" * 1000] * 16
+
+
+def test_partials_decode_a_bounded_window_during_a_long_utterance(fake_deps) -> None:
+    from transcribe_anything.server_config import StreamCancelled
+    from transcribe_anything.stream_backend import faster_whisper_streaming_fn
+
+    decoder = _WordDecoder()
+    mic = _Mic(cycles=30)  # 15 s without a VAD end after the first segment
+    session = StreamSession()
+    session.acquire()
+    cfg = ServerConfig(model="small.en", stream_decode_interval_ms=0)
+    partials: list = []
+    try:
+        for evt in faster_whisper_streaming_fn(mic, session=session, config=cfg, hello={"type": "hello"}, decoder=decoder):
+            if evt["type"] == "partial":
+                partials.append(evt["text"])
+            if mic.left == 0:
+                session.cancel()
+    except StreamCancelled:
+        pass
+    assert len(partials) >= 25
+    # Every tick decodes at most ~1.5 s, not the whole 15 s utterance.
+    assert max(decoder.sizes) <= 24000
+    words = partials[-1].split()
+    assert len(words) >= 25
+    assert words == [f"w{i}" for i in range(len(words))]
+
+
+# ----------------------------------------- forced cut at the max window
+
+
+@pytest.fixture
+def fake_models(monkeypatch):
+    """Like ``fake_deps``, but the VAD hears speech from the first window on and never an end."""
+    np = pytest.importorskip("numpy")
+
+    class _EndlessSpeech:
+        def __init__(self, *a, **kw):
+            self.calls = 0
+
+        def __call__(self, chunk, return_seconds=False):
+            self.calls += 1
+            return {"start": 0} if self.calls == 1 else None
+
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=object))
+    monkeypatch.setitem(sys.modules, "silero_vad", types.SimpleNamespace(VADIterator=_EndlessSpeech, load_silero_vad=lambda: object()))
+    return np
+
+
+def test_unbroken_speech_is_cut_at_the_quietest_point_with_overlap(fake_models) -> None:
+    from transcribe_anything.stream_backend import _VadChunker
+
+    np = fake_models
+    audio = np.full(16000 * 5, 0.5, dtype=np.float32)
+    audio[int(16000 * 2.5) : int(16000 * 2.5) + 640] = 0.0  # a near-silent spot 0.5 s before the 3 s limit
+    chunker = _VadChunker(max_window_seconds=3.0, overlap_seconds=0.5)
+    pushed = 16000 * 3 + 512
+    closed = chunker.push(audio[:pushed])
+    assert len(closed) == 1
+    first, forced = closed[0]
+    assert forced
+    assert 16000 * 2.5 <= len(first) <= 16000 * 2.5 + 640
+    # The next window starts 0.5 s before the cut.
+    assert len(chunker.provisional_tail()) == pushed - (len(first) - 8000)
+    # Never more than the max window is buffered.
+    for i in range(3, 5):
+        for cut, _forced in chunker.push(audio[16000 * i + 512 : 16000 * (i + 1) + 512]):
+            assert len(cut) <= 16000 * 3
+        assert len(chunker.provisional_tail()) < 16000 * 3
+
+
+def test_forced_cut_final_drops_the_repeated_overlap(fake_models) -> None:
+    from transcribe_anything.server_config import StreamCancelled
+    from transcribe_anything.stream_backend import (
+        _strip_overlap,
+        _VadChunker,
+        faster_whisper_streaming_fn,
+    )
+
+    assert _strip_overlap("the quick brown fox", "Brown fox jumps over") == "jumps over"
+    assert _strip_overlap("the quick brown fox", "jumps over") == "jumps over"
+
+    class _Script:
+        def __init__(self) -> None:
+            self.prompts: list = []
+            self.replies = iter([" one two three four", " three four five six"])
+
+        def transcribe_segments(self, audio, *, language=None, prompt=None):
+            self.prompts.append(prompt)
+            return [(0.0, len(audio) / 16000, next(self.replies, ""))]
+
+    np = fake_models
+    decoder = _Script()
+    session = StreamSession()
+    session.acquire()
+    cfg = ServerConfig(model="small.en", stream_decode_interval_ms=60_000)
+    pcm = (np.ones(16000 * 4) * 1000).astype(np.int16).tobytes()
+    chunker = _VadChunker(max_window_seconds=1.5, overlap_seconds=0.5)
+    finals: list = []
+    try:
+        for evt in faster_whisper_streaming_fn(iter([pcm]), session=session, config=cfg, hello={"type": "hello"}, decoder=decoder, chunker=chunker):
+            if evt["type"] == "final":
+                finals.append(evt["text"])
+            if len(finals) == 2:
+                session.cancel()
+    except StreamCancelled:
+        pass
+    assert finals == ["one two three four", "five six"]
+    # The window after a forced cut is prompted with the previous final.
+    assert decoder.prompts[:2] == [None, "one two three four"]
+
+
+# ----------------------------------------- preallocated sample ring
+
+
+def test_pcm_ring_keeps_samples_in_order_across_compaction_and_growth(fake_deps) -> None:
+    import numpy as np
+
+    from transcribe_anything.stream_backend import _PcmRing
+
+    ring = _PcmRing(capacity=8)
+    backing = ring.view().base
+    expected: list = []
+    for i in range(40):
+        pcm = np.array([i * 100, -i * 100], dtype=np.int16)
+        ring.write_pcm16(pcm.tobytes())
+        expected.extend((pcm / 32768.0).tolist())
+        ring.drop(len(ring) - 6)  # keep the newest 6 samples
+        expected = expected[-6:]
+        assert ring.view().tolist() == pytest.approx(expected)
+    # Compaction reused the preallocated array.
+    assert ring.view().base is backing
+    ring.write(np.arange(30, dtype=np.float32))
+    assert len(ring) == 36
+    assert ring.view()[6:].tolist() == list(range(30))
+
+
+# ----------------------------------------- event-driven audio bridge
+
+
+class _TextDecoder:
+    def transcribe_segments(self, audio, *, language=None, prompt=None):
+        return [(0.0, len(audio) / 16000, f" {len(audio)} samples")]
+
+
+def test_end_of_input_flushes_the_open_tail_and_returns(fake_models) -> None:
+    from transcribe_anything.server_config import AudioBridge
+    from transcribe_anything.stream_backend import faster_whisper_streaming_fn
+
+    bridge = AudioBridge()
+    session = StreamSession()
+    session.acquire()
+    cfg = ServerConfig(model="small.en", stream_decode_interval_ms=60_000)
+    for _ in range(3):
+        assert bridge.try_put(b"\x00" * 3200)
+    bridge.close()
+    events = list(faster_whisper_streaming_fn(bridge, session=session, config=cfg, hello={"type": "hello"}, decoder=_TextDecoder()))
+    finals = [e for e in events if e["type"] == "final"]
+    assert [e["text"] for e in finals] == ["4800 samples"]
+    assert events[-1]["type"] == "metrics"
+    assert events[-1]["queue"]["queued_ms"] == 0
+    assert events[-1]["queue"]["queue_lag_ms"] >= 0
+
+
+def test_ws_end_of_input_gets_a_final_and_done(fake_models, tmp_path) -> None:
+    import functools
+    import json
+
+    from transcribe_anything.stream_backend import faster_whisper_streaming_fn
+
+    cfg = ServerConfig(model="small.en", allow_stream=True, stream_decode_interval_ms=60_000, job_root=str(tmp_path / "jobs"))
+    app = create_app(cfg, streaming_fn=functools.partial(faster_whisper_streaming_fn, decoder=_TextDecoder()))
+    with TestClient(app) as client:
+        with client.websocket_connect("/v1/stream") as ws:
+            ws.send_text(json.dumps({"type": "hello"}))
+            assert ws.receive_json() == {"type": "ready"}
+            for _ in range(5):
+                ws.send_bytes(b"\x00" * 3200)
+            ws.send_text(json.dumps({"type": "end_of_input"}))
+            received: list = []
+            while True:
+                evt = ws.receive_json()
+                received.append(evt)
+                if evt["type"] == "done":
+                    break
+    assert [e["text"] for e in received if e["type"] == "final"] == ["8000 samples"]
+    assert not app.state.stream_sessions.live()
@@ -0,0 +1,87 @@
+"""Microbenchmark: sample-array allocations per second of streamed audio.
+
+Feeds a minute of 20 ms PCM16 frames through the streaming chunker with
+a provisional tail taken every 200 ms (the default partial cadence), and
+counts the steps (frame pushes and tails) that allocated a sample-sized
+block, using tracemalloc's per-step peak. The same run against the old list-of-frames buffer
+(``np.frombuffer(...).astype(...) / 32768`` per frame, ``np.concatenate``
+per tail) is the baseline. The VAD is faked to hear one unbroken
+utterance, so the only copies the chunker itself makes are forced cuts.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+FRAME_BYTES = 640  # 20 ms of 16 kHz PCM16
+FRAMES_PER_TAIL = 10  # a partial every 200 ms
+SECONDS = 60
+# Smaller than one frame of float32 samples (1280 bytes): Python object
+# overhead (views, ints) stays under it, any sample array goes over.
+ALLOCATION_BYTES = 1024
+
+
+class _EndlessSpeech:
+    def __init__(self, *a, **kw):
+        self.calls = 0
+
+    def __call__(self, chunk, return_seconds=False):
+        self.calls += 1
+        return {"start": 0} if self.calls == 1 else None
+
+
+def _frames():
+    rng = np.random.default_rng(0)
+    pcm = (rng.standard_normal(SECONDS * 16000) * 3000).astype(np.int16).tobytes()
+    return [pcm[i : i + FRAME_BYTES] for i in range(0, len(pcm), FRAME_BYTES)]
+
+
+def _allocations(frames, push, tail) -> int:
+    """Steps (frame pushes and tails) whose transient allocations exceed ALLOCATION_BYTES."""
+    count = 0
+    tracemalloc.start()
+    try:
+        for i, frame in enumerate(frames):
+            steps = [lambda frame=frame: push(frame)]
+            if i % FRAMES_PER_TAIL == FRAMES_PER_TAIL - 1:
+                steps.append(tail)
+            for step in steps:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                step()
+                _, peak = tracemalloc.get_traced_memory()
+                count += peak - before > ALLOCATION_BYTES
+    finally:
+        tracemalloc.stop()
+    return count
+
+
+def test_ring_buffer_allocations_per_second_of_audio(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=object))
+    monkeypatch.setitem(sys.modules, "silero_vad", types.SimpleNamespace(VADIterator=_EndlessSpeech, load_silero_vad=lambda: object()))
+    from transcribe_anything.stream_backend import _VadChunker
+
+    frames = _frames()
+
+    held: list = []
+
+    def list_push(frame: bytes) -> None:
+        held.append(np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0)
+
+    def list_tail():
+        return np.concatenate(held)
+
+    baseline = _allocations(frames, list_push, list_tail) / SECONDS
+    chunker = _VadChunker()
+    ring = _allocations(frames, chunker.push_pcm16, chunker.provisional_tail) / SECONDS
+    print(f"\nsample-array allocations per second of audio: list+concatenate={baseline:.1f} ring={ring:.2f}")
+    # Every frame converts into new arrays and every tail concatenates.
+    assert baseline == 50 + 5
+    # Only the two forced cuts of the minute copy samples out.
+    assert ring <= 0.1
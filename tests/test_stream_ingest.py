@@ -0,0 +1,108 @@
+"""Streaming URL ingest (yt-dlp | ffmpeg) tests.
+
+Fake ``yt-dlp`` / ``static_ffmpeg`` executables are put on PATH so the real
+pipe plumbing runs without network access or an ffmpeg download.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from transcribe_anything import audio
+
+FAKE_YTDLP = """
+import json, sys
+if "fail" in sys.argv[-1]:
+    sys.exit(3)
+if "-J" in sys.argv:
+    print(json.dumps({"title": "t", "webpage_url": sys.argv[-1]}))
+    sys.exit(0)
+url = sys.argv[-1]
+if "--load-info-json" in sys.argv:
+    with open(sys.argv[sys.argv.index("--load-info-json") + 1], encoding="utf-8") as fh:
+        url = json.load(fh)["webpage_url"]
+sys.stdout.buffer.write(b"media:" + url.encode())
+"""
+
+# Copies stdin to the output path (last arg) and records its argv.
+FAKE_FFMPEG = """
+import json, os, sys
+with open(os.environ["FAKE_FFMPEG_LOG"], "a", encoding="utf-8") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+data = sys.stdin.buffer.read()
+with open(sys.argv[-1], "wb") as fh:
+    fh.write(b"wav<" + data + b">")
+"""
+
+
+def _write_exe(directory: Path, name: str, body: str) -> None:
+    path = directory / name
+    path.write_text(f"#!{sys.executable}\n{body}", encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def fake_tools(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _write_exe(bin_dir, "yt-dlp", FAKE_YTDLP)
+    _write_exe(bin_dir, "static_ffmpeg", FAKE_FFMPEG)
+    log = tmp_path / "ffmpeg.log"
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    monkeypatch.setenv("TRANSCRIBE_ANYTHING_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv(audio.STREAM_INGEST_ENV_VAR, raising=False)
+    return log
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang executables")
+def test_fetch_audio_streams_url_into_destination(fake_tools: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    def no_download(*_args, **_kwargs):
+        raise AssertionError("streaming ingest should not download to disk")
+
+    monkeypatch.setattr(audio, "ytdlp_download", no_download)
+    out_wav = tmp_path / "out.wav"
+    out_wav.touch()
+
+    audio.fetch_audio("https://example.com/watch?v=1", str(out_wav))
+
+    assert out_wav.read_bytes() == b"wav<media:https://example.com/watch?v=1>"
+    ffmpeg_args = fake_tools.read_text(encoding="utf-8")
+    assert '"pipe:0"' in ffmpeg_args
+    assert '"16000"' in ffmpeg_args
+    assert "speechnorm" in ffmpeg_args
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang executables")
+def test_fetch_audio_falls_back_to_download_when_stream_fails(fake_tools: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def fake_download(url: str, outdir: str) -> str:
+        calls.append(url)
+        path = Path(outdir) / "out.webm"
+        path.write_bytes(b"downloaded")
+        return str(path)
+
+    def fake_convert(inpath: str, outpath: str, speech_normalization: bool = False) -> None:
+        Path(outpath).write_bytes(Path(inpath).read_bytes())
+
+    monkeypatch.setattr(audio, "ytdlp_download", fake_download)
+    monkeypatch.setattr(audio, "_convert_to_wav", fake_convert)
+    out_wav = tmp_path / "out.wav"
+
+    audio.fetch_audio("https://example.com/fail", str(out_wav))
+
+    assert calls == ["https://example.com/fail"]
+    assert out_wav.read_bytes() == b"downloaded"
+
+
+def test_stream_ingest_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(audio.STREAM_INGEST_ENV_VAR, raising=False)
+    assert audio.stream_ingest_enabled()
+    monkeypatch.setenv(audio.STREAM_INGEST_ENV_VAR, "0")
+    assert not audio.stream_ingest_enabled()
@@ -6,13 +6,17 @@ the protocol + StreamSession semantics using the canned in-tree backend.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import json
+import threading
+import time
 
 import pytest
 from fastapi.testclient import TestClient
 
 from transcribe_anything.server_app import create_app
-from transcribe_anything.server_config import ServerConfig, StreamSession
+from transcribe_anything.server_config import AudioBridge, ServerConfig, StreamSession
 
 
 def _cfg(tmp_path, *, allow_stream: bool = True, **kw) -> ServerConfig:
@@ -64,6 +68,48 @@ def test_stream_session_runtime_seconds() -> None:
     assert s.runtime_seconds is None
 
 
+# ---------------------------------------------------------------- AudioBridge
+
+
+def test_audio_bridge_wakes_the_backend_when_audio_arrives() -> None:
+    bridge = AudioBridge()
+    got: list = []
+    consumer = threading.Thread(target=lambda: got.extend(bridge))
+    consumer.start()
+    time.sleep(0.05)
+    assert consumer.is_alive()  # blocked, not polling an empty queue
+    assert bridge.try_put(b"ab")
+    consumer.join(2)
+    assert got == [b"ab"]
+    # A timed wait returns empty; close wakes an untimed one.
+    assert list(bridge.frames(timeout=0.01)) == []
+    consumer = threading.Thread(target=lambda: got.extend(bridge))
+    consumer.start()
+    bridge.close()
+    consumer.join(2)
+    assert not consumer.is_alive()
+    assert bridge.closed
+
+
+def test_audio_bridge_applies_backpressure_and_reports_lag() -> None:
+    bridge = AudioBridge(max_bytes=4)
+    assert bridge.try_put(b"1234")
+    assert not bridge.try_put(b"5")
+    blocked = threading.Thread(target=bridge.put, args=(b"5",))
+    blocked.start()
+    time.sleep(0.05)
+    assert blocked.is_alive()  # waits for the backend to catch up
+    frames = bridge.frames()
+    assert next(frames) == b"1234"
+    blocked.join(2)
+    assert not blocked.is_alive()
+    assert list(frames) == [b"5"]
+    stats = bridge.stats()
+    assert stats["backpressure_waits"] == 1
+    assert stats["max_queue_lag_ms"] >= 40
+    assert stats["queued_ms"] == 0
+
+
 # ---------------------------------------------------------------- WS endpoint
 
 
@@ -136,16 +182,17 @@ def test_stream_endpoint_rejects_wrong_type_first_frame(tmp_path) -> None:
 
 
 def test_stream_endpoint_busy_when_session_already_acquired(tmp_path) -> None:
-    """Pre-acquire the daemon's StreamSession; the WS handler must reject the new connection.
+    """Pre-acquire the daemon's only stream slot; the WS handler must reject the new connection.
 
-    Done by reaching into ``app.state.stream_session`` directly instead of
+    Done by reaching into ``app.state.stream_sessions`` directly instead of
     holding a parallel WebSocket open from a worker thread — the latter
     deadlocks the sync TestClient.
     """
     cfg = _cfg(tmp_path, allow_stream=True)
     app = create_app(cfg)
     # Simulate a live session by pre-acquiring before the new connection.
-    assert app.state.stream_session.acquire() is True
+    held = app.state.stream_sessions.acquire()
+    assert held is not None
     try:
         with TestClient(app) as client:
             with client.websocket_connect("/v1/stream") as ws:
@@ -153,7 +200,7 @@ def test_stream_endpoint_busy_when_session_already_acquired(tmp_path) -> None:
                 assert msg["type"] == "error"
                 assert msg["code"] == "busy"
     finally:
-        app.state.stream_session.release()
+        app.state.stream_sessions.release(held)
 
 
 def test_stream_endpoint_requires_auth_when_non_loopback(tmp_path) -> None:
@@ -201,3 +248,52 @@ def test_stream_endpoint_pluggable_streaming_fn(tmp_path) -> None:
                 if msg.get("type") == "done":
                     break
             assert {"type": "final", "text": "custom backend ran", "rev": 1} in collected
+
+
+def test_stream_backends_do_not_hold_the_default_executor(tmp_path) -> None:
+    """More live sessions than default-executor threads must all make progress."""
+    sessions = 3
+    all_live = threading.Barrier(sessions, timeout=10)
+    backend_threads: list = []
+
+    def _fn(audio_iter, *, session, config, hello):
+        backend_threads.append(threading.current_thread().name)
+        # Every session's backend must be running at once to get past here.
+        all_live.wait()
+        frames = sum(1 for _ in audio_iter)
+        yield {"type": "final", "text": f"{frames} frames", "rev": 1}
+
+    app = create_app(_cfg(tmp_path, max_streams=sessions), streaming_fn=_fn)
+    results: list = []
+    errors: list = []
+
+    def _session(client: TestClient) -> None:
+        try:
+            with client.websocket_connect("/v1/stream") as ws:
+                ws.send_text(_hello_frame())
+                assert ws.receive_json() == {"type": "ready"}
+                for _ in range(4):
+                    ws.send_bytes(b"\x00" * 3200)
+                ws.send_text(json.dumps({"type": "end_of_input"}))
+                while True:
+                    msg = ws.receive_json()
+                    if msg.get("type") == "done":
+                        break
+                    results.append(msg)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    async def _one_thread_default_executor() -> None:
+        asyncio.get_running_loop().set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=1))
+
+    with TestClient(app) as client:
+        client.portal.call(_one_thread_default_executor)
+        threads = [threading.Thread(target=_session, args=(client,)) for _ in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+    assert not errors
+    assert [msg["type"] for msg in results] == ["final"] * sessions
+    assert all(name.startswith("stream-backend-") for name in backend_threads)
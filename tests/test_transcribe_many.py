@@ -0,0 +1,147 @@
+"""transcribe_many bulk pipeline tests."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _install_fakes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> dict[str, Any]:
+    from transcribe_anything import api
+
+    state: dict[str, Any] = {"fetch_threads": set(), "backend_calls": [], "wav_count": 0}
+    lock = threading.Lock()
+
+    def fake_make_temp_wav() -> str:
+        with lock:
+            state["wav_count"] += 1
+            path = tmp_path / f"tmp{state['wav_count']}.wav"
+        path.touch()
+        return str(path)
+
+    def fake_fetch_audio(url_or_file: str, wav_path: str) -> None:
+        state["fetch_threads"].add(threading.current_thread().name)
+        if "broken" in url_or_file:
+            raise RuntimeError(f"cannot fetch {url_or_file}")
+        Path(wav_path).write_bytes(url_or_file.encode())
+
+    def fake_run_whisper(**kwargs: Any) -> None:
+        audio = Path(kwargs["input_wav"]).read_bytes().decode()
+        state["backend_calls"].append(kwargs)
+        if "bad_model_output" in audio:
+            return
+        out = Path(kwargs["output_dir"])
+        (out / "out.srt").write_text(f"1\n00:00:00,000 --> 00:00:01,000\n{audio}\n\n", encoding="utf-8")
+        (out / "out.txt").write_text(audio, encoding="utf-8")
+
+    monkeypatch.setattr(api.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api, "make_temp_wav", fake_make_temp_wav)
+    monkeypatch.setattr(api, "fetch_audio", fake_fetch_audio)
+    monkeypatch.setattr(api, "run_whisper", fake_run_whisper)
+    return state
+
+
+def _inputs(tmp_path: Path, names: list[str]) -> list[str]:
+    paths = []
+    for name in names:
+        path = tmp_path / "media" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"media")
+        paths.append(str(path))
+    return paths
+
+
+def test_transcribe_many_yields_results_in_order(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import transcribe_many
+
+    state = _install_fakes(monkeypatch, tmp_path)
+    inputs = _inputs(tmp_path, ["a.mp4", "b.mp4", "c.mp4"])
+
+    results = list(transcribe_many(inputs, output_root=str(tmp_path / "out"), model="tiny", device="cpu", initial_prompt="names"))
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.ok for r in results)
+    for index, (result, name) in enumerate(zip(results, ["a", "b", "c"])):
+        assert result.output_dir == str((tmp_path / "out" / f"text_{index:04d}_{name}").resolve())
+        assert (Path(result.output_dir) / "out.srt").exists()
+    # The prompt is added once per item, not accumulated across the batch.
+    for call in state["backend_calls"]:
+        assert call["other_args"] == ["--initial_prompt", "names"]
+    assert all(name.startswith("transcribe-fetch") for name in state["fetch_threads"])
+    assert not list(tmp_path.glob("tmp*.wav"))
+
+
+def test_transcribe_many_overlaps_fetch_with_backend(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import api, transcribe_many
+
+    _install_fakes(monkeypatch, tmp_path)
+    inputs = _inputs(tmp_path, ["a.mp4", "b.mp4", "c.mp4"])
+    second_fetch_started = threading.Event()
+    overlapped: list[bool] = []
+    fetch_audio = api.fetch_audio
+    run_whisper = api.run_whisper
+
+    def fetch(url_or_file: str, wav_path: str) -> None:
+        if url_or_file == inputs[1]:
+            second_fetch_started.set()
+        fetch_audio(url_or_file, wav_path)
+
+    def backend(**kwargs: Any) -> None:
+        if not overlapped:
+            # The next input is fetched while the first one is on the backend.
+            overlapped.append(second_fetch_started.wait(timeout=5))
+        run_whisper(**kwargs)
+
+    monkeypatch.setattr(api, "fetch_audio", fetch)
+    monkeypatch.setattr(api, "run_whisper", backend)
+
+    results = list(transcribe_many(inputs, output_root=str(tmp_path / "out"), device="cpu", prefetch=2))
+
+    assert all(r.ok for r in results)
+    assert overlapped == [True]
+
+
+def test_transcribe_many_same_basename_gets_separate_dirs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import transcribe_many
+
+    _install_fakes(monkeypatch, tmp_path)
+    inputs = _inputs(tmp_path, ["one/clip.mp4", "two/clip.mp4"])
+
+    results = list(transcribe_many(inputs, output_root=str(tmp_path / "out"), device="cpu"))
+
+    assert all(r.ok for r in results)
+    assert results[0].output_dir != results[1].output_dir
+    texts = [(Path(r.output_dir) / "out.txt").read_text(encoding="utf-8") for r in results]
+    assert texts == inputs
+
+
+def test_transcribe_many_reports_errors_and_continues(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import transcribe_many
+
+    _install_fakes(monkeypatch, tmp_path)
+    inputs = _inputs(tmp_path, ["broken.mp4", "bad_model_output.mp4", "ok.mp4"])
+
+    results = list(transcribe_many(inputs, output_root=str(tmp_path / "out"), device="cpu"))
+
+    assert [r.ok for r in results] == [False, False, True]
+    assert isinstance(results[0].error, RuntimeError)
+    assert isinstance(results[1].error, AssertionError)
+    assert results[2].output_dir is not None
+    assert not list(tmp_path.glob("tmp*.wav"))
+
+
+def test_transcribe_many_abandoned_generator_cleans_up(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import transcribe_many
+
+    _install_fakes(monkeypatch, tmp_path)
+    inputs = _inputs(tmp_path, [f"{i}.mp4" for i in range(5)])
+
+    gen = transcribe_many(inputs, output_root=str(tmp_path / "out"), device="cpu", prefetch=3)
+    first = next(gen)
+    gen.close()
+
+    assert first.ok
+    assert not list(tmp_path.glob("tmp*.wav"))
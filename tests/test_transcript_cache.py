@@ -0,0 +1,132 @@
+"""Content-addressed transcript cache tests."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything.transcript_cache import (
+    TranscriptCache,
+    cache_enabled_from_env,
+    hash_file,
+    make_cache_key,
+)
+
+
+def _artifacts(directory: Path, text: str, size: int = 0) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    srt = directory / "out.srt"
+    srt.write_text(f"1\n00:00:00,000 --> 00:00:01,000\n{text}\n\n", encoding="utf-8")
+    txt = directory / "out.txt"
+    txt.write_text(text + "x" * size, encoding="utf-8")
+    return [srt, txt]
+
+
+def test_make_cache_key_depends_on_audio_and_settings(tmp_path: Path) -> None:
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"RIFF" + b"\0" * 100)
+    digest = hash_file(wav)
+    base = make_cache_key(digest, {"model": "tiny", "language": "en"})
+    assert base == make_cache_key(digest, {"language": "en", "model": "tiny"})
+    assert base != make_cache_key(digest, {"model": "tiny", "language": "fr"})
+    assert base != make_cache_key("0" * 64, {"model": "tiny", "language": "en"})
+
+
+def test_put_then_get_copies_artifacts(tmp_path: Path) -> None:
+    cache = TranscriptCache(root=tmp_path / "cache")
+    cache.put("k1", _artifacts(tmp_path / "src", "Hello"), settings={"model": "tiny"})
+
+    out = tmp_path / "out"
+    assert cache.get("k1", out) == ["out.srt", "out.txt"]
+    assert (out / "out.txt").read_text(encoding="utf-8") == "Hello"
+    assert cache.get("missing", out) is None
+
+
+def test_eviction_is_lru_and_bounded_in_bytes(tmp_path: Path) -> None:
+    # Room for three ~1.2 KB entries, not four.
+    cache = TranscriptCache(root=tmp_path / "cache", max_bytes=4000)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, _artifacts(tmp_path / key, key, size=1000))
+        # Give each entry a distinct mtime so the LRU order is deterministic.
+        stamp = time.time() - 100 + index
+        os.utime(tmp_path / "cache" / key / "manifest.json", (stamp, stamp))
+    # Touch "a" so "b" becomes the least recently used entry.
+    assert cache.get("a", tmp_path / "out") is not None
+    cache.put("d", _artifacts(tmp_path / "d", "d", size=1000))
+
+    assert cache.get("b", tmp_path / "out") is None
+    assert cache.get("a", tmp_path / "out") is not None
+    assert cache.get("c", tmp_path / "out") is not None
+    assert cache.get("d", tmp_path / "out") is not None
+
+
+def test_cache_enabled_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRANSCRIBE_ANYTHING_CACHE", raising=False)
+    assert not cache_enabled_from_env()
+    monkeypatch.setenv("TRANSCRIBE_ANYTHING_CACHE", "1")
+    assert cache_enabled_from_env()
+
+
+def test_api_transcribe_cache_hit_skips_backend(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from transcribe_anything import api
+
+    calls: list[dict[str, Any]] = []
+    temp_wav = tmp_path / "input.wav"
+
+    def fake_fetch_audio(_url_or_file: str, wav_path: str) -> None:
+        Path(wav_path).write_bytes(b"same normalized audio")
+
+    def fake_run_whisper(**kwargs: Any) -> None:
+        calls.append(kwargs)
+        _artifacts(Path(kwargs["output_dir"]), "Hello")
+
+    monkeypatch.setattr(api.static_ffmpeg, "add_paths", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api, "make_temp_wav", lambda: str(temp_wav))
+    monkeypatch.setattr(api, "fetch_audio", fake_fetch_audio)
+    monkeypatch.setattr(api, "run_whisper", fake_run_whisper)
+    monkeypatch.setattr(api, "TranscriptCache", lambda: TranscriptCache(root=tmp_path / "cache"))
+
+    for name in ("first.mp4", "renamed.mp4"):
+        input_file = tmp_path / name
+        input_file.write_bytes(b"container bytes differ: " + name.encode())
+        output_dir = tmp_path / f"out_{name}"
+        api.transcribe(url_or_file=str(input_file), output_dir=str(output_dir), model="tiny", language="en", device="cpu", use_cache=True)
+        assert (output_dir / "out.srt").exists()
+        assert (output_dir / "out.txt").read_text(encoding="utf-8") == "Hello"
+
+    assert len(calls) == 1
+
+    # A different output-affecting setting misses the cache.
+    api.transcribe(url_or_file=str(tmp_path / "first.mp4"), output_dir=str(tmp_path / "fr"), model="tiny", language="fr", device="cpu", use_cache=True)
+    assert len(calls) == 2
+
+
+def test_concurrent_puts_of_one_key_do_not_collide(tmp_path: Path) -> None:
+    cache = TranscriptCache(root=tmp_path / "cache")
+    sources = [_artifacts(tmp_path / f"src{i}", f"text{i}") for i in range(8)]
+    barrier = threading.Barrier(len(sources))
+    errors: list[BaseException] = []
+
+    def put(artifacts: list[Path]) -> None:
+        barrier.wait()
+        try:
+            cache.put("same", artifacts)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=put, args=(artifacts,)) for artifacts in sources]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    out = tmp_path / "out"
+    assert cache.get("same", out) == ["out.srt", "out.txt"]
+    assert (out / "out.txt").read_text(encoding="utf-8") in {f"text{i}" for i in range(8)}
+    assert not [p for p in (tmp_path / "cache").iterdir() if p.name.startswith(".same.")]
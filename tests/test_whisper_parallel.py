@@ -0,0 +1,127 @@
+"""Process-parallel CPU whisper (fake backend, no models)."""
+
+from __future__ import annotations
+
+import json
+import wave
+from array import array
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from transcribe_anything import whisper, whisper_parallel
+from transcribe_anything.whisper_parallel import (
+    run_whisper_parallel,
+    write_whisper_outputs,
+)
+
+RATE = 16000
+
+
+def _write_wav(path: Path, seconds: float, silences: list[tuple[float, float]]) -> Path:
+    samples = array("h")
+    for i in range(int(seconds * RATE)):
+        t = i / RATE
+        quiet = any(start <= t < end for start, end in silences)
+        samples.append(0 if quiet else (8000 if i % 2 else -8000))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(samples.tobytes())
+    return path
+
+
+def _fake_whisper(calls: list[dict[str, Any]]):
+    """Writes ``<stem>.json`` like the whisper CLI: one segment spanning the window."""
+
+    def backend(**kwargs: Any) -> None:
+        calls.append(kwargs)
+        wav_path = Path(kwargs["input_wav"])
+        with wave.open(str(wav_path), "rb") as wav:
+            length = wav.getnframes() / wav.getframerate()
+        out = Path(kwargs["output_dir"])
+        out.mkdir(parents=True, exist_ok=True)
+        text = f" {wav_path.stem}"
+        data = {"text": text, "segments": [{"id": 0, "start": 0.0, "end": length, "text": text}], "language": "en"}
+        (out / f"{wav_path.stem}.json").write_text(json.dumps(data), encoding="utf-8")
+
+    return backend
+
+
+def test_windows_run_in_parallel_and_merge(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(whisper_parallel, "MIN_WINDOW_SECONDS", 1.0)
+    wav = _write_wav(tmp_path / "talk.wav", 12.0, [(3.5, 4.5), (7.5, 8.5)])
+    calls: list[dict[str, Any]] = []
+    out_dir = tmp_path / "out"
+
+    run_whisper_parallel(
+        input_wav=wav,
+        model="tiny",
+        output_dir=out_dir,
+        task="transcribe",
+        language="en",
+        workers=3,
+        other_args=["--beam_size", "5"],
+        threads_per_worker=2,
+        backend_fn=_fake_whisper(calls),
+    )
+
+    assert len(calls) == 3
+    assert all(call["device"] == "cpu" for call in calls)
+    assert all(call["other_args"] == ["--beam_size", "5", "--threads", "2"] for call in calls)
+    data = json.loads((out_dir / "talk.json").read_text(encoding="utf-8"))
+    assert data["text"] == "piece_000 piece_001 piece_002"
+    assert [seg["id"] for seg in data["segments"]] == [0, 1, 2]
+    assert data["segments"][0]["start"] == 0.0
+    assert data["segments"][-1]["end"] == pytest.approx(12.0)
+    for prev, cur in zip(data["segments"], data["segments"][1:]):
+        assert prev["end"] == pytest.approx(cur["start"])
+    for suffix in (".srt", ".vtt", ".txt", ".tsv"):
+        assert (out_dir / f"talk{suffix}").exists()
+    assert (out_dir / "talk.txt").read_text(encoding="utf-8").splitlines() == ["piece_000", "piece_001", "piece_002"]
+
+
+def test_short_audio_uses_one_process(tmp_path: Path) -> None:
+    wav = _write_wav(tmp_path / "short.wav", 2.0, [])
+    calls: list[dict[str, Any]] = []
+    run_whisper_parallel(
+        input_wav=wav,
+        model="tiny",
+        output_dir=tmp_path / "out",
+        task="transcribe",
+        language="en",
+        workers=4,
+        other_args=["--threads", "3"],
+        backend_fn=_fake_whisper(calls),
+    )
+    assert len(calls) == 1
+    assert calls[0]["input_wav"] == wav
+    assert calls[0]["other_args"] == ["--threads", "3"]
+
+
+def test_output_formats_match_whisper_layout(tmp_path: Path) -> None:
+    result = {"text": "hi there", "segments": [{"start": 0.0, "end": 1.5, "text": " hi"}, {"start": 3661.25, "end": 3662.0, "text": " there"}]}
+    write_whisper_outputs(result, tmp_path, "x")
+    srt = (tmp_path / "x.srt").read_text(encoding="utf-8")
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:01,500\nhi\n\n2\n01:01:01,250 --> 01:01:02,000\nthere\n")
+    vtt = (tmp_path / "x.vtt").read_text(encoding="utf-8")
+    assert vtt.startswith("WEBVTT\n\n00:00.000 --> 00:01.500\nhi\n")
+    assert (tmp_path / "x.tsv").read_text(encoding="utf-8").splitlines()[1] == "0\t1500\thi"
+
+
+def test_run_whisper_dispatches_cpu_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    seen: dict[str, Any] = {}
+
+    def fake_parallel(**kwargs: Any) -> None:
+        seen.update(kwargs)
+
+    def no_env() -> None:
+        raise AssertionError("the parallel path must not start a single whisper process")
+
+    monkeypatch.setattr(whisper_parallel, "run_whisper_parallel", fake_parallel)
+    monkeypatch.setattr(whisper, "get_environment", no_env)
+    whisper.run_whisper(input_wav=tmp_path / "a.wav", device="cpu", model="tiny", output_dir=tmp_path, task="transcribe", language="en", cpu_workers=4)
+    assert seen["workers"] == 4
+    assert seen["model"] == "tiny"
@@ -0,0 +1,67 @@
+"""Benchmark: --device cpu with one whisper process vs ``--cpu-workers K``.
+
+Loops the bundled ~10 s ``sample.mp3`` up to a few minutes, transcribes it
+with ``--model tiny`` once on a single process and once split across
+``K`` worker processes, prints both wall times, and checks that the merged
+transcript still reaches the end of the audio.
+
+Opt-in (it installs the whisper iso-env and runs real inference): set
+``TRANSCRIBE_ANYTHING_TEST_CPU_BENCHMARK=1``. ``K`` defaults to
+``min(4, cpu_count // 2)``; override with ``TRANSCRIBE_ANYTHING_BENCHMARK_CPU_WORKERS``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from transcribe_anything.api import transcribe
+
+HERE = Path(os.path.abspath(os.path.dirname(__file__)))
+ASSETS = HERE.parent / "src" / "transcribe_anything" / "assets"
+SAMPLE_MP3 = ASSETS / "sample.mp3"
+
+RUN_BENCHMARK = os.environ.get("TRANSCRIBE_ANYTHING_TEST_CPU_BENCHMARK", "").strip().lower() in {"1", "true", "yes", "on"}
+CPU_WORKERS = int(os.environ.get("TRANSCRIBE_ANYTHING_BENCHMARK_CPU_WORKERS", "0")) or max(2, min(4, (os.cpu_count() or 2) // 2))
+
+# 24 loops of the sample is ~4 minutes: enough for one 60 s+ window per worker.
+LOOP_COUNT = 24
+
+
+def _make_long_wav(workdir: Path) -> Path:
+    import static_ffmpeg  # type: ignore[import-untyped]
+
+    static_ffmpeg.add_paths()
+    out_wav = workdir / "long_sample.wav"
+    cmd = ["ffmpeg", "-y", "-stream_loop", str(LOOP_COUNT - 1), "-i", str(SAMPLE_MP3), "-ac", "1", "-ar", "16000", "-acodec", "pcm_s16le", str(out_wav)]
+    subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return out_wav
+
+
+def _last_end(path: Path) -> float:
+    return float(json.loads(path.read_text(encoding="utf-8"))["segments"][-1]["end"])
+
+
+@unittest.skipUnless(RUN_BENCHMARK and SAMPLE_MP3.is_file(), "Set TRANSCRIBE_ANYTHING_TEST_CPU_BENCHMARK=1 to run the CPU worker benchmark")
+class CpuWorkersBenchmark(unittest.TestCase):
+    def test_single_process_vs_cpu_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            long_wav = _make_long_wav(workdir)
+            runtimes: dict[int, float] = {}
+            last_ends: dict[int, float] = {}
+            # Warm the iso-env + model download so neither timed run pays for it.
+            transcribe(url_or_file=str(SAMPLE_MP3), output_dir=str(workdir / "warmup"), model="tiny", task="transcribe", language="en", device="cpu")
+            for workers in (1, CPU_WORKERS):
+                out_dir = workdir / f"out_{workers}"
+                start = time.perf_counter()
+                transcribe(url_or_file=str(long_wav), output_dir=str(out_dir), model="tiny", task="transcribe", language="en", device="cpu", cpu_workers=workers)
+                runtimes[workers] = time.perf_counter() - start
+                last_ends[workers] = _last_end(out_dir / "out.json")
+            print(f"\n[cpu-workers benchmark] 1 process: {runtimes[1]:.1f}s, {CPU_WORKERS} workers: {runtimes[CPU_WORKERS]:.1f}s ({runtimes[1] / runtimes[CPU_WORKERS]:.2f}x)")
+            self.assertAlmostEqual(last_ends[1], last_ends[CPU_WORKERS], delta=5.0)
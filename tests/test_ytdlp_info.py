@@ -0,0 +1,95 @@
+"""Single yt-dlp metadata pass per URL, cached on disk and shared by naming and download."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from transcribe_anything import ytldp_download
+
+# Logs every invocation; -J prints an info dict, a download writes out.<ext>.
+FAKE_YTDLP = """
+import json, os, sys
+with open(os.environ["FAKE_YTDLP_LOG"], "a", encoding="utf-8") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+if "-J" in sys.argv:
+    url = sys.argv[-1]
+    print(json.dumps({"title": "My Title: Part 1", "duration": 12.5, "format_id": "251", "ext": "webm", "filename": "x.webm", "webpage_url": url}))
+    sys.exit(0)
+if "--load-info-json" in sys.argv and os.environ.get("FAKE_YTDLP_EXPIRED"):
+    sys.exit(1)
+with open("out.opus", "wb") as fh:
+    fh.write(b"audio")
+"""
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="shebang executables")
+
+
+@pytest.fixture
+def ytdlp_log(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "yt-dlp"
+    exe.write_text(f"#!{sys.executable}\n{FAKE_YTDLP}", encoding="utf-8")
+    exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+    log = tmp_path / "ytdlp.log"
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.setenv("FAKE_YTDLP_LOG", str(log))
+    monkeypatch.setenv("TRANSCRIBE_ANYTHING_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv(ytldp_download.INFO_TTL_ENV_VAR, raising=False)
+    return log
+
+
+def _calls(log: Path) -> list[list[str]]:
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_naming_and_download_share_one_metadata_pass(ytdlp_log: Path, tmp_path: Path) -> None:
+    from transcribe_anything.api import get_video_name_from_url
+
+    url = "https://example.com/watch?v=1"
+    assert get_video_name_from_url(url) == get_video_name_from_url(url)
+    downloaded = ytldp_download.ytdlp_download(url, str(tmp_path / "dl"))
+
+    calls = _calls(ytdlp_log)
+    assert sum("-J" in call for call in calls) == 1
+    assert "--load-info-json" in calls[-1]
+    assert url not in calls[-1]
+    assert Path(downloaded).read_bytes() == b"audio"
+
+
+def test_video_info_fields(ytdlp_log: Path) -> None:
+    info = ytldp_download.get_video_info("https://example.com/watch?v=2")
+    assert info.title == "My Title: Part 1"
+    assert info.duration == 12.5
+    assert info.format_id == "251"
+    assert info.ext == "webm"
+    assert info.filename == "x.webm"
+    assert info.info_json.is_file()
+
+
+def test_stale_info_is_refetched(ytdlp_log: Path) -> None:
+    url = "https://example.com/watch?v=3"
+    info = ytldp_download.get_video_info(url)
+    old = time.time() - 2 * ytldp_download.DEFAULT_INFO_TTL_SECONDS
+    os.utime(info.info_json, (old, old))
+    ytldp_download.get_video_info(url)
+    assert sum("-J" in call for call in _calls(ytdlp_log)) == 2
+
+
+def test_download_retries_with_url_when_cached_formats_expired(ytdlp_log: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("FAKE_YTDLP_EXPIRED", "1")
+    url = "https://example.com/watch?v=4"
+    downloaded = ytldp_download.ytdlp_download(url, str(tmp_path / "dl"))
+    calls = _calls(ytdlp_log)
+    assert "--load-info-json" in calls[-2]
+    assert calls[-1][-1] == url
+    assert Path(downloaded).is_file()